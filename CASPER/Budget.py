@@ -0,0 +1,108 @@
+# Budget.py
+#
+# Execution limits for running untrusted programs: a step budget, a
+# wall-clock deadline and caps on list and string sizes. CodeGen and the
+# bytecode VM each take a Budget and stop a program that goes over one of
+# its limits with BudgetExceeded, which the server reports as a runtime
+# error. The defaults come from the environment (0 disables a limit):
+#
+#   CASPER_STEP_LIMIT     steps per run (loop iterations and function calls)
+#   CASPER_TIME_LIMIT     seconds per run
+#   CASPER_LIST_LIMIT     items in one list
+#   CASPER_STRING_LIMIT   characters in one string
+#
+# Interpreters keep the step count in a local "fuel" counter and only call
+# into the Budget when it runs out, every CHECK_INTERVAL steps or at the step
+# limit. So a step costs one decrement and the clock is only read now and then.
+# The same check stops a run that another thread cancelled.
+
+import os
+import time
+
+STEP_LIMIT = int(os.environ.get("CASPER_STEP_LIMIT", "10000000"))
+TIME_LIMIT = float(os.environ.get("CASPER_TIME_LIMIT", "10"))
+LIST_LIMIT = int(os.environ.get("CASPER_LIST_LIMIT", "1000000"))
+STRING_LIMIT = int(os.environ.get("CASPER_STRING_LIMIT", "1000000"))
+
+# Steps between two looks at the clock.
+CHECK_INTERVAL = 1024
+
+
+class BudgetExceeded(Exception):
+    """Raised when a running program goes over one of its Budget's limits."""
+    pass
+
+
+class RunCancelled(BudgetExceeded):
+    """Raised in a running program whose Budget was cancelled."""
+    pass
+
+
+class Budget:
+    """
+    The limits for one run of a program.
+
+    Call start() when the program starts. It returns the fuel to run on: the
+    number of steps the program may take before it must call refuel(). refuel()
+    counts those steps, checks the step limit and the deadline, and returns
+    the next allowance. add() and multiply() do + and *, refusing a list or
+    string over its cap before building it. cancel(), from any thread, stops the run at its next
+    refuel(). A Budget can be reused, but only for one run at a time.
+    """
+
+    def __init__(self, steps=None, seconds=None, list_items=None, string_chars=None):
+        self.steps = STEP_LIMIT if steps is None else steps
+        self.seconds = TIME_LIMIT if seconds is None else seconds
+        self.list_items = LIST_LIMIT if list_items is None else list_items
+        self.string_chars = STRING_LIMIT if string_chars is None else string_chars
+        self.used = 0
+        self.deadline = None
+        self.cancelled = False
+        self._granted = 0
+
+    @classmethod
+    def unlimited(cls):
+        return cls(0, 0, 0, 0)
+
+    def start(self):
+        self.used = 0
+        self._granted = 0
+        self.deadline = time.monotonic() + self.seconds if self.seconds else None
+        return self.refuel()
+
+    def cancel(self):
+        self.cancelled = True
+
+    def refuel(self):
+        if self.cancelled:
+            raise RunCancelled("The run was cancelled.")
+        self.used += self._granted
+        if self.steps and self.used > self.steps:
+            raise BudgetExceeded(f"Step limit of {self.steps} exceeded.")
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            raise BudgetExceeded(f"Time limit of {self.seconds:g} seconds exceeded.")
+        # Stop again right after the last allowed step, so the limit is exact.
+        self._granted = min(CHECK_INTERVAL, self.steps - self.used + 1) if self.steps else CHECK_INTERVAL
+        return self._granted
+
+    def add(self, left, right):
+        """left + right, unless that would build a list or string over its cap."""
+        kind = type(left)
+        if (kind is str or kind is list) and type(right) is kind:
+            self._check_length(kind, len(left) + len(right))
+        return left + right
+
+    def multiply(self, left, right):
+        """left * right, unless that would build a list or string over its cap."""
+        sequence, count = (left, right) if isinstance(right, int) else (right, left)
+        kind = type(sequence)
+        if (kind is str or kind is list) and isinstance(count, int):
+            self._check_length(kind, len(sequence) * max(count, 0))
+        return left * right
+
+    def _check_length(self, kind, length):
+        if kind is str:
+            if self.string_chars and length > self.string_chars:
+                raise BudgetExceeded(f"String of {length} characters exceeds the limit of {self.string_chars}.")
+        elif self.list_items and length > self.list_items:
+            raise BudgetExceeded(f"List of {length} items exceeds the limit of {self.list_items}.")
@@ -0,0 +1,788 @@
+# Bytecode.py
+#
+# A compact stack bytecode for CASPER programs and the virtual machine that
+# runs it. compile_program() lowers a parsed program into one CodeObject per
+# function plus one for @main_casper. Each CodeObject keeps its instructions
+# as (opcode, operand) pairs in an array of C ints, and all of them share the
+# module's constant pool. VirtualMachine runs a module and disassemble()
+# renders one for debugging:
+#
+#   python Bytecode.py tests/test.lime
+#
+# The VM runs a program as CodeGen's tree walker does. Control flow becomes
+# jumps: a check is a chain of JUMP_IF_FALSE tests, and a loop tests its
+# condition, takes a STEP, runs its body and jumps back to the test. A node
+# the walker has no method for (swap, casts, input(), list literals)
+# compiles to the code of its parts followed by a None constant. The stack
+# holds plain Python values, so arithmetic is Python's and DISPLAY shows
+# str() of each value. Variables live in the slots CodeGen's SlotResolver
+# assigns (per call frame for locals, per module for globals). Every run is
+# held to a Budget (see Budget.py): CALL and STEP take its steps, and
+# BUDGET_ADD and BUDGET_MUL refuse to build a list or string over its caps;
+# operands the analyzer typed as numbers use plain ADD and MUL instead.
+
+import re
+import sys
+from array import array
+from enum import IntEnum
+
+from Budget import Budget, BudgetExceeded
+from CodeGen import (
+    MAX_CALL_DEPTH, SlotResolver, _deep_recursion, _flatten_nodes, _numeric_operands, _operator_of, _split_conditional,
+    _truthy,
+)
+from Parser import ASTNode
+
+
+class VMError(Exception):
+    """Raised when a program cannot be compiled to bytecode or fails while running."""
+    pass
+
+
+class Op(IntEnum):
+    LOAD_CONST = 0
+    LOAD_LOCAL = 1
+    STORE_LOCAL = 2
+    LOAD_GLOBAL = 3
+    STORE_GLOBAL = 4
+    POP = 5
+    DUP = 6
+    SWAP = 7
+    ADD = 8
+    SUB = 9
+    MUL = 10
+    DIV = 11
+    MOD = 12
+    LT = 13
+    GT = 14
+    LE = 15
+    GE = 16
+    EQ = 17
+    NE = 18
+    JUMP = 19
+    JUMP_IF_FALSE = 20
+    AND_JUMP = 21          # falsy TOS: replace it with False and jump; otherwise pop it
+    OR_JUMP = 22           # truthy TOS: replace it with True and jump; otherwise pop it
+    TO_BOOL = 23
+    CALL = 24              # operand: index into module.functions; TOS is the argument list
+    RETURN = 25
+    DISPLAY = 26           # operand: number of values
+    BUILD_LIST = 27        # operand: number of items
+    COLLECT = 28           # operand: number of values; keeps those that are not None, or None
+    BUDGET_ADD = 29        # ADD, refused before it builds a list or string over the budget's caps
+    BUDGET_MUL = 30        # MUL, likewise
+    STEP = 31              # takes one step of the budget; every loop iteration starts with one
+    JUMP_IF_TRUE = 32
+    # Superinstructions the compiler emits for common pairs.
+    ADD_CONST = 33         # LOAD_CONST + ADD, for a numeric constant; operand: constant index
+    SUB_CONST = 34         # LOAD_CONST + SUB, likewise
+    JUMP_IF_NOT_LT = 35    # LT + JUMP_IF_FALSE
+    JUMP_IF_NOT_GT = 36
+    JUMP_IF_NOT_LE = 37
+    JUMP_IF_NOT_GE = 38
+    JUMP_IF_NOT_EQ = 39
+    JUMP_IF_NOT_NE = 40
+
+
+_BINARY_OPS = {
+    "+": Op.ADD, "-": Op.SUB, "*": Op.MUL, "/": Op.DIV, "%": Op.MOD,
+    "<": Op.LT, ">": Op.GT, "<=": Op.LE, ">=": Op.GE, "==": Op.EQ, "!=": Op.NE,
+}
+# Only + and * can build a list or string longer than their operands.
+_SIZED_OPS = {"+": Op.BUDGET_ADD, "*": Op.BUDGET_MUL}
+# Adding a number to a value cannot build a list or string, so no budget check is needed.
+_CONST_OPS = {"+": Op.ADD_CONST, "-": Op.SUB_CONST}
+_COMPARE_JUMPS = {
+    Op.LT: Op.JUMP_IF_NOT_LT, Op.GT: Op.JUMP_IF_NOT_GT, Op.LE: Op.JUMP_IF_NOT_LE,
+    Op.GE: Op.JUMP_IF_NOT_GE, Op.EQ: Op.JUMP_IF_NOT_EQ, Op.NE: Op.JUMP_IF_NOT_NE,
+}
+_JUMPS = (Op.JUMP, Op.JUMP_IF_FALSE, Op.JUMP_IF_TRUE, Op.AND_JUMP, Op.OR_JUMP, *_COMPARE_JUMPS.values())
+
+
+class CodeObject:
+    """The bytecode of one function: instructions, slot names and calling convention."""
+
+    __slots__ = ("name", "code", "argcount", "nlocals", "varnames", "_instructions")
+
+    def __init__(self, name, argcount=0, nlocals=0):
+        self.name = name
+        self.code = array("i")
+        self.argcount = argcount
+        self.nlocals = nlocals
+        self.varnames = [None] * nlocals
+        self._instructions = None
+
+    def instructions(self):
+        """
+        The code as a list of (opcode, operand) tuples, jump operands counted
+        in instructions. The VM runs this form: fetching one tuple costs less
+        than fetching two ints from the array.
+        """
+        if self._instructions is None:
+            code = self.code
+            self._instructions = [(code[pc], code[pc + 1] // 2 if code[pc] in _JUMPS else code[pc + 1])
+                                  for pc in range(0, len(code), 2)]
+        return self._instructions
+
+    def __repr__(self):
+        return f"CodeObject({self.name}, {len(self.code) // 2} instructions)"
+
+
+class BytecodeModule:
+    """A compiled program: its functions, @main_casper, the constant pool and global slots."""
+
+    __slots__ = ("constants", "functions", "main", "global_names")
+
+    def __init__(self, constants, functions, main, global_names):
+        self.constants = constants
+        self.functions = functions
+        self.main = main
+        self.global_names = global_names
+
+
+class BytecodeCompiler:
+    """
+    Lowers a program AST to a BytecodeModule.
+
+    Each node compiles to code that does what CodeGenerator.execute_node
+    does for it and leaves its result on the stack: _compile_<type> mirrors
+    execute_<type>, and a node the walker has no method for runs its
+    children for their effects and yields None, as in generic_execute.
+    """
+
+    def __init__(self):
+        self.constants = []
+        self._constant_slots = {}
+        self.global_names = []
+        self.functions = []
+        self._function_slots = {}
+
+    def compile(self, ast):
+        children = _flatten_nodes(ast.children)
+        resolver = SlotResolver().resolve(children)
+        self.global_names = [None] * len(resolver.global_slots)
+        for name, slot in resolver.global_slots.items():
+            self.global_names[slot] = name
+        # Every function is known before any code is compiled, so calls may come first, or recurse.
+        for name, function in resolver.functions.items():
+            self._function_slots[name] = len(self.functions)
+            self.functions.append(CodeObject(name, function.nparams, function.nlocals))
+
+        main = CodeObject("@main_casper", 0, resolver.main_size)
+        self._begin(main)
+        main_function = None
+        for child in children:
+            if getattr(child, "type", None) == "main_function":
+                main_function = child
+            else:
+                self._effect(child)
+        if main_function is None:
+            self._display_message("Error: main_function node not found.")
+        elif main_function.children:
+            # execute_program runs the main function's statements without flattening its children.
+            self._effect(main_function.children[0])
+        else:
+            self._display_message("Warning: main_function node has no statements.")
+        self._load_constant(None)
+        self._emit(Op.RETURN)
+        self._finish()
+
+        for function, code in zip(resolver.functions.values(), self.functions):
+            self._begin(code)
+            self._effect(function.body)
+            self._value(function.revive)
+            self._emit(Op.RETURN)
+            self._finish()
+        return BytecodeModule(self.constants, self.functions, main, self.global_names)
+
+    # -- emission -------------------------------------------------------------
+
+    def _begin(self, code):
+        self._code = code
+        self._ops = []
+
+    def _finish(self):
+        self._code.code = array("i", self._ops)
+
+    def _emit(self, op, arg=0):
+        self._ops += (op, arg)
+        return len(self._ops) - 2
+
+    def _here(self):
+        return len(self._ops)
+
+    def _patch(self, position, target):
+        self._ops[position + 1] = target
+
+    def _constant(self, value):
+        # Keyed by type as well, so 1, 1.0 and True get separate slots.
+        key = (type(value), value)
+        slot = self._constant_slots.get(key)
+        if slot is None:
+            slot = self._constant_slots[key] = len(self.constants)
+            self.constants.append(value)
+        return slot
+
+    def _load_constant(self, value):
+        self._emit(Op.LOAD_CONST, self._constant(value))
+
+    def _binary(self, symbol, numeric=False):
+        """Emits left <symbol> right, for operands already on the stack; `numeric` ones skip the size checks."""
+        fused = _CONST_OPS.get(symbol)
+        if fused is not None and self._ops[-2] == Op.LOAD_CONST and type(self.constants[self._ops[-1]]) in (int, float):
+            self._ops[-2] = fused
+            return
+        self._emit(_BINARY_OPS[symbol] if numeric else _SIZED_OPS.get(symbol, _BINARY_OPS[symbol]))
+
+    def _jump_if_false(self, target=0):
+        # A comparison whose result is only tested jumps on it directly.
+        fused = _COMPARE_JUMPS.get(self._ops[-2])
+        if fused is not None:
+            self._ops[-2:] = [fused, target]
+            return len(self._ops) - 2
+        return self._emit(Op.JUMP_IF_FALSE, target)
+
+    def _pop(self):
+        # A constant that is pushed only to be dropped is not pushed at all.
+        if len(self._ops) >= 2 and self._ops[-2] == Op.LOAD_CONST:
+            del self._ops[-2:]
+        else:
+            self._emit(Op.POP)
+
+    def _display_message(self, message):
+        self._load_constant(message)
+        self._emit(Op.DISPLAY, 1)
+
+    # -- names ----------------------------------------------------------------
+
+    def _load(self, ident):
+        if ident.is_global:
+            self._emit(Op.LOAD_GLOBAL, ident.slot)
+        else:
+            self._code.varnames[ident.slot] = ident.value
+            self._emit(Op.LOAD_LOCAL, ident.slot)
+
+    def _store(self, ident):
+        if ident.is_global:
+            self._emit(Op.STORE_GLOBAL, ident.slot)
+        else:
+            self._code.varnames[ident.slot] = ident.value
+            self._emit(Op.STORE_LOCAL, ident.slot)
+
+    # -- nodes ----------------------------------------------------------------
+
+    def _value(self, node):
+        """Emits code that does what CodeGenerator.execute_node(node) does and pushes its result."""
+        if isinstance(node, list):
+            items = _flatten_nodes(node)
+            for item in items:
+                self._value(item)
+            self._emit(Op.COLLECT, len(items))
+            return
+        if not isinstance(node, ASTNode):
+            # None, and the bare operator strings and numbers some nodes hold.
+            self._load_constant(None)
+            return
+        children = _flatten_nodes(node.children) if node.children else []
+        compiler = getattr(self, f"_compile_{node.type}", None)
+        if compiler is None:
+            for child in children:
+                self._effect(child)
+            self._load_constant(None)
+        else:
+            compiler(node, children)
+
+    def _effect(self, node):
+        """Emits code that runs node for what it does, leaving nothing on the stack."""
+        if isinstance(node, list):
+            for item in _flatten_nodes(node):
+                self._effect(item)
+        else:
+            self._value(node)
+            self._pop()
+
+    def _compile_output_statement(self, node, children):
+        if children:
+            self._value(children[0])
+            self._emit(Op.DISPLAY, 1)
+        else:
+            self._display_message("Warning: output_statement has no children.")
+        self._load_constant(None)
+
+    def _compile_value(self, node, children):
+        self._value(children[0] if children else None)
+
+    def _compile_expression(self, node, children):
+        tail = children[1] if len(children) > 1 else None
+        if tail is None or len(tail.children) < 2:
+            self._value(children[0])
+            return
+        operator, right = _operator_of(tail), tail.children[1]
+        self._value(children[0])
+        if operator in ("&&", "||"):
+            # && and || short-circuit, so the right operand may never run.
+            jump = self._emit(Op.AND_JUMP if operator == "&&" else Op.OR_JUMP)
+            self._value(right)
+            self._emit(Op.TO_BOOL)
+            self._patch(jump, self._here())
+        elif operator in _BINARY_OPS:
+            self._value(right)
+            self._binary(operator, _numeric_operands(node))
+        else:
+            # Other operators still evaluate the right operand, then yield the left one.
+            self._effect(right)
+
+    _compile_condition = _compile_expression
+
+    def _compile_paren(self, node, children):
+        self._value(children[0])
+
+    def _compile_neg_int(self, node, children):
+        self._load_constant(-node.value)
+
+    _compile_neg_flt = _compile_neg_int
+
+    def _compile_literal(self, node, children):
+        self._load_constant(node.value)
+
+    def _compile_str_lit(self, node, children):
+        self._load_constant(node.value.strip('"'))
+
+    def _compile_global_statement(self, node, children):
+        self._value(children[3] if len(children) > 3 else None)
+        self._store(children[1])
+        self._load_constant(None)
+
+    def _compile_var_statement(self, node, children):
+        # `int $a, $b = 1` declares both names; each `= value` belongs to the name before it.
+        ident = children[1] if len(children) > 1 else None
+        for extra in children[3:]:
+            if extra is None:
+                continue
+            if extra.type == "local_var_more":
+                if ident is not None:
+                    self._load_constant(None)
+                    self._store(ident)
+                ident = extra.children[0]
+            elif extra.type == "local_var_assign":
+                self._value(extra)
+                if ident is not None:
+                    self._store(ident)
+                else:
+                    self._pop()
+                ident = None
+        if ident is not None:
+            self._load_constant(None)
+            self._store(ident)
+        self._load_constant(None)
+
+    def _compile_control_variable(self, node, children):
+        self._value(children[2])
+        self._store(children[1])
+        self._load_constant(None)
+
+    def _compile_local_var_assign(self, node, children):
+        self._value(children[0])
+
+    def _compile_var_call(self, node, children):
+        if children:
+            self._load(children[0])
+        else:
+            self._load_constant(None)
+
+    def _compile_var_postfix(self, node, children):
+        var_call, postfix = children[0], children[1] if len(children) > 1 else None
+        self._value(var_call)
+        if postfix in ("++", "--"):
+            # Postfix yields the old value, then stores the updated one.
+            self._emit(Op.DUP)
+            self._load_constant(1)
+            self._binary("+" if postfix == "++" else "-")
+            self._store(var_call.children[0])
+
+    def _compile_assignment_statement(self, node, children):
+        target = children[0] if children else None
+        if target is not None and target.type == "IDENT":
+            tail = children[1]
+            if tail.type != "assign_tail_op":
+                # .push() and .splice() change nothing; their items are only evaluated.
+                for child in children:
+                    self._effect(child)
+                self._load_constant(None)
+                return
+            op = _operator_of(tail)
+            if op == "=":
+                self._value(tail.children[1])
+            else:
+                self._compound(tail.children[1], target)
+                self._binary(op[0], _numeric_operands(tail))
+            self._store(target)
+            self._load_constant(None)
+            return
+        # An element assignment, $a[i] = value, replaces the whole variable.
+        var_name = target.children[0] if target is not None and target.children else None
+        self._value(children[2] if len(children) > 2 else None)
+        if var_name is not None:
+            self._store(var_name)
+        else:
+            self._pop()
+        self._load_constant(None)
+
+    def _compound(self, value, ident):
+        """Pushes the variable, then value, evaluated in that order, for `ident op= value`."""
+        start = self._here()
+        self._value(value)
+        if self._here() - start == 2 and self._ops[start] in (Op.LOAD_CONST, Op.LOAD_LOCAL, Op.LOAD_GLOBAL):
+            # A plain load can be read after the variable instead.
+            load = self._ops[start:]
+            del self._ops[start:]
+            self._load(ident)
+            self._ops += load
+        else:
+            # The value is evaluated before the variable is read.
+            self._load(ident)
+            self._emit(Op.SWAP)
+
+    def _compile_conditional_statement(self, node, children):
+        condition, body, branches = _split_conditional(children)
+        arms = [(condition, body)] + [(parts[0], parts[1:]) for parts in
+                                      (_flatten_nodes(branch.children) for branch in branches)]
+        exits = []
+        for number, (test, block) in enumerate(arms, 1):
+            self._value(test)
+            skip = self._jump_if_false()
+            self._effect(block)
+            if number < len(arms):
+                exits.append(self._emit(Op.JUMP))
+            self._patch(skip, self._here())
+        for position in exits:
+            self._patch(position, self._here())
+        self._load_constant(None)
+
+    def _compile_for_loop(self, node, children):
+        self._effect(children[0])
+        top = self._here()
+        self._value(children[1])
+        exit_jump = self._jump_if_false()
+        self._emit(Op.STEP)
+        self._effect(children[3:])
+        self._effect(children[2])
+        self._emit(Op.JUMP, top)
+        self._patch(exit_jump, self._here())
+        self._load_constant(None)
+
+    def _compile_until_loop(self, node, children):
+        top = self._here()
+        self._value(children[0])
+        exit_jump = self._emit(Op.JUMP_IF_TRUE)
+        self._emit(Op.STEP)
+        self._effect(children[1:])
+        self._emit(Op.JUMP, top)
+        self._patch(exit_jump, self._here())
+        self._load_constant(None)
+
+    def _compile_repeat_until(self, node, children):
+        top = self._emit(Op.STEP)
+        self._effect(children[:-1])
+        self._value(children[-1])
+        self._jump_if_false(top)
+        self._load_constant(None)
+
+    def _compile_update(self, node, children):
+        var_call, tail = children[0], children[1]
+        ident = var_call.children[0]
+        if tail.type == "update_tail_postfix":
+            self._load(ident)
+            self._load_constant(1)
+            self._binary("+" if tail.value == "++" else "-")
+        else:
+            self._compound(tail.children[1], ident)
+            self._binary(_operator_of(tail)[0], _numeric_operands(tail))
+        self._store(ident)
+        self._load_constant(None)
+
+    def _compile_function_declaration(self, node, children):
+        # Bodies run when called; compile() has already compiled them.
+        self._load_constant(None)
+
+    def _compile_function_call(self, node, children):
+        if not children:
+            self._load_constant(None)
+            return
+        name = getattr(children[0], "value", None)
+        args_node = children[1] if len(children) > 1 else None
+        args = _flatten_nodes(args_node.children) if args_node is not None and args_node.children else []
+        for arg in args:
+            self._value(arg)
+        if name == "display":
+            self._emit(Op.DISPLAY, len(args))
+            self._load_constant(None)
+            return
+        slot = self._function_slots.get(name)
+        if slot is None:
+            # Calling an undeclared function evaluates its arguments and yields None.
+            for _ in args:
+                self._pop()
+            self._load_constant(None)
+            return
+        self._emit(Op.BUILD_LIST, len(args))
+        self._emit(Op.CALL, slot)
+
+
+def compile_program(ast):
+    """Compiles a parsed program to a BytecodeModule."""
+    return BytecodeCompiler().compile(ast)
+
+
+# -- virtual machine ------------------------------------------------------------
+
+class VirtualMachine:
+    """
+    Runs a BytecodeModule. `display` receives each output line and `budget`
+    (a default Budget if None) limits the run.
+    """
+
+    def __init__(self, module, display=print, budget=None):
+        self.module = module
+        self.display = display
+        self.budget = budget if budget is not None else Budget()
+        self.globals = []
+        self.fuel = 0
+        self.depth = 0
+
+    def run(self):
+        main = self.module.main
+        self.globals = [None] * len(self.module.global_names)
+        self.depth = 0
+        try:
+            with _deep_recursion():
+                self.fuel = self.budget.start()
+                return self.execute(main, [None] * main.nlocals)
+        except VMError:
+            raise
+        except (BudgetExceeded, ArithmeticError, AttributeError, IndexError, KeyError,
+                MemoryError, RecursionError, TypeError, ValueError) as error:
+            raise VMError(f"Runtime Error: {error}") from None
+
+    def execute(self, code_object, frame):
+        code = code_object.instructions()
+        # Calls run in this same loop: CALL saves the caller's state here and RETURN restores it.
+        calls = []
+        constants = self.module.constants
+        functions = self.module.functions
+        globals_ = self.globals
+        stack = []
+        push = stack.append
+        pop = stack.pop
+        budget = self.budget
+        add = budget.add
+        multiply = budget.multiply
+        pc = 0
+        # Opcodes are compared as int literals (see Op), most frequent first.
+        while True:
+            op, arg = code[pc]
+            pc += 1
+            if op == 1:    # LOAD_LOCAL
+                push(frame[arg])
+            elif op == 2:  # STORE_LOCAL
+                frame[arg] = pop()
+            elif op == 0:  # LOAD_CONST
+                push(constants[arg])
+            elif op == 29:  # BUDGET_ADD
+                right = pop()
+                stack[-1] = add(stack[-1], right)
+            elif op == 8:  # ADD
+                right = pop()
+                stack[-1] = stack[-1] + right
+            elif op == 30:  # BUDGET_MUL
+                right = pop()
+                stack[-1] = multiply(stack[-1], right)
+            elif op == 10:  # MUL
+                right = pop()
+                stack[-1] = stack[-1] * right
+            elif op == 25:  # RETURN
+                if not calls:
+                    return pop()
+                value = pop()
+                self.depth -= 1
+                code, pc, frame, stack = calls.pop()
+                push, pop = stack.append, stack.pop
+                push(value)
+            elif op == 27:  # BUILD_LIST
+                if arg:
+                    items = stack[-arg:]
+                    del stack[-arg:]
+                else:
+                    items = []
+                push(items)
+            elif op == 24:  # CALL
+                if self.depth >= MAX_CALL_DEPTH:
+                    raise RecursionError("maximum call depth exceeded")
+                self.fuel -= 1
+                if not self.fuel:
+                    self.fuel = budget.refuel()
+                function = functions[arg]
+                args = pop()
+                callee = [None] * function.nlocals
+                count = min(len(args), function.argcount)
+                callee[:count] = args[:count]
+                self.depth += 1
+                calls.append((code, pc, frame, stack))
+                code, pc, frame, stack = function.instructions(), 0, callee, []
+                push, pop = stack.append, stack.pop
+            elif op == 36:  # JUMP_IF_NOT_GT
+                right = pop()
+                if not pop() > right:
+                    pc = arg
+            elif op == 34:  # SUB_CONST
+                stack[-1] = stack[-1] - constants[arg]
+            elif op == 31:  # STEP
+                self.fuel -= 1
+                if not self.fuel:
+                    self.fuel = budget.refuel()
+            elif op == 33:  # ADD_CONST
+                stack[-1] = stack[-1] + constants[arg]
+            elif op == 19:  # JUMP
+                pc = arg
+            elif op == 35:  # JUMP_IF_NOT_LT
+                right = pop()
+                if not pop() < right:
+                    pc = arg
+            elif op == 37:  # JUMP_IF_NOT_LE
+                right = pop()
+                if not pop() <= right:
+                    pc = arg
+            elif op == 38:  # JUMP_IF_NOT_GE
+                right = pop()
+                if not pop() >= right:
+                    pc = arg
+            elif op == 20:  # JUMP_IF_FALSE
+                value = pop()
+                if not value or value == "Night":
+                    pc = arg
+            elif op == 7:  # SWAP
+                stack[-1], stack[-2] = stack[-2], stack[-1]
+            elif op == 9:  # SUB
+                right = pop()
+                stack[-1] = stack[-1] - right
+            elif op == 5:  # POP
+                pop()
+            elif op == 3:  # LOAD_GLOBAL
+                push(globals_[arg])
+            elif op == 4:  # STORE_GLOBAL
+                globals_[arg] = pop()
+            elif op == 39:  # JUMP_IF_NOT_EQ
+                right = pop()
+                if not pop() == right:
+                    pc = arg
+            elif op == 40:  # JUMP_IF_NOT_NE
+                right = pop()
+                if not pop() != right:
+                    pc = arg
+            elif op == 32:  # JUMP_IF_TRUE
+                value = pop()
+                if value and value != "Night":
+                    pc = arg
+            elif op == 26:  # DISPLAY
+                values = stack[-arg:] if arg else []
+                del stack[len(stack) - len(values):]
+                self.display(" ".join(str(value) for value in values))
+            elif op == 13:  # LT
+                right = pop()
+                stack[-1] = stack[-1] < right
+            elif op == 14:  # GT
+                right = pop()
+                stack[-1] = stack[-1] > right
+            elif op == 15:  # LE
+                right = pop()
+                stack[-1] = stack[-1] <= right
+            elif op == 16:  # GE
+                right = pop()
+                stack[-1] = stack[-1] >= right
+            elif op == 17:  # EQ
+                right = pop()
+                stack[-1] = stack[-1] == right
+            elif op == 18:  # NE
+                right = pop()
+                stack[-1] = stack[-1] != right
+            elif op == 11:  # DIV
+                right = pop()
+                stack[-1] = stack[-1] / right
+            elif op == 12:  # MOD
+                right = pop()
+                stack[-1] = stack[-1] % right
+            elif op == 21:  # AND_JUMP
+                if not _truthy(stack[-1]):
+                    stack[-1] = False
+                    pc = arg
+                else:
+                    pop()
+            elif op == 22:  # OR_JUMP
+                if _truthy(stack[-1]):
+                    stack[-1] = True
+                    pc = arg
+                else:
+                    pop()
+            elif op == 23:  # TO_BOOL
+                stack[-1] = _truthy(stack[-1])
+            elif op == 6:  # DUP
+                push(stack[-1])
+            elif op == 28:  # COLLECT
+                values = [value for value in (stack[-arg:] if arg else []) if value is not None]
+                del stack[len(stack) - arg:]
+                push(values if values else None)
+            else:
+                raise VMError(f"Bad opcode {op} at {(pc - 1) * 2} in {code_object.name}")
+
+
+def run_program(ast, display=print, budget=None):
+    """Compiles and runs a parsed program on the VM."""
+    VirtualMachine(compile_program(ast), display, budget).run()
+
+
+# -- disassembler ---------------------------------------------------------------
+
+def disassemble_code(code_object, module):
+    lines = [f"{code_object.name}: {code_object.argcount} args, {code_object.nlocals} locals"]
+    code = code_object.code
+    for pc in range(0, len(code), 2):
+        op, arg = Op(code[pc]), code[pc + 1]
+        if op in (Op.LOAD_CONST, Op.ADD_CONST, Op.SUB_CONST):
+            detail = repr(module.constants[arg])
+        elif op in (Op.LOAD_LOCAL, Op.STORE_LOCAL):
+            detail = code_object.varnames[arg]
+        elif op in (Op.LOAD_GLOBAL, Op.STORE_GLOBAL):
+            detail = module.global_names[arg]
+        elif op == Op.CALL:
+            detail = module.functions[arg].name
+        elif op in _JUMPS:
+            detail = f"to {arg}"
+        elif op in (Op.DISPLAY, Op.BUILD_LIST, Op.COLLECT):
+            detail = f"{arg} values"
+        else:
+            detail = ""
+        lines.append(f"  {pc:>5}  {op.name:<14}{arg if detail else '':>4}  {detail}".rstrip())
+    return "\n".join(lines)
+
+
+def disassemble(module):
+    """Renders every code object of a module, functions first, with operands resolved."""
+    parts = [disassemble_code(code, module) for code in module.functions + [module.main]]
+    return "\n\n".join(parts)
+
+
+if __name__ == "__main__":
+    from Lexer import TokenStream
+    from Parser import build_parser
+
+    with open(sys.argv[1]) as f:
+        text = f.read()
+    parser = build_parser()
+    for source in (chunk.strip() for chunk in re.split(r"(?<=ghost)", text)):
+        if source:
+            try:
+                module = compile_program(parser.parse(lexer=TokenStream(source.replace("\n", "\r\n"))))
+            except (SyntaxError, VMError) as error:
+                print(f"{error}\n")
+                continue
+            print(disassemble(module), end="\n\n")
@@ -0,0 +1,535 @@
+# CBackend.py
+#
+# Native code generation: translates a parsed CASPER program into portable
+# C99, builds it with the system C compiler and runs the binary. Lowering.py
+# gives every value a static type, so int/flt/bln/str values map directly
+# onto C types and compute-heavy programs run at native speed. Programs
+# behave as they do under CodeGen's tree walker: the same output, the same
+# runtime errors with Python's messages, and the same Budget limits on steps
+# and string sizes, baked into the binary when it is translated.
+#
+# Binaries are cached on disk under the SHA-256 of their C source and the
+# compiler command, in CASPER_NATIVE_CACHE (default: a casper-native folder
+# in the system temp directory), so a program is compiled once. To see the
+# generated C:
+#
+#   python CBackend.py tests/test.lime
+#
+# Differences from the tree walker: ints are 64-bit, so a result that does
+# not fit fails with "integer overflow", and int / int and comparisons
+# between ints and flts go through doubles, which round ints beyond 2**53.
+# The time limit is the `timeout` given to execute().
+
+import hashlib
+import math
+import os
+import re
+import shlex
+import subprocess
+import sys
+import tempfile
+
+from Budget import Budget
+from CodeGen import MAX_CALL_DEPTH
+from Lowering import Const, LoweringError, lower_program
+
+# Compiler command; CC follows the usual convention.
+CC = os.environ.get("CC", "cc")
+CFLAGS = ["-std=c99", "-O2"]
+CACHE_DIR = os.environ.get("CASPER_NATIVE_CACHE", os.path.join(tempfile.gettempdir(), "casper-native"))
+
+
+class NativeError(Exception):
+    """Raised when a program cannot be translated to C, fails to build, or fails while running."""
+    pass
+
+
+def _python_error(operation):
+    try:
+        operation()
+    except ArithmeticError as error:
+        return str(error)
+
+
+# The messages Python (and so the tree walker) gives for these errors.
+_ERRORS = {
+    "div_int": _python_error(lambda: 1 / 0),
+    "div_flt": _python_error(lambda: 1.0 / 0.0),
+    "mod_int": _python_error(lambda: 1 % 0),
+    "mod_flt": _python_error(lambda: 1.0 % 0.0),
+}
+
+_C_TYPES = {"int": "i64", "flt": "double", "bln": "int", "str": "const char *"}
+_DEFAULTS = {"int": "0", "flt": "0.0", "bln": "0", "str": '""'}
+_INTEGRAL = ("int", "bln")
+_ARITHMETIC = {"+": "add_int", "-": "sub_int", "*": "mul_int"}
+
+RUNTIME = r"""
+#include <math.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+
+typedef long long i64;
+
+static int depth;
+static i64 steps;
+
+static void fail(const char *message) {
+    fflush(stdout);
+    fprintf(stderr, "Runtime Error: %s\n", message);
+    exit(1);
+}
+
+static void *xalloc(size_t size) {
+    void *memory = malloc(size ? size : 1);
+    if (!memory) fail("out of memory");
+    return memory;
+}
+
+/* -- calls and loops ------------------------------------------------------ */
+
+/* One step of the Budget: a call, or a loop iteration. */
+static void step(void) {
+    char message[64];
+    if (STEP_LIMIT && ++steps > STEP_LIMIT) {
+        snprintf(message, sizeof message, "Step limit of %lld exceeded.", (i64)STEP_LIMIT);
+        fail(message);
+    }
+}
+
+static void enter(void) {
+    if (depth >= MAX_CALL_DEPTH) fail("maximum call depth exceeded");
+    step();
+    depth++;
+}
+
+/* -- strings -------------------------------------------------------------- */
+
+/* Characters, not bytes: strings are UTF-8. */
+static i64 str_chars(const char *text) {
+    i64 count = 0;
+    for (; *text; text++)
+        if ((*text & 0xC0) != 0x80) count++;
+    return count;
+}
+
+/* Refuses a string of `chars` characters before it is built. */
+static void check_size(i64 chars) {
+    char message[96];
+    if (STRING_LIMIT && chars > STRING_LIMIT) {
+        snprintf(message, sizeof message, "String of %lld characters exceeds the limit of %lld.",
+                 chars, (i64)STRING_LIMIT);
+        fail(message);
+    }
+}
+
+static const char *str_concat(const char *left, const char *right) {
+    size_t left_len = strlen(left), right_len = strlen(right);
+    char *result;
+    check_size(str_chars(left) + str_chars(right));
+    result = xalloc(left_len + right_len + 1);
+    memcpy(result, left, left_len);
+    memcpy(result + left_len, right, right_len + 1);
+    return result;
+}
+
+static const char *str_repeat(const char *text, i64 count) {
+    size_t len = strlen(text);
+    char *result, *cursor;
+    if (count <= 0 || !len) return "";
+    if ((i64)len > (i64)(0x7fffffffffffffffLL / count)) fail("repeated string is too long");
+    check_size(str_chars(text) * count);
+    result = cursor = xalloc(len * (size_t)count + 1);
+    for (; count; count--, cursor += len) memcpy(cursor, text, len);
+    *cursor = '\0';
+    return result;
+}
+
+/* Day and Night evaluate to their names, so "Night" is false as well. */
+static int str_truthy(const char *text) { return *text && strcmp(text, "Night") != 0; }
+
+/* -- arithmetic ----------------------------------------------------------- */
+
+static i64 add_int(i64 left, i64 right) {
+    i64 result;
+    if (__builtin_add_overflow(left, right, &result)) fail("integer overflow");
+    return result;
+}
+
+static i64 sub_int(i64 left, i64 right) {
+    i64 result;
+    if (__builtin_sub_overflow(left, right, &result)) fail("integer overflow");
+    return result;
+}
+
+static i64 mul_int(i64 left, i64 right) {
+    i64 result;
+    if (__builtin_mul_overflow(left, right, &result)) fail("integer overflow");
+    return result;
+}
+
+static double div_int(i64 left, i64 right) {
+    if (right == 0) fail(DIV_INT_ERROR);
+    return (double)left / (double)right;
+}
+
+static double div_flt(double left, double right) {
+    if (right == 0) fail(DIV_FLT_ERROR);
+    return left / right;
+}
+
+/* Python's %: the result takes the divisor's sign. */
+static i64 mod_int(i64 left, i64 right) {
+    i64 result;
+    if (right == 0) fail(MOD_INT_ERROR);
+    if (right == -1) return 0;
+    result = left % right;
+    if (result && (result < 0) != (right < 0)) result += right;
+    return result;
+}
+
+static double mod_flt(double left, double right) {
+    double result;
+    if (right == 0) fail(MOD_FLT_ERROR);
+    result = fmod(left, right);
+    if (result) {
+        if ((right < 0) != (result < 0)) result += right;
+    } else {
+        result = copysign(0.0, right);
+    }
+    return result;
+}
+
+/* -- display -------------------------------------------------------------- */
+
+/* Python's repr() of a float: the shortest digits that read back exactly. */
+static void format_flt(char *out, double value) {
+    char digits[40], mantissa[24];
+    int precision, exponent, count = 0, point, i;
+    char *cursor;
+    if (isnan(value)) { strcpy(out, "nan"); return; }
+    if (isinf(value)) { strcpy(out, value < 0 ? "-inf" : "inf"); return; }
+    if (value == 0) { strcpy(out, signbit(value) ? "-0.0" : "0.0"); return; }
+    for (precision = 1; precision < 17; precision++) {
+        snprintf(digits, sizeof digits, "%.*e", precision - 1, value);
+        if (strtod(digits, NULL) == value) break;
+    }
+    snprintf(digits, sizeof digits, "%.*e", precision - 1, value);
+    cursor = digits;
+    if (*cursor == '-') *out++ = *cursor++;
+    for (; *cursor != 'e'; cursor++)
+        if (*cursor != '.') mantissa[count++] = *cursor;
+    while (count > 1 && mantissa[count - 1] == '0') count--;
+    mantissa[count] = '\0';
+    exponent = atoi(cursor + 1);
+    if (exponent < -4 || exponent >= 16) {
+        *out++ = mantissa[0];
+        if (count > 1) { *out++ = '.'; memcpy(out, mantissa + 1, (size_t)count - 1); out += count - 1; }
+        sprintf(out, "e%c%02d", exponent < 0 ? '-' : '+', exponent < 0 ? -exponent : exponent);
+        return;
+    }
+    if (exponent < 0) {
+        *out++ = '0'; *out++ = '.';
+        for (i = -1; i > exponent; i--) *out++ = '0';
+        memcpy(out, mantissa, (size_t)count); out += count;
+    } else {
+        point = exponent + 1;
+        for (i = 0; i < point; i++) *out++ = i < count ? mantissa[i] : '0';
+        *out++ = '.';
+        if (count > point) { memcpy(out, mantissa + point, (size_t)(count - point)); out += count - point; }
+        else *out++ = '0';
+    }
+    *out = '\0';
+}
+
+static void put_int(i64 value) { printf("%lld", value); }
+
+static void put_flt(double value) {
+    char buffer[40];
+    format_flt(buffer, value);
+    fputs(buffer, stdout);
+}
+
+static void put_bln(int value) { fputs(value ? "True" : "False", stdout); }
+
+static void put_str(const char *value) { fputs(value, stdout); }
+"""
+
+
+def _c_string(text):
+    """A C string literal for `text`, encoded as UTF-8."""
+    out = []
+    for byte in text.encode("utf-8"):
+        char = chr(byte)
+        if char in '"\\':
+            out.append("\\" + char)
+        elif 32 <= byte < 127:
+            out.append(char)
+        else:
+            out.append(f"\\{byte:03o}")
+    return '"' + "".join(out) + '"'
+
+
+def _mangle(name):
+    return re.sub(r"\W", "_", name.lstrip("$@"))
+
+
+class CTranslator:
+    """
+    Emits C source for a LoweredProgram. Temps become C locals t<n>, a
+    CASPER local gets one C local per type it holds (l<slot>_<type>), and
+    globals, functions and their parameters keep their types throughout.
+    None values are never stored: an operand of type none is the constant
+    None, so none parameters are dropped and none functions return void.
+    """
+
+    def __init__(self, budget):
+        self.budget = budget
+
+    def translate(self, program):
+        self._functions = {name: f"f{number}_{_mangle(name)}" for number, name in enumerate(program.functions)}
+        self._globals = {slot: f"g{slot}_{_mangle(program.global_names[slot])}" for slot in program.global_types}
+        limits = {
+            "MAX_CALL_DEPTH": MAX_CALL_DEPTH,
+            "STEP_LIMIT": f"{self.budget.steps}LL",
+            "STRING_LIMIT": f"{self.budget.string_chars}LL",
+        }
+        limits.update((f"{key.upper()}_ERROR", _c_string(message)) for key, message in _ERRORS.items())
+        lines = [f"#define {name} {value}" for name, value in limits.items()]
+        lines += [RUNTIME.strip(), ""]
+        for slot, value_type in program.global_types.items():
+            lines.append(f"static {self._declaration(value_type, self._globals[slot])};")
+        functions = list(program.functions.values())
+        lines += [self._signature(function) + ";" for function in functions] + [""]
+        lines += [self._function(function) for function in functions]
+        lines.append(self._function(program.main))
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _declaration(value_type, name):
+        c_type = _C_TYPES[value_type]
+        return c_type + name if c_type.endswith("*") else f"{c_type} {name}"
+
+    def _signature(self, function):
+        if function.name == "@main_casper":
+            return "int main(void)"
+        params = ", ".join(self._declaration(param.type, f"t{param.number}")
+                           for param in function.params if param.type != "none")
+        # Functions that return None, or never return, are void.
+        returns = _C_TYPES.get(function.returns, "void")
+        separator = "" if returns.endswith("*") else " "
+        return f"static {returns}{separator}{self._functions[function.name]}({params or 'void'})"
+
+    # -- functions ------------------------------------------------------------
+
+    def _function(self, function):
+        self._body = []
+        self._depth = 1
+        self._main = function.name == "@main_casper"
+        lines = [self._signature(function) + " {"]
+        params = {param.number for param in function.params}
+        for temp in function.temps:
+            if temp.number not in params and temp.type in _C_TYPES:
+                lines.append(f"    {self._declaration(temp.type, f't{temp.number}')};")
+        for slot, value_type in sorted(function.locals):
+            lines.append(f"    {self._declaration(value_type, f'l{slot}_{value_type}')} = {_DEFAULTS[value_type]};")
+        if not self._main:
+            self._emit("enter();")
+        self._block(function.code)
+        if self._main:
+            self._emit("return 0;")
+        return "\n".join(lines + self._body + ["}", ""])
+
+    def _emit(self, line):
+        self._body.append("    " * self._depth + line)
+
+    def _block(self, code):
+        for instruction in code:
+            getattr(self, f"_emit_{instruction[0]}")(*instruction[1:])
+
+    # -- operands -------------------------------------------------------------
+
+    def _operand(self, value):
+        if not isinstance(value, Const):
+            return f"t{value.number}"
+        if value.type == "str":
+            return _c_string(value.value)
+        if value.type == "flt":
+            if math.isnan(value.value):
+                return "NAN"
+            if math.isinf(value.value):
+                return "HUGE_VAL" if value.value > 0 else "-HUGE_VAL"
+            return repr(value.value)
+        if not -2 ** 63 < value.value < 2 ** 63:
+            raise NativeError(f"The integer {value.value} does not fit in 64 bits.")
+        return f"{int(value.value)}LL" if value.type == "int" else str(int(value.value))
+
+    def _var(self, var):
+        if var[0] == "global":
+            return self._globals[var[1]]
+        return f"l{var[1]}_{var[2]}"
+
+    # -- instructions ---------------------------------------------------------
+
+    def _emit_load(self, dst, var):
+        self._emit(f"{self._operand(dst)} = {self._var(var)};")
+
+    def _emit_store(self, var, src):
+        self._emit(f"{self._var(var)} = {self._operand(src)};")
+
+    def _emit_move(self, dst, src):
+        self._emit(f"{self._operand(dst)} = {self._operand(src)};")
+
+    def _emit_truth(self, dst, src):
+        test = "str_truthy({})" if src.type == "str" else "{} != 0"
+        self._emit(f"{self._operand(dst)} = {test.format(self._operand(src))};")
+
+    def _emit_binary(self, op, dst, left, right):
+        self._emit(f"{self._operand(dst)} = {self._binary(op, dst.type, left, right)};")
+
+    def _binary(self, op, result_type, left, right):
+        l, r = self._operand(left), self._operand(right)
+        types = (left.type, right.type)
+        if "str" in types:
+            if op == "+":
+                return f"str_concat({l}, {r})"
+            if op == "*":
+                return f"str_repeat({l}, {r})" if left.type == "str" else f"str_repeat({r}, {l})"
+            # Both are strings: the rest compare them.
+            return f"(strcmp({l}, {r}) {op} 0)"
+        integral = left.type in _INTEGRAL and right.type in _INTEGRAL
+        if op == "/":
+            return f"div_int({l}, {r})" if integral else f"div_flt({l}, {r})"
+        if op == "%":
+            return f"mod_int({l}, {r})" if integral else f"mod_flt({l}, {r})"
+        if op in _ARITHMETIC and result_type == "int":
+            return f"{_ARITHMETIC[op]}({l}, {r})"
+        if result_type == "flt":
+            return f"((double){l} {op} (double){r})"
+        return f"({l} {op} {r})"
+
+    def _emit_display(self, values):
+        # One line, each value as str() shows it, separated by spaces (see Output.print).
+        text = []
+        for number, value in enumerate(values):
+            if number:
+                text.append(" ")
+            if isinstance(value, Const):
+                text.append(str(value.value))
+                continue
+            if text:
+                self._emit(f"put_str({_c_string(''.join(text))});")
+                text = []
+            self._emit(f"put_{value.type}({self._operand(value)});")
+        self._emit(f"put_str({_c_string(''.join(text) + chr(10))});")
+
+    def _emit_call(self, dst, name, args):
+        call = f"{self._functions[name]}({', '.join(self._operand(arg) for arg in args if arg.type != 'none')})"
+        self._emit(f"{self._operand(dst)} = {call};" if dst is not None else f"{call};")
+
+    def _emit_if(self, condition, then, otherwise):
+        self._emit(f"if ({self._operand(condition)}) {{")
+        self._depth += 1
+        self._block(then)
+        self._depth -= 1
+        if otherwise:
+            self._emit("} else {")
+            self._depth += 1
+            self._block(otherwise)
+            self._depth -= 1
+        self._emit("}")
+
+    def _emit_loop(self, head, condition, body):
+        self._emit("for (;;) {")
+        self._depth += 1
+        self._block(head)
+        self._emit(f"if (!{self._operand(condition)}) break;")
+        self._block(body)
+        self._depth -= 1
+        self._emit("}")
+
+    def _emit_not(self, dst, src):
+        self._emit(f"{self._operand(dst)} = !{self._operand(src)};")
+
+    def _emit_step(self):
+        self._emit("step();")
+
+    def _emit_fail(self, message):
+        self._emit(f"fail({_c_string(message)});")
+
+    def _emit_return(self, src):
+        self._emit("depth--;")
+        self._emit(f"return {self._operand(src)};" if src.type in _C_TYPES else "return;")
+
+
+def translate_program(ast, budget=None):
+    """Returns the C source of a parsed program, with the limits of `budget` (default: a fresh Budget())."""
+    try:
+        program = lower_program(ast)
+    except LoweringError as error:
+        raise NativeError(str(error)) from None
+    return CTranslator(budget if budget is not None else Budget()).translate(program)
+
+
+def build(c_source):
+    """Compiles C source to an executable, reusing the cached binary for identical source and flags."""
+    command = shlex.split(CC) + CFLAGS
+    key = hashlib.sha256((" ".join(command) + "\n" + c_source).encode()).hexdigest()[:32]
+    binary = os.path.join(CACHE_DIR, "casper-" + key + (".exe" if os.name == "nt" else ""))
+    if os.path.exists(binary):
+        return binary
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    source_path = os.path.join(CACHE_DIR, key + ".c")
+    with open(source_path, "w") as f:
+        f.write(c_source)
+    # Build under a private name, then rename, so a concurrent run never sees half a binary.
+    partial = f"{binary}.{os.getpid()}.tmp"
+    try:
+        result = subprocess.run(command + ["-o", partial, source_path, "-lm"], capture_output=True, text=True)
+    except OSError as error:
+        raise NativeError(f"Cannot run the C compiler '{CC}': {error}") from error
+    if result.returncode != 0:
+        raise NativeError(f"C compiler failed:\n{result.stderr}")
+    os.replace(partial, binary)
+    return binary
+
+
+def build_program(ast, budget=None):
+    """Translates and compiles a parsed program; returns the path of its executable."""
+    return build(translate_program(ast, budget))
+
+
+def execute(binary, display=print, timeout=None):
+    """Runs a built program and passes each output line to `display`."""
+    try:
+        result = subprocess.run([binary], capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        raise NativeError(f"Runtime Error: program did not finish within {timeout} seconds.") from None
+    for line in result.stdout.splitlines():
+        display(line)
+    if result.returncode != 0:
+        raise NativeError(result.stderr.strip() or f"Runtime Error: exit status {result.returncode}")
+
+
+def run_program(ast, display=print, budget=None, timeout=None):
+    """Builds (or reuses) a parsed program's executable and runs it."""
+    execute(build_program(ast, budget), display, timeout)
+
+
+if __name__ == "__main__":
+    from Lexer import TokenStream
+    from Parser import build_parser
+
+    with open(sys.argv[1]) as f:
+        text = f.read()
+    parser = build_parser()
+    for source in (chunk.strip() for chunk in re.split(r"(?<=ghost)", text)):
+        if source:
+            try:
+                c_source = translate_program(parser.parse(lexer=TokenStream(source.replace("\n", "\r\n"))))
+            except (SyntaxError, NativeError) as error:
+                print(f"{error}\n")
+                continue
+            # The runtime is the same for every program; show only the translation.
+            print(c_source.split(RUNTIME.strip(), 1)[1].strip(), end="\n\n")
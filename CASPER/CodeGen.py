@@ -1,8 +1,298 @@
+import operator
+import os
+import sys
+import threading
+from contextlib import contextmanager
+
+from Budget import Budget
+from Output import StdoutSink
 from Parser import ASTNode
 
-class CodeGenerator:
+# Execution engine used by run_code_generation(): "walk" or "closure". The
+# web endpoints run each program once, and compiling it to closures costs
+# more than walking it once, so the tree walker is the default.
+CODEGEN_ENGINE = os.environ.get("CASPER_CODEGEN_ENGINE", "walk")
+
+# Deepest chain of CASPER function calls before a program is stopped. Each
+# call takes a few dozen Python frames, so generate() raises Python's own
+# recursion limit to match while a program runs.
+MAX_CALL_DEPTH = 1000
+PYTHON_FRAMES_PER_CALL = 40
+
+# The recursion limit is process-wide, so concurrent runs share one raise:
+# the first run in raises it and the last one out restores it.
+_recursion_lock = threading.Lock()
+_recursion_users = 0
+_recursion_saved = None
+
+
+@contextmanager
+def _deep_recursion():
+    global _recursion_users, _recursion_saved
+    with _recursion_lock:
+        if _recursion_users == 0:
+            _recursion_saved = sys.getrecursionlimit()
+            sys.setrecursionlimit(max(_recursion_saved, MAX_CALL_DEPTH * PYTHON_FRAMES_PER_CALL))
+        _recursion_users += 1
+    try:
+        yield
+    finally:
+        with _recursion_lock:
+            _recursion_users -= 1
+            if _recursion_users == 0:
+                sys.setrecursionlimit(_recursion_saved)
+
+# Operators the interpreter evaluates; any other operator yields its left operand.
+_BINARY_OPERATORS = {
+    "+": operator.add, "-": operator.sub, "*": operator.mul, "/": operator.truediv,
+    "%": operator.mod,
+    "<": operator.lt, ">": operator.gt, "<=": operator.le, ">=": operator.ge,
+    "==": operator.eq, "!=": operator.ne,
+}
+
+
+def _operation(budget, symbol, node=None):
+    """
+    The function computing left <symbol> right for a run held to budget.
+    + and * may build lists or strings, so the Budget does those and refuses
+    one over its caps before building it, unless node is typed numeric.
+    """
+    if symbol == "+" and not _numeric_operands(node):
+        return budget.add
+    if symbol == "*" and not _numeric_operands(node):
+        return budget.multiply
+    return _BINARY_OPERATORS[symbol]
+
+
+def _apply(operation, left, right):
+    return lambda: operation(left(), right())
+
+
+def _numeric_operands(node):
+    """
+    Whether the analyzer found that both operands of node, an expression or
+    the tail of a compound assignment, are numbers (see Semantics'
+    numeric_operands). Their + and * then build no list or string, so they
+    skip the Budget's checks.
+    """
+    return getattr(node, "numeric_operands", False)
+
+
+# Closure-compiler factories: each builds the closure for left <op> right.
+_COMPILED = {
+    "+": lambda left, right, budget: _apply(budget.add, left, right),
+    "-": lambda left, right, budget: lambda: left() - right(),
+    "*": lambda left, right, budget: _apply(budget.multiply, left, right),
+    "/": lambda left, right, budget: lambda: left() / right(),
+    "%": lambda left, right, budget: lambda: left() % right(),
+    "<": lambda left, right, budget: lambda: left() < right(),
+    ">": lambda left, right, budget: lambda: left() > right(),
+    "<=": lambda left, right, budget: lambda: left() <= right(),
+    ">=": lambda left, right, budget: lambda: left() >= right(),
+    "==": lambda left, right, budget: lambda: left() == right(),
+    "!=": lambda left, right, budget: lambda: left() != right(),
+}
+
+# The factories for operands _numeric_operands() vouches for.
+_COMPILED_NUMERIC = dict(_COMPILED, **{
+    "+": lambda left, right, budget: lambda: left() + right(),
+    "*": lambda left, right, budget: lambda: left() * right(),
+})
+
+
+def _walked(function):
+    def walked(walker, left, right):
+        return function(walker.execute_node(left), walker.execute_node(right))
+    return walked
+
+
+def _walk_add(walker, left, right):
+    return walker.budget.add(walker.execute_node(left), walker.execute_node(right))
+
+
+def _walk_multiply(walker, left, right):
+    return walker.budget.multiply(walker.execute_node(left), walker.execute_node(right))
+
+
+# Tree-walker operations: operation(walker, left, right) evaluates both operands.
+# _WALKED_NUMERIC is for operands _numeric_operands() vouches for.
+_WALKED_NUMERIC = {symbol: _walked(function) for symbol, function in _BINARY_OPERATORS.items()}
+_WALKED = dict(_WALKED_NUMERIC, **{"+": _walk_add, "*": _walk_multiply})
+
+
+def _walk_and(walker, left, right):
+    # && and || short-circuit, so the right operand may never run.
+    return _truthy(walker.execute_node(left)) and _truthy(walker.execute_node(right))
+
+
+def _walk_or(walker, left, right):
+    return _truthy(walker.execute_node(left)) or _truthy(walker.execute_node(right))
+
+
+def _walk_left(walker, left, right):
+    # Other operators still evaluate the right operand, then yield the left one.
+    result = walker.execute_node(left)
+    walker.execute_node(right)
+    return result
+
+
+def _bind_operation(node):
+    """What CodeGenerator.execute_expression does for node: None, or operation(walker, left, right)."""
+    if len(node.children) > 1 and node.children[1]:
+        factor_tail = node.children[1]
+        if factor_tail.children and len(factor_tail.children) >= 2:
+            operator = _operator_of(factor_tail)
+            if operator == '&&':
+                return _walk_and
+            if operator == '||':
+                return _walk_or
+            return (_WALKED_NUMERIC if _numeric_operands(node) else _WALKED).get(operator, _walk_left)
+    return None
+
+
+def _truthy(value):
+    # Day/Night literals evaluate to their names, so "Night" is false as well.
+    return bool(value) and value != "Night"
+
+
+def _operator_of(tail):
+    operator_node = tail.children[0]
+    return operator_node.value if hasattr(operator_node, 'value') else operator_node
+
+
+def _walk(node):
+    """Yields every ASTNode under node (lists included) in source order, without recursing."""
+    stack = [node]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, list):
+            stack.extend(reversed(item))
+        elif isinstance(item, ASTNode):
+            yield item
+            stack.extend(reversed(item.children))
+
+
+def _flatten_nodes(items):
+    """CodeGenerator.flatten_nodes without recursing: nested lists spliced in, None kept."""
+    flat = []
+    stack = [items]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, list):
+            stack.extend(reversed(item))
+        else:
+            flat.append(item)
+    return flat
+
+
+def _split_conditional(children):
+    """(condition, body statements, otherwise_check branches) of flattened conditional children."""
+    body, branches = [], []
+    for child in children[1:]:
+        if child is None:
+            continue
+        if getattr(child, 'type', None) == "otherwise_check":
+            branches.append(child)
+        elif not branches:
+            body.append(child)
+    return children[0], body, branches
+
+
+class Function:
+    """A declared function as laid out by SlotResolver."""
+
+    __slots__ = ("name", "nlocals", "nparams", "body", "revive")
+
+    def __init__(self, name, nlocals, nparams, body, revive):
+        self.name = name
+        self.nlocals = nlocals
+        self.nparams = nparams
+        self.body = body
+        self.revive = revive
+
+
+class SlotResolver:
+    """
+    Resolves every variable to an integer slot before a program runs.
+
+    Globals index the interpreter's global list. Parameters and everything a
+    function (or @main_casper) declares index that function's frame, with
+    parameters first. Each IDENT node gets `slot` and `is_global`
+    attributes; a name declared nowhere gets a global slot of its own that
+    stays None, as undeclared variables have always read None.
+    """
+
+    # Node type -> index of the IDENT child it declares.
+    DECLARATIONS = {"var_statement": 1, "local_var_more": 0, "control_variable": 1}
+    SCOPES = ("global_statement", "function_declaration", "main_function")
+
     def __init__(self):
-        self.variables = {}
+        self.global_slots = {}
+        self.functions = {}
+        self.main_size = 0
+
+    def resolve(self, program_children):
+        parts = self._top_level(program_children)
+        for node in parts:
+            if node.type == "global_statement":
+                self.global_slots.setdefault(node.children[1].value, len(self.global_slots))
+        for node in parts:
+            if node.type == "global_statement":
+                self._resolve_scope(node.children, [])
+            elif node.type == "function_declaration":
+                children = [child for child in node.children if not isinstance(child, list)]
+                params = children[2].children if children[2] is not None else []
+                nlocals = self._resolve_scope(children[2:], [param.children[1] for param in params])
+                revive = children[4] if len(children) > 4 else None
+                self.functions[children[1].value] = Function(
+                    children[1].value, nlocals, len(params), children[3],
+                    revive.children[0] if revive is not None and revive.children else None)
+            elif node.type == "main_function":
+                self.main_size = self._resolve_scope(node.children, [])
+        return self
+
+    def _top_level(self, nodes):
+        parts = []
+        for item in nodes:
+            if isinstance(item, list):
+                parts.extend(self._top_level(item))
+            elif isinstance(item, ASTNode) and item.type in self.SCOPES:
+                parts.append(item)
+        return parts
+
+    def _resolve_scope(self, nodes, params):
+        """Slots every IDENT under nodes; returns how many local slots the scope needs."""
+        local_slots = {}
+        for ident in params:
+            local_slots.setdefault(ident.value, len(local_slots))
+        idents = []
+        declarations = self.DECLARATIONS
+        for node in _walk(nodes):
+            if node.type == "IDENT":
+                idents.append(node)
+                continue
+            position = declarations.get(node.type)
+            if position is not None and len(node.children) > position:
+                local_slots.setdefault(node.children[position].value, len(local_slots))
+        for ident in idents:
+            if ident.value in local_slots:
+                ident.slot, ident.is_global = local_slots[ident.value], False
+            else:
+                ident.slot, ident.is_global = self.global_slots.setdefault(ident.value, len(self.global_slots)), True
+        return len(local_slots)
+
+
+class CodeGenerator:
+    def __init__(self, output=None, budget=None):
+        # Everything the program displays goes to this Output sink (stdout by default).
+        self.output = output if output is not None else StdoutSink()
+        # Every call and every loop iteration is a step the Budget counts.
+        self.budget = budget if budget is not None else Budget()
+        self.fuel = 0
+        self.globals = []
+        self.frame = []
+        self.functions = {}
+        self.depth = 0
 
     def flatten_nodes(self, nodes):
         flat = []
@@ -16,7 +306,39 @@ class CodeGenerator:
         return flat
 
     def generate(self, ast):
-        self.execute_node(ast)
+        with _deep_recursion():
+            self.execute_node(ast)
+
+    def load(self, ident):
+        return self.globals[ident.slot] if ident.is_global else self.frame[ident.slot]
+
+    def store(self, ident, value):
+        if ident.is_global:
+            self.globals[ident.slot] = value
+        else:
+            self.frame[ident.slot] = value
+
+    def step(self):
+        self.fuel -= 1
+        if not self.fuel:
+            self.fuel = self.budget.refuel()
+
+    def call(self, function, args):
+        if self.depth >= MAX_CALL_DEPTH:
+            raise RecursionError("maximum call depth exceeded")
+        self.step()
+        frame = [None] * function.nlocals
+        count = min(len(args), function.nparams)
+        frame[:count] = args[:count]
+        caller = self.frame
+        self.frame = frame
+        self.depth += 1
+        try:
+            self.execute_node(function.body)
+            return self.execute_node(function.revive)
+        finally:
+            self.frame = caller
+            self.depth -= 1
 
     def execute_node(self, node):
         if node is None:
@@ -48,6 +370,11 @@ class CodeGenerator:
         return result
 
     def execute_program(self, node):
+        resolver = SlotResolver().resolve(node.children)
+        self.functions = resolver.functions
+        self.globals = [None] * len(resolver.global_slots)
+        self.frame = [None] * resolver.main_size
+        self.fuel = self.budget.start()
         main_function = None
         for child in self.flatten_nodes(node.children):
             if hasattr(child, 'type') and child.type == "main_function":
@@ -58,22 +385,22 @@ class CodeGenerator:
         if main_function:
             self.execute_main_function(main_function)
         else:
-            print("Error: main_function node not found.")
+            self.output.print("Error: main_function node not found.")
 
     def execute_main_function(self, node):
         if node.children:
             statements = node.children[0]
             self.execute_node(statements)
         else:
-            print("Warning: main_function node has no statements.")
+            self.output.print("Warning: main_function node has no statements.")
 
     def execute_output_statement(self, node):
         if len(node.children) >= 1:
             value_node = node.children[0]
             result = self.execute_node(value_node)
-            print(result)
+            self.output.print(result)
         else:
-            print("Warning: output_statement has no children.")
+            self.output.print("Warning: output_statement has no children.")
 
     def execute_value(self, node):
         if node.children:
@@ -81,22 +408,24 @@ class CodeGenerator:
         return None
 
     def execute_expression(self, node):
-        left = self.execute_node(node.children[0])
-        if len(node.children) > 1 and node.children[1]:
-            factor_tail = node.children[1]
-            if factor_tail.children and len(factor_tail.children) >= 2:
-                operator_node = factor_tail.children[0]
-                operator = operator_node.value if hasattr(operator_node, 'value') else operator_node
-                right = self.execute_node(factor_tail.children[1])
-                if operator == '+':
-                    return left + right
-                elif operator == '-':
-                    return left - right
-                elif operator == '*':
-                    return left * right
-                elif operator == '/':
-                    return left / right
-        return left
+        # The operation is chosen on first evaluation and kept on the node.
+        try:
+            operation = node.operation
+        except AttributeError:
+            operation = node.operation = _bind_operation(node)
+        if operation is None:
+            return self.execute_node(node.children[0])
+        return operation(self, node.children[0], node.children[1].children[1])
+
+    execute_condition = execute_expression
+
+    def execute_paren(self, node):
+        return self.execute_node(node.children[0])
+
+    def execute_neg_int(self, node):
+        return -node.value
+
+    execute_neg_flt = execute_neg_int
 
     def execute_literal(self, node):
         return node.value
@@ -104,37 +433,120 @@ class CodeGenerator:
     def execute_str_lit(self, node):
         return node.value.strip('"')
 
+    def execute_global_statement(self, node):
+        value = self.execute_node(node.children[3]) if len(node.children) > 3 else None
+        self.store(node.children[1], value)
+
     def execute_var_statement(self, node):
-        var_name = node.children[1].value if len(node.children) > 1 else None
-        value = None
-        if len(node.children) > 3:
-            value = self.execute_node(node.children[3])
-        if var_name is not None:
-            self.variables[var_name] = value
+        # `int $a, $b = 1` declares both names; each `= value` belongs to the name before it.
+        ident = node.children[1] if len(node.children) > 1 else None
+        for extra in node.children[3:]:
+            if extra is None:
+                continue
+            if extra.type == "local_var_more":
+                if ident is not None:
+                    self.store(ident, None)
+                ident = extra.children[0]
+            elif extra.type == "local_var_assign":
+                value = self.execute_node(extra)
+                if ident is not None:
+                    self.store(ident, value)
+                ident = None
+        if ident is not None:
+            self.store(ident, None)
         return None
 
+    def execute_control_variable(self, node):
+        self.store(node.children[1], self.execute_node(node.children[2]))
+        return None
+
+    def execute_local_var_assign(self, node):
+        return self.execute_node(node.children[0])
+
     def execute_var_call(self, node):
-        var_name = node.children[0].value if node.children else None
-        return self.variables.get(var_name, None)
+        return self.load(node.children[0]) if node.children else None
+
+    def execute_var_postfix(self, node):
+        var_call, postfix = node.children[0], node.children[1] if len(node.children) > 1 else None
+        value = self.execute_node(var_call)
+        if postfix == "++":
+            self.store(var_call.children[0], value + 1)
+        elif postfix == "--":
+            self.store(var_call.children[0], value - 1)
+        return value
 
     def execute_assignment_statement(self, node):
-        var_call_node = node.children[0] if len(node.children) > 0 else None
-        var_name = None
-        if var_call_node and var_call_node.children:
-            var_name = var_call_node.children[0].value
+        target = node.children[0] if len(node.children) > 0 else None
+        if target is not None and target.type == "IDENT":
+            tail = node.children[1]
+            if tail.type != "assign_tail_op":
+                return self.generic_execute(node)
+            op = _operator_of(tail)
+            value = self.execute_node(tail.children[1])
+            if op != "=":
+                value = _operation(self.budget, op[0], tail)(self.load(target), value)
+            self.store(target, value)
+            return None
+        var_name = target.children[0] if target is not None and target.children else None
         value_node = node.children[2] if len(node.children) > 2 else None
         value = self.execute_node(value_node)
         if var_name is not None:
-            self.variables[var_name] = value
+            self.store(var_name, value)
         return None
 
-    def execute_function_declaration(self, node):
+    def execute_conditional_statement(self, node):
+        condition, body, branches = _split_conditional(node.children)
+        if _truthy(self.execute_node(condition)):
+            self.execute_node(body)
+            return None
+        for branch in branches:
+            branch_children = self.flatten_nodes(branch.children)
+            if _truthy(self.execute_node(branch_children[0])):
+                self.execute_node(branch_children[1:])
+                return None
+        return None
 
-        if len(node.children) >= 4:
-            statements = node.children[3]
-            self.execute_node(statements)
+    def execute_for_loop(self, node):
+        control, condition, update = node.children[:3]
+        body = node.children[3:]
+        self.execute_node(control)
+        while _truthy(self.execute_node(condition)):
+            self.step()
+            self.execute_node(body)
+            self.execute_node(update)
+        return None
+
+    def execute_until_loop(self, node):
+        condition, body = node.children[0], node.children[1:]
+        while not _truthy(self.execute_node(condition)):
+            self.step()
+            self.execute_node(body)
+        return None
+
+    def execute_repeat_until(self, node):
+        # The body runs before the condition is first tested.
+        body, condition = node.children[:-1], node.children[-1]
+        while True:
+            self.step()
+            self.execute_node(body)
+            if _truthy(self.execute_node(condition)):
+                return None
+
+    def execute_update(self, node):
+        var_call, tail = node.children[0], node.children[1]
+        if tail.type == "update_tail_postfix":
+            value = self.execute_node(var_call)
+            value = value + 1 if tail.value == "++" else value - 1
         else:
-            print("Error: Incomplete function declaration.")
+            # As in an assignment, the value is evaluated before the variable is read.
+            value = self.execute_node(tail.children[1])
+            value = _operation(self.budget, _operator_of(tail)[0], tail)(self.execute_node(var_call), value)
+        self.store(var_call.children[0], value)
+        return None
+
+    def execute_function_declaration(self, node):
+        # Bodies run when called; SlotResolver has already registered the function.
+        return None
 
     def execute_function_call(self, node):
 
@@ -151,10 +563,420 @@ class CodeGenerator:
                 args.append(val)
 
         if func_name == "display":
-            print(*args)
+            self.output.print(*args)
+            return None
+        function = self.functions.get(func_name)
+        if function is not None:
+            return self.call(function, args)
         return None
 
 
-def run_code_generation(ast):
-    generator = CodeGenerator()
+def _none():
+    return None
+
+
+def _report(output, message):
+    def run():
+        output.print(message)
+    return run
+
+
+def _sequence(steps):
+    """Runs each step for its side effects; the result is always None."""
+    def run():
+        for step in steps:
+            step()
+    return run
+
+
+class ClosureCompiler:
+    """
+    Compiles an AST once into nested Python closures, then runs them.
+
+    Each compile_<type> method mirrors CodeGenerator.execute_<type>: children,
+    operators and variable slots are resolved at compile time and the
+    returned zero-argument closure produces the same value and output when
+    called. A node whose shape a compile_ method cannot resolve is handed to
+    a CodeGenerator sharing the same globals and frame, so malformed trees
+    fail the same way, at the same point, as under the tree walker.
+    """
+
+    def __init__(self, output=None, budget=None):
+        self.output = output if output is not None else StdoutSink()
+        self.budget = budget if budget is not None else Budget()
+        self.fuel = 0
+        self.globals = []
+        self.frame = []
+        self.depth = 0
+        # name -> (Function, compiled body, compiled revive value)
+        self.functions = {}
+        self.resolved = {}
+        self.walker = CodeGenerator(self.output, self.budget)
+
+    def generate(self, ast):
+        program = self.compile(ast)
+        with _deep_recursion():
+            program()
+
+    def compile(self, node):
+        if node is None:
+            return _none
+        if isinstance(node, list):
+            return self.compile_list(node)
+        if not hasattr(node, 'type'):
+            return _none
+
+        children = self.walker.flatten_nodes(node.children) if node.children else node.children
+        compiler = getattr(self, f"compile_{node.type}", self.compile_generic)
+        try:
+            return compiler(node, children)
+        except (AttributeError, IndexError, TypeError, KeyError, RecursionError):
+            return self._fallback(node)
+
+    def _fallback(self, node):
+        walker = self.walker
+
+        def run():
+            walker.globals, walker.frame, walker.depth = self.globals, self.frame, self.depth
+            walker.functions, walker.fuel = self.resolved, self.fuel
+            try:
+                return walker.execute_node(node)
+            finally:
+                self.fuel = walker.fuel
+        return run
+
+    def _load(self, ident):
+        slot = ident.slot
+        if ident.is_global:
+            return lambda: self.globals[slot]
+        return lambda: self.frame[slot]
+
+    def _store(self, ident):
+        slot = ident.slot
+        if ident.is_global:
+            def store(value):
+                self.globals[slot] = value
+        else:
+            def store(value):
+                self.frame[slot] = value
+        return store
+
+    def _step(self):
+        self.fuel -= 1
+        if not self.fuel:
+            self.fuel = self.budget.refuel()
+
+    def _call(self, entry, args):
+        function, body, revive = entry
+        if self.depth >= MAX_CALL_DEPTH:
+            raise RecursionError("maximum call depth exceeded")
+        self._step()
+        frame = [None] * function.nlocals
+        count = min(len(args), function.nparams)
+        frame[:count] = args[:count]
+        caller = self.frame
+        self.frame = frame
+        self.depth += 1
+        try:
+            body()
+            return revive()
+        finally:
+            self.frame = caller
+            self.depth -= 1
+
+    def compile_list(self, nodes):
+        steps = [self.compile(subnode) for subnode in self.walker.flatten_nodes(nodes)]
+
+        def run():
+            results = []
+            for step in steps:
+                res = step()
+                if res is not None:
+                    results.append(res)
+            return results if results else None
+        return run
+
+    def compile_generic(self, node, children):
+        return _sequence([self.compile(child) for child in children])
+
+    def compile_program(self, node, children):
+        resolver = SlotResolver().resolve(children)
+        self.resolved = resolver.functions
+        self.functions.clear()
+        for name, function in resolver.functions.items():
+            self.functions[name] = (function, self.compile(function.body), self.compile(function.revive))
+
+        main_function = None
+        steps = []
+        for child in children:
+            if hasattr(child, 'type') and child.type == "main_function":
+                main_function = child
+            else:
+                steps.append(self.compile(child))
+
+        if main_function:
+            # execute_program calls execute_main_function directly, on the unflattened children.
+            steps.append(self.compile_main_function(main_function, main_function.children))
+        else:
+            steps.append(_report(self.output, "Error: main_function node not found."))
+        global_count, main_size = len(resolver.global_slots), resolver.main_size
+
+        def run():
+            self.globals = [None] * global_count
+            self.frame = [None] * main_size
+            self.depth = 0
+            self.fuel = self.budget.start()
+            for step in steps:
+                step()
+        return run
+
+    def compile_main_function(self, node, children):
+        if children:
+            return _sequence([self.compile(children[0])])
+        return _report(self.output, "Warning: main_function node has no statements.")
+
+    def compile_output_statement(self, node, children):
+        if len(children) >= 1:
+            value, emit = self.compile(children[0]), self.output.print
+
+            def run():
+                emit(value())
+            return run
+        return _report(self.output, "Warning: output_statement has no children.")
+
+    def compile_value(self, node, children):
+        if children:
+            return self.compile(children[0])
+        return _none
+
+    def compile_expression(self, node, children):
+        left = self.compile(children[0])
+        if len(children) > 1 and children[1]:
+            factor_tail = children[1]
+            if factor_tail.children and len(factor_tail.children) >= 2:
+                operator = _operator_of(factor_tail)
+                right = self.compile(factor_tail.children[1])
+                if operator == '&&':
+                    return lambda: _truthy(left()) and _truthy(right())
+                if operator == '||':
+                    return lambda: _truthy(left()) or _truthy(right())
+                factory = (_COMPILED_NUMERIC if _numeric_operands(node) else _COMPILED).get(operator)
+                if factory is not None:
+                    return factory(left, right, self.budget)
+
+                def run():
+                    # Other operators still evaluate the right operand, then yield the left one.
+                    result = left()
+                    right()
+                    return result
+                return run
+        return left
+
+    compile_condition = compile_expression
+
+    def compile_paren(self, node, children):
+        return self.compile(children[0])
+
+    def compile_neg_int(self, node, children):
+        value = -node.value
+        return lambda: value
+
+    compile_neg_flt = compile_neg_int
+
+    def compile_literal(self, node, children):
+        value = node.value
+        return lambda: value
+
+    def compile_str_lit(self, node, children):
+        value = node.value.strip('"')
+        return lambda: value
+
+    def compile_global_statement(self, node, children):
+        value = self.compile(children[3]) if len(children) > 3 else _none
+        store = self._store(children[1])
+        return lambda: store(value())
+
+    def compile_var_statement(self, node, children):
+        # Pairs of (store or None, value), in the order execute_var_statement performs them.
+        steps = []
+        ident = children[1] if len(children) > 1 else None
+        for extra in children[3:]:
+            if extra is None:
+                continue
+            if extra.type == "local_var_more":
+                if ident is not None:
+                    steps.append((self._store(ident), _none))
+                ident = extra.children[0]
+            elif extra.type == "local_var_assign":
+                steps.append((self._store(ident) if ident is not None else None, self.compile(extra)))
+                ident = None
+        if ident is not None:
+            steps.append((self._store(ident), _none))
+
+        def run():
+            for store, value in steps:
+                result = value()
+                if store is not None:
+                    store(result)
+        return run
+
+    def compile_control_variable(self, node, children):
+        store, value = self._store(children[1]), self.compile(children[2])
+        return lambda: store(value())
+
+    def compile_local_var_assign(self, node, children):
+        return self.compile(children[0])
+
+    def compile_var_call(self, node, children):
+        return self._load(children[0]) if children else _none
+
+    def compile_var_postfix(self, node, children):
+        var_call, postfix = children[0], children[1] if len(children) > 1 else None
+        value = self.compile(var_call)
+        if postfix not in ("++", "--"):
+            return value
+        store = self._store(var_call.children[0])
+        apply = operator.add if postfix == "++" else operator.sub
+
+        def run():
+            current = value()
+            store(apply(current, 1))
+            return current
+        return run
+
+    def compile_assignment_statement(self, node, children):
+        target = children[0] if len(children) > 0 else None
+        if target is not None and target.type == "IDENT":
+            tail = children[1]
+            if tail.type != "assign_tail_op":
+                return self.compile_generic(node, children)
+            op = _operator_of(tail)
+            value = self.compile(tail.children[1])
+            store = self._store(target)
+            if op == "=":
+                return lambda: store(value())
+            apply, load = _operation(self.budget, op[0], tail), self._load(target)
+
+            def run():
+                right = value()
+                store(apply(load(), right))
+            return run
+        var_name = target.children[0] if target is not None and target.children else None
+        value_node = children[2] if len(children) > 2 else None
+        value = self.compile(value_node)
+        if var_name is None:
+            return _sequence([value])
+        store = self._store(var_name)
+        return lambda: store(value())
+
+    def compile_conditional_statement(self, node, children):
+        condition, body, branches = _split_conditional(children)
+        test, run_body = self.compile(condition), self.compile_list(body)
+        compiled_branches = []
+        for branch in branches:
+            branch_children = self.walker.flatten_nodes(branch.children)
+            compiled_branches.append((self.compile(branch_children[0]), self.compile_list(branch_children[1:])))
+
+        def run():
+            if _truthy(test()):
+                run_body()
+                return None
+            for branch_test, branch_body in compiled_branches:
+                if _truthy(branch_test()):
+                    branch_body()
+                    return None
+            return None
+        return run
+
+    def compile_for_loop(self, node, children):
+        control, test, update = (self.compile(child) for child in children[:3])
+        body, step = self.compile_list(children[3:]), self._step
+
+        def run():
+            control()
+            while _truthy(test()):
+                step()
+                body()
+                update()
+        return run
+
+    def compile_until_loop(self, node, children):
+        test, body, step = self.compile(children[0]), self.compile_list(children[1:]), self._step
+
+        def run():
+            while not _truthy(test()):
+                step()
+                body()
+        return run
+
+    def compile_repeat_until(self, node, children):
+        body, test, step = self.compile_list(children[:-1]), self.compile(children[-1]), self._step
+
+        def run():
+            while True:
+                step()
+                body()
+                if _truthy(test()):
+                    return None
+        return run
+
+    def compile_update(self, node, children):
+        var_call, tail = children[0], children[1]
+        load, store = self.compile(var_call), self._store(var_call.children[0])
+        if tail.type == "update_tail_postfix":
+            apply = operator.add if tail.value == "++" else operator.sub
+
+            def run():
+                store(apply(load(), 1))
+            return run
+        value, apply = self.compile(tail.children[1]), _operation(self.budget, _operator_of(tail)[0], tail)
+
+        def run():
+            right = value()
+            store(apply(load(), right))
+        return run
+
+    def compile_function_declaration(self, node, children):
+        # compile_program has already compiled the body for calls to use.
+        return _none
+
+    def compile_function_call(self, node, children):
+        if not children:
+            return _none
+        func_name_node = children[0]
+        func_name = func_name_node.value if hasattr(func_name_node, 'value') else None
+
+        args_node = children[1] if len(children) > 1 else None
+        args = []
+        if args_node and args_node.children:
+            args = [self.compile(arg) for arg in self.walker.flatten_nodes(args_node.children)]
+
+        if func_name == "display":
+            emit = self.output.print
+
+            def run():
+                emit(*[arg() for arg in args])
+            return run
+        functions = self.functions
+
+        def run():
+            values = [arg() for arg in args]
+            entry = functions.get(func_name)
+            return self._call(entry, values) if entry is not None else None
+        return run
+
+
+CODEGEN_ENGINES = {
+    "closure": ClosureCompiler,
+    "walk": CodeGenerator,
+}
+
+
+def run_code_generation(ast, engine=None, output=None, budget=None):
+    """
+    Runs a program; what it displays goes to `output`, an Output sink
+    (default: stdout), and `budget` (default: a Budget from the environment)
+    limits it. A program over its budget raises BudgetExceeded.
+    """
+    generator = CODEGEN_ENGINES[engine or CODEGEN_ENGINE](output, budget)
     generator.generate(ast)
@@ -0,0 +1,257 @@
+# CompileCache.py
+#
+# Content-addressed cache of compile results for the web endpoints. The
+# editor re-posts the whole document on every pause, and resubmits, undo and
+# a class running the same sample all send text the server has compiled
+# before. CompileCache.compile(source) lexes, parses, analyzes and optimizes
+# a source once. After that, any worker that sees the same text gets the
+# diagnostics and the finished AST back without compiling again.
+# CompileCache.check(source) does the same for the editor's lex-and-parse
+# diagnostics.
+#
+# Results are keyed by the SHA-256 of the source, the stage (compile or
+# check), the optimizer passes and CACHE_VERSION. The in-memory tier is an LRU bounded by entry count and by
+# bytes. The optional disk tier (CASPER_CACHE_DIR) is shared by every worker
+# process pointed at it. It holds pickles, so it must be a directory only
+# the server can write to.
+#
+#   CASPER_CACHE_ENTRIES   results kept in memory (0 disables the cache)
+#   CASPER_CACHE_BYTES     bytes kept in memory
+#   CASPER_CACHE_DIR       directory of the shared disk tier (off if unset)
+#
+# The AST is stored pickled, and every ast() call unpickles a private copy,
+# because running a program annotates and rearranges its tree.
+
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+
+from Lexer import TokenStream
+from Optimizer import OPTIMIZER_PASSES, run_optimizer
+from Parser import build_parser
+from Semantics import run_semantic_analysis
+
+CACHE_ENTRIES = int(os.environ.get("CASPER_CACHE_ENTRIES", "256"))
+CACHE_BYTES = int(os.environ.get("CASPER_CACHE_BYTES", str(64 << 20)))
+CACHE_DIR = os.environ.get("CASPER_CACHE_DIR", "")
+
+# Bump whenever the pipeline or CompileResult changes what a result holds.
+CACHE_VERSION = 1
+
+
+class CompileResult:
+    """
+    What compiling one source produced, at the first stage that failed.
+
+    illegal_tokens holds (message, line, column, literal) for each illegal
+    token. syntax_error is the parser's message. semantic_errors is None
+    unless parsing succeeded. ast() returns the analyzed, optimized tree of
+    a program that compiled cleanly, and None otherwise.
+    """
+
+    __slots__ = ("illegal_tokens", "syntax_error", "semantic_errors", "ast_bytes", "_fresh_ast")
+
+    def __init__(self, illegal_tokens, syntax_error=None, semantic_errors=None, ast_bytes=None, fresh_ast=None):
+        self.illegal_tokens = illegal_tokens
+        self.syntax_error = syntax_error
+        self.semantic_errors = semantic_errors
+        self.ast_bytes = ast_bytes
+        self._fresh_ast = fresh_ast
+
+    @property
+    def ok(self):
+        return not self.illegal_tokens and self.syntax_error is None and not self.semantic_errors
+
+    def ast(self):
+        # The compile that built this result hands its own tree to the first caller.
+        fresh, self._fresh_ast = self._fresh_ast, None
+        if fresh is not None:
+            return fresh
+        return pickle.loads(self.ast_bytes) if self.ast_bytes is not None else None
+
+    def size(self):
+        """Approximate bytes held, for the cache's byte limit."""
+        text = sum(len(token[0]) + len(token[3]) for token in self.illegal_tokens)
+        text += len(self.syntax_error or "") + sum(len(error) for error in self.semantic_errors or ())
+        return text + len(self.ast_bytes or b"")
+
+    def __getstate__(self):
+        return (self.illegal_tokens, self.syntax_error, self.semantic_errors, self.ast_bytes)
+
+    def __setstate__(self, state):
+        self.illegal_tokens, self.syntax_error, self.semantic_errors, self.ast_bytes = state
+        self._fresh_ast = None
+
+
+def check_source(source):
+    """
+    Lexes and parses source, uncached, and returns its CompileResult. The
+    analyzer isn't run, so semantic_errors is None and ast() hands out the
+    plain parsed tree of a program that parses.
+    """
+    token_stream = TokenStream(source)
+    illegal_tokens = [(str(token), token.line_no, token.position, token.literal)
+                      for token in token_stream.illegal_tokens]
+    if illegal_tokens:
+        return CompileResult(illegal_tokens)
+    try:
+        ast = build_parser().parse(lexer=token_stream)
+    except SyntaxError as error:
+        return CompileResult([], str(error))
+    return CompileResult([], None, None, None, ast)
+
+
+def compile_source(source, tracer=None):
+    """Runs the compile pipeline on source, uncached, and returns its CompileResult."""
+    result = check_source(source)
+    ast = result.ast()
+    if ast is None:
+        return result
+    semantic_errors = run_semantic_analysis(ast, tracer)
+    if semantic_errors:
+        return CompileResult([], None, semantic_errors)
+    run_optimizer(ast, tracer)
+    try:
+        ast_bytes = pickle.dumps(ast, pickle.HIGHEST_PROTOCOL)
+    except RecursionError:
+        # Too deeply nested to pickle: usable once, but never cached.
+        ast_bytes = None
+    return CompileResult([], None, [], ast_bytes, ast)
+
+
+class CompileCache:
+    """A thread-safe LRU of CompileResults, with an optional shared directory behind it."""
+
+    def __init__(self, max_entries=None, max_bytes=None, directory=None):
+        self.max_entries = CACHE_ENTRIES if max_entries is None else max_entries
+        self.max_bytes = CACHE_BYTES if max_bytes is None else max_bytes
+        self.directory = CACHE_DIR if directory is None else directory
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(source, stage="compile"):
+        salt = f"{CACHE_VERSION}:{stage}:{OPTIMIZER_PASSES}\0"
+        return hashlib.sha256((salt + source).encode()).hexdigest()
+
+    def compile(self, source, tracer=None):
+        """The CompileResult for source: cached if possible, compiled (and cached) if not."""
+        if not self.max_entries:
+            return compile_source(source, tracer)
+        key = self.key(source)
+        # A traced compile has to run the pipeline to produce its events.
+        if tracer is None:
+            result = self._lookup(key)
+            if result is not None:
+                return result
+        result = compile_source(source, tracer)
+        with self._lock:
+            self.misses += 1
+        if result.ok and result.ast_bytes is None:
+            return result
+        # The caller keeps the freshly built tree; the cache and later callers get copies.
+        shared = CompileResult(result.illegal_tokens, result.syntax_error, result.semantic_errors, result.ast_bytes)
+        with self._lock:
+            self._store(key, shared)
+        self._write(key, shared)
+        return result
+
+    def check(self, source):
+        """
+        check_source(source), cached as compile() is. Only the diagnostics are
+        kept, so the analyzer isn't run and ast() returns None.
+        """
+        if not self.max_entries:
+            return check_source(source)
+        key = self.key(source, "check")
+        result = self._lookup(key)
+        if result is not None:
+            return result
+        checked = check_source(source)
+        result = CompileResult(checked.illegal_tokens, checked.syntax_error)
+        with self._lock:
+            self.misses += 1
+            self._store(key, result)
+        self._write(key, result)
+        return result
+
+    def _lookup(self, key):
+        """The result stored under key in memory or on disk, or None."""
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return result
+        result = self._read(key)
+        if result is not None:
+            with self._lock:
+                self.disk_hits += 1
+                self._store(key, result)
+        return result
+
+    def _store(self, key, result):
+        size = result.size()
+        if size > self.max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.bytes -= previous.size()
+        self._entries[key] = result
+        self.bytes += size
+        while len(self._entries) > self.max_entries or self.bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.bytes -= evicted.size()
+            self.evictions += 1
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], key + ".pickle")
+
+    def _read(self, key):
+        if not self.directory:
+            return None
+        try:
+            with open(self._path(key), "rb") as file:
+                return pickle.load(file)
+        except Exception:
+            # A missing, truncated or stale file (say, from an older version of a class) is a miss.
+            return None
+
+    def _write(self, key, result):
+        if not self.directory:
+            return
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write under a temporary name and rename, so readers never see half a file.
+            fd, temporary = tempfile.mkstemp(dir=os.path.dirname(path))
+            with os.fdopen(fd, "wb") as file:
+                pickle.dump(result, file, pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary, path)
+        except OSError:
+            pass
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self.bytes,
+            }
+
+    def clear(self):
+        """Empties the in-memory tier; the disk tier is left to whoever owns the directory."""
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
@@ -0,0 +1,100 @@
+# DelimiterTable.py
+#
+# Compiled follow-character tables for the Lexer. The sets in Delimiters and
+# KEYWORD_DELIMITERS mix single characters, multi-character words ('Day', '<=')
+# and the EOF markers None/'' in the same set. The Lexer only ever tests one
+# peeked character (or None at end of input) against them, so each set is
+# compiled once into a 128-entry ASCII bitmap plus an explicit EOF flag.
+
+from Delimiters import Delimiters
+from KeywordDelimiters import KEYWORD_DELIMITERS
+from Token import TokenType
+
+ASCII_SIZE = 128
+
+
+class DelimiterSet:
+    """
+    One compiled delimiter set.
+
+    `bitmap[ord(ch)]` is 1 when the ASCII character `ch` may follow the token,
+    `accepts_eof` says whether the token may end the source, and `source` is
+    the original set, kept for the "Expected delimiters" part of ILLEGAL
+    diagnostics. Membership goes through `accepts`, a frozenset built from
+    the bitmap, because C-level set lookups are cheaper than indexing the
+    bitmap from Python.
+    """
+
+    __slots__ = ("name", "bitmap", "accepts_eof", "source", "accepts")
+
+    def __init__(self, name, delims):
+        bitmap = bytearray(ASCII_SIZE)
+        accepts_eof = False
+        for delim in delims:
+            if delim is None:
+                accepts_eof = True
+            elif len(delim) == 1:
+                if ord(delim) >= ASCII_SIZE:
+                    raise ValueError(f"{name}: delimiter {delim!r} is not ASCII")
+                bitmap[ord(delim)] = 1
+            # '' and multi-character entries can never equal a single peeked character.
+
+        self.name = name
+        self.bitmap = bytes(bitmap)
+        self.accepts_eof = accepts_eof
+        self.source = delims
+        members = {chr(code) for code in range(ASCII_SIZE) if bitmap[code]}
+        if accepts_eof:
+            members.add(None)
+        self.accepts = frozenset(members).__contains__
+
+    def __contains__(self, char):
+        return self.accepts(char)
+
+    def __repr__(self):
+        return f"DelimiterSet({self.name})"
+
+
+# Follow sets for tokens that KEYWORD_DELIMITERS does not list by type.
+_LITERAL_DELIMITERS = {
+    "INT_LIT": Delimiters.DEL10,
+    "FLT_LIT": Delimiters.DEL10,
+    "FUNCTION_NAME": Delimiters.identifier_del,
+    "MAIN_CASPER": Delimiters.identifier_del,
+}
+
+
+def build_delimiter_table():
+    """Compiles one DelimiterSet per TokenType; types without a follow set accept nothing."""
+    table = {}
+    for token_type in TokenType:
+        name = token_type.name
+        delims = KEYWORD_DELIMITERS.get(name, _LITERAL_DELIMITERS.get(name, set()))
+        table[token_type] = DelimiterSet(name, delims)
+    return table
+
+
+DELIMITER_TABLE = build_delimiter_table()
+
+
+def check_delimiter_table(table=DELIMITER_TABLE):
+    """
+    Returns a list of mismatches between the compiled table and the original
+    sets, probing every ASCII character, a few non-ASCII ones and EOF.
+    """
+    probes = [chr(code) for code in range(ASCII_SIZE)] + ["\u00a0", "\u00e9", "\u3000", None]
+    mismatches = []
+    for token_type, compiled in table.items():
+        for char in probes:
+            expected = char in compiled.source
+            if (char in compiled) != expected:
+                mismatches.append((token_type.name, char, expected))
+    return mismatches
+
+
+if __name__ == "__main__":
+    problems = check_delimiter_table()
+    for name, char, expected in problems:
+        print(f"{name}: {char!r} should {'' if expected else 'not '}be a delimiter")
+    print(f"{len(DELIMITER_TABLE)} delimiter sets, {len(problems)} mismatches")
+    raise SystemExit(1 if problems else 0)
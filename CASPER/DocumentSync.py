@@ -0,0 +1,329 @@
+# DocumentSync.py
+#
+# Server-side copies of the documents open in the editor, kept in step with
+# the edits made to them. The editor sends Monaco's change deltas instead of
+# the whole text. Each Document applies them to its text, its line index and
+# its token stream, and re-lexes only the lines an edit touched. Diagnostics
+# for a small edit to a large file then cost a few lines of lexing instead of
+# the whole file (the parse still reads every token).
+#
+# Tokens are kept per line, with lines and offsets relative to the start of
+# the line they were lexed from. So lines an edit moves keep their tokens as
+# they are. Re-lexing starts at the first line that could see the edit and
+# stops once the lexer reaches a line start past the edit that the previous
+# lexing also started from. From there on the old tokens are still right.
+#
+# DocumentStore holds one Document per editor session and drops sessions
+# that go idle or that don't fit its limits, least recently used first:
+#
+#   CASPER_SESSIONS        documents kept at once
+#   CASPER_SESSION_IDLE    seconds a document is kept without edits
+#   CASPER_SESSION_BYTES   approximate bytes all documents may hold
+#
+# A client whose session was dropped, or whose edits no longer follow the
+# server's version, gets a DocumentSyncError and sends its whole text again.
+
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+
+from CompileCache import CompileResult
+from Lexer import TokenReplay, make_lexer
+from Parser import build_parser
+from Token import ParserToken, Token, TokenType
+
+SESSION_LIMIT = int(os.environ.get("CASPER_SESSIONS", "256"))
+SESSION_IDLE = float(os.environ.get("CASPER_SESSION_IDLE", "900"))
+SESSION_BYTES = int(os.environ.get("CASPER_SESSION_BYTES", str(64 << 20)))
+
+# Rough cost of one stored token: its tuple, literal and list slot.
+TOKEN_BYTES = 136
+
+# What the lexers skip in front of a token.
+_BLANKS = re.compile(r"[ \t\r]*")
+
+
+class DocumentSyncError(Exception):
+    """Raised for an edit that can't be applied: unknown session, out-of-order version or a bad range."""
+    pass
+
+
+class Document:
+    """
+    The text of one open document, with its line index and tokens.
+
+    line_starts[i] is the offset where line i (0-based) starts. Every line
+    has a list of (type, literal, line delta, offset delta, column, length)
+    tuples for the tokens lexed from it (column and length give the text the
+    token was read from), a flag telling whether the lexer started a token
+    exactly at the line's start ("clean"), and how far the lexer's line
+    counter moved while reading the line. Lines inside a token that spans
+    several (an unterminated string, a '---' comment) have no tokens and
+    aren't clean.
+    """
+
+    def __init__(self, text, version=0, engine=None):
+        self.text = text
+        self.version = version
+        self.engine = engine
+        self.line_starts = _line_starts(text, 0, 0)
+        self.line_tokens = []
+        self.line_clean = []
+        self.line_advance = []
+        self.token_count = 0
+        self.relexed_lines = 0
+        self.lock = threading.Lock()
+        self._relex(0, 0, 0, 0, (), (), ())
+
+    def size(self):
+        """Approximate bytes held, for the store's byte limit."""
+        return len(self.text) + 8 * len(self.line_starts) + TOKEN_BYTES * self.token_count
+
+    def apply_changes(self, changes, version):
+        """
+        Applies Monaco content changes in the order given ({"range": {...},
+        "text": ...} with 1-based lines and columns) and moves to version.
+        """
+        for change in changes:
+            try:
+                edit = change["range"]
+                self.apply_change(edit["startLineNumber"], edit["startColumn"],
+                                  edit["endLineNumber"], edit["endColumn"], change["text"])
+            except (KeyError, TypeError):
+                raise DocumentSyncError(f"Malformed change: {change!r}") from None
+        self.version = version
+
+    def apply_change(self, start_line, start_column, end_line, end_column, text):
+        """Replaces the text between two 1-based (line, column) positions with text."""
+        start = self._offset(start_line, start_column)
+        end = self._offset(end_line, end_column)
+        if end < start:
+            raise DocumentSyncError(f"Change ends before it starts: {start_line}:{start_column}-{end_line}:{end_column}")
+        first, last = start_line - 1, end_line - 1
+        shift = len(text) - (end - start)
+        self.text = self.text[:start] + text + self.text[end:]
+        starts = self.line_starts
+        inserted = _line_starts(text, start, 1)
+        self.line_starts = starts[:first + 1] + inserted + [offset + shift for offset in starts[last + 1:]]
+
+        # Start one line early: a keyword at the end of a line looks at the next one.
+        relex_from = max(first - 1, 0)
+        while relex_from and not self.line_clean[relex_from]:
+            relex_from -= 1
+        old_tokens, old_clean, old_advance = self.line_tokens, self.line_clean, self.line_advance
+        self._relex(relex_from, first + len(inserted), len(inserted) - (last - first),
+                    sum(old_advance[:relex_from]), old_tokens, old_clean, old_advance)
+
+    def _offset(self, line, column):
+        starts = self.line_starts
+        if not 1 <= line <= len(starts) or column < 1:
+            raise DocumentSyncError(f"Position {line}:{column} is outside the document.")
+        offset = starts[line - 1] + column - 1
+        line_end = starts[line] - 1 if line < len(starts) else len(self.text)
+        if offset > line_end:
+            raise DocumentSyncError(f"Position {line}:{column} is outside the document.")
+        return offset
+
+    def _relex(self, first, edited, shift, line_no, old_tokens, old_clean, old_advance):
+        """
+        Lexes from the start of line `first` and rebuilds the per-line lists
+        from there. `edited` is the last line the edit wrote to and `shift`
+        how many lines it added; old_* are the lists from before the edit.
+        """
+        text, starts = self.text, self.line_starts
+        line_count = len(starts)
+        tokens, clean, advance = [[]], [True], [0]
+        resume = None
+        line = first
+        lexer = make_lexer(text, self.engine)
+        start = starts[first]
+        if start:
+            lexer.position = start
+            lexer.read_position = start + 1
+            lexer.current_char = text[start] if start < len(text) else None
+        lexer.line_no = line_no + 1
+        base = lexer.line_no
+        while lexer.current_char is not None:
+            before = lexer.position
+            while line + 1 < line_count and starts[line + 1] <= before:
+                line += 1
+                at_start = starts[line] == before
+                if at_start and line > edited + 1 and line - shift < len(old_clean) and old_clean[line - shift]:
+                    resume = line - shift
+                    break
+                tokens.append([])
+                clean.append(at_start)
+                advance.append(0)
+                base = lexer.line_no
+            if resume is not None:
+                break
+            token_start = _BLANKS.match(text, before).end()
+            tok = lexer.next_token()
+            if tok.type is not TokenType.EOF:
+                tokens[-1].append((tok.type, tok.literal, tok.line_no - base, tok.position - starts[line],
+                                   token_start - starts[line], lexer.position - token_start))
+            advance[-1] = lexer.line_no - base
+        else:
+            # Lines after the last token: empty, and nothing is left to re-lex.
+            for later in range(line + 1, line_count):
+                tokens.append([])
+                clean.append(starts[later] == len(text))
+                advance.append(0)
+        self.relexed_lines = len(tokens)
+        replaced = old_tokens[first:] if resume is None else old_tokens[first:resume]
+        self.token_count += sum(map(len, tokens)) - sum(map(len, replaced))
+        if resume is None:
+            self.line_tokens = self.line_tokens[:first] + tokens
+            self.line_clean = self.line_clean[:first] + clean
+            self.line_advance = self.line_advance[:first] + advance
+        else:
+            self.line_tokens = old_tokens[:first] + tokens + old_tokens[resume:]
+            self.line_clean = old_clean[:first] + clean + old_clean[resume:]
+            self.line_advance = old_advance[:first] + advance + old_advance[resume:]
+
+    def tokens(self):
+        """Every token with its absolute line number and offset, as the lexer reports them for the whole text."""
+        line_no = 1
+        for start, line_tokens, advance in zip(self.line_starts, self.line_tokens, self.line_advance):
+            for token_type, literal, line_delta, offset, _, _ in line_tokens:
+                yield Token(token_type, literal, line_no + line_delta, start + offset)
+            line_no += advance
+
+    def spans(self):
+        """(line, column, length, type, literal) for every token, where it sits in the text; lines are 0-based."""
+        for line, line_tokens in enumerate(self.line_tokens):
+            for token_type, literal, _, _, column, length in line_tokens:
+                yield line, column, length, token_type, literal
+
+    def check(self):
+        """
+        Illegal tokens and the syntax error, if any, as a CompileResult (the
+        analyzer isn't run). Reads the stored tokens; nothing is re-lexed.
+        """
+        return check_tokens(self.tokens())
+
+
+def check_tokens(tokens):
+    """
+    Lexical and syntax diagnostics for already lexed tokens, as a
+    CompileResult. The tree of a program that parses is handed out by the
+    result's ast(); it hasn't been analyzed, so semantic_errors is None.
+    """
+    illegal_tokens = []
+    parser_tokens = []
+    for tok in tokens:
+        if tok.type is TokenType.ILLEGAL:
+            illegal_tokens.append((str(tok), tok.line_no, tok.position, tok.literal))
+        elif tok.type is not TokenType.COMMENT:
+            parser_tokens.append(ParserToken(tok.type.name, tok.literal, tok.line_no, tok.position))
+    if illegal_tokens:
+        return CompileResult(illegal_tokens)
+    try:
+        ast = build_parser().parse(lexer=TokenReplay(parser_tokens))
+    except SyntaxError as error:
+        return CompileResult([], str(error))
+    return CompileResult([], None, None, None, ast)
+
+
+def _line_starts(text, offset, first):
+    """Offsets of the line starts in text (placed at `offset`), skipping the first `first` of them."""
+    starts = [offset] if not first else []
+    index = text.find("\n")
+    while index != -1:
+        starts.append(offset + index + 1)
+        index = text.find("\n", index + 1)
+    return starts
+
+
+class DocumentStore:
+    """
+    The Documents of the open editor sessions: a thread-safe LRU bounded by
+    count, idle time and approximate bytes.
+    """
+
+    def __init__(self, max_sessions=None, idle_seconds=None, max_bytes=None, engine=None):
+        self.max_sessions = SESSION_LIMIT if max_sessions is None else max_sessions
+        self.idle_seconds = SESSION_IDLE if idle_seconds is None else idle_seconds
+        self.max_bytes = SESSION_BYTES if max_bytes is None else max_bytes
+        self.engine = engine
+        self.opened = 0
+        self.changed = 0
+        self.resyncs = 0
+        self.evictions = 0
+        self.bytes = 0
+        self._sessions = OrderedDict()  # session id -> [Document, last used, size]
+        self._lock = threading.Lock()
+
+    def open(self, session, text, version=0):
+        """Starts (or restarts) a session from the full text; returns its Document."""
+        document = Document(text, version, self.engine)
+        with self._lock:
+            self.opened += 1
+            self._put(session, document)
+        return document
+
+    def change(self, session, base_version, version, changes):
+        """
+        Applies changes to the session's Document, which must be at
+        base_version, and returns it. Raises DocumentSyncError when the
+        client has to send its whole text instead.
+        """
+        with self._lock:
+            entry = self._sessions.get(session)
+            if entry is None:
+                self.resyncs += 1
+                raise DocumentSyncError(f"Unknown session: {session}")
+            self._sessions.move_to_end(session)
+        document = entry[0]
+        with document.lock:
+            if document.version != base_version:
+                with self._lock:
+                    self.resyncs += 1
+                raise DocumentSyncError(f"Session {session} is at version {document.version}, not {base_version}.")
+            try:
+                document.apply_changes(changes, version)
+            except DocumentSyncError:
+                # A half-applied batch leaves the copy unusable; the client starts over.
+                self.discard(session)
+                raise
+        with self._lock:
+            self.changed += 1
+            if self._sessions.get(session) is entry:
+                self._put(session, document)
+        return document
+
+    def discard(self, session):
+        with self._lock:
+            entry = self._sessions.pop(session, None)
+            if entry is not None:
+                self.bytes -= entry[2]
+
+    def _put(self, session, document):
+        now = time.monotonic()
+        previous = self._sessions.pop(session, None)
+        if previous is not None:
+            self.bytes -= previous[2]
+        size = document.size()
+        self._sessions[session] = [document, now, size]
+        self.bytes += size
+        while self._sessions:
+            _, (_, used, oldest_size) = next(iter(self._sessions.items()))
+            idle = self.idle_seconds and now - used > self.idle_seconds
+            if not idle and len(self._sessions) <= self.max_sessions and self.bytes <= self.max_bytes:
+                break
+            self._sessions.popitem(last=False)
+            self.bytes -= oldest_size
+            self.evictions += 1
+
+    def stats(self):
+        with self._lock:
+            return {
+                "sessions": len(self._sessions),
+                "bytes": self.bytes,
+                "opened": self.opened,
+                "changed": self.changed,
+                "resyncs": self.resyncs,
+                "evictions": self.evictions,
+            }
@@ -0,0 +1,306 @@
+# ExecutionPool.py
+#
+# Runs compile-and-run jobs in a pool of worker processes instead of the
+# web server's request threads. CPU-bound programs then run on every core
+# instead of taking turns on one GIL, and a runaway or crashing program
+# only costs a worker, which is replaced.
+#
+# Workers are started up front, each with the parse tables loaded and its own
+# CompileCache. Each one is fed by a thread in the server process that takes
+# jobs from a bounded queue. The thread kills a worker that overruns the
+# job's timeout and replaces any worker that dies or has served its quota of
+# jobs. If a replacement can't be started, the thread answers its jobs with
+# "crashed" results and tries again on the next one. Settings come from the
+# environment:
+#
+#   CASPER_POOL_WORKERS    worker processes (0: run jobs inline in main.py)
+#   CASPER_POOL_QUEUE      jobs allowed to wait for a worker
+#   CASPER_POOL_JOBS       jobs a worker runs before it is replaced
+#   CASPER_JOB_TIMEOUT     seconds a job may take before its worker is killed
+#
+# The job timeout is a backstop for the in-process Budget (Budget.py), which
+# stops ordinary runaway programs itself and reports what they printed.
+
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+from Budget import BudgetExceeded
+from CodeGen import run_code_generation
+from CompileCache import CompileCache, CompileResult, compile_source
+from Output import BufferSink, OutputLimitExceeded
+
+POOL_WORKERS = int(os.environ.get("CASPER_POOL_WORKERS", "0"))
+POOL_QUEUE = int(os.environ.get("CASPER_POOL_QUEUE", "256"))
+POOL_JOBS = int(os.environ.get("CASPER_POOL_JOBS", "500"))
+JOB_TIMEOUT = float(os.environ.get("CASPER_JOB_TIMEOUT", "30"))
+
+
+class ExecutionPoolError(Exception):
+    """Raised when the pool cannot take a job: it is shut down, or its queue is full."""
+    pass
+
+
+class JobResult:
+    """
+    The outcome of one job.
+
+    status is "ok" when the job ran to completion, including when the program
+    had compile errors or stopped at a runtime error (see run_source). The
+    other statuses are "error" (the pipeline itself raised), "timeout" and
+    "crashed".
+    diagnostics is the job's CompileResult without its AST, and output is
+    what the program displayed. error explains any status other than "ok".
+    """
+
+    __slots__ = ("status", "diagnostics", "output", "error", "seconds", "pid")
+
+    def __init__(self, status, diagnostics=None, output="", error=None, seconds=0.0, pid=None):
+        self.status = status
+        self.diagnostics = diagnostics
+        self.output = output
+        self.error = error
+        self.seconds = seconds
+        self.pid = pid
+
+    def __getstate__(self):
+        return (self.status, self.diagnostics, self.output, self.error, self.seconds, self.pid)
+
+    def __setstate__(self, state):
+        self.status, self.diagnostics, self.output, self.error, self.seconds, self.pid = state
+
+
+def run_source(source, compile_cache=None, tracer=None):
+    """
+    Compiles source (through compile_cache when given) and, if it compiled
+    cleanly, runs it. Returns (CompileResult, output). A program stopped by
+    a runtime error, its Budget or its output cap has the reason appended to
+    its output; any other exception propagates.
+    """
+    if compile_cache is not None:
+        result = compile_cache.compile(source, tracer)
+    else:
+        result = compile_source(source, tracer)
+    if not result.ok:
+        return result, ""
+    sink = BufferSink()
+    try:
+        run_code_generation(result.ast(), output=sink)
+        output = sink.getvalue()
+    except OutputLimitExceeded as e:
+        output = f"{sink.getvalue()}\n[{e}]"
+    except (BudgetExceeded, ArithmeticError, AttributeError, IndexError, KeyError, MemoryError,
+            RecursionError, TypeError, ValueError) as e:
+        output = f"{sink.getvalue()}\nRuntime Error: {e}"
+    return result, output
+
+
+def _worker_main(conn):
+    """A worker process: warm up, then answer jobs until told to stop."""
+    from Parser import warm_up_parser
+
+    warm_up_parser()
+    compile_cache = CompileCache()
+    pid = os.getpid()
+    conn.send(pid)
+    while True:
+        try:
+            source = conn.recv()
+        except EOFError:
+            return
+        if source is None:
+            return
+        start = time.perf_counter()
+        try:
+            result, output = run_source(source, compile_cache)
+            diagnostics = CompileResult(result.illegal_tokens, result.syntax_error, result.semantic_errors)
+            job_result = JobResult("ok", diagnostics, output)
+        except Exception as error:
+            job_result = JobResult("error", error=str(error))
+        job_result.seconds = time.perf_counter() - start
+        job_result.pid = pid
+        conn.send(job_result)
+
+
+class _Worker:
+    __slots__ = ("process", "conn", "pid", "jobs")
+
+    def __init__(self, context):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child_conn,), daemon=True)
+        self.process.start()
+        child_conn.close()
+        try:
+            self.pid = self.conn.recv()
+        except BaseException:
+            self.kill()
+            raise
+        self.jobs = 0
+
+    def stop(self):
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.process.join(1)
+        self.kill()
+
+    def kill(self):
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+
+class _Job:
+    __slots__ = ("source", "timeout", "future", "queued_at")
+
+    def __init__(self, source, timeout):
+        self.source = source
+        self.timeout = timeout
+        self.future = Future()
+        self.queued_at = time.perf_counter()
+
+
+class ExecutionPool:
+    """
+    A fixed number of worker processes running compile-and-run jobs.
+
+    submit() queues a job and returns a concurrent.futures.Future of its
+    JobResult; run() waits for it. Both raise ExecutionPoolError when the
+    queue is full. metrics() reports throughput, latency and worker churn.
+    """
+
+    def __init__(self, workers=None, queue_size=None, jobs_per_worker=None, timeout=None, start_method="spawn"):
+        self.workers = workers or POOL_WORKERS or os.cpu_count() or 1
+        self.jobs_per_worker = POOL_JOBS if jobs_per_worker is None else jobs_per_worker
+        self.timeout = JOB_TIMEOUT if timeout is None else timeout
+        self._context = multiprocessing.get_context(start_method)
+        self._jobs = queue.Queue(POOL_QUEUE if queue_size is None else queue_size)
+        self._lock = threading.Lock()
+        self._closed = False
+        self._started = time.perf_counter()
+        self._counts = dict.fromkeys(
+            ("submitted", "rejected", "completed", "errors", "timeouts", "crashes", "recycled", "spawn_failures",
+             "busy"), 0)
+        self._run_seconds = 0.0
+        self._wait_seconds = 0.0
+        # Start every worker before taking jobs, so the first requests don't pay for it.
+        started = [_Worker(self._context) for _ in range(self.workers)]
+        self._threads = [threading.Thread(target=self._serve, args=(worker,), daemon=True) for worker in started]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, source, timeout=None):
+        job = _Job(source, self.timeout if timeout is None else timeout)
+        with self._lock:
+            if self._closed:
+                raise ExecutionPoolError("The execution pool is shut down.")
+            try:
+                self._jobs.put_nowait(job)
+            except queue.Full:
+                self._counts["rejected"] += 1
+                raise ExecutionPoolError("The server is busy; try again shortly.") from None
+            self._counts["submitted"] += 1
+        return job.future
+
+    def run(self, source, timeout=None):
+        return self.submit(source, timeout).result()
+
+    def _serve(self, worker):
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                if worker is not None:
+                    worker.stop()
+                return
+            if not job.future.set_running_or_notify_cancel():
+                continue
+            started = time.perf_counter()
+            with self._lock:
+                self._counts["busy"] += 1
+                self._wait_seconds += started - job.queued_at
+            if worker is None:
+                worker = self._spawn()
+            if worker is None:
+                result = JobResult("crashed", error="No worker process could be started.")
+            else:
+                worker, result = self._execute(worker, job)
+            with self._lock:
+                self._counts["busy"] -= 1
+                self._counts["completed"] += 1
+                self._run_seconds += time.perf_counter() - started
+                if result.status != "ok":
+                    self._counts[{"error": "errors", "timeout": "timeouts", "crashed": "crashes"}[result.status]] += 1
+            job.future.set_result(result)
+
+    def _spawn(self):
+        """A new worker, or None if it couldn't be started."""
+        try:
+            return _Worker(self._context)
+        except Exception:
+            with self._lock:
+                self._counts["spawn_failures"] += 1
+            return None
+
+    def _execute(self, worker, job):
+        """
+        Runs job on worker; returns the worker to use next (a replacement if
+        needed, None if that couldn't be started) and the JobResult.
+        """
+        start = time.perf_counter()
+        try:
+            worker.conn.send(job.source)
+            if worker.conn.poll(job.timeout):
+                result = worker.conn.recv()
+            else:
+                result = JobResult("timeout", error=f"Time limit of {job.timeout:g} seconds exceeded.",
+                                   seconds=time.perf_counter() - start, pid=worker.pid)
+        except (EOFError, OSError):
+            result = JobResult("crashed", error="The program's worker process died.",
+                               seconds=time.perf_counter() - start, pid=worker.pid)
+        worker.jobs += 1
+        if result.status in ("timeout", "crashed"):
+            worker.kill()
+            worker = self._spawn()
+        elif self.jobs_per_worker and worker.jobs >= self.jobs_per_worker:
+            worker.stop()
+            worker = self._spawn()
+            with self._lock:
+                self._counts["recycled"] += 1
+        return worker, result
+
+    def metrics(self):
+        with self._lock:
+            metrics = dict(self._counts)
+            uptime = time.perf_counter() - self._started
+            completed = metrics["completed"]
+            metrics.update(
+                workers=self.workers,
+                queued=self._jobs.qsize(),
+                uptime_seconds=uptime,
+                jobs_per_second=completed / uptime if uptime else 0.0,
+                mean_run_seconds=self._run_seconds / completed if completed else 0.0,
+                mean_wait_seconds=self._wait_seconds / completed if completed else 0.0,
+            )
+        return metrics
+
+    def close(self):
+        """Lets queued jobs finish, then stops every worker."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        for _ in self._threads:
+            self._jobs.put(None)
+        for thread in self._threads:
+            thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
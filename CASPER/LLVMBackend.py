@@ -0,0 +1,616 @@
+# LLVMBackend.py
+#
+# Lowers a parsed CASPER program to LLVM IR and, when llvmlite is installed,
+# JIT-compiles and runs it in-process. The IR is plain text, so it can be
+# dumped and inspected without llvmlite:
+#
+#   python LLVMBackend.py tests/test.lime
+#
+# Lowering.py gives every value a static type, as for CBackend.py, and the
+# program behaves as it does under CodeGen's tree walker: the same output,
+# the same runtime errors with Python's messages, and the same call-depth,
+# step and string-size limits, baked into the IR from a Budget. int, flt
+# and bln values are i64, double and i1; loops are blocks with a back edge
+# to their head.
+#
+# Output and strings go through a few runtime functions (casper_put_*,
+# casper_str_*, casper_fail) that the JIT binds to Python callbacks, so
+# display formatting and string operations are exactly Python's. A str is
+# a pointer to NUL-terminated UTF-8 that the runtime keeps alive until the
+# run ends. A runtime error sets casper_failed; every function then returns
+# straight to its caller, which checks the flag after each call, so a
+# failure unwinds back to run_program() without touching the process.
+#
+# As in CBackend.py, ints are 64-bit (a result that does not fit fails with
+# "integer overflow"), and int / int and comparisons between ints and flts
+# go through doubles.
+
+import ctypes
+import hashlib
+import re
+import struct
+import sys
+import threading
+
+from Budget import Budget, BudgetExceeded
+from CodeGen import MAX_CALL_DEPTH, _truthy
+from Lowering import Const, LoweringError, lower_program
+
+try:
+    import llvmlite.binding as llvm
+except ImportError:
+    llvm = None
+
+
+class LLVMError(Exception):
+    """Raised when a program cannot be lowered to LLVM IR, or fails while running."""
+    pass
+
+
+def _python_error(operation):
+    try:
+        operation()
+    except ArithmeticError as error:
+        return str(error)
+
+
+# The messages Python (and so the tree walker) gives for these errors.
+_ERRORS = {
+    "div_int": _python_error(lambda: 1 / 0),
+    "div_flt": _python_error(lambda: 1.0 / 0.0),
+    "mod_int": _python_error(lambda: 1 % 0),
+    "mod_flt": _python_error(lambda: 1.0 % 0.0),
+    "overflow": "integer overflow",
+    "depth": "maximum call depth exceeded",
+}
+
+_IR_TYPES = {"int": "i64", "flt": "double", "bln": "i1", "str": "ptr"}
+_ZEROS = {"int": "0", "flt": "0.0", "bln": "false", "str": "null"}
+_INTEGRAL = ("int", "bln")
+_INT_COMPARES = {"<": "slt", ">": "sgt", "<=": "sle", ">=": "sge", "==": "eq", "!=": "ne"}
+_FLT_COMPARES = {"<": "olt", ">": "ogt", "<=": "ole", ">=": "oge", "==": "oeq", "!=": "une"}
+_INT_OPS = {"+": "sadd", "-": "ssub", "*": "smul"}
+_FLT_OPS = {"+": "fadd", "-": "fsub", "*": "fmul"}
+
+PRELUDE = """\
+declare void @casper_put_int(i64)
+declare void @casper_put_flt(double)
+declare void @casper_put_bln(i32)
+declare void @casper_put_str(ptr)
+declare void @casper_put_end()
+declare void @casper_fail(ptr)
+declare ptr @casper_str_concat(ptr, ptr, i64)
+declare ptr @casper_str_repeat(ptr, i64, i64)
+declare i32 @casper_str_compare(ptr, ptr)
+declare i32 @casper_str_truthy(ptr)
+declare {i64, i1} @llvm.sadd.with.overflow.i64(i64, i64)
+declare {i64, i1} @llvm.ssub.with.overflow.i64(i64, i64)
+declare {i64, i1} @llvm.smul.with.overflow.i64(i64, i64)
+declare double @llvm.copysign.f64(double, double)
+
+@casper_failed = external global i32
+@casper.depth = internal global i64 0
+@casper.steps = internal global i64 0
+"""
+
+
+def _flt_constant(value):
+    """LLVM spells double constants exactly as 64-bit hex."""
+    return f"0x{struct.unpack('>Q', struct.pack('>d', value))[0]:016X}"
+
+
+def _mangle(name):
+    return re.sub(r"\W", "_", name.lstrip("$@"))
+
+
+class IRGenerator:
+    """
+    Emits an LLVM module for a LoweredProgram. Temps are SSA values %t<n>,
+    except those && and || move into, which live in allocas, as do CASPER
+    locals (one per type each holds); LLVM's own passes promote them to
+    registers. None values are never stored, so none parameters are dropped
+    and functions that return None, or never return, are void.
+    """
+
+    def __init__(self, budget):
+        self.budget = budget
+        self._strings = {}
+
+    def generate(self, program):
+        self._functions = {name: f'@"f.{_mangle(name)}"' for name in program.functions}
+        self._globals = {slot: f'@"g{slot}.{_mangle(program.global_names[slot])}"'
+                         for slot in program.global_types}
+        for value_type in program.global_types.values():
+            self._ir_type(value_type)
+        functions = [self._function(function) for function in program.functions.values()]
+        functions.append(self._function(program.main))
+        globals_ = [f"{self._globals[slot]} = internal global {_IR_TYPES[value_type]} {_ZEROS[value_type]}"
+                    for slot, value_type in program.global_types.items()]
+        strings = []
+        for text, label in self._strings.items():
+            data, escaped = self._encode(text)
+            strings.append(f'{label} = private unnamed_addr constant [{len(data)} x i8] c"{escaped}"')
+        return "\n".join([PRELUDE] + globals_ + strings + [""] + functions)
+
+    @staticmethod
+    def _encode(text):
+        data = text.encode("utf-8") + b"\0"
+        escaped = "".join(chr(byte) if 32 <= byte < 127 and byte not in (34, 92) else f"\\{byte:02X}" for byte in data)
+        return data, escaped
+
+    @staticmethod
+    def _ir_type(value_type):
+        if value_type not in _IR_TYPES:
+            raise LLVMError(f"{value_type} values are not supported by the LLVM backend.")
+        return _IR_TYPES[value_type]
+
+    def _string(self, text):
+        if text not in self._strings:
+            self._strings[text] = f"@.str.{len(self._strings)}"
+        return self._strings[text]
+
+    # -- functions and blocks -------------------------------------------------
+
+    def _function(self, function):
+        self._lines = []
+        self._counter = 0
+        self._terminated = False
+        self._unwinds = False
+        main = function.name == "@main_casper"
+        self._moved = {instruction[1].number for instruction in _instructions(function.code)
+                       if instruction[0] == "move"}
+        allocas = [f"%t{number}.slot = alloca i1" for number in sorted(self._moved)]
+        allocas += [f"%l{slot}.{value_type} = alloca {self._ir_type(value_type)}"
+                    for slot, value_type in sorted(function.locals)]
+        self._returns = "void" if main or function.returns in ("none", "never") else self._ir_type(function.returns)
+        if main:
+            header = "define void @casper_main()"
+            self._emit("store i64 0, ptr @casper.depth")
+            self._emit("store i64 0, ptr @casper.steps")
+        else:
+            params = ", ".join(f"{self._ir_type(param.type)} %t{param.number}"
+                               for param in function.params if param.type != "none")
+            header = f"define internal {self._returns} {self._functions[function.name]}({params})"
+            self._enter()
+        self._block_code(function.code)
+        default = "ret void" if self._returns == "void" else f"ret {self._returns} {_ZEROS[function.returns]}"
+        lines = [header + " {", "entry:"] + ["  " + alloca for alloca in allocas] + self._lines
+        if not self._terminated:
+            lines.append("  " + default)
+        if self._unwinds:
+            lines += ["unwind:", "  " + default]
+        return "\n".join(lines + ["}", ""])
+
+    def _enter(self):
+        """As CodeGenerator.call: the depth limit, then one step of the Budget."""
+        depth = self._fresh()
+        self._emit(f"{depth} = load i64, ptr @casper.depth")
+        self._guard(f"icmp sge i64 {depth}, {MAX_CALL_DEPTH}", _ERRORS["depth"])
+        self._emit_step()
+        deeper = self._fresh()
+        self._emit(f"{deeper} = add i64 {depth}, 1")
+        self._emit(f"store i64 {deeper}, ptr @casper.depth")
+
+    def _fresh(self):
+        self._counter += 1
+        return f"%x{self._counter}"
+
+    def _new_label(self, prefix):
+        self._counter += 1
+        return f"{prefix}{self._counter}"
+
+    def _emit(self, instruction):
+        self._lines.append("  " + instruction)
+
+    def _block(self, label):
+        self._lines.append(f"{label}:")
+        self._terminated = False
+
+    def _jump(self, label):
+        """Ends the current block with a branch, unless it already ended."""
+        if not self._terminated:
+            self._emit(f"br label %{label}")
+            self._terminated = True
+
+    def _branch(self, condition, true_label, false_label):
+        self._emit(f"br i1 {condition}, label %{true_label}, label %{false_label}")
+        self._terminated = True
+
+    def _fail(self, message):
+        self._emit(f"call void @casper_fail(ptr {self._string(message)})")
+        self._unwinds = True
+        self._jump("unwind")
+
+    def _guard(self, test, message):
+        """Fails with `message` when `test`, an i1-valued instruction, holds."""
+        flag = self._fresh()
+        self._emit(f"{flag} = {test}")
+        fail, ok = self._new_label("fail"), self._new_label("ok")
+        self._branch(flag, fail, ok)
+        self._block(fail)
+        self._fail(message)
+        self._block(ok)
+
+    def _check_failed(self):
+        """After a call that can fail, unwinds when it did."""
+        flag, failed = self._fresh(), self._fresh()
+        self._emit(f"{flag} = load i32, ptr @casper_failed")
+        self._emit(f"{failed} = icmp ne i32 {flag}, 0")
+        resume = self._new_label("ok")
+        self._unwinds = True
+        self._branch(failed, "unwind", resume)
+        self._block(resume)
+
+    def _block_code(self, code):
+        for instruction in code:
+            getattr(self, f"_emit_{instruction[0]}")(*instruction[1:])
+
+    # -- operands -------------------------------------------------------------
+
+    def _value(self, operand):
+        """The IR value of an int, flt, bln or str operand."""
+        self._ir_type(operand.type)
+        if isinstance(operand, Const):
+            if operand.type == "str":
+                return self._string(operand.value)
+            if operand.type == "flt":
+                return _flt_constant(operand.value)
+            if operand.type == "bln":
+                return "true" if operand.value else "false"
+            if not -2 ** 63 <= operand.value < 2 ** 63:
+                raise LLVMError(f"The integer {operand.value} does not fit in 64 bits.")
+            return str(operand.value)
+        if operand.number in self._moved:
+            value = self._fresh()
+            self._emit(f"{value} = load i1, ptr %t{operand.number}.slot")
+            return value
+        return f"%t{operand.number}"
+
+    def _widen(self, operand, ir_type):
+        """An operand as an i64 or a double."""
+        value = self._value(operand)
+        if _IR_TYPES[operand.type] == ir_type:
+            return value
+        result = self._fresh()
+        if operand.type == "bln":
+            self._emit(f"{result} = {'zext' if ir_type == 'i64' else 'uitofp'} i1 {value} to {ir_type}")
+        else:
+            self._emit(f"{result} = sitofp i64 {value} to double")
+        return result
+
+    def _var(self, var):
+        if var[0] == "global":
+            return self._globals[var[1]]
+        return f"%l{var[1]}.{var[2]}"
+
+    # -- instructions ---------------------------------------------------------
+
+    def _emit_load(self, dst, var):
+        self._emit(f"%t{dst.number} = load {self._ir_type(dst.type)}, ptr {self._var(var)}")
+
+    def _emit_store(self, var, src):
+        self._emit(f"store {self._ir_type(src.type)} {self._value(src)}, ptr {self._var(var)}")
+
+    def _emit_move(self, dst, src):
+        self._emit(f"store i1 {self._value(src)}, ptr %t{dst.number}.slot")
+
+    def _emit_truth(self, dst, src):
+        value = self._value(src)
+        if src.type == "str":
+            truthy = self._fresh()
+            self._emit(f"{truthy} = call i32 @casper_str_truthy(ptr {value})")
+            self._emit(f"%t{dst.number} = icmp ne i32 {truthy}, 0")
+        elif src.type == "int":
+            self._emit(f"%t{dst.number} = icmp ne i64 {value}, 0")
+        else:
+            # NaN is true, as in Python.
+            self._emit(f"%t{dst.number} = fcmp une double {value}, 0.0")
+
+    def _emit_binary(self, op, dst, left, right):
+        result = f"%t{dst.number}"
+        if "str" in (left.type, right.type):
+            self._string_binary(op, result, left, right)
+            return
+        integral = left.type in _INTEGRAL and right.type in _INTEGRAL
+        ir_type = "i64" if integral else "double"
+        if op in _INT_COMPARES:
+            l, r = self._widen(left, ir_type), self._widen(right, ir_type)
+            compare = f"icmp {_INT_COMPARES[op]} i64" if integral else f"fcmp {_FLT_COMPARES[op]} double"
+            self._emit(f"{result} = {compare} {l}, {r}")
+        elif op == "/":
+            l, r = self._widen(left, "double"), self._widen(right, "double")
+            self._guard(f"fcmp oeq double {r}, 0.0", _ERRORS["div_int" if integral else "div_flt"])
+            self._emit(f"{result} = fdiv double {l}, {r}")
+        elif op == "%":
+            l, r = self._widen(left, ir_type), self._widen(right, ir_type)
+            if integral:
+                self._mod_int(result, l, r)
+            else:
+                self._mod_flt(result, l, r)
+        elif integral:
+            l, r = self._widen(left, "i64"), self._widen(right, "i64")
+            pair = self._fresh()
+            self._emit(f"{pair} = call {{i64, i1}} @llvm.{_INT_OPS[op]}.with.overflow.i64(i64 {l}, i64 {r})")
+            self._guard(f"extractvalue {{i64, i1}} {pair}, 1", _ERRORS["overflow"])
+            self._emit(f"{result} = extractvalue {{i64, i1}} {pair}, 0")
+        else:
+            l, r = self._widen(left, "double"), self._widen(right, "double")
+            self._emit(f"{result} = {_FLT_OPS[op]} double {l}, {r}")
+
+    def _string_binary(self, op, result, left, right):
+        limit = self.budget.string_chars
+        if op == "+":
+            self._emit(f"{result} = call ptr @casper_str_concat(ptr {self._value(left)}, ptr {self._value(right)}, "
+                       f"i64 {limit})")
+            self._check_failed()
+        elif op == "*":
+            text, count = (left, right) if left.type == "str" else (right, left)
+            self._emit(f"{result} = call ptr @casper_str_repeat(ptr {self._value(text)}, "
+                       f"i64 {self._widen(count, 'i64')}, i64 {limit})")
+            self._check_failed()
+        else:
+            # Both are strings: the rest compare them.
+            order = self._fresh()
+            self._emit(f"{order} = call i32 @casper_str_compare(ptr {self._value(left)}, ptr {self._value(right)})")
+            self._emit(f"{result} = icmp {_INT_COMPARES[op]} i32 {order}, 0")
+
+    def _mod_int(self, result, left, right):
+        # Python's %: the result takes the divisor's sign, and x % -1 is 0 (srem would trap on INT64_MIN).
+        self._guard(f"icmp eq i64 {right}, 0", _ERRORS["mod_int"])
+        minus_one, divisor, rem, mixed, nonzero, adjust, fixed, plain = (self._fresh() for _ in range(8))
+        self._emit(f"{minus_one} = icmp eq i64 {right}, -1")
+        self._emit(f"{divisor} = select i1 {minus_one}, i64 1, i64 {right}")
+        self._emit(f"{rem} = srem i64 {left}, {divisor}")
+        self._emit(f"{mixed} = xor i64 {rem}, {divisor}")
+        self._emit(f"{nonzero} = icmp ne i64 {rem}, 0")
+        self._emit(f"{adjust} = icmp slt i64 {mixed}, 0")
+        self._emit(f"{fixed} = add i64 {rem}, {divisor}")
+        self._emit(f"{plain} = and i1 {nonzero}, {adjust}")
+        self._emit(f"{result} = select i1 {plain}, i64 {fixed}, i64 {rem}")
+
+    def _mod_flt(self, result, left, right):
+        # Python's float %: the result takes the divisor's sign, and a zero result keeps it too.
+        self._guard(f"fcmp oeq double {right}, 0.0", _ERRORS["mod_flt"])
+        rem, nonzero, rem_negative, right_negative, mixed, adjust, fixed, signed, zero = (
+            self._fresh() for _ in range(9))
+        self._emit(f"{rem} = frem double {left}, {right}")
+        self._emit(f"{nonzero} = fcmp une double {rem}, 0.0")
+        self._emit(f"{rem_negative} = fcmp olt double {rem}, 0.0")
+        self._emit(f"{right_negative} = fcmp olt double {right}, 0.0")
+        self._emit(f"{mixed} = xor i1 {rem_negative}, {right_negative}")
+        self._emit(f"{adjust} = and i1 {nonzero}, {mixed}")
+        self._emit(f"{fixed} = fadd double {rem}, {right}")
+        self._emit(f"{signed} = select i1 {adjust}, double {fixed}, double {rem}")
+        self._emit(f"{zero} = call double @llvm.copysign.f64(double 0.0, double {right})")
+        self._emit(f"{result} = select i1 {nonzero}, double {signed}, double {zero}")
+
+    def _emit_display(self, values):
+        # One line, each value as str() shows it, separated by spaces (see Output.print).
+        for value in values:
+            if isinstance(value, Const):
+                self._emit(f"call void @casper_put_str(ptr {self._string(str(value.value))})")
+            elif value.type == "bln":
+                widened = self._fresh()
+                self._emit(f"{widened} = zext i1 {self._value(value)} to i32")
+                self._emit(f"call void @casper_put_bln(i32 {widened})")
+            else:
+                self._emit(f"call void @casper_put_{value.type}({self._ir_type(value.type)} {self._value(value)})")
+        self._emit("call void @casper_put_end()")
+
+    def _emit_call(self, dst, name, args):
+        texts = ", ".join(f"{self._ir_type(arg.type)} {self._value(arg)}" for arg in args if arg.type != "none")
+        if dst is None:
+            self._emit(f"call void {self._functions[name]}({texts})")
+        else:
+            self._emit(f"%t{dst.number} = call {self._ir_type(dst.type)} {self._functions[name]}({texts})")
+        self._check_failed()
+
+    def _emit_if(self, condition, then, otherwise):
+        then_label, else_label, end = self._new_label("then"), self._new_label("else"), self._new_label("endif")
+        self._branch(self._value(condition), then_label, else_label)
+        for label, code in ((then_label, then), (else_label, otherwise)):
+            self._block(label)
+            self._block_code(code)
+            self._jump(end)
+        self._block(end)
+
+    def _emit_loop(self, head, condition, body):
+        top, go, end = self._new_label("loop"), self._new_label("body"), self._new_label("endloop")
+        self._jump(top)
+        self._block(top)
+        self._block_code(head)
+        self._branch(self._value(condition), go, end)
+        self._block(go)
+        self._block_code(body)
+        self._jump(top)
+        self._block(end)
+
+    def _emit_not(self, dst, src):
+        self._emit(f"%t{dst.number} = xor i1 {self._value(src)}, true")
+
+    def _emit_step(self):
+        if self.budget.steps:
+            steps, next_steps = self._fresh(), self._fresh()
+            self._emit(f"{steps} = load i64, ptr @casper.steps")
+            self._emit(f"{next_steps} = add i64 {steps}, 1")
+            self._emit(f"store i64 {next_steps}, ptr @casper.steps")
+            self._guard(f"icmp sgt i64 {next_steps}, {self.budget.steps}",
+                        f"Step limit of {self.budget.steps} exceeded.")
+
+    def _emit_fail(self, message):
+        self._fail(message)
+
+    def _emit_return(self, src):
+        before, after = self._fresh(), self._fresh()
+        self._emit(f"{before} = load i64, ptr @casper.depth")
+        self._emit(f"{after} = sub i64 {before}, 1")
+        self._emit(f"store i64 {after}, ptr @casper.depth")
+        self._emit("ret void" if self._returns == "void" else f"ret {self._returns} {self._value(src)}")
+        self._terminated = True
+
+
+def _instructions(code):
+    """Every instruction in code, including those inside ifs and loops."""
+    for instruction in code:
+        yield instruction
+        if instruction[0] in ("if", "loop"):
+            yield from _instructions(instruction[1 if instruction[0] == "loop" else 2])
+            yield from _instructions(instruction[3])
+
+
+def generate_ir(ast, budget=None):
+    """Returns the LLVM IR (text) of a parsed program, with the step limit of `budget`; its entry point is casper_main()."""
+    try:
+        program = lower_program(ast)
+    except LoweringError as error:
+        raise LLVMError(str(error)) from None
+    return IRGenerator(budget if budget is not None else Budget()).generate(program)
+
+
+# -- JIT ---------------------------------------------------------------------
+
+class _Runtime:
+    """Python side of the casper_* functions for the program currently running."""
+
+    def __init__(self, display):
+        self.display = display
+        self.parts = []
+        self.error = None
+        # The buffers behind every str the program made, so its pointers stay valid.
+        self.strings = []
+
+
+_failed = ctypes.c_int(0)
+_runtime = None
+_run_lock = threading.Lock()
+_callbacks = []
+_engines = {}
+_target_machine = None
+
+
+def _fail(message):
+    _failed.value = 1
+    if _runtime.error is None:
+        _runtime.error = message.decode("utf-8")
+
+
+def _keep(text):
+    """The address of a NUL-terminated UTF-8 copy of text that lives until the run ends."""
+    buffer = ctypes.create_string_buffer(text.encode("utf-8"))
+    _runtime.strings.append(buffer)
+    return ctypes.addressof(buffer)
+
+
+def _sized(operation, limit):
+    """Runs a Budget operation with the string limit `limit`; a string over it fails the program."""
+    try:
+        return _keep(operation(Budget(0, 0, 0, limit)))
+    except BudgetExceeded as error:
+        _fail(str(error).encode("utf-8"))
+        return None
+
+
+def _str_concat(left, right, limit):
+    return _sized(lambda budget: budget.add(left.decode("utf-8"), right.decode("utf-8")), limit)
+
+
+def _str_repeat(text, count, limit):
+    return _sized(lambda budget: budget.multiply(text.decode("utf-8"), count), limit)
+
+
+def _str_compare(left, right):
+    left, right = left.decode("utf-8"), right.decode("utf-8")
+    return (left > right) - (left < right)
+
+
+def _bind_runtime():
+    """Registers the casper_* callbacks with LLVM's symbol table, once per process."""
+    global _target_machine
+    if _target_machine is not None:
+        return
+    llvm.initialize_native_target()
+    llvm.initialize_native_asmprinter()
+    text, i32, i64 = ctypes.c_char_p, ctypes.c_int32, ctypes.c_int64
+    functions = {
+        "casper_put_int": (None, [i64], lambda value: _runtime.parts.append(str(value))),
+        "casper_put_flt": (None, [ctypes.c_double], lambda value: _runtime.parts.append(str(value))),
+        "casper_put_bln": (None, [i32], lambda value: _runtime.parts.append(str(bool(value)))),
+        "casper_put_str": (None, [text], lambda value: _runtime.parts.append(value.decode("utf-8"))),
+        "casper_fail": (None, [text], _fail),
+        "casper_str_concat": (ctypes.c_void_p, [text, text, i64], _str_concat),
+        "casper_str_repeat": (ctypes.c_void_p, [text, i64, i64], _str_repeat),
+        "casper_str_compare": (i32, [text, text], _str_compare),
+        "casper_str_truthy": (i32, [text], lambda value: _truthy(value.decode("utf-8"))),
+    }
+    for name, (restype, argtypes, function) in functions.items():
+        callback = ctypes.CFUNCTYPE(restype, *argtypes)(function)
+        _callbacks.append(callback)
+        llvm.add_symbol(name, ctypes.cast(callback, ctypes.c_void_p).value)
+
+    def put_end():
+        _runtime.display(" ".join(_runtime.parts))
+        _runtime.parts = []
+    callback = ctypes.CFUNCTYPE(None)(put_end)
+    _callbacks.append(callback)
+    llvm.add_symbol("casper_put_end", ctypes.cast(callback, ctypes.c_void_p).value)
+    llvm.add_symbol("casper_failed", ctypes.addressof(_failed))
+    _target_machine = llvm.Target.from_default_triple().create_target_machine(opt=2)
+
+
+def jit_compile(ir):
+    """JIT-compiles IR with LLVM's O2 pipeline; returns casper_main as a ctypes function. Cached by IR hash."""
+    if llvm is None:
+        raise LLVMError("The LLVM JIT needs llvmlite (pip install llvmlite); generate_ir() works without it.")
+    key = hashlib.sha256(ir.encode()).hexdigest()
+    if key in _engines:
+        return _engines[key][1]
+    _bind_runtime()
+    module = llvm.parse_assembly(ir)
+    module.verify()
+    options = llvm.create_pipeline_tuning_options(speed_level=2)
+    passes = llvm.create_pass_builder(_target_machine, options)
+    passes.getModulePassManager().run(module, passes)
+    engine = llvm.create_mcjit_compiler(module, _target_machine)
+    engine.finalize_object()
+    main = ctypes.CFUNCTYPE(None)(engine.get_function_address("casper_main"))
+    # The engine owns the machine code, so it lives as long as the cache entry.
+    _engines[key] = (engine, main)
+    return main
+
+
+def execute(main, display=print):
+    """Runs a JIT-compiled casper_main; one program at a time, since the runtime is process-wide."""
+    global _runtime
+    with _run_lock:
+        _runtime = _Runtime(display)
+        _failed.value = 0
+        try:
+            main()
+            error = _runtime.error
+        finally:
+            _runtime = None
+    if error is not None:
+        raise LLVMError(f"Runtime Error: {error}")
+
+
+def run_program(ast, display=print, budget=None):
+    """Lowers, JIT-compiles (or reuses) and runs a parsed program."""
+    execute(jit_compile(generate_ir(ast, budget)), display)
+
+
+if __name__ == "__main__":
+    from Lexer import TokenStream
+    from Parser import build_parser
+
+    with open(sys.argv[1]) as f:
+        text = f.read()
+    parser = build_parser()
+    for source in (chunk.strip() for chunk in re.split(r"(?<=ghost)", text)):
+        if source:
+            try:
+                ir = generate_ir(parser.parse(lexer=TokenStream(source.replace("\n", "\r\n"))))
+            except (SyntaxError, LLVMError) as error:
+                print(f"{error}\n")
+                continue
+            # The prelude is the same for every program; show only the translation.
+            print(ir[len(PRELUDE):].strip(), end="\n\n")
@@ -0,0 +1,467 @@
+# LanguageServer.py
+#
+# A Language Server Protocol server for CASPER, speaking JSON-RPC over stdin
+# and stdout, for editors that can start a language server. Run it from the
+# CASPER directory:
+#
+#   python LanguageServer.py
+#
+# Open documents are kept as DocumentSync.Documents. So didChange edits
+# (incremental sync) are applied in place and re-lex only the lines they
+# touch. Diagnostics run on a timer after the last edit, and a newer edit
+# restarts the timer. An analysis overtaken by a newer version stops at its
+# next stage and publishes nothing. Semantic tokens and document symbols
+# are read from the stored tokens. Every analysis is cached with the
+# document version it was made for.
+#
+#   CASPER_LSP_DEBOUNCE    milliseconds between the last edit and diagnostics
+#
+# Columns are counted in characters, which matches LSP's UTF-16 columns
+# except for characters outside the Basic Multilingual Plane.
+
+import json
+import os
+import queue
+import re
+import sys
+import threading
+
+from DocumentSync import Document, DocumentSyncError, check_tokens
+from Parser import warm_up_parser
+from Semantics import run_semantic_analysis
+from Token import KEYWORDS, TokenType
+
+LSP_DEBOUNCE = float(os.environ.get("CASPER_LSP_DEBOUNCE", "300")) / 1000
+
+# JSON-RPC and LSP error codes.
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+REQUEST_CANCELLED = -32800
+
+SEMANTIC_TOKEN_TYPES = ["keyword", "type", "function", "variable", "number", "string", "comment", "operator"]
+
+_DATA_TYPES = {TokenType.INT, TokenType.FLT, TokenType.BLN, TokenType.STR, TokenType.CHR}
+_FUNCTION_TYPES = {token_type for token_type in TokenType if token_type.name.startswith("FUNCTION")} - {TokenType.FUNCTION_NAME}
+_KEYWORD_TYPES = set(KEYWORDS.values())
+_UNMARKED = {TokenType.NEWLINE, TokenType.ILLEGAL, TokenType.EOF, TokenType.LPAREN, TokenType.RPAREN,
+             TokenType.LBRACE, TokenType.RBRACE, TokenType.LBRACKET, TokenType.RBRACKET, TokenType.COMMA}
+
+
+def _semantic_kind(token_type):
+    name = token_type.name
+    if token_type in _DATA_TYPES or name.startswith("LIST_"):
+        return "type"
+    if token_type in (TokenType.FUNCTION_NAME, TokenType.MAIN_CASPER) or name.startswith("CONVERT_TO_"):
+        return "function"
+    if token_type is TokenType.IDENT:
+        return "variable"
+    if token_type in (TokenType.INT_LIT, TokenType.FLT_LIT):
+        return "number"
+    if token_type in (TokenType.STR_LIT, TokenType.CHR_LIT):
+        return "string"
+    if token_type is TokenType.COMMENT:
+        return "comment"
+    if token_type in _KEYWORD_TYPES:
+        return "keyword"
+    return "operator"
+
+
+SEMANTIC_TOKEN_CODES = {
+    token_type: SEMANTIC_TOKEN_TYPES.index(_semantic_kind(token_type))
+    for token_type in TokenType if token_type not in _UNMARKED
+}
+
+# LSP SymbolKind values.
+SYMBOL_FUNCTION = 12
+SYMBOL_VARIABLE = 13
+
+
+class LanguageServerError(Exception):
+    """Raised by a request handler to answer with a JSON-RPC error; code is the error code."""
+
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+
+
+def read_message(stream):
+    """Reads one Content-Length framed JSON-RPC message from a binary stream; None at the end of the stream."""
+    headers = {}
+    while True:
+        line = stream.readline()
+        if not line:
+            return None
+        line = line.strip()
+        if not line:
+            break
+        name, _, value = line.decode("ascii").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    body = stream.read(int(headers["content-length"]))
+    return json.loads(body)
+
+
+def write_message(stream, message):
+    body = json.dumps(message, separators=(",", ":")).encode()
+    stream.write(b"Content-Length: %d\r\n\r\n" % len(body) + body)
+    stream.flush()
+
+
+def _position(line, character):
+    return {"line": line, "character": character}
+
+
+def _range(line, start, end_line, end):
+    return {"start": _position(line, start), "end": _position(end_line, end)}
+
+
+class Analysis:
+    """What the server worked out for one version of a document; each part is filled in when first asked for."""
+
+    __slots__ = ("version", "diagnostics", "semantic_tokens", "symbols")
+
+    def __init__(self, version):
+        self.version = version
+        self.diagnostics = None
+        self.semantic_tokens = None
+        self.symbols = None
+
+
+class LanguageServer:
+    """
+    Answers one client on a pair of binary streams until it sends "exit".
+
+    serve() reads messages on the calling thread. Cancellations take effect
+    there straight away; everything else is handled in order on a worker
+    thread, and diagnostics run on timer threads.
+    """
+
+    def __init__(self, reader, writer, debounce=None):
+        self.reader = reader
+        self.writer = writer
+        self.debounce = LSP_DEBOUNCE if debounce is None else debounce
+        self.documents = {}  # uri -> Document
+        self.analyses = {}  # uri -> Analysis of the latest version looked at
+        self.shutdown_requested = False
+        self._timers = {}
+        self._cancelled = set()
+        self._messages = queue.Queue()
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._handlers = {
+            "initialize": self.initialize,
+            "shutdown": self.shutdown,
+            "textDocument/didOpen": self.did_open,
+            "textDocument/didChange": self.did_change,
+            "textDocument/didClose": self.did_close,
+            "textDocument/semanticTokens/full": self.semantic_tokens,
+            "textDocument/documentSymbol": self.document_symbols,
+        }
+
+    def serve(self):
+        """Runs until "exit" or the end of the input; returns the process exit code LSP asks for."""
+        worker = threading.Thread(target=self._work, daemon=True)
+        worker.start()
+        while True:
+            message = read_message(self.reader)
+            if message is None or message.get("method") == "exit":
+                break
+            if message.get("method") == "$/cancelRequest":
+                with self._lock:
+                    self._cancelled.add(message["params"]["id"])
+                continue
+            self._messages.put(message)
+        self._messages.put(None)
+        worker.join()
+        with self._lock:
+            for timer in self._timers.values():
+                timer.cancel()
+        return 0 if self.shutdown_requested else 1
+
+    def _work(self):
+        while True:
+            message = self._messages.get()
+            if message is None:
+                return
+            self._handle(message)
+
+    def _handle(self, message):
+        method, request_id = message.get("method"), message.get("id")
+        handler = self._handlers.get(method)
+        if request_id is None:
+            # A notification: nothing to answer, and unknown ones are ignored.
+            if handler is not None:
+                try:
+                    handler(message.get("params") or {})
+                except Exception as error:
+                    self._notify("window/logMessage", {"type": 1, "message": f"{method}: {error}"})
+            return
+        with self._lock:
+            cancelled = request_id in self._cancelled
+            self._cancelled.discard(request_id)
+        try:
+            if cancelled:
+                raise LanguageServerError(REQUEST_CANCELLED, "Request cancelled.")
+            if handler is None:
+                raise LanguageServerError(METHOD_NOT_FOUND, f"Unsupported method: {method}")
+            response = {"jsonrpc": "2.0", "id": request_id, "result": handler(message.get("params") or {})}
+        except LanguageServerError as error:
+            response = {"jsonrpc": "2.0", "id": request_id, "error": {"code": error.code, "message": str(error)}}
+        except Exception as error:
+            response = {"jsonrpc": "2.0", "id": request_id, "error": {"code": INTERNAL_ERROR, "message": str(error)}}
+        self._send(response)
+
+    def _send(self, message):
+        with self._write_lock:
+            write_message(self.writer, message)
+
+    def _notify(self, method, params):
+        self._send({"jsonrpc": "2.0", "method": method, "params": params})
+
+    # -- lifecycle ------------------------------------------------------------
+
+    def initialize(self, params):
+        warm_up_parser()
+        return {
+            "capabilities": {
+                "textDocumentSync": {"openClose": True, "change": 2},
+                "semanticTokensProvider": {
+                    "legend": {"tokenTypes": SEMANTIC_TOKEN_TYPES, "tokenModifiers": []},
+                    "full": True,
+                },
+                "documentSymbolProvider": True,
+            },
+            "serverInfo": {"name": "casper"},
+        }
+
+    def shutdown(self, params):
+        self.shutdown_requested = True
+        return None
+
+    # -- document sync --------------------------------------------------------
+
+    def did_open(self, params):
+        item = params["textDocument"]
+        with self._lock:
+            self.documents[item["uri"]] = Document(item["text"], item.get("version", 0))
+        self._schedule(item["uri"], 0)
+
+    def did_change(self, params):
+        uri, version = params["textDocument"]["uri"], params["textDocument"]["version"]
+        document = self._document(uri)
+        with document.lock:
+            edited = document
+            for change in params["contentChanges"]:
+                if "range" not in change:
+                    edited = Document(change["text"], version)
+                    continue
+                start, end = change["range"]["start"], change["range"]["end"]
+                try:
+                    edited.apply_change(start["line"] + 1, start["character"] + 1,
+                                        end["line"] + 1, end["character"] + 1, change["text"])
+                except DocumentSyncError:
+                    # The copy no longer matches the editor's; forget it until the document is reopened.
+                    self._forget(uri)
+                    raise
+            edited.version = version
+            if edited is not document:
+                with self._lock:
+                    self.documents[uri] = edited
+        self._schedule(uri, self.debounce)
+
+    def did_close(self, params):
+        uri = params["textDocument"]["uri"]
+        self._forget(uri)
+        self._notify("textDocument/publishDiagnostics", {"uri": uri, "diagnostics": []})
+
+    def _forget(self, uri):
+        with self._lock:
+            self.documents.pop(uri, None)
+            self.analyses.pop(uri, None)
+            timer = self._timers.pop(uri, None)
+        if timer is not None:
+            timer.cancel()
+
+    def _document(self, uri):
+        with self._lock:
+            document = self.documents.get(uri)
+        if document is None:
+            raise LanguageServerError(INVALID_PARAMS, f"Document is not open: {uri}")
+        return document
+
+    def _analysis(self, uri, version):
+        """The cached Analysis for this version of uri, started afresh if the cache holds an older one."""
+        with self._lock:
+            analysis = self.analyses.get(uri)
+            if analysis is None or analysis.version != version:
+                analysis = self.analyses[uri] = Analysis(version)
+            return analysis
+
+    def _current(self, uri, version):
+        with self._lock:
+            document = self.documents.get(uri)
+            return document is not None and document.version == version
+
+    # -- diagnostics ----------------------------------------------------------
+
+    def _schedule(self, uri, delay):
+        timer = threading.Timer(delay, self._diagnose, (uri,))
+        timer.daemon = True
+        with self._lock:
+            previous = self._timers.get(uri)
+            self._timers[uri] = timer
+        if previous is not None:
+            previous.cancel()
+        timer.start()
+
+    def _diagnose(self, uri):
+        with self._lock:
+            document = self.documents.get(uri)
+        if document is None:
+            return
+        with document.lock:
+            version = document.version
+            tokens = list(document.tokens())
+            spans = list(document.spans())
+        analysis = self._analysis(uri, version)
+        if analysis.diagnostics is None:
+            diagnostics = self._diagnostics(uri, version, tokens, spans)
+            if diagnostics is None:
+                return
+            analysis.diagnostics = diagnostics
+        # Checked and sent under the lock, so an older analysis can't publish over a newer one.
+        with self._lock:
+            if self.documents.get(uri) is not document or document.version != version:
+                return
+            self._notify("textDocument/publishDiagnostics",
+                         {"uri": uri, "version": version, "diagnostics": analysis.diagnostics})
+
+    def _diagnostics(self, uri, version, tokens, spans):
+        """The LSP diagnostics for one version, or None if a newer version made them moot partway."""
+        diagnostics = [
+            self._diagnostic(_range(line, column, line, column + length), f"Illegal Token: {literal}")
+            for line, column, length, token_type, literal in spans if token_type is TokenType.ILLEGAL
+        ]
+        if diagnostics:
+            return diagnostics
+        result = check_tokens(tokens)
+        if result.syntax_error is not None:
+            match = re.search(r"line\s+(\d+)", result.syntax_error)
+            line = int(match.group(1)) - 1 if match else 0
+            return [self._diagnostic(_range(line, 0, line + 1, 0), result.syntax_error)]
+        if not self._current(uri, version):
+            return None
+        try:
+            semantic_errors = run_semantic_analysis(result.ast())
+        except Exception:
+            # The editor only shows what the analyzer reports; a crash in it is not the program's error.
+            semantic_errors = []
+        return [self._diagnostic(self._locate(message, spans), message) for message in semantic_errors]
+
+    @staticmethod
+    def _diagnostic(span, message):
+        return {"range": span, "severity": 1, "source": "casper", "message": message}
+
+    @staticmethod
+    def _locate(message, spans):
+        """The range of the first $variable or @function a semantic error names, or the first line."""
+        for name in re.findall(r"'([$@]\w+)'", message):
+            for line, column, length, token_type, literal in spans:
+                if literal == name and token_type in (TokenType.IDENT, TokenType.FUNCTION_NAME):
+                    return _range(line, column, line, column + length)
+        return _range(0, 0, 1, 0)
+
+    # -- semantic tokens and symbols -------------------------------------------
+
+    def semantic_tokens(self, params):
+        uri = params["textDocument"]["uri"]
+        document = self._document(uri)
+        with document.lock:
+            analysis = self._analysis(uri, document.version)
+            if analysis.semantic_tokens is None:
+                analysis.semantic_tokens = self._encode_tokens(document)
+        return {"data": analysis.semantic_tokens}
+
+    @staticmethod
+    def _encode_tokens(document):
+        """LSP's relative encoding: (line delta, start delta, length, type, modifiers) per token."""
+        data = []
+        starts, text_length = document.line_starts, len(document.text)
+        previous_line = previous_column = 0
+        for line, column, length, token_type, _ in document.spans():
+            code = SEMANTIC_TOKEN_CODES.get(token_type)
+            if code is None:
+                continue
+            # A token can't run past its line: cut strings and comments that span lines.
+            line_end = starts[line + 1] - 1 if line + 1 < len(starts) else text_length
+            length = min(length, line_end - starts[line] - column)
+            if length <= 0:
+                continue
+            data += (line - previous_line, column - previous_column if line == previous_line else column,
+                     length, code, 0)
+            previous_line, previous_column = line, column
+        return data
+
+    def document_symbols(self, params):
+        uri = params["textDocument"]["uri"]
+        document = self._document(uri)
+        with document.lock:
+            analysis = self._analysis(uri, document.version)
+            if analysis.symbols is None:
+                analysis.symbols = self._symbols(list(document.spans()))
+        return analysis.symbols
+
+    @staticmethod
+    def _symbols(spans):
+        """@functions (with their parameters and locals as children) and global $variables, read off the tokens."""
+        symbols = []
+        function = None
+        depth = 0
+        previous = None
+        for span in spans:
+            line, column, length, token_type, literal = span
+            if token_type in (TokenType.NEWLINE, TokenType.COMMENT):
+                continue
+            starts_function = function is None and (
+                token_type is TokenType.MAIN_CASPER
+                or token_type is TokenType.FUNCTION_NAME and previous is not None and previous[3] in _FUNCTION_TYPES)
+            if starts_function:
+                first = previous if token_type is TokenType.FUNCTION_NAME else span
+                function = {
+                    "name": literal,
+                    "detail": first[4] if first is not span else "",
+                    "kind": SYMBOL_FUNCTION,
+                    "range": _range(first[0], first[1], line, column + length),
+                    "selectionRange": _range(line, column, line, column + length),
+                    "children": [],
+                }
+                depth = 0
+            elif token_type is TokenType.IDENT and previous is not None and (
+                    previous[3] in _DATA_TYPES or previous[3].name.startswith("LIST_")):
+                variable = {
+                    "name": literal,
+                    "detail": previous[4],
+                    "kind": SYMBOL_VARIABLE,
+                    "range": _range(previous[0], previous[1], line, column + length),
+                    "selectionRange": _range(line, column, line, column + length),
+                }
+                (function["children"] if function is not None else symbols).append(variable)
+            elif function is not None and token_type is TokenType.LBRACE:
+                depth += 1
+            elif function is not None and token_type is TokenType.RBRACE:
+                depth -= 1
+                if depth == 0:
+                    function["range"]["end"] = _position(line, column + length)
+                    symbols.append(function)
+                    function = None
+            previous = span
+        if function is not None:
+            # An unclosed body runs to the end of the document.
+            if previous is not None:
+                function["range"]["end"] = _position(previous[0], previous[1] + previous[2])
+            symbols.append(function)
+        return symbols
+
+
+if __name__ == "__main__":
+    sys.exit(LanguageServer(sys.stdin.buffer, sys.stdout.buffer).serve())
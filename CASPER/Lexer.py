@@ -1,9 +1,22 @@
-from Token import Token, TokenType, lookup_ident
+import os
+import re
+import sys
+from array import array
+
+from Token import KEYWORDS, ParserToken, Token, TokenType, lookup_ident
 from Delimiters import Delimiters
-from KeywordDelimiters import KEYWORD_DELIMITERS
+from DelimiterTable import DELIMITER_TABLE
 
 tokens = [token.name for token in TokenType] 
 
+# Scanning engine used by make_lexer()/TokenStream: "regex" or "char".
+LEXER_ENGINE = os.environ.get("CASPER_LEXER_ENGINE", "regex")
+
+# Compiled follow-character sets (see DelimiterTable) shared by both engines.
+IDENTIFIER_DELIMS = DELIMITER_TABLE[TokenType.IDENT]
+NUMBER_DELIMS = DELIMITER_TABLE[TokenType.INT_LIT]
+LITERAL_DELIMS = DELIMITER_TABLE[TokenType.STR_LIT]
+
 class Lexer:
     def __init__(self, source: str) -> None:
         self.source = source  # current code
@@ -64,7 +77,7 @@ class Lexer:
                     # Building the integer part
                     if len(integer_part) >= 9:
                         # Exceeds 9 digits => ILLEGAL
-                        while self.current_char and self.current_char not in Delimiters.DEL10 and self.current_char != '\n':
+                        while self.current_char and self.current_char not in NUMBER_DELIMS and self.current_char != '\n':
                             self.__read_char()
                         illegal_literal = self.source[start_pos:self.position]
                         return self.__new_token(TokenType.ILLEGAL, illegal_literal)
@@ -73,7 +86,7 @@ class Lexer:
                     # Building the decimal part
                     if len(decimal_part) >= 9:
                         # Exceeds 9 digits => ILLEGAL
-                        while self.current_char and self.current_char not in Delimiters.DEL10 and self.current_char != '\n':
+                        while self.current_char and self.current_char not in NUMBER_DELIMS and self.current_char != '\n':
                             self.__read_char()
                         illegal_literal = self.source[start_pos:self.position]
                         return self.__new_token(TokenType.ILLEGAL, illegal_literal)
@@ -83,9 +96,9 @@ class Lexer:
             self.__read_char()
 
         # After collecting digits, check the next character is a valid delimiter
-        if self.current_char not in Delimiters.DEL10:
+        if self.current_char not in NUMBER_DELIMS:
             # Read until we find a valid delimiter or newline, then treat as ILLEGAL
-            while self.current_char and self.current_char not in Delimiters.DEL10 and self.current_char != '\n':
+            while self.current_char and self.current_char not in NUMBER_DELIMS and self.current_char != '\n':
                 self.__read_char()
             illegal_literal = self.source[start_pos:self.position]
             return self.__new_token(TokenType.ILLEGAL, illegal_literal)
@@ -139,7 +152,7 @@ class Lexer:
             # Ensure the identifier starts with a valid character
             if self.current_char is None or not (self.current_char.isalpha() or self.current_char == '_'):
                 # If the first character after $ is invalid, treat it as ILLEGAL
-                while self.current_char and self.current_char not in Delimiters.identifier_del and self.current_char != '\n':
+                while self.current_char and self.current_char not in IDENTIFIER_DELIMS and self.current_char != '\n':
                     self.__read_char()
                 illegal_literal = self.source[start_pos:self.position]
             
@@ -153,7 +166,7 @@ class Lexer:
                 elif self.current_char in {'$', '@'}:
                
                     # If another $ or @ is encountered mid-identifier, read the whole sequence as ILLEGAL
-                    while self.current_char and self.current_char not in Delimiters.identifier_del and self.current_char != '\n':
+                    while self.current_char and self.current_char not in IDENTIFIER_DELIMS and self.current_char != '\n':
                         self.__read_char()
                     illegal_literal = self.source[start_pos:self.position]
                     return self.__new_token(TokenType.ILLEGAL, illegal_literal)
@@ -167,36 +180,36 @@ class Lexer:
 
             # After reading, validate delimiters for identifiers
             identifier = self.source[start_pos:self.position]
-            valid_delims = Delimiters.identifier_del 
+            valid_delims = IDENTIFIER_DELIMS.source
 
             # Check if the identifier starts with '@' for FUNCTION_NAME
             if identifier.startswith('@'):
                 # If the identifier is the main function token, return MAIN_CASPER.
                 if identifier == "@main_casper":
-                    if self.current_char in valid_delims:
+                    if self.current_char in IDENTIFIER_DELIMS:
                         return self.__new_token(TokenType.MAIN_CASPER, identifier)
                     else:
-                        while self.current_char and self.current_char not in Delimiters.identifier_del:
+                        while self.current_char and self.current_char not in IDENTIFIER_DELIMS:
                             self.__read_char()
                         illegal_literal = self.source[start_pos:self.position]
                         return self.__return_illegal_token(identifier, valid_delims=valid_delims)
                 else:
                     # For any other '@'-prefixed identifier, return FUNCTION_NAME.
-                    if self.current_char in valid_delims:
+                    if self.current_char in IDENTIFIER_DELIMS:
                         return self.__new_token(TokenType.FUNCTION_NAME, identifier)
                     else:
-                        while self.current_char and self.current_char not in Delimiters.identifier_del:
+                        while self.current_char and self.current_char not in IDENTIFIER_DELIMS:
                             self.__read_char()
                         illegal_literal = self.source[start_pos:self.position]
                         return self.__return_illegal_token(identifier, valid_delims=valid_delims)
 
             # Check if the identifier starts with '$' for IDENT
             elif identifier.startswith('$'):
-                if self.current_char in Delimiters.identifier_del:
+                if self.current_char in IDENTIFIER_DELIMS:
                     return self.__new_token(TokenType.IDENT, identifier)
                 else:
                     # If no valid delimiter, treat as ILLEGAL
-                    while self.current_char and self.current_char not in Delimiters.identifier_del:
+                    while self.current_char and self.current_char not in IDENTIFIER_DELIMS:
                         self.__read_char()
                     illegal_literal = self.source[start_pos:self.position]
                     return self.__return_illegal_token(identifier, valid_delims=valid_delims)
@@ -229,7 +242,7 @@ class Lexer:
         # Specific logic for the "BIRTH" keyword
         if token_type == TokenType.BIRTH or token_type == TokenType.SKIP or token_type == TokenType.STOP:
             next_char = self.__peek_char()
-            valid_delims = KEYWORD_DELIMITERS.get("BIRTH", set())
+            valid_delims = DELIMITER_TABLE[TokenType.BIRTH].source
 
             # Allow both newline and other valid delimiters for BIRTH
             if next_char == '\n':
@@ -239,9 +252,10 @@ class Lexer:
             
         # General keyword validation for other keywords
         if token_type != TokenType.IDENT:
-            valid_delims = KEYWORD_DELIMITERS.get(token_type.name, set())
+            delims = DELIMITER_TABLE[token_type]
+            valid_delims = delims.source
             
-            if self.current_char in valid_delims:
+            if self.current_char in delims:
                 return self.__new_token(token_type, identifier)
             else:
               
@@ -255,10 +269,10 @@ class Lexer:
         
         # For identifiers
         if token_type == TokenType.IDENT:
-            valid_delims = KEYWORD_DELIMITERS.get(token_type.name, set())
+            valid_delims = IDENTIFIER_DELIMS.source
           
         
-            if self.current_char in valid_delims:
+            if self.current_char in IDENTIFIER_DELIMS:
               
                 return self.__new_token(token_type, identifier)
             else:
@@ -270,7 +284,7 @@ class Lexer:
             return self.__new_token(TokenType.ILLEGAL, identifier)
 
         # Validate general delimiters for identifiers
-        if self.current_char not in Delimiters.identifier_del:
+        if self.current_char not in IDENTIFIER_DELIMS:
             return self.__new_token(TokenType.ILLEGAL, identifier)
         
         # Otherwise, return the identifier token
@@ -308,7 +322,7 @@ class Lexer:
 
         if self.current_char == '"':
             self.__read_char()  
-            if self.current_char in Delimiters.DEL11:
+            if self.current_char in LITERAL_DELIMS:
                 return literal 
             return None  
 
@@ -340,7 +354,7 @@ class Lexer:
             self.__read_char()  # Consume closing quote
 
             # Check if the next character is a valid delimiter (DEL11)
-            if self.current_char in Delimiters.DEL11:
+            if self.current_char in LITERAL_DELIMS:
                 if len(literal) == 1:
                     return literal  # Return valid single-character literal
                 else:
@@ -360,17 +374,7 @@ class Lexer:
         :param token_type: The type of the token being validated.
         :return: True if the next character is a valid delimiter, False otherwise.
         """
-        # Debugging shit
-        prev = self.position-1
-        prevChar = self.source[prev]
-      
-        valid_delims = KEYWORD_DELIMITERS.get(token_type.name)
-    
-
-
-        next_char = self.__peek_char()
-       
-        return next_char in valid_delims
+        return self.__peek_char() in DELIMITER_TABLE[token_type]
 
     def __skip_invalid_characters(self) -> None:
         """Skips invalid characters until a valid delimiter is found."""
@@ -457,7 +461,7 @@ class Lexer:
                         if self.__is_valid_delimiter(TokenType.PLUS):
                             return self.__consume_single_char_token(TokenType.PLUS)
                         else:
-                            valid_delims = KEYWORD_DELIMITERS.get(TokenType.PLUS.name, set())
+                            valid_delims = DELIMITER_TABLE[TokenType.PLUS].source
                             return self.__return_illegal_token("+", valid_delims=valid_delims)
 
                     # Otherwise, attempt "++"
@@ -467,7 +471,7 @@ class Lexer:
                         return self.__new_token(TokenType.PLUS_PLUS, "++")
                     else:
                         # If the delimiter is invalid for "++"
-                        valid_delims = KEYWORD_DELIMITERS.get(TokenType.PLUS_PLUS.name, set())
+                        valid_delims = DELIMITER_TABLE[TokenType.PLUS_PLUS].source
                         return self.__return_illegal_token("++", valid_delims=valid_delims)
 
                 elif self.__peek_char() == '=':  # Handle '+='
@@ -476,14 +480,14 @@ class Lexer:
                         self.__read_char()  # consume '='
                         return self.__new_token(TokenType.PLUS_EQ, "+=")
                     else:
-                        valid_delims = KEYWORD_DELIMITERS.get(TokenType.PLUS_EQ.name, set())
+                        valid_delims = DELIMITER_TABLE[TokenType.PLUS_EQ].source
                         return self.__return_illegal_token("+=", valid_delims=valid_delims)
 
                 # Handles single '+'
                 if self.__is_valid_delimiter(TokenType.PLUS):
                     return self.__consume_single_char_token(TokenType.PLUS)
                 else:
-                    valid_delims = KEYWORD_DELIMITERS.get(TokenType.PLUS.name, set())
+                    valid_delims = DELIMITER_TABLE[TokenType.PLUS].source
                     return self.__return_illegal_token("+", valid_delims=valid_delims)
                         # Token Creation for -, -=, --
             case '-':
@@ -518,13 +522,13 @@ class Lexer:
                        
                     else:
                         if orig_pos > 0 and self.source[orig_pos - 1].isspace():
-                            valid_delims = KEYWORD_DELIMITERS.get(TokenType.MINUS.name, set())
+                            valid_delims = DELIMITER_TABLE[TokenType.MINUS].source
                             return self.__return_illegal_token("-", valid_delims=valid_delims)
                         if self.__is_valid_delimiter(TokenType.MINUS_MINUS):
                             self.__read_char() 
                             return self.__new_token(TokenType.MINUS_MINUS, "--")
                         else:
-                            valid_delims = KEYWORD_DELIMITERS.get(TokenType.MINUS_MINUS.name, set())
+                            valid_delims = DELIMITER_TABLE[TokenType.MINUS_MINUS].source
                             return self.__return_illegal_token("--", valid_delims=valid_delims)
 
                 elif self.__peek_char() == '=':
@@ -533,7 +537,7 @@ class Lexer:
                         self.__read_char()  
                         return self.__new_token(TokenType.MINUS_EQ, "-=")
                     else:
-                        valid_delims = KEYWORD_DELIMITERS.get(TokenType.MINUS_EQ.name, set())
+                        valid_delims = DELIMITER_TABLE[TokenType.MINUS_EQ].source
                         return self.__return_illegal_token("-=", valid_delims=valid_delims)
                                         
 
@@ -541,7 +545,7 @@ class Lexer:
                     return self.__consume_single_char_token(TokenType.MINUS)
                                         
                 else:
-                    valid_delims = KEYWORD_DELIMITERS.get(TokenType.MINUS.name, set())
+                    valid_delims = DELIMITER_TABLE[TokenType.MINUS].source
                     return self.__return_illegal_token("-", valid_delims=valid_delims)
 
 
@@ -555,7 +559,7 @@ class Lexer:
                         self.__read_char()
                         return self.__new_token(TokenType.MUL_EQ, "*=")
                     else:
-                        valid_delims = KEYWORD_DELIMITERS.get(TokenType.MUL_EQ.name, set())
+                        valid_delims = DELIMITER_TABLE[TokenType.MUL_EQ].source
                         return self.__return_illegal_token("*=", valid_delims=valid_delims)
                 elif self.current_char == '*':
                     if self.__peek_char() == '*':
@@ -564,12 +568,12 @@ class Lexer:
                             self.__read_char()
                             return self.__new_token(TokenType.EXPONENT, "**")
                         else:
-                            valid_delims = KEYWORD_DELIMITERS.get(TokenType.EXPONENT.name, set())
+                            valid_delims = DELIMITER_TABLE[TokenType.EXPONENT].source
                             return self.__return_illegal_token("**", valid_delims=valid_delims)
                     elif self.__is_valid_delimiter(TokenType.MULTIPLY):
                         return self.__consume_single_char_token(TokenType.MULTIPLY)
                     else:
-                        valid_delims = KEYWORD_DELIMITERS.get(TokenType.MULTIPLY.name, set())
+                        valid_delims = DELIMITER_TABLE[TokenType.MULTIPLY].source
                         return self.__return_illegal_token("*", valid_delims=valid_delims)
                     
 
@@ -581,12 +585,12 @@ class Lexer:
                         self.__read_char()
                         return self.__new_token(TokenType.DIV_EQ, "/=")
                     else:
-                        valid_delims = KEYWORD_DELIMITERS.get(TokenType.DIV_EQ.name, set())
+                        valid_delims = DELIMITER_TABLE[TokenType.DIV_EQ].source
                         return self.__return_illegal_token("/=", valid_delims=valid_delims)
                 if self.__is_valid_delimiter(TokenType.DIVISION):
                     return self.__consume_single_char_token(TokenType.DIVISION)
                 else:
-                    valid_delims = KEYWORD_DELIMITERS.get(TokenType.DIVISION.name, set())
+                    valid_delims = DELIMITER_TABLE[TokenType.DIVISION].source
                     return self.__return_illegal_token("/", valid_delims=valid_delims)
                    
             # Token Creation for Modulo (%, %=)
@@ -597,12 +601,12 @@ class Lexer:
                         self.__read_char()
                         return self.__new_token(TokenType.MOD_EQ, "%=")
                     else:
-                        valid_delims = KEYWORD_DELIMITERS.get(TokenType.MOD_EQ.name, set())
+                        valid_delims = DELIMITER_TABLE[TokenType.MOD_EQ].source
                         return self.__return_illegal_token("%=", valid_delims=valid_delims)
                 if self.__is_valid_delimiter(TokenType.MODULO):
                     return self.__consume_single_char_token(TokenType.MODULO)
                 else:
-                    valid_delims = KEYWORD_DELIMITERS.get(TokenType.MODULO.name, set())
+                    valid_delims = DELIMITER_TABLE[TokenType.MODULO].source
                     return self.__return_illegal_token("%", valid_delims=valid_delims)
             
 
@@ -614,12 +618,12 @@ class Lexer:
                         self.__read_char()
                         return self.__new_token(TokenType.EQ_EQ, "==")
                     else:
-                        valid_delims = KEYWORD_DELIMITERS.get(TokenType.EQ_EQ.name, set())
+                        valid_delims = DELIMITER_TABLE[TokenType.EQ_EQ].source
                         return self.__return_illegal_token("==", valid_delims=valid_delims)
                 if self.__is_valid_delimiter(TokenType.EQ):
                     return self.__consume_single_char_token(TokenType.EQ)
                 else:
-                    valid_delims = KEYWORD_DELIMITERS.get(TokenType.EQ.name, set())
+                    valid_delims = DELIMITER_TABLE[TokenType.EQ].source
                     return self.__return_illegal_token("=", valid_delims=valid_delims)
 
 
@@ -633,7 +637,7 @@ class Lexer:
                         self.__read_char()
                         return self.__new_token(TokenType.LT_EQ, "<=")
                     else:
-                        valid_delims = KEYWORD_DELIMITERS.get(TokenType.LT_EQ.name, set())
+                        valid_delims = DELIMITER_TABLE[TokenType.LT_EQ].source
                         return self.__return_illegal_token("<=", valid_delims=valid_delims)
                 
                 if self.__peek_char() == '<':  
@@ -647,12 +651,12 @@ class Lexer:
                             self.__read_char()
                         return self.__new_token(TokenType.COMMENT, comment_content.strip())  
                     else:
-                        valid_delims = KEYWORD_DELIMITERS.get(TokenType.COMMENT.name, set())
+                        valid_delims = DELIMITER_TABLE[TokenType.COMMENT].source
                         return self.__return_illegal_token("<<", valid_delims=valid_delims)
                 if self.__is_valid_delimiter(TokenType.LT):
                     return self.__consume_single_char_token(TokenType.LT)
                 else:
-                    valid_delims = KEYWORD_DELIMITERS.get(TokenType.LT.name, set())
+                    valid_delims = DELIMITER_TABLE[TokenType.LT].source
                     return self.__return_illegal_token("<", valid_delims=valid_delims)
             
             # Token Creation for Greater than, Greater than Equals (> , >=)
@@ -663,12 +667,12 @@ class Lexer:
                         self.__read_char()
                         return self.__new_token(TokenType.GT_EQ, ">=")
                     else:
-                        valid_delims = KEYWORD_DELIMITERS.get(TokenType.GT_EQ.name, set())
+                        valid_delims = DELIMITER_TABLE[TokenType.GT_EQ].source
                         return self.__return_illegal_token(">=", valid_delims=valid_delims)
                 if self.__is_valid_delimiter(TokenType.GT):
                     return self.__consume_single_char_token(TokenType.GT)
                 else:
-                    valid_delims = KEYWORD_DELIMITERS.get(TokenType.GT.name, set())
+                    valid_delims = DELIMITER_TABLE[TokenType.GT].source
                     return self.__return_illegal_token(">", valid_delims=valid_delims)
                        
             # Token Creation for Not, Not Equals (!, !=)
@@ -679,12 +683,12 @@ class Lexer:
                         self.__read_char()
                         return self.__new_token(TokenType.NOT_EQ, "!=")
                     else:
-                        valid_delims = KEYWORD_DELIMITERS.get(TokenType.NOT_EQ.name, set())
+                        valid_delims = DELIMITER_TABLE[TokenType.NOT_EQ].source
                         return self.__return_illegal_token("!=", valid_delims=valid_delims)
                 if self.__is_valid_delimiter(TokenType.NOT):
                     return self.__consume_single_char_token(TokenType.NOT)
                 else:
-                    valid_delims = KEYWORD_DELIMITERS.get(TokenType.NOT.name, set())
+                    valid_delims = DELIMITER_TABLE[TokenType.NOT].source
                     return self.__return_illegal_token("!", valid_delims=valid_delims)
 
             # LOGICAL OPERATORS
@@ -697,10 +701,10 @@ class Lexer:
                         self.__read_char()
                         return self.__new_token(TokenType.AND, "&&")
                     else:
-                        valid_delims = KEYWORD_DELIMITERS.get(TokenType.AND.name, set())
+                        valid_delims = DELIMITER_TABLE[TokenType.AND].source
                         return self.__return_illegal_token("&&", valid_delims=valid_delims)
                 else:
-                    valid_delims = KEYWORD_DELIMITERS.get(TokenType.AND.name, set())
+                    valid_delims = DELIMITER_TABLE[TokenType.AND].source
                     return self.__return_illegal_token("&", valid_delims=valid_delims)
 
             # Token Creation for OR (||)
@@ -711,10 +715,10 @@ class Lexer:
                         self.__read_char()
                         return self.__new_token(TokenType.OR, "||")   
                     else:
-                        valid_delims = KEYWORD_DELIMITERS.get(TokenType.OR.name, set())
+                        valid_delims = DELIMITER_TABLE[TokenType.OR].source
                         return self.__return_illegal_token("||", valid_delims=valid_delims)
                 else:
-                    valid_delims = KEYWORD_DELIMITERS.get(TokenType.OR.name, set())
+                    valid_delims = DELIMITER_TABLE[TokenType.OR].source
                     return self.__return_illegal_token("|", valid_delims=valid_delims)
                 
             # Token Creation NEGATIVE OP/TILDE
@@ -722,7 +726,7 @@ class Lexer:
                 if self.__is_valid_delimiter(TokenType.TILDE):
                     return self.__consume_single_char_token(TokenType.TILDE)
                 else:
-                    valid_delims = KEYWORD_DELIMITERS.get(TokenType.TILDE.name, set())
+                    valid_delims = DELIMITER_TABLE[TokenType.TILDE].source
                     return self.__return_illegal_token("~", valid_delims=valid_delims)
                 
             # Parentheses, Brackets, Braces, and Punctuation
@@ -730,62 +734,62 @@ class Lexer:
                 if self.__is_valid_delimiter(TokenType.LPAREN):
                     return self.__consume_single_char_token(TokenType.LPAREN)
                 else:
-                    valid_delims = KEYWORD_DELIMITERS.get(TokenType.LPAREN.name, set())
+                    valid_delims = DELIMITER_TABLE[TokenType.LPAREN].source
                     return self.__return_illegal_token("(", valid_delims=valid_delims)
             case ')':
                 if self.__is_valid_delimiter(TokenType.RPAREN):
                     return self.__consume_single_char_token(TokenType.RPAREN)
                 else:
-                    valid_delims = KEYWORD_DELIMITERS.get(TokenType.RPAREN.name, set())
+                    valid_delims = DELIMITER_TABLE[TokenType.RPAREN].source
                     return self.__return_illegal_token(")", valid_delims=valid_delims)
             case '[':
                 if self.__is_valid_delimiter(TokenType.LBRACKET):
                     return self.__consume_single_char_token(TokenType.LBRACKET)
                 else:
-                    valid_delims = KEYWORD_DELIMITERS.get(TokenType.LBRACKET.name, set())
+                    valid_delims = DELIMITER_TABLE[TokenType.LBRACKET].source
                     return self.__return_illegal_token("[", valid_delims=valid_delims)
             case ']':
                 if self.__is_valid_delimiter(TokenType.RBRACKET):
                     return self.__consume_single_char_token(TokenType.RBRACKET)
                 else:
-                    valid_delims = KEYWORD_DELIMITERS.get(TokenType.RBRACKET.name, set())
+                    valid_delims = DELIMITER_TABLE[TokenType.RBRACKET].source
                     return self.__return_illegal_token("]", valid_delims=valid_delims)
             case '{':
                 if self.__is_valid_delimiter(TokenType.LBRACE):
                     return self.__consume_single_char_token(TokenType.LBRACE)
                 else:
-                    valid_delims = KEYWORD_DELIMITERS.get(TokenType.LBRACE.name, set())
+                    valid_delims = DELIMITER_TABLE[TokenType.LBRACE].source
                     return self.__return_illegal_token("{", valid_delims=valid_delims)
             case '}':
                 if self.__is_valid_delimiter(TokenType.RBRACE):
                     return self.__consume_single_char_token(TokenType.RBRACE)
                 else:
-                    valid_delims = KEYWORD_DELIMITERS.get(TokenType.RBRACE.name, set())
+                    valid_delims = DELIMITER_TABLE[TokenType.RBRACE].source
                     return self.__return_illegal_token("}", valid_delims=valid_delims)
             case ',':
                 if self.__is_valid_delimiter(TokenType.COMMA):
                     return self.__consume_single_char_token(TokenType.COMMA)
                 else:
-                    valid_delims = KEYWORD_DELIMITERS.get(TokenType.COMMA.name, set())
+                    valid_delims = DELIMITER_TABLE[TokenType.COMMA].source
                     return self.__return_illegal_token(",", valid_delims=valid_delims)
             case ';':
                 if self.__is_valid_delimiter(TokenType.SEMICOLON):
                     return self.__consume_single_char_token(TokenType.SEMICOLON)
                 else:
-                    valid_delims = KEYWORD_DELIMITERS.get(TokenType.SEMICOLON.name, set())
+                    valid_delims = DELIMITER_TABLE[TokenType.SEMICOLON].source
                     return self.__return_illegal_token(";", valid_delims=valid_delims)
             case ':':
                 if self.__is_valid_delimiter(TokenType.COLON):
                     return self.__consume_single_char_token(TokenType.COLON)
                 else:
-                    valid_delims = KEYWORD_DELIMITERS.get(TokenType.COLON.name, set())
+                    valid_delims = DELIMITER_TABLE[TokenType.COLON].source
                     return self.__return_illegal_token(":", valid_delims=valid_delims)
             case '.':
              
                 if self.__is_valid_delimiter(TokenType.DOT):
                     return self.__consume_single_char_token(TokenType.DOT)
                 else:
-                    valid_delims = KEYWORD_DELIMITERS.get(TokenType.DOT.name, set())
+                    valid_delims = DELIMITER_TABLE[TokenType.DOT].source
                     return self.__return_illegal_token(".", valid_delims=valid_delims)
             case _:
                 return self.__return_illegal_token()
@@ -850,6 +854,14 @@ class Lexer:
                 return False
         return False
 
+    def scan(self):
+        """Yields (type, literal, line_no, position, valid_delims) for every token from here on, up to and including EOF."""
+        while True:
+            tok = self.next_token()
+            yield tok.type, tok.literal, tok.line_no, tok.position, tok.valid_delims
+            if tok.type == TokenType.EOF:
+                return
+
     def token(self):
         """Returns the next valid token for PLY, skipping ILLEGAL tokens"""
         while True:
@@ -862,8 +874,322 @@ class Lexer:
                 continue
 
             # Otherwise, it's a valid token for the parser
-            tok.type = tok.type.name  # PLY requires token type as a string
-            tok.value = tok.literal
-            tok.lineno = tok.line_no
-            return tok
+            return ParserToken(tok.type.name, tok.literal, tok.line_no, tok.position)
+
+
+# One alternative per token class, tried after skipping blanks the same way
+# __skip_whitespace does. Anything that does not match here is left to the
+# character scanner.
+_MASTER_PATTERN = re.compile(r"""
+    [ \t\r]*
+    (?:
+        (?P<NEWLINE>\n)
+      | (?P<IDENT>[$@][A-Za-z_][A-Za-z0-9_]*)
+      | (?P<WORD>[A-Za-z][A-Za-z0-9_]*)
+      | (?P<NUMBER>[0-9]{1,9}(?:\.[0-9]{0,9})?)(?![0-9.])
+      | (?P<STRING>"(?:[^"\\]|\\.)*")
+      | (?P<CHAR>'(?:\\'|[^'\\])')
+      | (?P<COMMENT><<\ [^\n]*)
+      | (?P<OPERATOR>\+\+|\+=|--|-=|\*\*|\*=|/=|%=|==|<=|>=|!=|&&|\|\||[-+*/%=<>!~()\[\]{},;:.])
+    )
+""", re.VERBOSE | re.DOTALL)
+
+_identifier_follows = IDENTIFIER_DELIMS.accepts
+_number_follows = NUMBER_DELIMS.accepts
+_literal_follows = LITERAL_DELIMS.accepts
+
+_ESCAPE_PATTERN = re.compile(r"\\(.)", re.DOTALL)
+_ESCAPE_SEQUENCES = {'"': '"', "'": "'", "\\": "\\", "n": "\n", "t": "\t"}
+
+_OPERATORS = {
+    "+": TokenType.PLUS, "-": TokenType.MINUS, "*": TokenType.MULTIPLY,
+    "/": TokenType.DIVISION, "%": TokenType.MODULO, "=": TokenType.EQ,
+    "<": TokenType.LT, ">": TokenType.GT, "!": TokenType.NOT, "~": TokenType.TILDE,
+    "(": TokenType.LPAREN, ")": TokenType.RPAREN, "[": TokenType.LBRACKET,
+    "]": TokenType.RBRACKET, "{": TokenType.LBRACE, "}": TokenType.RBRACE,
+    ",": TokenType.COMMA, ";": TokenType.SEMICOLON, ":": TokenType.COLON,
+    ".": TokenType.DOT,
+    "++": TokenType.PLUS_PLUS, "+=": TokenType.PLUS_EQ, "--": TokenType.MINUS_MINUS,
+    "-=": TokenType.MINUS_EQ, "**": TokenType.EXPONENT, "*=": TokenType.MUL_EQ,
+    "/=": TokenType.DIV_EQ, "%=": TokenType.MOD_EQ, "==": TokenType.EQ_EQ,
+    "<=": TokenType.LT_EQ, ">=": TokenType.GT_EQ, "!=": TokenType.NOT_EQ,
+    "&&": TokenType.AND, "||": TokenType.OR,
+}
+
+# Keywords that must be followed by a line break instead of a delimiter set.
+_LINE_KEYWORDS = {TokenType.BIRTH, TokenType.SKIP, TokenType.STOP}
+
+# lexeme -> (token type, follow-char test); resolved once so the scan loop
+# does no per-token table lookups. Line keywords get None for a test, which
+# also keeps TokenType's Python-level __hash__ out of the loop.
+_OPERATOR_TABLE = {
+    lexeme: (token_type, DELIMITER_TABLE[token_type].accepts)
+    for lexeme, token_type in _OPERATORS.items()
+}
+_KEYWORD_TABLE = {
+    word: (token_type, None if token_type in _LINE_KEYWORDS else DELIMITER_TABLE[token_type].accepts)
+    for word, token_type in KEYWORDS.items()
+}
+
+
+def _unescape(match):
+    char = match.group(1)
+    return _ESCAPE_SEQUENCES.get(char, match.group(0))
+
+
+class RegexLexer(Lexer):
+    """
+    Lexer engine that scans with one compiled master pattern instead of
+    reading a character at a time. Tokens that are not on the happy path
+    (bad delimiters, '---' comments, over-long numbers, ...) are handed to
+    the character scanner at the same position, so both engines produce
+    the same tokens and ILLEGAL diagnostics.
+    """
+
+    def __init__(self, source: str) -> None:
+        super().__init__(source)
+        self._scanner = self.scan()
+
+    def next_token(self) -> Token:
+        return Token(*next(self._scanner, None) or next(self.scan()))
+
+    def scan(self):
+        """
+        Yields (type, literal, line_no, position, valid_delims) for every
+        token from the current position on, up to and including EOF.
+
+        The position lives in locals between matches and is written back
+        before each yield, so next_token() and the character scanner carry
+        on from where the scan stopped. Only tokens the character scanner
+        decides become Token objects along the way.
+        """
+        source = self.source
+        size = len(source)
+        match_at = _MASTER_PATTERN.match
+        fallback = super().next_token
+        while True:
+            # Reloaded every time, in case the caller moved the lexer between tokens.
+            position = self.position
+            line_no = self.line_no
+            match = match_at(source, position) if position < size else None
+            if match is None:
+                tok = fallback()
+                yield tok.type, tok.literal, tok.line_no, tok.position, tok.valid_delims
+                if tok.type is TokenType.EOF:
+                    return
+                continue
+
+            kind = match.lastgroup
+            lexeme = match.group(kind)
+            end = match.end()
+            lookahead = source[end] if end < size else None
+            token_type = None
+
+            if kind == "OPERATOR":
+                token_type, accepts = _OPERATOR_TABLE[lexeme]
+                if accepts(lookahead):
+                    if len(lexeme) == 1:
+                        # Single-char tokens are stamped before the char is consumed.
+                        stamp = end - 1
+                    elif lexeme not in ("++", "--") or not source[end - 3:end - 2].isspace():
+                        # "++"/"--" right after a blank are rejected by the character scanner.
+                        stamp = end
+                    else:
+                        token_type = None
+                else:
+                    token_type = None
+
+            elif kind == "IDENT":
+                if _identifier_follows(lookahead):
+                    if lexeme[0] == "$":
+                        token_type = TokenType.IDENT
+                    elif lexeme == "@main_casper":
+                        token_type = TokenType.MAIN_CASPER
+                    else:
+                        token_type = TokenType.FUNCTION_NAME
+                    stamp = end
+
+            elif kind == "NEWLINE":
+                line_no += 1
+                token_type, lexeme, stamp = TokenType.NEWLINE, "\\n", end
+
+            elif kind == "WORD":
+                entry = _KEYWORD_TABLE.get(lexeme)
+                if entry is not None:
+                    token_type, accepts = entry
+                    if accepts is None:
+                        if source[end + 1:end + 2] != "\n":
+                            token_type = None
+                    elif not accepts(lookahead):
+                        token_type = None
+                    stamp = end
+
+            elif kind == "NUMBER":
+                if _number_follows(lookahead):
+                    if "." in lexeme:
+                        token_type, lexeme = TokenType.FLT_LIT, float(lexeme)
+                    else:
+                        token_type, lexeme = TokenType.INT_LIT, int(lexeme)
+                    stamp = end
+
+            elif kind == "STRING":
+                if _literal_follows(lookahead):
+                    lexeme = lexeme[1:-1]
+                    if "\\" in lexeme:
+                        lexeme = _ESCAPE_PATTERN.sub(_unescape, lexeme)
+                    token_type, stamp = TokenType.STR_LIT, end
+
+            elif kind == "CHAR":
+                if _literal_follows(lookahead):
+                    lexeme = "'" if lexeme == "'\\''" else lexeme[1:-1]
+                    token_type, stamp = TokenType.CHR_LIT, end
 
+            else:
+                token_type, lexeme, stamp = TokenType.COMMENT, lexeme[2:].strip(), end
+
+            if token_type is None:
+                # Off the happy path: let the character scanner decide from the token start.
+                start = match.start(kind)
+                self.position = start
+                self.read_position = start + 1
+                self.current_char = source[start]
+                self.line_no = line_no
+                tok = fallback()
+                yield tok.type, tok.literal, tok.line_no, tok.position, tok.valid_delims
+                continue
+
+            self.position = end
+            self.read_position = end + 1
+            self.current_char = lookahead
+            self.line_no = line_no
+            yield token_type, lexeme, line_no, stamp, None
+
+
+LEXER_ENGINES = {
+    "char": Lexer,
+    "regex": RegexLexer,
+}
+
+
+def make_lexer(source: str, engine: str | None = None) -> Lexer:
+    """Creates a lexer using the requested engine (defaults to LEXER_ENGINE)."""
+    return LEXER_ENGINES[engine or LEXER_ENGINE](source)
+
+
+_TYPE_NAMES = [token_type.name for token_type in TokenType]
+# Keyed by id(), since hashing a TokenType runs Python code.
+_TYPE_CODES = {id(token_type): code for code, token_type in enumerate(TokenType)}
+# Rows that TokenArray.extend leaves out of the buffer.
+_KEPT_ASIDE = (TokenType.ILLEGAL, TokenType.COMMENT, TokenType.EOF)
+
+
+class TokenArray:
+    """
+    Struct-of-arrays token buffer: token kinds, lines and offsets live in
+    `array` buffers and only the literal values are Python objects (names
+    and keywords are interned, so repeated identifiers share one string).
+    Indexing builds a ParserToken on demand.
+    """
+
+    def __init__(self) -> None:
+        self.kinds = array("H")
+        self.lines = array("I")
+        self.offsets = array("I")
+        self.values: list = []
+
+    def append(self, tok: Token) -> None:
+        literal = tok.literal
+        if tok.type is not TokenType.STR_LIT and type(literal) is str:
+            literal = sys.intern(literal)
+        self.kinds.append(_TYPE_CODES[id(tok.type)])
+        self.lines.append(tok.line_no)
+        self.offsets.append(tok.position)
+        self.values.append(literal)
+
+    def extend(self, rows) -> list[Token]:
+        """
+        Adds the (type, literal, line_no, position, valid_delims) rows of a
+        lexer's scan(), except EOF and the ILLEGAL and COMMENT ones, which
+        come back as Tokens. Only those diagnostics are ever built as Tokens.
+        """
+        kinds, lines, offsets, values = self.kinds.append, self.lines.append, self.offsets.append, self.values.append
+        skipped = []
+        for token_type, literal, line_no, position, valid_delims in rows:
+            if token_type in _KEPT_ASIDE:
+                if token_type is not TokenType.EOF:
+                    skipped.append(Token(token_type, literal, line_no, position, valid_delims))
+                continue
+            if token_type is not TokenType.STR_LIT and type(literal) is str:
+                literal = sys.intern(literal)
+            kinds(_TYPE_CODES[id(token_type)])
+            lines(line_no)
+            offsets(position)
+            values(literal)
+        return skipped
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def __getitem__(self, index: int) -> ParserToken:
+        return ParserToken(_TYPE_NAMES[self.kinds[index]], self.values[index], self.lines[index], self.offsets[index])
+
+    def __iter__(self):
+        for index in range(len(self.kinds)):
+            yield self[index]
+
+    def type_names(self, start: int = 0, stop: int | None = None) -> list[str]:
+        """Token type names for a slice of the buffer, without building tokens."""
+        return [_TYPE_NAMES[kind] for kind in self.kinds[start:stop]]
+
+    def nbytes(self) -> int:
+        """Bytes held by the buffers themselves (values are counted by the caller)."""
+        return sum(buf.itemsize * len(buf) for buf in (self.kinds, self.lines, self.offsets)) + sys.getsizeof(self.values)
+
+
+class TokenStream:
+    """
+    Lexes a source once into a buffer. ILLEGAL and COMMENT tokens are kept
+    aside as diagnostics, and token() replays the rest for PLY, so the error
+    check and the parser share a single lexing pass.
+    """
+
+    def __init__(self, source: str, engine: str | None = None) -> None:
+        self.source = source
+        self.tokens = TokenArray()  # tokens handed to the parser
+        self.illegal_tokens: list[Token] = []
+        self.comments: list[Token] = []
+        self.__index = 0
+
+        for tok in self.tokens.extend(make_lexer(source, engine).scan()):
+            if tok.type == TokenType.ILLEGAL:
+                self.illegal_tokens.append(tok)
+            else:
+                self.comments.append(tok)
+
+    def reset(self) -> None:
+        """Rewinds the replay so the buffer can be parsed again."""
+        self.__index = 0
+
+    def drain(self) -> range:
+        """Marks every remaining token as read and returns their indexes in `tokens`."""
+        remaining = range(self.__index, len(self.tokens))
+        self.__index = len(self.tokens)
+        return remaining
+
+    def token(self):
+        """Returns the next buffered token for PLY, or None at the end."""
+        if self.__index >= len(self.tokens):
+            return None
+        tok = self.tokens[self.__index]
+        self.__index += 1
+        return tok
+
+
+class TokenReplay:
+    """A lexer that hands out tokens that were already read."""
+
+    def __init__(self, tokens) -> None:
+        self.tokens = iter(tokens)
+
+    def token(self):
+        return next(self.tokens, None)
@@ -0,0 +1,644 @@
+# Lowering.py
+#
+# Lowers a parsed program to typed instructions for the native backends
+# (CBackend.py and LLVMBackend.py). The instructions do what CodeGen's tree
+# walker does with the program, node for node: check branches are taken,
+# loops go round until their condition says stop, each iteration and each
+# call taking one step of the Budget, and `/` is true division. What
+# lowering adds is a static type for every value, so a backend can keep it
+# in a machine type. Type casts, input() and list literals have no typed
+# lowering; a program that uses them is rejected.
+#
+# Types follow the values, not the declarations: `int $x = 7 / 2` holds a
+# flt, and a variable holds None until something is stored in it. A local
+# may change type from one statement to the next. A program is rejected
+# with a LoweringError when a value's type can't be known before it runs:
+# a local whose type depends on which branch ran or on how many times a
+# loop went round, a function called with arguments of different types,
+# or a global given values of two types. An operation Python refuses, such
+# as None + 1, lowers to a `fail` carrying Python's message, so the
+# program fails only if it gets there.
+#
+# Types are "int", "flt", "bln", "str" and "none". A function that never
+# returns (it always fails, or recurses without end) returns "never".
+# Instructions are tuples:
+#
+#   ("load", dst, var)                 var is ("local", slot, type) or ("global", slot)
+#   ("store", var, src)
+#   ("move", dst, src)
+#   ("binary", op, dst, left, right)   op is one of CodeGen's _BINARY_OPERATORS
+#   ("truth", dst, src)                dst is a bln: CodeGen's _truthy(src)
+#   ("display", [src, ...])            one line: str() of each value, space-separated
+#   ("call", dst, name, [src, ...])    dst is None when the function returns none or never
+#   ("if", condition, then, otherwise) condition is a bln; then and otherwise are instruction lists
+#   ("loop", head, condition, body)    runs head, leaves unless condition (a bln) is true,
+#                                      runs body and starts again
+#   ("not", dst, src)                  both bln
+#   ("step",)                          one step of the Budget, as a call takes
+#   ("fail", message)                  a runtime error with Python's message
+#   ("return", src)
+#
+# Operands are Temps, which an instruction sets once (or moves into, for
+# && and ||), and Consts. A none value is always the Const None, so it
+# needs no storage.
+
+from CodeGen import SlotResolver, _BINARY_OPERATORS, _flatten_nodes, _operator_of, _split_conditional, _truthy, _walk
+from Parser import ASTNode
+
+
+class LoweringError(Exception):
+    """Raised when a program's values can't be given static types."""
+    pass
+
+
+# A value of each type, to ask Python what an operator makes of a pair of types.
+_SAMPLES = {"int": 2, "flt": 2.5, "bln": True, "str": "s", "none": None}
+_TYPE_NAMES = {int: "int", float: "flt", bool: "bln", str: "str", type(None): "none"}
+_NUMERIC = ("int", "flt", "bln")
+
+# Passes over the program before its types must have settled.
+MAX_PASSES = 64
+
+
+class Temp:
+    """A value an instruction computes."""
+
+    __slots__ = ("number", "type")
+
+    def __init__(self, number, value_type):
+        self.number = number
+        self.type = value_type
+
+    def __repr__(self):
+        return f"t{self.number}:{self.type}"
+
+
+class Const:
+    """A value known when the program is lowered."""
+
+    __slots__ = ("value", "type")
+
+    def __init__(self, value, value_type):
+        self.value = value
+        self.type = value_type
+
+    def __repr__(self):
+        return f"{self.value!r}:{self.type}"
+
+
+_NONE = Const(None, "none")
+_NEVER = Const(None, "never")
+
+
+class LoweredFunction:
+    """
+    One function's instructions. params are the Temps its arguments arrive
+    in, locals the (slot, type) pairs its instructions store to, and temps
+    every Temp it uses, parameters first.
+    """
+
+    __slots__ = ("name", "params", "returns", "code", "locals", "temps")
+
+    def __init__(self, name, params, returns, code, local_types, temps):
+        self.name = name
+        self.params = params
+        self.returns = returns
+        self.code = code
+        self.locals = local_types
+        self.temps = temps
+
+
+class LoweredProgram:
+    """main, the functions the program can call, and the type of each global slot that holds a value."""
+
+    __slots__ = ("main", "functions", "global_types", "global_names")
+
+    def __init__(self, main, functions, global_types, global_names):
+        self.main = main
+        self.functions = functions
+        self.global_types = global_types
+        self.global_names = global_names
+
+
+def _unify(known, value_type, what):
+    """The one type `what` has once it also holds value_type."""
+    if known == "never" or known == value_type:
+        return value_type
+    if value_type == "never":
+        return known
+    raise LoweringError(f"{what} holds both {known} and {value_type} values.")
+
+
+def _merge(envs):
+    """The local types after any of envs: a local that differs between them is "mixed"."""
+    return [types[0] if len(set(types)) == 1 else "mixed" for types in zip(*envs)]
+
+
+def _result_type(operator, left, right):
+    """(type of left <operator> right, None), or (None, the TypeError message) when Python refuses it."""
+    if operator == "%" and left == "str":
+        raise LoweringError("String formatting with '%' is not supported by the native backends.")
+    try:
+        result = _BINARY_OPERATORS[operator](_SAMPLES[left], _SAMPLES[right])
+    except TypeError as error:
+        return None, str(error)
+    return _TYPE_NAMES[type(result)], None
+
+
+class Lowerer:
+    """
+    Lowers a program AST to a LoweredProgram.
+
+    _value(node) emits what CodeGenerator.execute_node(node) does and
+    returns the operand holding its result; _effect(node) runs it for its
+    effects only. Types are inferred in passes: each pass lowers main and
+    every function called so far, with the argument, return and global
+    types the previous passes found, until a pass finds nothing new.
+    """
+
+    def __init__(self):
+        self.params = {}
+        self.returns = {}
+        self.global_types = {}
+
+    def lower(self, ast):
+        children = _flatten_nodes(ast.children)
+        resolver = SlotResolver().resolve(children)
+        self.functions = resolver.functions
+        self.main_size = resolver.main_size
+        self.global_names = {slot: name for name, slot in resolver.global_slots.items()}
+        self._find_initialized_globals(children)
+        for _ in range(MAX_PASSES):
+            state = self._state()
+            program = self._lower_pass(children)
+            if self._state() == state:
+                return program
+        raise LoweringError("The program's types did not settle.")
+
+    def _state(self):
+        return (sorted((name, tuple(types)) for name, types in self.params.items()),
+                sorted(self.returns.items()), sorted(self.global_types.items()))
+
+    def _find_initialized_globals(self, children):
+        """
+        Globals are set in program order before main runs. `declared` holds
+        every global a global statement sets, and `ready` those set before
+        the first one that calls a function: the globals a function body can
+        rely on.
+        """
+        self.declared, self.ready = set(), None
+        for node in children:
+            if getattr(node, "type", None) != "global_statement":
+                continue
+            if self.ready is None and any(
+                    inner.type == "function_call" and getattr(inner.children[0], "value", None) in self.functions
+                    for inner in _walk(node.children[3:])):
+                self.ready = set(self.declared)
+            self.declared.add(_flatten_nodes(node.children)[1].slot)
+        if self.ready is None:
+            self.ready = self.declared
+
+    def _lower_pass(self, children):
+        self._phase = "init"
+        self._init_stored, self._init_called = set(), False
+        self._begin([])
+        self._env = ["none"] * self.main_size
+        main_function = None
+        for child in children:
+            if getattr(child, "type", None) == "main_function":
+                main_function = child
+            else:
+                self._effect(child)
+        self._phase = "main"
+        if main_function is None:
+            self._display(Const("Error: main_function node not found.", "str"))
+        elif main_function.children:
+            # execute_program runs the main function's statements without flattening its children.
+            self._effect(main_function.children[0])
+        else:
+            self._display(Const("Warning: main_function node has no statements.", "str"))
+        main = LoweredFunction("@main_casper", [], "none", self._code, self._locals, self._temps)
+
+        self._phase = "function"
+        functions = {}
+        for name in list(self.params):
+            functions[name] = self._lower_function(self.functions[name], self.params[name])
+        global_types = {slot: value_type for slot, value_type in self.global_types.items()
+                        if value_type not in ("none", "never")}
+        return LoweredProgram(main, functions, global_types, self.global_names)
+
+    def _lower_function(self, function, param_types):
+        params = [self._temp(value_type) for value_type in self._begin(param_types)]
+        self._env = ["none"] * function.nlocals
+        # As in CodeGenerator.call, the arguments fill the frame's first slots.
+        for slot, param in enumerate(params[:function.nlocals]):
+            self._env[slot] = param.type
+            if param.type != "none":
+                self._emit(("store", ("local", slot, param.type), param))
+                self._locals.add((slot, param.type))
+        self._effect(function.body)
+        result = self._value(function.revive)
+        self._emit(("return", result))
+        returns = "never" if self._dead else result.type
+        self.returns[function.name] = _unify(self.returns.get(function.name, "never"), returns,
+                                             f"Function '{function.name}'")
+        return LoweredFunction(function.name, params, self.returns[function.name],
+                               self._code, self._locals, self._temps)
+
+    # -- emission -------------------------------------------------------------
+
+    def _begin(self, param_types):
+        self._code = []
+        self._locals = set()
+        self._temps = []
+        self._dead = False
+        return param_types
+
+    def _emit(self, instruction):
+        # Code after a failure, or after a call that never returns, can't run; it is dropped.
+        if not self._dead:
+            self._code.append(instruction)
+
+    def _temp(self, value_type):
+        temp = Temp(len(self._temps), value_type)
+        self._temps.append(temp)
+        return temp
+
+    def _fail(self, message):
+        self._emit(("fail", message))
+        self._dead = True
+        return _NEVER
+
+    def _display(self, *values):
+        self._emit(("display", list(values)))
+
+    def _branch(self, condition, then_lower, otherwise_lower):
+        """Emits an if over two lowerings and merges the local types each leaves behind."""
+        code, env = self._code, self._env
+        blocks, outcomes = [], []
+        for lower in (then_lower, otherwise_lower):
+            self._code, self._env, self._dead = [], list(env), False
+            lower()
+            blocks.append(self._code)
+            if not self._dead:
+                outcomes.append(self._env)
+        self._code, self._dead = code, not outcomes
+        self._env = _merge(outcomes) if outcomes else env
+        self._code.append(("if", condition, blocks[0], blocks[1]))
+
+    def _loop(self, head_lower, body_lower):
+        """
+        Emits a loop whose head_lower returns the bln that keeps it going. The
+        local types at the top are those on entry merged with those the body
+        leaves behind, so the loop is lowered again until they settle.
+        """
+        code, entry = self._code, self._env
+        top = entry
+        for _ in range(MAX_PASSES):
+            self._code, self._env, self._dead = [], list(top), False
+            condition = head_lower()
+            head, after, exits = self._code, self._env, not self._dead
+            self._code = []
+            if exits:
+                body_lower()
+            merged = _merge([entry] if self._dead or not exits else [entry, self._env])
+            if merged == top:
+                break
+            top = merged
+        else:
+            raise LoweringError("The program's types did not settle.")
+        body = self._code
+        self._code, self._env, self._dead = code, after, not exits
+        # A head that never finishes is not a loop at all.
+        self._code.extend([("loop", head, condition, body)] if exits else head)
+
+    def _step(self):
+        self._emit(("step",))
+
+    # -- variables ------------------------------------------------------------
+
+    def _global_type(self, slot):
+        stored = self.global_types.get(slot, "never")
+        if self._phase == "init" and not self._init_called:
+            # Nothing but the global statements so far has run.
+            return stored if slot in self._init_stored else "none"
+        unset = slot not in (self.declared if self._phase == "main" else self.ready)
+        return _unify(stored, "none", f"Global '{self.global_names[slot]}'") if unset else stored
+
+    def _load(self, ident):
+        if ident.is_global:
+            value_type, var = self._global_type(ident.slot), ("global", ident.slot)
+        else:
+            value_type = self._env[ident.slot]
+            var = ("local", ident.slot, value_type)
+        if value_type == "mixed":
+            raise LoweringError(f"'{ident.value}' holds a value of a different type depending on which branch ran.")
+        if value_type == "none":
+            return _NONE
+        if value_type == "never":
+            # No store that can run before this one gives the variable a value yet.
+            self._dead = True
+            return _NEVER
+        result = self._temp(value_type)
+        self._emit(("load", result, var))
+        return result
+
+    def _store(self, ident, value):
+        if self._dead:
+            return
+        if ident.is_global:
+            self.global_types[ident.slot] = _unify(self.global_types.get(ident.slot, "never"), value.type,
+                                                   f"Global '{ident.value}'")
+            if self._phase == "init":
+                self._init_stored.add(ident.slot)
+            var = ("global", ident.slot)
+        else:
+            self._env[ident.slot] = value.type
+            var = ("local", ident.slot, value.type)
+            if value.type != "none":
+                self._locals.add((ident.slot, value.type))
+        if value.type != "none":
+            self._emit(("store", var, value))
+
+    # -- operations -----------------------------------------------------------
+
+    def _truth(self, value):
+        if value.type in ("bln", "never"):
+            return value
+        if isinstance(value, Const):
+            return Const(_truthy(value.value), "bln")
+        result = self._temp("bln")
+        self._emit(("truth", result, value))
+        return result
+
+    def _not(self, value):
+        if value.type == "never":
+            return value
+        if isinstance(value, Const):
+            return Const(not value.value, "bln")
+        result = self._temp("bln")
+        self._emit(("not", result, value))
+        return result
+
+    def _binary(self, operator, left, right):
+        if self._dead:
+            return _NEVER
+        if operator in ("==", "!=") and not (
+                left.type in _NUMERIC and right.type in _NUMERIC or left.type == right.type == "str"):
+            # Values of unrelated types are never equal; None equals None.
+            return Const((left.type == right.type) == (operator == "=="), "bln")
+        result_type, error = _result_type(operator, left.type, right.type)
+        if error is not None:
+            return self._fail(error)
+        result = self._temp(result_type)
+        self._emit(("binary", operator, result, left, right))
+        return result
+
+    # -- nodes ----------------------------------------------------------------
+
+    def _value(self, node):
+        """Emits what CodeGenerator.execute_node(node) does; returns the operand holding its result."""
+        if self._dead:
+            return _NEVER
+        if isinstance(node, list):
+            values = [self._value(item) for item in _flatten_nodes(node)]
+            if any(value.type != "none" for value in values):
+                raise LoweringError("Statement lists have no value in the native backends.")
+            return _NONE
+        if not isinstance(node, ASTNode):
+            # None, and the bare operator strings and numbers some nodes hold.
+            return _NONE
+        children = _flatten_nodes(node.children) if node.children else []
+        lower = getattr(self, f"_lower_{node.type}", None)
+        if lower is not None:
+            return lower(node, children) or _NONE
+        for child in children:
+            self._effect(child)
+        return _NONE
+
+    def _effect(self, node):
+        if isinstance(node, list):
+            for item in _flatten_nodes(node):
+                self._effect(item)
+        else:
+            self._value(node)
+
+    def _lower_output_statement(self, node, children):
+        if children:
+            value = self._value(children[0])
+            self._display(value)
+        else:
+            self._display(Const("Warning: output_statement has no children.", "str"))
+
+    def _lower_value(self, node, children):
+        return self._value(children[0] if children else None)
+
+    def _lower_expression(self, node, children):
+        tail = children[1] if len(children) > 1 else None
+        if tail is None or len(tail.children) < 2:
+            return self._value(children[0])
+        operator = _operator_of(tail)
+        left = self._value(children[0])
+        if operator in ("&&", "||"):
+            # && and || short-circuit, so the right operand may never run.
+            condition = self._truth(left)
+            if self._dead:
+                return _NEVER
+            result = self._temp("bln")
+
+            def evaluate():
+                self._emit(("move", result, self._truth(self._value(tail.children[1]))))
+
+            def settle():
+                self._emit(("move", result, Const(operator == "||", "bln")))
+
+            self._branch(condition, *((evaluate, settle) if operator == "&&" else (settle, evaluate)))
+            return result
+        right = self._value(tail.children[1])
+        if operator in _BINARY_OPERATORS:
+            return self._binary(operator, left, right)
+        # Other operators still evaluate the right operand, then yield the left one.
+        return left
+
+    _lower_condition = _lower_expression
+
+    def _lower_paren(self, node, children):
+        return self._value(children[0])
+
+    def _lower_neg_int(self, node, children):
+        return Const(-node.value, _TYPE_NAMES[type(node.value)])
+
+    _lower_neg_flt = _lower_neg_int
+
+    def _lower_literal(self, node, children):
+        if type(node.value) not in _TYPE_NAMES:
+            raise LoweringError(f"Literal {node.value!r} is not supported by the native backends.")
+        return Const(node.value, _TYPE_NAMES[type(node.value)])
+
+    def _lower_str_lit(self, node, children):
+        return Const(node.value.strip('"'), "str")
+
+    def _lower_global_statement(self, node, children):
+        self._store(children[1], self._value(children[3] if len(children) > 3 else None))
+
+    def _lower_var_statement(self, node, children):
+        # `int $a, $b = 1` declares both names; each `= value` belongs to the name before it.
+        ident = children[1] if len(children) > 1 else None
+        for extra in children[3:]:
+            if extra is None:
+                continue
+            if extra.type == "local_var_more":
+                if ident is not None:
+                    self._store(ident, _NONE)
+                ident = extra.children[0]
+            elif extra.type == "local_var_assign":
+                value = self._value(extra)
+                if ident is not None:
+                    self._store(ident, value)
+                ident = None
+        if ident is not None:
+            self._store(ident, _NONE)
+
+    def _lower_control_variable(self, node, children):
+        self._store(children[1], self._value(children[2]))
+
+    def _lower_local_var_assign(self, node, children):
+        return self._value(children[0])
+
+    def _lower_var_call(self, node, children):
+        return self._load(children[0]) if children else _NONE
+
+    def _lower_var_postfix(self, node, children):
+        var_call, postfix = children[0], children[1] if len(children) > 1 else None
+        value = self._value(var_call)
+        if postfix in ("++", "--"):
+            # Postfix yields the old value, then stores the updated one.
+            self._store(var_call.children[0], self._binary(postfix[0], value, Const(1, "int")))
+        return value
+
+    def _lower_assignment_statement(self, node, children):
+        target = children[0] if children else None
+        if target is not None and target.type == "IDENT":
+            tail = children[1]
+            if tail.type != "assign_tail_op":
+                # .push() and .splice() change nothing; their items are only evaluated.
+                for child in children:
+                    self._effect(child)
+                return
+            op = _operator_of(tail)
+            value = self._value(tail.children[1])
+            self._store(target, value if op == "=" else self._compound(op[0], target, value))
+            return
+        # An element assignment, $a[i] = value, replaces the whole variable.
+        value = self._value(children[2] if len(children) > 2 else None)
+        if target is not None and target.children:
+            self._store(target.children[0], value)
+
+    def _lower_conditional_statement(self, node, children):
+        condition, body, branches = _split_conditional(children)
+        arms = [(condition, body)] + [(parts[0], parts[1:]) for parts in
+                                      (_flatten_nodes(branch.children) for branch in branches)]
+        self._arms(arms)
+
+    def _arms(self, arms):
+        """check / otherwise_check: each arm's test runs only when the ones before it were false."""
+        if not arms:
+            return
+        (test, block), rest = arms[0], arms[1:]
+        condition = self._truth(self._value(test))
+        if not self._dead:
+            self._branch(condition, lambda: self._effect(block), lambda: self._arms(rest))
+
+    def _compound(self, operator, target, value):
+        """target <operator>= value; the value is evaluated before the variable is read."""
+        if operator not in _BINARY_OPERATORS:
+            self._fail(repr(operator))
+        return self._binary(operator, self._load(target), value)
+
+    def _lower_for_loop(self, node, children):
+        control, condition, update, body = children[0], children[1], children[2], children[3:]
+        self._effect(control)
+
+        def iterate():
+            self._step()
+            self._effect(body)
+            self._effect(update)
+
+        self._loop(lambda: self._truth(self._value(condition)), iterate)
+
+    def _lower_until_loop(self, node, children):
+        condition, body = children[0], children[1:]
+
+        def iterate():
+            self._step()
+            self._effect(body)
+
+        self._loop(lambda: self._not(self._truth(self._value(condition))), iterate)
+
+    def _lower_repeat_until(self, node, children):
+        # The body runs before the condition is first tested, so all of it is the loop's head.
+        body, condition = children[:-1], children[-1]
+
+        def head():
+            self._step()
+            self._effect(body)
+            return self._not(self._truth(self._value(condition)))
+
+        self._loop(head, lambda: None)
+
+    def _lower_update(self, node, children):
+        var_call, tail = children[0], children[1]
+        if tail.type == "update_tail_postfix":
+            value = self._binary(tail.value[0], self._value(var_call), Const(1, "int"))
+        else:
+            value = self._compound(_operator_of(tail)[0], var_call.children[0], self._value(tail.children[1]))
+        self._store(var_call.children[0], value)
+
+    def _lower_type_cast(self, node, children):
+        raise LoweringError("Type casts are not supported by the native backends.")
+
+    def _lower_input_statement(self, node, children):
+        raise LoweringError("input() is not supported by the native backends.")
+
+    def _lower_list_value(self, node, children):
+        raise LoweringError("List literals are not supported by the native backends.")
+
+    def _lower_function_declaration(self, node, children):
+        # Bodies run when called; every function called is lowered on its own.
+        return None
+
+    def _lower_function_call(self, node, children):
+        if not children:
+            return _NONE
+        name = getattr(children[0], "value", None)
+        args_node = children[1] if len(children) > 1 else None
+        args = [self._value(arg) for arg in _flatten_nodes(args_node.children)] \
+            if args_node is not None and args_node.children else []
+        if self._dead:
+            return _NEVER
+        if name == "display":
+            self._display(*args)
+            return _NONE
+        function = self.functions.get(name)
+        if function is None:
+            # Calling an undeclared function evaluates its arguments and yields None.
+            return _NONE
+        if self._phase == "init":
+            self._init_called = True
+        # Missing arguments read None, and extra ones are dropped, as with the walker's frames.
+        args = (args + [_NONE] * function.nparams)[:function.nparams]
+        params = self.params.setdefault(name, ["never"] * function.nparams)
+        for number, arg in enumerate(args):
+            params[number] = _unify(params[number], arg.type, f"Parameter {number + 1} of '{name}'")
+        returns = self.returns.get(name, "never")
+        result = self._temp(returns) if returns not in ("none", "never") else None
+        self._emit(("call", result, name, args))
+        if returns == "never":
+            self._dead = True
+            return _NEVER
+        return result or _NONE
+
+
+def lower_program(ast):
+    """Lowers a parsed program to a LoweredProgram; raises LoweringError if its values can't be typed."""
+    return Lowerer().lower(ast)
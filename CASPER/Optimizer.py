@@ -0,0 +1,492 @@
+# Optimizer.py
+#
+# AST optimization between semantic analysis and code generation. Each pass
+# rewrites the tree in place and records what it changed in an
+# OptimizationReport:
+#
+#   fold      folds binary operations on constants
+#   branches  drops check/otherwise_check branches whose condition is a
+#             constant Day or Night, unless they declare a variable
+#   hoist     moves loop-invariant expressions out of for/until loop bodies
+#             into a variable declared just before the loop
+#
+# CASPER_OPTIMIZE selects the passes, e.g. "fold,branches" (default: all of
+# them; "none" turns the optimizer off). Rewrites keep what CodeGen's tree
+# walker, the reference for program semantics that every engine follows,
+# does with a program: `/` is true division and `%` takes the sign of its
+# right operand, as in Python. Type casts evaluate to None there, so they are
+# never folded to a value.
+#
+# Usage: python Optimizer.py tests/test.lime
+
+import math
+import os
+import sys
+
+from Parser import ASTNode
+from Trace import tracer_from_env
+
+OPTIMIZER_PASSES = os.environ.get("CASPER_OPTIMIZE", "fold,branches,hoist")
+
+# Anything that is not a compile-time constant.
+_UNKNOWN = object()
+
+INT64_MIN, INT64_MAX = -2 ** 63, 2 ** 63 - 1
+
+# Operators folded or hoisted per pair of operand types; none of them can fail
+# on such operands. Comparisons are left out: the interpreter shows their
+# results as True/False, which no literal can express.
+_NUMERIC_OPERATORS = ("+", "-", "*")
+_STRING_OPERATORS = ("+",)
+
+# Node type -> index of the IDENT child it declares, as CodeGen's SlotResolver reads them.
+_DECLARATIONS = {"var_statement": 1, "local_var_more": 0, "control_variable": 1, "param_decl": 1}
+
+
+def _nodes(root):
+    """Every ASTNode under root, parents before children, without recursing."""
+    nodes = []
+    stack = [root]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, list):
+            stack.extend(reversed(item))
+        elif isinstance(item, ASTNode):
+            nodes.append(item)
+            stack.extend(reversed(item.children))
+    return nodes
+
+
+def _operator_of(tail):
+    operator = tail.children[0]
+    return operator.value if hasattr(operator, "value") else operator
+
+
+def _binary_parts(node):
+    """(left, operator, right) of a binary expression node, or None."""
+    if node.type not in ("expression", "condition") or len(node.children) < 2:
+        return None
+    tail = node.children[1]
+    if not isinstance(tail, ASTNode) or len(tail.children) < 2:
+        return None
+    return node.children[0], _operator_of(tail), tail.children[1]
+
+
+def _constant(node):
+    """The value of a constant operand (Day/Night as True/False), or _UNKNOWN."""
+    while isinstance(node, ASTNode) and node.type in ("expression", "condition", "paren", "value") \
+            and len(node.children) == 1:
+        node = node.children[0]
+    if not isinstance(node, ASTNode):
+        return _UNKNOWN
+    if node.type == "literal":
+        if node.value in ("Day", "Night"):
+            return node.value == "Day"
+        return node.value
+    if node.type in ("neg_int", "neg_flt"):
+        return -node.value
+    return _UNKNOWN
+
+
+def _constant_node(value):
+    """A parser-shaped node for a folded value."""
+    if type(value) is bool:
+        return ASTNode("literal", value="Day" if value else "Night")
+    if isinstance(value, (int, float)) and value < 0:
+        return ASTNode("neg_int" if type(value) is int else "neg_flt", value=-value)
+    return ASTNode("literal", value=value)
+
+
+def _representable(value):
+    # Day/Night literals double as bln values, so those strings cannot be folded to.
+    if type(value) is str:
+        return value not in ("Day", "Night")
+    if type(value) is float:
+        return math.isfinite(value)
+    if type(value) is int:
+        return INT64_MIN <= value <= INT64_MAX
+    return type(value) is bool
+
+
+def _fold_binary(operator, left, right):
+    if type(left) is str and type(right) is str:
+        return left + right if operator == "+" else _UNKNOWN
+    if type(left) not in (int, float) or type(right) not in (int, float):
+        return _UNKNOWN
+    if operator == "+":
+        return left + right
+    if operator == "-":
+        return left - right
+    if operator == "*":
+        return left * right
+    if operator == "/" and right != 0:
+        try:
+            return left / right
+        except OverflowError:
+            return _UNKNOWN
+    if operator == "%" and right != 0:
+        return left % right
+    return _UNKNOWN
+
+
+def _declares(root):
+    """Whether anything under root declares a variable."""
+    return any(node.type in _DECLARATIONS for node in _nodes(root))
+
+
+def _describe(node):
+    """Short source-like text of an expression, for reports."""
+    parts = _binary_parts(node)
+    if parts is not None:
+        return f"{_describe(parts[0])} {parts[1]} {_describe(parts[2])}"
+    if node.type in ("expression", "condition", "value") and len(node.children) == 1:
+        return _describe(node.children[0])
+    if node.type == "paren" and node.children:
+        return f"({_describe(node.children[0])})"
+    if node.type == "var_postfix" and node.children:
+        return _describe(node.children[0]) + (node.children[1] or "")
+    if node.type == "var_call" and node.children:
+        return node.children[0].value
+    if node.type == "type_cast" and node.children:
+        return f"{node.value}({_describe(node.children[0])})"
+    if node.type in ("neg_int", "neg_flt"):
+        return f"~{node.value}"
+    if node.type == "literal" and type(node.value) is str and node.value not in ("Day", "Night"):
+        return f'"{node.value}"'
+    if node.value is not None:
+        return str(node.value)
+    return node.type
+
+
+def _forget_operation(node):
+    # Analyzer annotations and the tree walker's bound operation describe the old shape.
+    for name in ("operand_types", "numeric_operands", "operation"):
+        node.__dict__.pop(name, None)
+
+
+class OptimizationReport:
+    """What each pass changed, as one description per rewrite."""
+
+    def __init__(self):
+        self.changes = {}
+
+    def add(self, pass_name, description):
+        self.changes.setdefault(pass_name, []).append(description)
+
+    def count(self, pass_name=None):
+        if pass_name is not None:
+            return len(self.changes.get(pass_name, []))
+        return sum(len(changes) for changes in self.changes.values())
+
+    def __str__(self):
+        if not self.changes:
+            return "No optimizations applied."
+        return "\n".join(f"[{pass_name}] {description}"
+                         for pass_name, changes in self.changes.items() for description in changes)
+
+
+class ConstantFolder:
+    """Folds binary operations on constants, innermost first."""
+
+    name = "fold"
+
+    def run(self, ast, report):
+        # Children come after their parents in _nodes(), so walking it backwards folds bottom-up.
+        for node in reversed(_nodes(ast)):
+            parts = _binary_parts(node)
+            if parts is not None:
+                self._fold_binary(node, parts, report)
+
+    def _fold_binary(self, node, parts, report):
+        left, operator, right = parts
+        left_value, right_value = _constant(left), _constant(right)
+        if left_value is _UNKNOWN or right_value is _UNKNOWN:
+            return
+        value = _fold_binary(operator, left_value, right_value)
+        if value is _UNKNOWN or not _representable(value):
+            return
+        folded = _constant_node(value)
+        report.add(self.name, f"{_describe(node)} -> {_describe(folded)}")
+        node.children = [folded]
+        _forget_operation(node)
+
+
+class DeadBranchEliminator:
+    """
+    Removes check/otherwise_check branches whose condition is a constant.
+
+    A check on Day is replaced by its body. A check on Night hands over to
+    its first otherwise_check, or disappears when it has none (the parser
+    does not keep `otherwise` bodies). otherwise_check branches on Night
+    are dropped, and nothing after one on Day can run.
+
+    A branch that declares a variable stays, dead or not: a declaration
+    anywhere in a function makes the name local to all of it, so dropping
+    one could turn the function's other uses of the name into a global.
+    """
+
+    name = "branches"
+
+    def run(self, ast, report):
+        for container in self._statement_lists(ast):
+            for index, item in enumerate(container):
+                if isinstance(item, ASTNode) and item.type == "conditional_statement":
+                    container[index] = self._simplify(item, report)
+
+    def _statement_lists(self, ast):
+        lists, stack = [], [ast]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, list):
+                lists.append(item)
+                stack.extend(item)
+            elif isinstance(item, ASTNode):
+                stack.append(item.children)
+        return lists
+
+    def _simplify(self, node, report):
+        while True:
+            condition = node.children[0]
+            value = _constant(condition)
+            branches = node.children[2] if len(node.children) > 2 and isinstance(node.children[2], list) else []
+            if value is True:
+                if _declares(branches):
+                    return node
+                report.add(self.name, "check (Day): kept its body, dropped the other branches")
+                return node.children[1] if isinstance(node.children[1], list) else [node.children[1]]
+            if value is False:
+                if _declares(node.children[1]):
+                    return node
+                if not branches:
+                    report.add(self.name, "check (Night) without otherwise_check: removed")
+                    return []
+                report.add(self.name, "check (Night): first otherwise_check becomes the check")
+                first = branches[0]
+                node = ASTNode("conditional_statement",
+                               [first.children[0], first.children[1], branches[1:]] + node.children[3:])
+                continue
+            kept = []
+            for position, branch in enumerate(branches):
+                branch_value = _constant(branch.children[0])
+                if branch_value is False and not _declares(branch):
+                    report.add(self.name, "otherwise_check (Night): removed")
+                    continue
+                kept.append(branch)
+                if branch_value is True:
+                    if _declares(branches[position + 1:]):
+                        kept += branches[position + 1:]
+                        break
+                    if position < len(branches) - 1:
+                        report.add(self.name, "otherwise_check (Day): dropped the branches after it")
+                    break
+            if len(node.children) > 2 and kept != branches:
+                node.children[2] = kept
+            return node
+
+
+class LoopInvariantHoister:
+    """
+    Moves loop-invariant expressions out of for_loop and until_loop bodies.
+
+    An expression is invariant when it only reads variables the loop never
+    writes, and it is hoisted when the analyzer typed its operands as
+    numbers (+ - *) or strings (+), which cannot fail, so evaluating it
+    before a loop that runs zero times changes nothing. If the loop calls
+    a function, only the enclosing function's own locals count as unchanged.
+    Each hoisted expression is stored in a fresh variable declared just
+    before the loop. Inner loops are handled first, so an expression can
+    move out of several nested loops.
+    """
+
+    name = "hoist"
+    LOOPS = ("for_loop", "until_loop")
+
+    def run(self, ast, report):
+        self.names = {node.value for node in _nodes(ast) if node.type == "IDENT"}
+        self.counter = 0
+        for scope in _nodes(ast):
+            if scope.type in ("function_declaration", "main_function"):
+                self._hoist_scope(scope, report)
+
+    def _hoist_scope(self, scope, report):
+        nodes = _nodes(scope.children)
+        local_names = set()
+        for node in nodes:
+            position = _DECLARATIONS.get(node.type)
+            if position is not None and len(node.children) > position:
+                local_names.add(node.children[position].value)
+        containers = self._containers(scope)
+        for loop in reversed([node for node in nodes if node.type in self.LOOPS]):
+            container = containers.get(id(loop))
+            if container is not None:
+                self._hoist_loop(loop, container, local_names, report)
+
+    def _containers(self, scope):
+        """id(statement) -> the statement list holding it, for lists new declarations can go in."""
+        containers = {}
+        stack = [(scope.children, scope.type == "statements")]
+        while stack:
+            item, free = stack.pop()
+            if isinstance(item, list):
+                for child in item:
+                    if isinstance(child, ASTNode) and free:
+                        containers[id(child)] = item
+                    stack.append((child, True))
+            elif isinstance(item, ASTNode):
+                # A node's own children list is positional unless the node is a statement list.
+                stack.append((item.children, item.type == "statements"))
+        return containers
+
+    def _hoist_loop(self, loop, container, local_names, report):
+        loop_nodes = _nodes(loop.children)
+        written, calls = set(), False
+        for node in loop_nodes:
+            if node.type == "function_call":
+                calls = calls or (node.children and node.children[0].value != "display")
+            elif node.type in ("assignment_statement", "update") and node.children:
+                target = node.children[0]
+                written.add(target.value if target.type == "IDENT" else target.children[0].value)
+            elif node.type == "var_postfix" and len(node.children) > 1 and node.children[1]:
+                written.add(node.children[0].children[0].value)
+            elif node.type == "input_statement":
+                calls = True
+            position = _DECLARATIONS.get(node.type)
+            if position is not None and len(node.children) > position:
+                written.add(node.children[position].value)
+
+        body = loop.children[-1] if loop.type == "for_loop" else loop.children[1]
+        declarations = []
+        for node in self._invariants(body, written, local_names if calls else None):
+            declarations.append(self._hoist(node, report))
+        if declarations:
+            position = next(index for index, item in enumerate(container) if item is loop)
+            container.insert(position, declarations)
+
+    def _invariants(self, body, written, readable):
+        """Outermost hoistable expressions in body, in source order."""
+        found, stack = [], [body]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, list):
+                stack.extend(reversed(item))
+            elif isinstance(item, ASTNode):
+                if self._hoistable(item, written, readable):
+                    found.append(item)
+                elif item.type not in self.LOOPS or item is body:
+                    stack.extend(reversed(item.children))
+                else:
+                    # Expressions inside an inner loop stay there; they moved already if they could.
+                    continue
+        return found
+
+    def _hoistable(self, node, written, readable):
+        return node.type == "expression" and self._safe_operation(node) and self._invariant(node, written, readable)
+
+    def _safe_operation(self, node):
+        """Whether node is a binary operation the analyzer typed, on operands it cannot fail for."""
+        parts = _binary_parts(node)
+        types = getattr(node, "operand_types", None)
+        if parts is None or types is None or getattr(node, "resolved_type", None) not in ("int", "flt", "str"):
+            return False
+        if types[0] in ("int", "flt") and types[1] in ("int", "flt"):
+            return parts[1] in _NUMERIC_OPERATORS
+        return tuple(types) == ("str", "str") and parts[1] in _STRING_OPERATORS
+
+    def _invariant(self, node, written, readable):
+        for item in _nodes(node.children):
+            if _binary_parts(item) is not None:
+                if item.type != "expression" or not self._safe_operation(item):
+                    return False
+            elif item.type == "var_postfix":
+                if len(item.children) > 1 and item.children[1]:
+                    return False
+            elif item.type == "var_call":
+                name = item.children[0].value
+                if item.children[1] or name in written or (readable is not None and name not in readable):
+                    return False
+            elif item.type == "literal":
+                if item.value in ("Day", "Night"):
+                    return False
+            elif item.type not in ("expression", "factor_tail_binop", "operator", "paren", "IDENT",
+                                   "neg_int", "neg_flt"):
+                return False
+        return True
+
+    def _hoist(self, node, report):
+        name = self._fresh_name()
+        hoisted = ASTNode("expression", node.children)
+        for attribute in ("operand_types", "numeric_operands", "resolved_type"):
+            if hasattr(node, attribute):
+                setattr(hoisted, attribute, getattr(node, attribute))
+        report.add(self.name, f"{name} = {_describe(hoisted)} moved before the loop")
+        node.children = [ASTNode("var_postfix", [ASTNode("var_call", [ASTNode("IDENT", value=name), []]), None])]
+        _forget_operation(node)
+        return ASTNode("var_statement", [
+            ASTNode("local_data_type", value=node.resolved_type),
+            ASTNode("IDENT", value=name),
+            None,
+            ASTNode("local_var_assign", [ASTNode("value", [hoisted])]),
+        ])
+
+    def _fresh_name(self):
+        while True:
+            name = f"$hoisted{self.counter}"
+            self.counter += 1
+            if name not in self.names:
+                self.names.add(name)
+                return name
+
+
+PASSES = {
+    ConstantFolder.name: ConstantFolder,
+    DeadBranchEliminator.name: DeadBranchEliminator,
+    LoopInvariantHoister.name: LoopInvariantHoister,
+}
+
+
+def _selected(passes):
+    if passes is None:
+        passes = OPTIMIZER_PASSES
+    if isinstance(passes, str):
+        passes = [] if passes.strip().lower() in ("", "none", "off", "0") else \
+            [name.strip() for name in passes.split(",") if name.strip()]
+    unknown = [name for name in passes if name not in PASSES]
+    if unknown:
+        raise ValueError(f"Unknown optimizer pass(es) {', '.join(unknown)}; choose from {', '.join(PASSES)}.")
+    # Passes always run in pipeline order: folding first exposes constant conditions.
+    return [name for name in PASSES if name in passes]
+
+
+def optimize(ast, passes=None, tracer=None):
+    """Runs the selected passes (default CASPER_OPTIMIZE) over ast in place; returns the report."""
+    tracer = tracer if tracer is not None else tracer_from_env()
+    report = OptimizationReport()
+    for name in _selected(passes):
+        PASSES[name]().run(ast, report)
+        if tracer.enabled("optimizer"):
+            for description in report.changes.get(name, []):
+                tracer.emit("optimizer", name, change=description)
+    return report
+
+
+def run_optimizer(ast, tracer=None):
+    return optimize(ast, tracer=tracer)
+
+
+if __name__ == "__main__":
+    import Parser
+    from Lexer import TokenStream
+    from Semantics import SemanticAnalyzer
+
+    with open(sys.argv[1] if len(sys.argv) > 1 else "tests/test.lime") as handle:
+        programs = [text.strip() + "\nghost" for text in handle.read().split("ghost") if text.strip()]
+    parser = Parser.build_parser()
+    for number, program in enumerate(programs, 1):
+        try:
+            ast = parser.parse(lexer=TokenStream(program.replace("\n", "\r\n")))
+        except SyntaxError as error:
+            print(f"program {number}: {error}")
+            continue
+        SemanticAnalyzer().analyze(ast)
+        print(f"program {number}:")
+        print(optimize(ast))
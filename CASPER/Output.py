@@ -0,0 +1,204 @@
+# Output.py
+#
+# Output sinks for running programs. CodeGen writes everything a program
+# displays to the sink it was given instead of to sys.stdout, so several
+# programs can run at once (e.g. under a threaded Flask server) and their
+# output can be collected, streamed as it is produced, or written to a file.
+#
+# Every sink is thread-safe and enforces a size cap: once a program has
+# written `limit` characters, the rest of the write is cut off and
+# OutputLimitExceeded stops the program. CASPER_OUTPUT_LIMIT sets the default
+# cap (in characters; 0 means unlimited).
+
+import os
+import queue
+import sys
+import threading
+
+OUTPUT_LIMIT = int(os.environ.get("CASPER_OUTPUT_LIMIT", str(1 << 20)))
+
+
+class OutputLimitExceeded(Exception):
+    """Raised when a program writes more output than its sink allows."""
+    pass
+
+
+class OutputCancelled(Exception):
+    """Raised in a program whose output stream was abandoned by its reader."""
+    pass
+
+
+class OutputSink:
+    """
+    Base class: counts characters against the cap and serializes writes.
+
+    Subclasses implement _emit(text) and, when they hold text back, _flush().
+    print() formats its values the way the built-in print() does.
+    """
+
+    def __init__(self, limit=None):
+        self.limit = OUTPUT_LIMIT if limit is None else limit
+        self.written = 0
+        self.truncated = False
+        self.closed = False
+        self._lock = threading.Lock()
+
+    def write(self, text):
+        with self._lock:
+            if self.closed:
+                raise ValueError("write to a closed output sink")
+            if self.limit and self.written + len(text) > self.limit:
+                text = text[:max(self.limit - self.written, 0)]
+                self.truncated = True
+            self.written += len(text)
+            if text:
+                self._emit(text)
+            if self.truncated:
+                self._flush()
+                raise OutputLimitExceeded(f"Output limit of {self.limit} characters exceeded.")
+
+    def print(self, *values):
+        self.write(" ".join(str(value) for value in values) + "\n")
+
+    def flush(self):
+        with self._lock:
+            self._flush()
+
+    def close(self):
+        with self._lock:
+            if not self.closed:
+                self._flush()
+                self._close()
+                self.closed = True
+
+    def _emit(self, text):
+        raise NotImplementedError
+
+    def _flush(self):
+        pass
+
+    def _close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class StdoutSink(OutputSink):
+    """Writes to whatever sys.stdout is at the time, uncapped: the behaviour before sinks existed."""
+
+    def __init__(self, limit=0):
+        super().__init__(limit)
+
+    def _emit(self, text):
+        sys.stdout.write(text)
+
+
+class BufferSink(OutputSink):
+    """Collects output in memory, up to the cap; getvalue() returns it."""
+
+    def __init__(self, limit=None):
+        super().__init__(limit)
+        self._chunks = []
+
+    def _emit(self, text):
+        self._chunks.append(text)
+
+    def getvalue(self):
+        with self._lock:
+            text = "".join(self._chunks)
+            self._chunks = [text]
+            return text
+
+
+class ChunkedSink(OutputSink):
+    """
+    Streams output to a callback in chunks of about `chunk_size` characters.
+
+    Text is held back until a chunk fills up, the sink is flushed or it is
+    closed, so a program that displays many short lines does not cost one
+    callback per line.
+    """
+
+    def __init__(self, callback, chunk_size=4096, limit=None):
+        super().__init__(limit)
+        self.callback = callback
+        self.chunk_size = chunk_size
+        self._pending = []
+        self._pending_size = 0
+
+    def _emit(self, text):
+        self._pending.append(text)
+        self._pending_size += len(text)
+        if self._pending_size >= self.chunk_size:
+            self._flush()
+
+    def _flush(self):
+        if self._pending:
+            chunk = "".join(self._pending)
+            self._pending, self._pending_size = [], 0
+            self.callback(chunk)
+
+
+class QueueSink(ChunkedSink):
+    """
+    A ChunkedSink feeding a bounded queue, for streaming from another thread.
+
+    The program runs in one thread and writes; a consumer (e.g. a streaming
+    HTTP response) iterates chunks() in another. A full queue blocks the
+    writer, so a slow reader holds the program back instead of letting
+    output pile up in memory.
+    """
+
+    _DONE = object()
+
+    def __init__(self, chunk_size=1024, max_chunks=64, limit=None):
+        self.queue = queue.Queue(max_chunks)
+        self.cancelled = False
+        super().__init__(self.queue.put, chunk_size, limit)
+
+    def cancel(self):
+        """For a reader that stops early: the next write fails, and a writer blocked on the full queue is let go."""
+        self.cancelled = True
+        try:
+            while True:
+                self.queue.get_nowait()
+        except queue.Empty:
+            pass
+
+    def _emit(self, text):
+        if self.cancelled:
+            raise OutputCancelled("The output stream was closed by its reader.")
+        super()._emit(text)
+
+    def _close(self):
+        self.queue.put(self._DONE)
+
+    def chunks(self):
+        while True:
+            chunk = self.queue.get()
+            if chunk is self._DONE:
+                return
+            yield chunk
+
+
+class FileSink(OutputSink):
+    """Writes to a file path (opened and owned by the sink) or an open text file."""
+
+    def __init__(self, target, limit=None):
+        super().__init__(limit)
+        self._owned = isinstance(target, (str, bytes, os.PathLike))
+        self.file = open(target, "w", encoding="utf-8") if self._owned else target
+
+    def _emit(self, text):
+        self.file.write(text)
+
+    def _flush(self):
+        self.file.flush()
+
+    def _close(self):
+        if self._owned:
+            self.file.close()
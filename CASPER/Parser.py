@@ -1,10 +1,17 @@
+import copy
+import os
+import threading
+
 import ply.yacc as yacc
-from Lexer import tokens
+from Lexer import Lexer, TokenReplay, TokenStream, tokens
 from Token import TokenType
 
 parser = None 
 tokens = [token.name for token in TokenType]
 
+# "lalr" (PLY tables) or "descent" (hand-written); see PARSER_ENGINES.
+PARSER_ENGINE = os.environ.get("CASPER_PARSER_ENGINE", "lalr")
+
 # Define valid types
 valid_types = {"int", "flt", "str", "chr", "bln"}  # Ensure tokens are strings
 
@@ -18,16 +25,19 @@ class ASTNode:
     def __repr__(self):
         return f"ASTNode({self.type}, {self.value}, {self.children})"
     
+# PLY ranks the table lowest-binding first, so the language's precedence
+# levels are listed here from 10 (assignment) up to 2 (exponentiation).
+# Negation is the ~ literal prefix and never competes with binary MINUS.
 precedence = (
-    ('right', 'EXPONENT'),  # 2 - Exponentiation
-    ('right', 'NOT', 'MINUS'),  # 3 - Logical NOT, Negative Indicator
-    ('left', 'MULTIPLY', 'DIVISION', 'MODULO'),  # 4 - Multiplication, Division, Modulus
-    ('left', 'PLUS', 'MINUS'),  # 5 - Addition, Subtraction
-    ('left', 'PLUS_PLUS', 'MINUS_MINUS'),  # 6 - Postfix Increment, Decrement
-    ('left', 'EQ_EQ', 'NOT_EQ', 'LT', 'GT', 'LT_EQ', 'GT_EQ'),  # 7 - Relational Operators
-    ('left', 'AND'),  # 8 - Boolean AND
+    ('right', 'EQ', 'PLUS_EQ', 'MINUS_EQ', 'MUL_EQ', 'DIV_EQ', 'MOD_EQ'),  # 10 - Assignment Operators
     ('left', 'OR'),  # 9 - Boolean OR
-    ('right', 'EQ', 'PLUS_EQ', 'MINUS_EQ', 'MUL_EQ', 'DIV_EQ', 'MOD_EQ')  # 10 - Assignment Operators
+    ('left', 'AND'),  # 8 - Boolean AND
+    ('left', 'EQ_EQ', 'NOT_EQ', 'LT', 'GT', 'LT_EQ', 'GT_EQ'),  # 7 - Relational Operators
+    ('left', 'PLUS_PLUS', 'MINUS_MINUS'),  # 6 - Postfix Increment, Decrement
+    ('left', 'PLUS', 'MINUS'),  # 5 - Addition, Subtraction
+    ('left', 'MULTIPLY', 'DIVISION', 'MODULO'),  # 4 - Multiplication, Division, Modulus
+    ('right', 'NOT'),  # 3 - Logical NOT
+    ('right', 'EXPONENT'),  # 2 - Exponentiation
 )
 
 
@@ -68,31 +78,36 @@ def p_main_function(p):
 # -----------------------------------------------------------------------------
 # GLOBAL DECLARATIONS
 # CFG:
-#   <global_dec> → <global_statement> <global_tail>
+#   <global_dec> → <global_list>
 #   <global_dec> → null
-#   <global_tail> → <global_dec>
+#   <global_list> → <global_list> <global_statement>
+#   <global_list> → <global_statement>
+#
+# Sequences are left-recursive so PLY reduces each item as soon as it is read:
+# the parse stack stays flat and the list is appended to, not re-copied.
 # -----------------------------------------------------------------------------
 
 def p_global_dec(p):
     """
-    global_dec : global_statement unli_newline global_tail     
+    global_dec : global_list
                | empty                            
     """
-    if len(p) == 4 and p[1] is not None:  
-        # 'global_statement unli_newline global_tail'
-        p[0] = [p[1]] + p[3]  
-    else:
-        p[0] = []
+    p[0] = p[1] if p[1] is not None else []
 
 
 # =============================================================================
-# (4) <global_tail> → <global_dec>
+# (4) <global_list> → <global_list> <global_statement> | <global_statement>
 # =============================================================================
-def p_global_tail(p):
+def p_global_list(p):
     """
-        global_tail : global_dec
+    global_list : global_list global_statement unli_newline
+                | global_statement unli_newline
     """
-    p[0] = p[1]
+    if len(p) == 4:
+        p[1].append(p[2])
+        p[0] = p[1]
+    else:
+        p[0] = [p[1]]
 
 
 # =============================================================================
@@ -174,39 +189,36 @@ def p_2d_list(p):
 
 
 # =============================================================================
-# (11) <global_statement_tail> → null
-# (12) <global_statement_tail> → , IDENTIFIER <global_statement_tail>
-# (13) <global_statement_tail> → = <global_value> <global_statement_tail2>
+# (11) <global_statement_tail> → <global_statement_tail2>
+# (12) <global_statement_tail> → <global_statement_tail2> = <global_value>
+# (Left-recursive form of , IDENTIFIER / = <global_value> items where two
+#  assignments never follow each other.)
 # =============================================================================
 def p_global_statement_tail(p):
     """
-    global_statement_tail : empty                        
-                          | COMMA IDENT global_statement_tail 
-                          | EQ global_value global_statement_tail2 
+    global_statement_tail : global_statement_tail2
+                          | global_statement_tail2 EQ global_value
     """
-    if len(p) == 2:
-        p[0] = []
-    elif p[1] == ',':
-        node = ASTNode("global_statement_tail_item", children=[ASTNode("IDENT", value=p[2])])
-        p[0] = [node] + p[3]
-    else:
-        node = ASTNode("global_statement_tail_item", children=[ASTNode("assign_op", value="="), p[2]])
-        p[0] = [node] + p[3]
+    if len(p) == 4:
+        node = ASTNode("global_statement_tail_item", children=[ASTNode("assign_op", value="="), p[3]])
+        p[1].append(node)
+    p[0] = p[1]
 
 # =============================================================================
-# (14) <global_statement_tail2> → , IDENTIFIER <global_statement_tail>
+# (14) <global_statement_tail2> → <global_statement_tail> , IDENTIFIER
 # (15) <global_statement_tail2> → null
 # =============================================================================
 def p_global_statement_tail2(p):
     """
-    global_statement_tail2 : COMMA IDENT global_statement_tail 
+    global_statement_tail2 : global_statement_tail COMMA IDENT
                            | empty                           
     """
     if len(p) == 2:
         p[0] = []
     else:
-        node = ASTNode("global_statement_tail_item", children=[ASTNode("IDENT", value=p[2])])
-        p[0] = [node] + p[3]
+        node = ASTNode("global_statement_tail_item", children=[ASTNode("IDENT", value=p[3])])
+        p[1].append(node)
+        p[0] = p[1]
 
 
 # =============================================================================
@@ -283,24 +295,66 @@ def p_data_type(p):
 
 
 # =============================================================================
-# (27) <expression> → <factor> <factor_tail>
+# (27) <expression> → <expression> <binary_op> <expression>
+# (28) <expression> → <factor>
+#
+# One expression grammar serves every context (values, conditions, loop
+# headers, display, revive, type casts). Operators are ranked by the
+# `precedence` table, and every operation keeps the node shape Semantics and
+# CodeGen walk:
+#     expression[left, factor_tail_binop(operator, right, None)]
+# where an operand is a bare factor, or a nested expression for a sub-term.
+#
+# The per-context grammars this replaced built one unranked chain,
+#     expression[f1, factor_tail_binop(op1, f2, factor_tail_binop(op2, f3, ...))]
+# and only allowed a single factor inside parentheses outside of
+# conditions and global values. So the language grew: "(a + b)" is an
+# operand everywhere, and a missing ")" now lists the operators that could
+# continue the expression. Semantics types every operation on its own
+# operands, where the chain only ever looked at the first two; see
+# SemanticAnalyzer.already_reported for how it keeps that to one error per
+# mistake.
 # =============================================================================
 def p_expression(p):
     """
-    expression : factor factor_tail
+    expression : expression PLUS expression
+               | expression MINUS expression
+               | expression MULTIPLY expression
+               | expression DIVISION expression
+               | expression MODULO expression
+               | expression EXPONENT expression
+               | expression GT expression
+               | expression LT expression
+               | expression EQ_EQ expression
+               | expression GT_EQ expression
+               | expression LT_EQ expression
+               | expression NOT_EQ expression
+               | expression AND expression
+               | expression OR expression
+               | factor
     """
-    if p[2] is None:
+    if len(p) == 2:
         p[0] = ASTNode("expression", [p[1]])
     else:
-        p[0] = ASTNode("expression", [p[1], p[2]])
+        p[0] = ASTNode("expression", [
+            _operand(p[1]),
+            ASTNode("factor_tail_binop", [ASTNode("operator", value=p[2]), _operand(p[3]), None])
+        ])
+
+
+def _operand(expression):
+    """A lone factor is used as the operand itself; compound sub-terms stay nested."""
+    if len(expression.children) == 1:
+        return expression.children[0]
+    return expression
 
 
 # =============================================================================
-# (28) <factor> → <var_call> <postfix>
-# (29) <factor> → <literal1>
-# (30) <factor> → ~ <int_literal>
-# (31) <factor> → ~ <flt_literal>
-# (32) <factor> → ( <expression> )
+# (29) <factor> → <var_call> <postfix>
+# (30) <factor> → <literal1>
+# (31) <factor> → ~ <int_literal>
+# (32) <factor> → ~ <flt_literal>
+# (33) <factor> → ( <expression> )
 # =============================================================================
 def p_factor(p):
     """
@@ -308,43 +362,7 @@ def p_factor(p):
            | literal1                    
            | TILDE INT_LIT               
            | TILDE FLT_LIT                
-           | LPAREN factor_expression RPAREN    
-    """
-    # We must handle each case by length of p
-    if len(p) == 3 and p[2] in ("++", "--", None):  # var_call postfix
-        p[0] = ASTNode("factor_var_postfix", [p[1], p[2]])
-    elif len(p) == 2:
-        # literal1
-        p[0] = ASTNode("literal", value=p[1])
-    elif len(p) == 3 and p[1] == '~' and isinstance(p[2], int):
-        # TILDE INT_LIT
-        p[0] = ASTNode("factor_neg_int", value=p[2])
-    elif len(p) == 3 and p[1] == '~' and isinstance(p[2], float):
-        # TILDE FLT_LIT
-        p[0] = ASTNode("factor_neg_flt", value=p[2])
-    else:
-        # ( expression )
-        p[0] = ASTNode("factor_paren", [p[2]])
-
-
-
-def p_factor_expression(p):
-    """
-    factor_expression : factor_expression_factor factor_expression_tail
-    """
-    if p[2] is None:
-        p[0] = ASTNode("expression", [p[1]])
-    else:
-        p[0] = ASTNode("expression", [p[1], p[2]])
-
-
-def p_factor_expression_factor(p):
-    """
-    factor_expression_factor : factor_var_call factor_postfix           
-           | factor_expression1                    
-           | TILDE INT_LIT               
-           | TILDE FLT_LIT                
-           | LPAREN factor_expression RPAREN    
+           | LPAREN expression RPAREN    
     """
     # We must handle each case by length of p
     if len(p) == 3 and p[2] in ("++", "--", None):  # var_call postfix
@@ -363,142 +381,6 @@ def p_factor_expression_factor(p):
         p[0] = ASTNode("paren", [p[2]])
 
 
-def p_factor_var_call(p):
-    """
-    factor_var_call : IDENT factor_list_index  
-    """
-    p[0] = ASTNode("var_call", children=[ASTNode("IDENT", value=p[1]), p[2]])
-
-def p_factor_postfix_op(p):
-    """
-    factor_postfix_op : PLUS_PLUS   
-               | MINUS_MINUS 
-    """
-    p[0] = p[1]
-def p_factor_postfix(p):
-    """
-    factor_postfix : empty        
-            | factor_postfix_op  
-    """
-    p[0] = p[1]
-
-def p_factor_list_index(p):
-    """
-    factor_list_index : LBRACKET factor_index RBRACKET factor_list_index2  
-               | empty                                
-    """
-    if len(p) == 2:
-        p[0] = []
-    else:
-        p[0] = [p[2]] + p[4]
-
-
-def p_factor_list_index2(p):
-    """
-    factor_list_index2 : LBRACKET factor_index RBRACKET 
-                | empty                   
-    """
-    if len(p) == 2:
-        p[0] = []
-    else:
-        p[0] = [p[2]]
-
-
-
-def p_factor__int_lit(p):
-    """factor_index : INT_LIT"""
-    # Instead of returning the bare int, build a literal node
-    p[0] = ASTNode("literal", value=p[1])
-
-def p_factor_index_ident(p):
-    """factor_index : IDENT"""
-    p[0] = ASTNode("IDENT", value=p[1])
-
-
-def p_factor_expression_tail(p):
-    """
-    factor_expression_tail : PLUS factor_expression_factor factor_expression_tail
-                | MINUS factor_expression_factor factor_expression_tail
-                | MULTIPLY factor_expression_factor factor_expression_tail
-                | DIVISION factor_expression_factor factor_expression_tail
-                | MODULO factor_expression_factor factor_expression_tail
-                | EXPONENT factor_expression_factor factor_expression_tail
-                | GT factor_expression_factor factor_expression_tail
-                | LT factor_expression_factor factor_expression_tail
-                | EQ_EQ factor_expression_factor factor_expression_tail
-                | GT_EQ factor_expression_factor factor_expression_tail
-                | LT_EQ factor_expression_factor factor_expression_tail
-                | NOT_EQ factor_expression_factor factor_expression_tail
-                | AND factor_expression_factor factor_expression_tail
-                | OR factor_expression_factor factor_expression_tail
-                | empty
-    """
-    if len(p) == 2:
-        p[0] = None
-    else:
-        p[0] = ASTNode("factor_tail_binop", [
-    ASTNode("operator", value=p[1]),
-    p[2],
-    p[3]
-])
-
-
-def p_factor_expression1 (p):
-    """
-    factor_expression1  : INT_LIT
-             | FLT_LIT
-             | DAY
-             | NIGHT
-             | STR_LIT
-    """
-    p[0] = p[1]  
-
-
-# =============================================================================
-# (33) <factor_tail> → + <factor> <factor_tail>
-# (34) <factor_tail> → - <factor> <factor_tail>
-# (35) <factor_tail> → * <factor> <factor_tail>
-# (36) <factor_tail> → / <factor> <factor_tail>
-# (37) <factor_tail> → % <factor> <factor_tail>
-# (38) <factor_tail> → ** <factor> <factor_tail>
-# (39) <factor_tail> → > <factor> <factor_tail>
-# (40) <factor_tail> → < <factor> <factor_tail>
-# (41) <factor_tail> → == <factor> <factor_tail>
-# (42) <factor_tail> → >= <factor> <factor_tail>
-# (43) <factor_tail> → <= <factor> <factor_tail>
-# (44) <factor_tail> → != <factor> <factor_tail>
-# (45) <factor_tail> → && <factor> <factor_tail>
-# (46) <factor_tail> → || <factor> <factor_tail>
-# (47) <factor_tail> → null
-# =============================================================================
-def p_factor_tail(p):
-    """
-    factor_tail : PLUS factor factor_tail
-                | MINUS factor factor_tail
-                | MULTIPLY factor factor_tail
-                | DIVISION factor factor_tail
-                | MODULO factor factor_tail
-                | EXPONENT factor factor_tail
-                | GT factor factor_tail
-                | LT factor factor_tail
-                | EQ_EQ factor factor_tail
-                | GT_EQ factor factor_tail
-                | LT_EQ factor factor_tail
-                | NOT_EQ factor factor_tail
-                | AND factor factor_tail
-                | OR factor factor_tail
-                | empty
-    """
-    if len(p) == 2:
-        p[0] = None
-    else:
-        p[0] = ASTNode("factor_tail_binop", [
-    ASTNode("operator", value=p[1]),
-    p[2],
-    p[3]
-])
-
-
 
 # =============================================================================
 # (48) <literal> → <literal1> | <literal2>
@@ -693,171 +575,59 @@ def p_revive(p):
 
 
 def p_revive_value(p):
-    """revive_value : revive_type_cast
-             | revive_expression
+    """revive_value : type_cast
+             | expression
              | function_call"""
     p[0] = ASTNode("value", [p[1]])
 
 
-def p_revive_expression(p):
-    """
-    revive_expression : revive_factor revive_factor_tail
-    """
-    if p[2] is None:
-        p[0] = ASTNode("expression", [p[1]])
-    else:
-        p[0] = ASTNode("expression", [p[1], p[2]])
-
-
-def p_revive_factor(p):
-    """
-    revive_factor : revive_var_call revive_postfix           
-           | revive_factor1                    
-           | TILDE INT_LIT               
-           | TILDE FLT_LIT                
-           | LPAREN revive_factor RPAREN    
-    """
-    # We must handle each case by length of p
-    if len(p) == 3 and p[2] in ("++", "--", None):  # var_call postfix
-        p[0] = ASTNode("var_postfix", [p[1], p[2]])
-    elif len(p) == 2:
-        # literal1
-        p[0] = ASTNode("literal", value=p[1])
-    elif len(p) == 3 and p[1] == '~' and isinstance(p[2], int):
-        # TILDE INT_LIT
-        p[0] = ASTNode("neg_int", value=p[2])
-    elif len(p) == 3 and p[1] == '~' and isinstance(p[2], float):
-        # TILDE FLT_LIT
-        p[0] = ASTNode("neg_flt", value=p[2])
-    else:
-        # ( expression )
-        p[0] = ASTNode("paren", [p[2]])
-
-def p_revive_var_call(p):
-    """
-    revive_var_call : IDENT revive_list_index  
-    """
-    p[0] = ASTNode("var_call", children=[ASTNode("IDENT", value=p[1]), p[2]])
-
-def p_revive_postfix_op(p):
-    """
-    revive_postfix_op : PLUS_PLUS   
-               | MINUS_MINUS 
-    """
-    p[0] = p[1]
-def p_revive_postfix(p):
-    """
-    revive_postfix : empty        
-            | revive_postfix_op  
-    """
-    p[0] = p[1]
-
-def p_revive_list_index(p):
-    """
-    revive_list_index : LBRACKET revive_index RBRACKET revive_list_index2  
-               | empty                                
-    """
-    if len(p) == 2:
-        p[0] = []
-    else:
-        p[0] = [p[2]] + p[4]
-
-
-def p_revive_list_index2(p):
-    """
-    revive_list_index2 : LBRACKET revive_index RBRACKET 
-                | empty                   
-    """
-    if len(p) == 2:
-        p[0] = []
-    else:
-        p[0] = [p[2]]
-
-
-def p_revive_int_lit(p):
-    """revive_index : INT_LIT"""
-    # Instead of returning the bare int, build a literal node
-    p[0] = ASTNode("literal", value=p[1])
-
-def p_revive_index_ident(p):
-    """revive_index : IDENT"""
-    p[0] = ASTNode("IDENT", value=p[1])
-def p_revive_factor_tail(p):
-    """
-    revive_factor_tail : PLUS revive_factor revive_factor_tail
-                | MINUS revive_factor revive_factor_tail
-                | MULTIPLY revive_factor revive_factor_tail
-                | DIVISION revive_factor revive_factor_tail
-                | MODULO revive_factor revive_factor_tail
-                | EXPONENT revive_factor revive_factor_tail
-                | GT revive_factor revive_factor_tail
-                | LT revive_factor revive_factor_tail
-                | EQ_EQ revive_factor revive_factor_tail
-                | GT_EQ revive_factor revive_factor_tail
-                | LT_EQ revive_factor revive_factor_tail
-                | NOT_EQ revive_factor revive_factor_tail
-                | AND revive_factor revive_factor_tail
-                | OR revive_factor revive_factor_tail
-                | empty
-    """
-    if len(p) == 2:
-        p[0] = None
-    else:
-        p[0] = ASTNode("factor_tail_binop", [
-    ASTNode("operator", value=p[1]),
-    p[2],
-    p[3]
-])
-
-
-def p_revive_factor1 (p):
-    """
-    revive_factor1  : INT_LIT
-             | FLT_LIT
-             | DAY
-             | NIGHT
-             | STR_LIT
-    """
-    p[0] = p[1]  
-
-def p_revive_type_cast(p):
-    """revive_type_cast : CONVERT_TO_INT LPAREN typecast_value RPAREN
-                 | CONVERT_TO_FLT LPAREN typecast_value RPAREN
-                 | CONVERT_TO_BLN LPAREN typecast_value RPAREN
-                 | CONVERT_TO_STR LPAREN typecast_value RPAREN"""
-    p[0] = ASTNode("type_cast", [p[3]], p[1])
 # -----------------------------------------------------------------------------
-# (77) <statements> → <local_dec> <statements_tail>
+# (77) <statements> → <statement_list>
+# (78) <statements> → null
 # -----------------------------------------------------------------------------
 
 def p_statements(p):
     """statements : empty
-           | local_dec maybe_newline statements_tail """
+           | statement_list """
+    p[0] = p[1] if p[1] is not None else []
 
+# -----------------------------------------------------------------------------
+# <statement_list> → <statement_list> <local_dec> | <statement_list> <statements_tail>
+# <statement_list> → <local_dec> | <statements_tail>
+#
+# The list alternates declarations and statements the way the old right-
+# recursive <local_dec> <statements_tail> rules produced it: a statement that
+# does not directly follow a declaration gets an empty [] declaration slot.
+# -----------------------------------------------------------------------------
+def p_statement_list(p):
+    """
+    statement_list : statement_list local_dec maybe_newline
+                   | statement_list statements_tail unli_newline
+                   | local_dec maybe_newline
+                   | statements_tail unli_newline
+    """
+    if len(p) == 3:
+        p[0] = [p[1]] if isinstance(p[1], list) else [[], p[1]]
+        return
+    items = p[1]
+    if not isinstance(p[2], list) and not isinstance(items[-1], list):
+        items.append([])
+    items.append(p[2])
+    p[0] = items
 
-    if len(p) == 2:
-   
-        p[0] = []     
-    else:
-   
-        p[0] = [p[1]] + p[3]
 # -----------------------------------------------------------------------------
-# Production: <statements_tail> →  one of: <conditional_statement> | <switch_statement> | <loop_statement> | <function_call> | <string_operation_statement> | <output_statement> then <statements_tail2>
+# Production: <statements_tail> →  one of: <conditional_statement> | <switch_statement> | <loop_statement> | <function_call> | <string_operation_statement> | <output_statement>
 # -----------------------------------------------------------------------------
 def p_statements_tail(p):
     """
-    statements_tail : switch_statement unli_newline statements
-                    | loop_statement unli_newline statements
-                    | function_call unli_newline statements
-                    | assignment_statement unli_newline statements
-                    | output_statement unli_newline statements
-                    | conditional_statement unli_newline statements
-                    | statements
+    statements_tail : switch_statement
+                    | loop_statement
+                    | function_call
+                    | assignment_statement
+                    | output_statement
+                    | conditional_statement
     """
-    if len(p) == 4:
-        p[0] = [p[1]] + p[3]
-    else:
-        p[0] = p[1]
+    p[0] = p[1]
             
 # -----------------------------------------------------------------------------
 # (78) <statements_tail> → <statements_list>
@@ -906,22 +676,17 @@ def p_statements_tail(p):
 
 # -----------------------------------------------------------------------------
 # (87) <local_dec> → <var_statement> <local_dec_tail>
-# (88) <local_dec> → null
+# (88) <local_dec> → null   (the empty slot is filled in by <statement_list>)
 # -----------------------------------------------------------------------------
 def p_local_dec(p):
     """
     local_dec : local_var_statement local_dec_tail unli_newline
-              | empty
     """
-    if len(p) == 2:
-        # empty
-        p[0] = []
-    else:
-        var_node = p[1]             
-        tail_nodes = p[2]         
-        if isinstance(tail_nodes, list):
-            var_node.children.extend(tail_nodes)
-        p[0] = [var_node]
+    var_node = p[1]             
+    tail_nodes = p[2]         
+    if isinstance(tail_nodes, list):
+        var_node.children.extend(tail_nodes)
+    p[0] = [var_node]
 
 def p_local_var_statement(p):
     """
@@ -1011,300 +776,56 @@ def p_local_value(p):
     p[0] = p[1]
 
 def p_local_value_value(p):
-    """local_value_value  : local_type_cast
-             | local_expression
+    """local_value_value  : type_cast
+             | expression
              | function_call"""
     p[0] = ASTNode("value", [p[1]])
     
-def p_local_expression(p):
+# -----------------------------------------------------------------------------
+# (96) <conditional_statement> → check(<expression>){<statements>} <conditional_tail> otherwise {<statements>}
+# -----------------------------------------------------------------------------
+def p_conditional_statement(p):
     """
-    local_expression : local_factor local_factor_tail
+    conditional_statement : CHECK LPAREN condition RPAREN LBRACE maybe_newline statements maybe_newline RBRACE  maybe_newline conditional_tail  maybe_newline OTHERWISE  maybe_newline LBRACE  maybe_newline statements  maybe_newline RBRACE  
     """
-    if p[2] is None:
-        p[0] = ASTNode("expression", [p[1]])
-    else:
-        p[0] = ASTNode("expression", [p[1], p[2]])
+    p[0] = ASTNode("conditional_statement", children=[p[3], p[7], p[11], p[16]])
 
 
-def p_local_factor(p):
+# -----------------------------------------------------------------------------
+# (97) <conditional_tail> → <conditional_tail> otherwise_check(<expression>){<statements>}
+# (98) <conditional_tail> → null
+# -----------------------------------------------------------------------------
+def p_conditional_tail(p):
     """
-    local_factor : local_var_call local_postfix           
-           | local_factor1                    
-           | TILDE INT_LIT               
-           | TILDE FLT_LIT                
-           | LPAREN local_factor RPAREN    
+    conditional_tail : conditional_tail OTHERWISE_CHECK LPAREN condition RPAREN LBRACE maybe_newline statements maybe_newline RBRACE maybe_newline
+                     | empty                                            
     """
-    # We must handle each case by length of p
-    if len(p) == 3 and p[2] in ("++", "--", None):  # var_call postfix
-        p[0] = ASTNode("var_postfix", [p[1], p[2]])
-    elif len(p) == 2:
-        # literal1
-        p[0] = ASTNode("literal", value=p[1])
-    elif len(p) == 3 and p[1] == '~' and isinstance(p[2], int):
-        # TILDE INT_LIT
-        p[0] = ASTNode("neg_int", value=p[2])
-    elif len(p) == 3 and p[1] == '~' and isinstance(p[2], float):
-        # TILDE FLT_LIT
-        p[0] = ASTNode("neg_flt", value=p[2])
+    if len(p) == 2:
+        p[0] = []
     else:
-        # ( expression )
-        p[0] = ASTNode("paren", [p[2]])
+        p[1].append(ASTNode("otherwise_check", children=[p[4], p[8]]))
+        p[0] = p[1]
 
 
-def p_local_var_call(p):
+def p_condition(p):
     """
-    local_var_call : IDENT local_list_index  
+    condition : expression
     """
-    p[0] = ASTNode("var_call", children=[ASTNode("IDENT", value=p[1]), p[2]])
+    p[0] = ASTNode("condition", p[1].children)
 
-def p_local_postfix_op(p):
-    """
-    local_postfix_op : PLUS_PLUS   
-               | MINUS_MINUS 
-    """
-    p[0] = p[1]
-def p_local_postfix(p):
-    """
-    local_postfix : empty        
-            | local_postfix_op  
-    """
-    p[0] = p[1]
 
-def p_local_list_index(p):
+# -----------------------------------------------------------------------------
+# (99) <switch_statement> → swap(IDENTIFIER){<switch_condition> otherwise <statements>}
+# -----------------------------------------------------------------------------
+def p_switch_statement(p):
     """
-    local_list_index : LBRACKET local_index RBRACKET local_list_index2  
-               | empty                                
+    switch_statement : SWAP LPAREN IDENT RPAREN LBRACE maybe_newline switch_condition maybe_newline OTHERWISE maybe_newline LBRACE maybe_newline statements maybe_newline RBRACE maybe_newline RBRACE
     """
-    if len(p) == 2:
-        p[0] = []
-    else:
-        p[0] = [p[2]] + p[4]
-
-
-def p_local_list_index2(p):
-    """
-    local_list_index2 : LBRACKET local_index RBRACKET 
-                | empty                   
-    """
-    if len(p) == 2:
-        p[0] = []
-    else:
-        p[0] = [p[2]]
-
-
-def p_local_int_lit(p):
-    """local_index : INT_LIT"""
-    # Instead of returning the bare int, build a literal node
-    p[0] = ASTNode("literal", value=p[1])
-
-def p_local_index_ident(p):
-    """local_index : IDENT"""
-    p[0] = ASTNode("IDENT", value=p[1])
-def p_local_factor_tail(p):
-    """
-    local_factor_tail : PLUS local_factor local_factor_tail
-                | MINUS local_factor local_factor_tail
-                | MULTIPLY local_factor local_factor_tail
-                | DIVISION local_factor local_factor_tail
-                | MODULO local_factor local_factor_tail
-                | EXPONENT local_factor local_factor_tail
-                | GT local_factor local_factor_tail
-                | LT local_factor local_factor_tail
-                | EQ_EQ local_factor local_factor_tail
-                | GT_EQ local_factor local_factor_tail
-                | LT_EQ local_factor local_factor_tail
-                | NOT_EQ local_factor local_factor_tail
-                | AND local_factor local_factor_tail
-                | OR local_factor local_factor_tail
-                | empty
-    """
-    if len(p) == 2:
-        p[0] = None
-    else:
-        p[0] = ASTNode("factor_tail_binop", [
-    ASTNode("operator", value=p[1]),
-    p[2],
-    p[3]
-])
-
-
-def p_local_factor1 (p):
-    """
-    local_factor1  : INT_LIT
-             | FLT_LIT
-             | DAY
-             | NIGHT
-             | STR_LIT
-    """
-    p[0] = p[1]  
-
-def p_local_type_cast(p):
-    """local_type_cast : CONVERT_TO_INT LPAREN typecast_value RPAREN
-                 | CONVERT_TO_FLT LPAREN typecast_value RPAREN
-                 | CONVERT_TO_BLN LPAREN typecast_value RPAREN
-                 | CONVERT_TO_STR LPAREN typecast_value RPAREN"""
-    p[0] = ASTNode("type_cast", [p[3]], p[1])
-# -----------------------------------------------------------------------------
-# (96) <conditional_statement> → check(<expression>){<statements>} <conditional_tail> otherwise {<statements>}
-# -----------------------------------------------------------------------------
-def p_conditional_statement(p):
-    """
-    conditional_statement : CHECK LPAREN condition RPAREN LBRACE maybe_newline statements maybe_newline RBRACE  maybe_newline conditional_tail  maybe_newline OTHERWISE  maybe_newline LBRACE  maybe_newline statements  maybe_newline RBRACE  
-    """
-    p[0] = ASTNode("conditional_statement", children=[p[3], p[7], p[11], p[16]])
-
-
-# -----------------------------------------------------------------------------
-# (97) <conditional_tail> → otherwise_check(<expression>){<statements>} <conditional_tail>
-# (98) <conditional_tail> → null
-# -----------------------------------------------------------------------------
-def p_conditional_tail(p):
-    """
-    conditional_tail : OTHERWISE_CHECK LPAREN condition RPAREN LBRACE maybe_newline statements maybe_newline RBRACE maybe_newline conditional_tail 
-                     | empty                                            
-    """
-    if len(p) == 2:
-        p[0] = []
-    else:
-        p[0] = [ASTNode("otherwise_check", children=[p[3], p[7]])] + p[11]
-
-
-def p_condition(p):
-    """
-    condition : condition_factor condition_tail
-    """
-    if p[2] is None:
-        p[0] = ASTNode("condition", [p[1]])
-    else:
-        p[0] = ASTNode("condition", [p[1], p[2]])
-
-
-def p_condition_factor(p):
-    """
-    condition_factor : condition_var_call condition_postfix           
-           | condition1                    
-           | TILDE INT_LIT               
-           | TILDE FLT_LIT                
-           | LPAREN condition RPAREN    
-    """
-    # We must handle each case by length of p
-    if len(p) == 3 and p[2] in ("++", "--", None):  # var_call postfix
-        p[0] = ASTNode("var_postfix", [p[1], p[2]])
-    elif len(p) == 2:
-        # literal1
-        p[0] = ASTNode("literal", value=p[1])
-    elif len(p) == 3 and p[1] == '~' and isinstance(p[2], int):
-        # TILDE INT_LIT
-        p[0] = ASTNode("neg_int", value=p[2])
-    elif len(p) == 3 and p[1] == '~' and isinstance(p[2], float):
-        # TILDE FLT_LIT
-        p[0] = ASTNode("neg_flt", value=p[2])
-    else:
-        # ( expression )
-        p[0] = ASTNode("paren", [p[2]])
-
-def p_condition_var_call(p):
-    """
-    condition_var_call : IDENT condition_list_index  
-    """
-    p[0] = ASTNode("var_call", children=[ASTNode("IDENT", value=p[1]), p[2]])
-
-def p_condition_postfix_op(p):
-    """
-    condition_postfix_op : PLUS_PLUS   
-               | MINUS_MINUS 
-    """
-    p[0] = p[1]
-def p_condition_postfix(p):
-    """
-    condition_postfix : empty        
-            | condition_postfix_op  
-    """
-    p[0] = p[1]
-
-def p_condition_list_index(p):
-    """
-    condition_list_index : LBRACKET condition_index RBRACKET condition_list_index2  
-               | empty                                
-    """
-    if len(p) == 2:
-        p[0] = []
-    else:
-        p[0] = [p[2]] + p[4]
-
-
-def p_condition_list_index2(p):
-    """
-    condition_list_index2 : LBRACKET condition_index RBRACKET 
-                | empty                   
-    """
-    if len(p) == 2:
-        p[0] = []
-    else:
-        p[0] = [p[2]]
-
-
-def p_condition_int_lit(p):
-    """condition_index : INT_LIT"""
-    # Instead of returning the bare int, build a literal node
-    p[0] = ASTNode("literal", value=p[1])
-
-def p_condition_index_ident(p):
-    """condition_index : IDENT"""
-    p[0] = ASTNode("IDENT", value=p[1])
-def p_condition_tail(p):
-    """
-    condition_tail : PLUS condition_factor condition_tail
-                | MINUS condition_factor condition_tail
-                | MULTIPLY condition_factor condition_tail
-                | DIVISION condition_factor condition_tail
-                | MODULO condition_factor condition_tail
-                | EXPONENT condition_factor condition_tail
-                | GT condition_factor condition_tail
-                | LT condition_factor condition_tail
-                | EQ_EQ condition_factor condition_tail
-                | GT_EQ condition_factor condition_tail
-                | LT_EQ condition_factor condition_tail
-                | NOT_EQ condition_factor condition_tail
-                | AND condition_factor condition_tail
-                | OR condition_factor condition_tail
-                | empty
-    """
-    if len(p) == 2:
-        p[0] = None
-    else:
-        p[0] = ASTNode("factor_tail_binop", [
-    ASTNode("operator", value=p[1]),
-    p[2],
-    p[3]
-])
-
-
-def p_condition1(p):
-    """
-    condition1 : INT_LIT
-             | FLT_LIT
-             | DAY
-             | NIGHT
-             | STR_LIT
-    """
-    p[0] = p[1]  
-
-
-
-
-# -----------------------------------------------------------------------------
-# (99) <switch_statement> → swap(IDENTIFIER){<switch_condition> otherwise <statements>}
-# -----------------------------------------------------------------------------
-def p_switch_statement(p):
-    """
-    switch_statement : SWAP LPAREN IDENT RPAREN LBRACE maybe_newline switch_condition maybe_newline OTHERWISE maybe_newline LBRACE maybe_newline statements maybe_newline RBRACE maybe_newline RBRACE
-    """
-    p[0] = ASTNode("switch_statement", children=[
-        ASTNode("IDENT", value=p[3]),
-        p[7],
-        p[13]
-    ])
+    p[0] = ASTNode("switch_statement", children=[
+        ASTNode("IDENT", value=p[3]),
+        p[7],
+        p[13]
+    ])
 
 
 # -----------------------------------------------------------------------------
@@ -1318,138 +839,11 @@ def p_switch_condition(p):
 
 
 def p_switch_value(p):
-    """switch_value  : switch_type_cast
-             | switch_expression
+    """switch_value  : type_cast
+             | expression
              | function_call"""
     p[0] = ASTNode("value", [p[1]])
 
-def p_switch_expression(p):
-    """
-    switch_expression : switch_factor switch_factor_tail
-    """
-    if p[2] is None:
-        p[0] = ASTNode("expression", [p[1]])
-    else:
-        p[0] = ASTNode("expression", [p[1], p[2]])
-
-
-def p_switch_factor(p):
-    """
-    switch_factor : switch_var_call switch_postfix           
-           | switch_factor1                    
-           | TILDE INT_LIT               
-           | TILDE FLT_LIT                
-           | LPAREN switch_factor RPAREN    
-    """
-    # We must handle each case by length of p
-    if len(p) == 3 and p[2] in ("++", "--", None):  # var_call postfix
-        p[0] = ASTNode("factor_var_postfix", [p[1], p[2]])
-    elif len(p) == 2:
-        # literal1
-        p[0] = ASTNode("literal", value=p[1])
-    elif len(p) == 3 and p[1] == '~' and isinstance(p[2], int):
-        # TILDE INT_LIT
-        p[0] = ASTNode("factor_neg_int", value=p[2])
-    elif len(p) == 3 and p[1] == '~' and isinstance(p[2], float):
-        # TILDE FLT_LIT
-        p[0] = ASTNode("factor_neg_flt", value=p[2])
-    else:
-        # ( expression )
-        p[0] = ASTNode("factor_paren", [p[2]])
-
-def p_switch_var_call(p):
-    """
-    switch_var_call : IDENT switch_list_index  
-    """
-    p[0] = ASTNode("var_call", children=[ASTNode("IDENT", value=p[1]), p[2]])
-
-def p_switch_postfix_op(p):
-    """
-    switch_postfix_op : PLUS_PLUS   
-               | MINUS_MINUS 
-    """
-    p[0] = p[1]
-def p_switch_postfix(p):
-    """
-    switch_postfix : empty        
-            | switch_postfix_op  
-    """
-    p[0] = p[1]
-
-def p_switch_list_index(p):
-    """
-    switch_list_index : LBRACKET switch_index RBRACKET switch_list_index2  
-               | empty                                
-    """
-    if len(p) == 2:
-        p[0] = []
-    else:
-        p[0] = [p[2]] + p[4]
-
-
-def p_switch_list_index2(p):
-    """
-    switch_list_index2 : LBRACKET switch_index RBRACKET 
-                | empty                   
-    """
-    if len(p) == 2:
-        p[0] = []
-    else:
-        p[0] = [p[2]]
-
-def p_switch_int_lit(p):
-    """switch_index : INT_LIT"""
-    # Instead of returning the bare int, build a literal node
-    p[0] = ASTNode("literal", value=p[1])
-
-def p_switch_index_ident(p):
-    """switch_index : IDENT"""
-    p[0] = ASTNode("IDENT", value=p[1])
-
-def p_switch_factor_tail(p):
-    """
-    switch_factor_tail : PLUS switch_factor switch_factor_tail
-                | MINUS switch_factor switch_factor_tail
-                | MULTIPLY switch_factor switch_factor_tail
-                | DIVISION switch_factor switch_factor_tail
-                | MODULO switch_factor switch_factor_tail
-                | EXPONENT switch_factor switch_factor_tail
-                | GT switch_factor switch_factor_tail
-                | LT switch_factor switch_factor_tail
-                | EQ_EQ switch_factor switch_factor_tail
-                | GT_EQ switch_factor switch_factor_tail
-                | LT_EQ switch_factor switch_factor_tail
-                | NOT_EQ switch_factor switch_factor_tail
-                | AND switch_factor switch_factor_tail
-                | OR switch_factor switch_factor_tail
-                | empty
-    """
-    if len(p) == 2:
-        p[0] = None
-    else:
-        p[0] = ASTNode("factor_tail_binop", [
-    ASTNode("operator", value=p[1]),
-    p[2],
-    p[3]
-])
-
-
-def p_switch_factor1 (p):
-    """
-    switch_factor1  : INT_LIT
-             | FLT_LIT
-             | DAY
-             | NIGHT
-             | STR_LIT  
-    """
-    p[0] = p[1]  
-
-def p_switch_type_cast(p):
-    """switch_type_cast : CONVERT_TO_INT LPAREN typecast_value RPAREN
-                 | CONVERT_TO_FLT LPAREN typecast_value RPAREN
-                 | CONVERT_TO_BLN LPAREN typecast_value RPAREN
-                 | CONVERT_TO_STR LPAREN typecast_value RPAREN"""
-    p[0] = ASTNode("local_type_cast", [p[3]], p[1])
 # -----------------------------------------------------------------------------
 # (101) <switchcond_tail> → <switch_condition>
 # (102) <switchcond_tail> → null
@@ -1466,286 +860,41 @@ def p_switchcond_tail(p):
             p[0] = [p[1]]
 
 # -----------------------------------------------------------------------------
-# (103) <loop_statement> → <for_loop>
-# (104) <loop_statement> → <until_loop>
-# (105) <loop_statement> → <repeat_until>
-# -----------------------------------------------------------------------------
-def p_loop_statement(p):
-    """
-    loop_statement : for_loop    
-                   | until_loop  
-                   | repeat_until
-    """
-    p[0] = p[1]
-
-# -----------------------------------------------------------------------------
-# (106) <for_loop> → for ( <control_variable> ; <expression> ; <update> ) { <statements> }
-# -----------------------------------------------------------------------------
-def p_for_loop(p):
-    """for_loop : FOR LPAREN control_variable SEMICOLON for_expression SEMICOLON update RPAREN LBRACE maybe_newline statements maybe_newline RBRACE"""
-    p[0] = ASTNode("for_loop", children=[p[3], p[5], p[7], p[11]])
-
-def p_for_expression(p):
-    """
-    for_expression : for_factor for_factor_tail
-    """
-    if p[2] is None:
-        p[0] = ASTNode("expression", [p[1]])
-    else:
-        p[0] = ASTNode("expression", [p[1], p[2]])
-
-
-def p_for_factor(p):
-    """
-    for_factor : for_var_call for_postfix           
-           | for_factor1                    
-           | TILDE INT_LIT               
-           | TILDE FLT_LIT                
-           | LPAREN for_factor RPAREN    
-    """
-    # We must handle each case by length of p
-    if len(p) == 3 and p[2] in ("++", "--", None):  # var_call postfix
-        p[0] = ASTNode("var_postfix", [p[1], p[2]])
-    elif len(p) == 2:
-        # literal1
-        p[0] = ASTNode("literal", value=p[1])
-    elif len(p) == 3 and p[1] == '~' and isinstance(p[2], int):
-        # TILDE INT_LIT
-        p[0] = ASTNode("neg_int", value=p[2])
-    elif len(p) == 3 and p[1] == '~' and isinstance(p[2], float):
-        # TILDE FLT_LIT
-        p[0] = ASTNode("neg_flt", value=p[2])
-    else:
-        # ( expression )
-        p[0] = ASTNode("paren", [p[2]])
-
-def p_for_var_call(p):
-    """
-    for_var_call : IDENT for_list_index  
-    """
-    p[0] = ASTNode("var_call", children=[ASTNode("IDENT", value=p[1]), p[2]])
-
-def p_for_postfix_op(p):
-    """
-    for_postfix_op : PLUS_PLUS   
-               | MINUS_MINUS 
-    """
-    p[0] = p[1]
-def p_for_postfix(p):
-    """
-    for_postfix : empty        
-            | for_postfix_op  
-    """
-    p[0] = p[1]
-
-def p_for_list_index(p):
-    """
-    for_list_index : LBRACKET for_index RBRACKET for_list_index2  
-               | empty                                
-    """
-    if len(p) == 2:
-        p[0] = []
-    else:
-        p[0] = [p[2]] + p[4]
-
-
-def p_for_list_index2(p):
-    """
-    for_list_index2 : LBRACKET for_index RBRACKET 
-                | empty                   
-    """
-    if len(p) == 2:
-        p[0] = []
-    else:
-        p[0] = [p[2]]
-
-
-def p_for_int_lit(p):
-    """for_index : INT_LIT"""
-    # Instead of returning the bare int, build a literal node
-    p[0] = ASTNode("literal", value=p[1])
-
-def p_for_index_ident(p):
-    """for_index : IDENT"""
-    p[0] = ASTNode("IDENT", value=p[1])
-
-
-
-def p_for_factor_tail(p):
-    """
-    for_factor_tail : PLUS for_factor for_factor_tail
-                | MINUS for_factor for_factor_tail
-                | MULTIPLY for_factor for_factor_tail
-                | DIVISION for_factor for_factor_tail
-                | MODULO for_factor for_factor_tail
-                | EXPONENT for_factor for_factor_tail
-                | GT for_factor for_factor_tail
-                | LT for_factor for_factor_tail
-                | EQ_EQ for_factor for_factor_tail
-                | GT_EQ for_factor for_factor_tail
-                | LT_EQ for_factor for_factor_tail
-                | NOT_EQ for_factor for_factor_tail
-                | AND for_factor for_factor_tail
-                | OR for_factor for_factor_tail
-                | empty
-    """
-    if len(p) == 2:
-        p[0] = None
-    else:
-        p[0] = ASTNode("factor_tail_binop", [
-    ASTNode("operator", value=p[1]),
-    p[2],
-    p[3]
-])
-
-
-def p_for_factor1 (p):
-    """
-    for_factor1  : INT_LIT
-             | FLT_LIT
-             | DAY
-             | NIGHT
-             | STR_LIT  
-    """
-    p[0] = p[1]  
-# -----------------------------------------------------------------------------
-# (107) <until_loop> → until ( <expression> ) { <statements> }
-# -----------------------------------------------------------------------------
-def p_until_loop(p):
-    """
-    until_loop : UNTIL LPAREN until_expression RPAREN LBRACE statements RBRACE  
-    """
-    p[0] = ASTNode("until_loop", children=[p[3], p[6]])
-
-
-def p_until_expression(p):
-    """
-    until_expression : until_factor until_factor_tail
-    """
-    if p[2] is None:
-        p[0] = ASTNode("expression", [p[1]])
-    else:
-        p[0] = ASTNode("expression", [p[1], p[2]])
-
-
-def p_until_factor(p):
-    """
-    until_factor : until_var_call until_postfix           
-           | until_factor1                    
-           | TILDE INT_LIT               
-           | TILDE FLT_LIT                
-           | LPAREN until_factor RPAREN    
-    """
-    # We must handle each case by length of p
-    if len(p) == 3 and p[2] in ("++", "--", None):  # var_call postfix
-        p[0] = ASTNode("var_postfix", [p[1], p[2]])
-    elif len(p) == 2:
-        # literal1
-        p[0] = ASTNode("literal", value=p[1])
-    elif len(p) == 3 and p[1] == '~' and isinstance(p[2], int):
-        # TILDE INT_LIT
-        p[0] = ASTNode("neg_int", value=p[2])
-    elif len(p) == 3 and p[1] == '~' and isinstance(p[2], float):
-        # TILDE FLT_LIT
-        p[0] = ASTNode("neg_flt", value=p[2])
-    else:
-        # ( expression )
-        p[0] = ASTNode("paren", [p[2]])
-
-def p_until_var_call(p):
-    """
-    until_var_call : IDENT until_list_index  
-    """
-    p[0] = ASTNode("var_call", children=[ASTNode("IDENT", value=p[1]), p[2]])
-
-def p_until_postfix_op(p):
-    """
-    until_postfix_op : PLUS_PLUS   
-               | MINUS_MINUS 
-    """
-    p[0] = p[1]
-def p_until_postfix(p):
-    """
-    until_postfix : empty        
-            | until_postfix_op  
-    """
-    p[0] = p[1]
-
-def p_until_list_index(p):
-    """
-    until_list_index : LBRACKET until_index RBRACKET until_list_index2  
-               | empty                                
-    """
-    if len(p) == 2:
-        p[0] = []
-    else:
-        p[0] = [p[2]] + p[4]
-
-
-def p_until_list_index2(p):
-    """
-    until_list_index2 : LBRACKET until_index RBRACKET 
-                | empty                   
-    """
-    if len(p) == 2:
-        p[0] = []
-    else:
-        p[0] = [p[2]]
-
-
-
-def p_until_int_lit(p):
-    """until_index : INT_LIT"""
-    # Instead of returning the bare int, build a literal node
-    p[0] = ASTNode("literal", value=p[1])
-
-def p_until_index_ident(p):
-    """until_index : IDENT"""
-    p[0] = ASTNode("IDENT", value=p[1])
-
-def p_until_factor_tail(p):
-    """
-    until_factor_tail : PLUS until_factor until_factor_tail
-                | MINUS until_factor until_factor_tail
-                | MULTIPLY until_factor until_factor_tail
-                | DIVISION until_factor until_factor_tail
-                | MODULO until_factor until_factor_tail
-                | EXPONENT until_factor until_factor_tail
-                | GT until_factor until_factor_tail
-                | LT until_factor until_factor_tail
-                | EQ_EQ until_factor until_factor_tail
-                | GT_EQ until_factor until_factor_tail
-                | LT_EQ until_factor until_factor_tail
-                | NOT_EQ until_factor until_factor_tail
-                | AND until_factor until_factor_tail
-                | OR until_factor until_factor_tail
-                | empty
+# (103) <loop_statement> → <for_loop>
+# (104) <loop_statement> → <until_loop>
+# (105) <loop_statement> → <repeat_until>
+# -----------------------------------------------------------------------------
+def p_loop_statement(p):
     """
-    if len(p) == 2:
-        p[0] = None
-    else:
-        p[0] = ASTNode("factor_tail_binop", [
-    ASTNode("operator", value=p[1]),
-    p[2],
-    p[3]
-])
+    loop_statement : for_loop    
+                   | until_loop  
+                   | repeat_until
+    """
+    p[0] = p[1]
 
+# -----------------------------------------------------------------------------
+# (106) <for_loop> → for ( <control_variable> ; <expression> ; <update> ) { <statements> }
+# -----------------------------------------------------------------------------
+def p_for_loop(p):
+    """for_loop : FOR LPAREN control_variable SEMICOLON expression SEMICOLON update RPAREN LBRACE maybe_newline statements maybe_newline RBRACE"""
+    p[0] = ASTNode("for_loop", children=[p[3], p[5], p[7], p[11]])
 
-def p_until_factor1 (p):
+# -----------------------------------------------------------------------------
+# (107) <until_loop> → until ( <expression> ) { <statements> }
+# -----------------------------------------------------------------------------
+def p_until_loop(p):
     """
-    until_factor1  : INT_LIT
-             | FLT_LIT
-             | DAY
-             | NIGHT
-             | STR_LIT  
+    until_loop : UNTIL LPAREN expression RPAREN LBRACE statements RBRACE  
     """
-    p[0] = p[1]  
+    p[0] = ASTNode("until_loop", children=[p[3], p[6]])
+
+
 # -----------------------------------------------------------------------------
 # (108) <repeat_until> → repeat { <statements> } until(<expression>)
 # -----------------------------------------------------------------------------
 def p_repeat_until(p):
     """
-    repeat_until : REPEAT LBRACE statements RBRACE UNTIL LPAREN until_expression RPAREN 
+    repeat_until : REPEAT LBRACE statements RBRACE UNTIL LPAREN expression RPAREN 
     """
     p[0] = ASTNode("repeat_until", children=[p[3], p[7]])
 
@@ -1825,31 +974,29 @@ def p_function_call(p):
 
 # -----------------------------------------------------------------------------
 # (119) <arguments> → null
-# (120) <arguments> → <arg_value><arg_tail>
+# (120) <arguments> → <arg_list>
 # -----------------------------------------------------------------------------
 def p_arguments(p):
     """
     arguments : empty                  
-              | arg_value arg_tail    
+              | arg_list
     """
-    if len(p) == 2:
-        p[0] = []
-    else:
-        p[0] = [p[1]] + p[2]
+    p[0] = p[1] if p[1] is not None else []
 
 # -----------------------------------------------------------------------------
-# (121) <arg_tail> → , <arg_value><arg_tail>
-# (122) <arg_tail> → null
+# (121) <arg_list> → <arg_list> , <arg_value>
+# (122) <arg_list> → <arg_value>
 # -----------------------------------------------------------------------------
-def p_arg_tail(p):
+def p_arg_list(p):
     """
-    arg_tail : COMMA arg_value arg_tail   
-             | empty                     
+    arg_list : arg_list COMMA arg_value
+             | arg_value
     """
     if len(p) == 2:
-        p[0] = []
+        p[0] = [p[1]]
     else:
-        p[0] = [p[2]] + p[3]
+        p[1].append(p[3])
+        p[0] = p[1]
 
 # -----------------------------------------------------------------------------
 # (123) <arg_value> → <literal>
@@ -1874,140 +1021,12 @@ def p_output_statement(p):
 
 
 def p_output_value(p):
-    """output_value : output_type_cast
-             | output_expression
+    """output_value : type_cast
+             | expression
              | function_call"""
     p[0] = ASTNode("value", [p[1]])
 
 
-def p_output_expression(p):
-    """
-    output_expression : output_factor output_factor_tail
-    """
-    if p[2] is None:
-        p[0] = ASTNode("expression", [p[1]])
-    else:
-        p[0] = ASTNode("expression", [p[1], p[2]])
-
-
-def p_output_factor(p):
-    """
-    output_factor : output_var_call output_postfix           
-           | output_factor1                    
-           | TILDE INT_LIT               
-           | TILDE FLT_LIT                
-           | LPAREN output_factor RPAREN    
-    """
-    # We must handle each case by length of p
-    if len(p) == 3 and p[2] in ("++", "--", None):  # var_call postfix
-        p[0] = ASTNode("var_postfix", [p[1], p[2]])
-    elif len(p) == 2:
-        # literal1
-        p[0] = ASTNode("literal", value=p[1])
-    elif len(p) == 3 and p[1] == '~' and isinstance(p[2], int):
-        # TILDE INT_LIT
-        p[0] = ASTNode("neg_int", value=p[2])
-    elif len(p) == 3 and p[1] == '~' and isinstance(p[2], float):
-        # TILDE FLT_LIT
-        p[0] = ASTNode("neg_flt", value=p[2])
-    else:
-        # ( expression )
-        p[0] = ASTNode("paren", [p[2]])
-
-def p_output_var_call(p):
-    """
-    output_var_call : IDENT output_list_index  
-    """
-    p[0] = ASTNode("var_call", children=[ASTNode("IDENT", value=p[1]), p[2]])
-
-def p_output_postfix_op(p):
-    """
-    output_postfix_op : PLUS_PLUS   
-               | MINUS_MINUS 
-    """
-    p[0] = p[1]
-def p_output_postfix(p):
-    """
-    output_postfix : empty        
-            | output_postfix_op  
-    """
-    p[0] = p[1]
-
-def p_output_list_index(p):
-    """
-    output_list_index : LBRACKET output_index RBRACKET output_list_index2  
-               | empty                                
-    """
-    if len(p) == 2:
-        p[0] = []
-    else:
-        p[0] = [p[2]] + p[4]
-
-
-def p_output_list_index2(p):
-    """
-    output_list_index2 : LBRACKET output_index RBRACKET 
-                | empty                   
-    """
-    if len(p) == 2:
-        p[0] = []
-    else:
-        p[0] = [p[2]]
-
-
-def p_output_int_lit(p):
-    """output_index : INT_LIT"""
-    # Instead of returning the bare int, build a literal node
-    p[0] = ASTNode("literal", value=p[1])
-
-def p_output_index_ident(p):
-    """output_index : IDENT"""
-    p[0] = ASTNode("IDENT", value=p[1])
-
-def p_output_factor_tail(p):
-    """
-    output_factor_tail : PLUS output_factor output_factor_tail
-                | MINUS output_factor output_factor_tail
-                | MULTIPLY output_factor output_factor_tail
-                | DIVISION output_factor output_factor_tail
-                | MODULO output_factor output_factor_tail
-                | EXPONENT output_factor output_factor_tail
-                | GT output_factor output_factor_tail
-                | LT output_factor output_factor_tail
-                | EQ_EQ output_factor output_factor_tail
-                | GT_EQ output_factor output_factor_tail
-                | LT_EQ output_factor output_factor_tail
-                | NOT_EQ output_factor output_factor_tail
-                | AND output_factor output_factor_tail
-                | OR output_factor output_factor_tail
-                | empty
-    """
-    if len(p) == 2:
-        p[0] = None
-    else:
-        p[0] = ASTNode("factor_tail_binop", [
-    ASTNode("operator", value=p[1]),
-    p[2],
-    p[3]
-])
-
-
-def p_output_factor1 (p):
-    """
-    output_factor1  : INT_LIT
-             | FLT_LIT
-             | DAY
-             | NIGHT
-             | STR_LIT
-    """
-    p[0] = p[1]  
-
-def p_output_type_cast(p):
-    """output_type_cast : CONVERT_TO_INT LPAREN typecast_value RPAREN
-                 | CONVERT_TO_FLT LPAREN typecast_value RPAREN
-                 | CONVERT_TO_BLN LPAREN typecast_value RPAREN
-                 | CONVERT_TO_STR LPAREN typecast_value RPAREN"""
-    p[0] = ASTNode("type_cast", [p[3]], p[1])
 # -----------------------------------------------------------------------------
 # (126) <next_val> → , <value> <next_val>
 # (127) <next_val> → null
@@ -2207,134 +1226,12 @@ def p_postfix(p):
 def p_value(p):
     """
     value : type_cast     
-          | value_expression   
+          | expression   
           | function_call 
     """
     p[0] = p[1]
 
 
-def p_value_expression(p):
-    """
-    value_expression : value_factor value_factor_tail
-    """
-    if p[2] is None:
-        p[0] = ASTNode("expression", [p[1]])
-    else:
-        p[0] = ASTNode("expression", [p[1], p[2]])
-
-
-def p_value_factor(p):
-    """
-    value_factor : value_var_call value_postfix           
-           | value_factor1                    
-           | TILDE INT_LIT               
-           | TILDE FLT_LIT                
-           | LPAREN value_factor RPAREN    
-    """
-    # We must handle each case by length of p
-    if len(p) == 3 and p[2] in ("++", "--", None):  # var_call postfix
-        p[0] = ASTNode("var_postfix", [p[1], p[2]])
-    elif len(p) == 2:
-        # literal1
-        p[0] = ASTNode("literal", value=p[1])
-    elif len(p) == 3 and p[1] == '~' and isinstance(p[2], int):
-        # TILDE INT_LIT
-        p[0] = ASTNode("neg_int", value=p[2])
-    elif len(p) == 3 and p[1] == '~' and isinstance(p[2], float):
-        # TILDE FLT_LIT
-        p[0] = ASTNode("neg_flt", value=p[2])
-    else:
-        # ( expression )
-        p[0] = ASTNode("paren", [p[2]])
-
-
-def p_value_var_call(p):
-    """
-    value_var_call : IDENT value_list_index  
-    """
-    p[0] = ASTNode("var_call", children=[ASTNode("IDENT", value=p[1]), p[2]])
-
-def p_value_postfix_op(p):
-    """
-    value_postfix_op : PLUS_PLUS   
-               | MINUS_MINUS 
-    """
-    p[0] = p[1]
-def p_value_postfix(p):
-    """
-    value_postfix : empty        
-            | value_postfix_op  
-    """
-    p[0] = p[1]
-
-def p_value_list_index(p):
-    """
-    value_list_index : LBRACKET value_index RBRACKET value_list_index2  
-               | empty                                
-    """
-    if len(p) == 2:
-        p[0] = []
-    else:
-        p[0] = [p[2]] + p[4]
-
-
-def p_value_list_index2(p):
-    """
-    value_list_index2 : LBRACKET value_index RBRACKET 
-                | empty                   
-    """
-    if len(p) == 2:
-        p[0] = []
-    else:
-        p[0] = [p[2]]
-
-
-def p_value_int_lit(p):
-    """value_index : INT_LIT"""
-    # Instead of returning the bare int, build a literal node
-    p[0] = ASTNode("literal", value=p[1])
-
-def p_value_index_ident(p):
-    """value_index : IDENT"""
-    p[0] = ASTNode("IDENT", value=p[1])
-
-def p_value_factor_tail(p):
-    """
-    value_factor_tail : PLUS value_factor value_factor_tail
-                | MINUS value_factor value_factor_tail
-                | MULTIPLY value_factor value_factor_tail
-                | DIVISION value_factor value_factor_tail
-                | MODULO value_factor value_factor_tail
-                | EXPONENT value_factor value_factor_tail
-                | GT value_factor value_factor_tail
-                | LT value_factor value_factor_tail
-                | EQ_EQ value_factor value_factor_tail
-                | GT_EQ value_factor value_factor_tail
-                | LT_EQ value_factor value_factor_tail
-                | NOT_EQ value_factor value_factor_tail
-                | AND value_factor value_factor_tail
-                | OR value_factor value_factor_tail
-                | empty
-    """
-    if len(p) == 2:
-        p[0] = None
-    else:
-        p[0] = ASTNode("factor_tail_binop", [
-    ASTNode("operator", value=p[1]),
-    p[2],
-    p[3]
-])
-
-
-def p_value_factor1 (p):
-    """
-    value_factor1  : INT_LIT
-             | FLT_LIT
-             | DAY
-             | NIGHT
-             | STR_LIT  
-    """
-    p[0] = p[1]  
 # -----------------------------------------------------------------------------
 # (156) <type_cast> → to_int(<typecast_value>)
 # (157) <type_cast> → to_flt(<typecast_value>)
@@ -2348,7 +1245,7 @@ def p_type_cast(p):
               | CONVERT_TO_BLN LPAREN typecast_value RPAREN  
               | CONVERT_TO_STR LPAREN typecast_value RPAREN 
     """
-    p[0] = ASTNode("type_cast", children=[ASTNode("conversion", value=p[1]), p[3]])
+    p[0] = ASTNode("type_cast", [p[3]], p[1])
 
 
 # -----------------------------------------------------------------------------
@@ -2358,7 +1255,7 @@ def p_type_cast(p):
 # -----------------------------------------------------------------------------
 def p_typecast_value(p):
     """
-    typecast_value : typecast_expression                           
+    typecast_value : expression                                     
                    | FUNCTION_NAME LPAREN RPAREN          
                    | input_statement                     
     """
@@ -2368,78 +1265,6 @@ def p_typecast_value(p):
         p[0] = ASTNode("typecast_funcname", value=p[1])
 
 
-def p_typecast_expression(p):
-    """
-    typecast_expression : typecast_factor typecast_factor_tail
-    """
-    if p[2] is None:
-        p[0] = ASTNode("expression", [p[1]])
-    else:
-        p[0] = ASTNode("expression", [p[1], p[2]])
-
-
-def p_typecast_factor(p):
-    """
-    typecast_factor : var_call postfix           
-           | typecast_factor1                    
-           | TILDE INT_LIT               
-           | TILDE FLT_LIT                
-           | LPAREN typecast_factor RPAREN    
-    """
-    # We must handle each case by length of p
-    if len(p) == 3 and p[2] in ("++", "--", None):  # var_call postfix
-        p[0] = ASTNode("postfix", [p[1], p[2]])
-    elif len(p) == 2:
-        # literal1
-        p[0] = ASTNode("literal", value=p[1])
-    elif len(p) == 3 and p[1] == '~' and isinstance(p[2], int):
-        # TILDE INT_LIT
-        p[0] = ASTNode("neg_int", value=p[2])
-    elif len(p) == 3 and p[1] == '~' and isinstance(p[2], float):
-        # TILDE FLT_LIT
-        p[0] = ASTNode("neg_flt", value=p[2])
-    else:
-        # ( expression )
-        p[0] = ASTNode("paren", [p[2]])
-
-
-def p_typecast_factor_tail(p):
-    """
-    typecast_factor_tail : PLUS typecast_factor typecast_factor_tail
-                | MINUS typecast_factor typecast_factor_tail
-                | MULTIPLY typecast_factor typecast_factor_tail
-                | DIVISION typecast_factor typecast_factor_tail
-                | MODULO typecast_factor typecast_factor_tail
-                | EXPONENT typecast_factor typecast_factor_tail
-                | GT typecast_factor typecast_factor_tail
-                | LT typecast_factor typecast_factor_tail
-                | EQ_EQ typecast_factor typecast_factor_tail
-                | GT_EQ typecast_factor typecast_factor_tail
-                | LT_EQ typecast_factor typecast_factor_tail
-                | NOT_EQ typecast_factor typecast_factor_tail
-                | AND typecast_factor typecast_factor_tail
-                | OR typecast_factor typecast_factor_tail
-                | empty
-    """
-    if len(p) == 2:
-        p[0] = None
-    else:
-        p[0] = ASTNode("factor_tail_binop", [
-    ASTNode("operator", value=p[1]),
-    p[2],
-    p[3]
-])
-
-
-def p_typecast_factor1 (p):
-    """
-    typecast_factor1  : INT_LIT
-             | FLT_LIT
-             | DAY
-             | NIGHT
-             | STR_LIT
-    """
-    p[0] = p[1]  
 # -----------------------------------------------------------------------------
 # (163) <input_statement> → input()
 # -----------------------------------------------------------------------------
@@ -2455,7 +1280,7 @@ def p_empty(p):
 
 
 def p_error(p):
-    global parser 
+    parser = build_lalr_parser()
     token_display = {
         "EOF": "EOF",
         "ILLEGAL": "ILLEGAL",
@@ -2606,8 +1431,653 @@ def p_error(p):
 
 
 
+# =============================================================================
+# Recursive-descent engine
+#
+# A hand-written parser for the grammar above. It reads the token buffer once,
+# dispatches on token types instead of LALR table lookups, climbs binary
+# operators by the `precedence` table, and builds the same ASTNode trees the
+# p_ actions build. maybe_newline/unli_newline consume every NEWLINE, which is
+# how PLY resolves their shift/reduce conflicts. On a syntax error the tokens
+# are replayed through the LALR parser, so both engines raise the same
+# diagnostics.
+# =============================================================================
+_BINARY_OPERATORS = {
+    "PLUS", "MINUS", "MULTIPLY", "DIVISION", "MODULO", "EXPONENT",
+    "GT", "LT", "EQ_EQ", "GT_EQ", "LT_EQ", "NOT_EQ", "AND", "OR",
+}
+_DATA_TYPES = {"INT", "FLT", "BLN", "CHR", "STR"}
+_RET_TYPES = {
+    "FUNCTION", "FUNCTION_INT", "FUNCTION_FLT", "FUNCTION_CHR", "FUNCTION_BLN", "FUNCTION_STR",
+    "FUNCTION_LIST_INT", "FUNCTION_LIST_FLT", "FUNCTION_LIST_CHR", "FUNCTION_LIST_STR", "FUNCTION_LIST_BLN",
+}
+_LITERAL1 = {"INT_LIT", "FLT_LIT", "DAY", "NIGHT", "STR_LIT"}
+_CONVERSIONS = {"CONVERT_TO_INT", "CONVERT_TO_FLT", "CONVERT_TO_BLN", "CONVERT_TO_STR"}
+_COMPOUND_OPS = {"PLUS_EQ", "MINUS_EQ", "MUL_EQ", "DIV_EQ", "MOD_EQ"}
+_POSTFIX_OPS = {"PLUS_PLUS", "MINUS_MINUS"}
+_END = "$end"
+
+
+def _binding_powers():
+    """Maps each binary operator to (level, right-associative) from `precedence`."""
+    powers = {}
+    for level, (associativity, *names) in enumerate(precedence, 1):
+        for name in names:
+            if name in _BINARY_OPERATORS:
+                powers[name] = (level, associativity == "right")
+    return powers
+
+
+_BINDING_POWERS = _binding_powers()
+
+
+class _NoParse(Exception):
+    """The tokens left the grammar; the LALR parser reports where."""
+
+
+class DescentParser:
+    """
+    Drop-in for the PLY parser: parse(lexer=...) returns the program AST.
+    With diagnostics=False a syntax error raises a bare SyntaxError instead
+    of re-parsing with the LALR tables for the message.
+    """
+
+    def __init__(self, diagnostics=True):
+        self.diagnostics = diagnostics
+
+    def parse(self, lexer):
+        if isinstance(lexer, TokenStream):
+            span = lexer.drain()
+            self._types = lexer.tokens.type_names(span.start, span.stop)
+            self._values = lexer.tokens.values[span.start:span.stop]
+            replay = lambda: TokenReplay(lexer.tokens[index] for index in span)
+        else:
+            read = list(iter(lexer.token, None))
+            self._types = [tok.type for tok in read]
+            self._values = [tok.value for tok in read]
+            replay = lambda: TokenReplay(read)
+        self._types.append(_END)
+        self._values.append(None)
+        self._pos = 0
+        try:
+            return self._program()
+        except (_NoParse, RecursionError):
+            if not self.diagnostics:
+                raise SyntaxError("Syntax Error") from None
+            return build_lalr_parser().parse(lexer=replay())
+        finally:
+            self._types = self._values = None
+
+    # -- token helpers --------------------------------------------------------
+
+    def _expect(self, token_type):
+        pos = self._pos
+        if self._types[pos] != token_type:
+            raise _NoParse
+        self._pos = pos + 1
+        return self._values[pos]
+
+    def _newlines(self):
+        """maybe_newline"""
+        types = self._types
+        pos = self._pos
+        while types[pos] == "NEWLINE":
+            pos += 1
+        self._pos = pos
+
+    def _required_newlines(self):
+        """unli_newline"""
+        if self._types[self._pos] != "NEWLINE":
+            raise _NoParse
+        self._newlines()
+
+    # -- program structure ----------------------------------------------------
+
+    def _program(self):
+        self._expect("BIRTH")
+        self._required_newlines()
+        global_dec = []
+        while self._types[self._pos] in _DATA_TYPES:
+            global_dec.append(self._global_statement())
+            self._required_newlines()
+        self._newlines()
+        functions = []
+        while self._types[self._pos] in _RET_TYPES:
+            functions.append(self._function_declaration())
+            self._required_newlines()
+        self._newlines()
+        main_function = self._main_function()
+        self._required_newlines()
+        self._expect("GHOST")
+        if self._types[self._pos] != _END:
+            raise _NoParse
+        return ASTNode("program", [global_dec, functions, main_function])
+
+    def _global_statement(self):
+        data_type = ASTNode("data_type", value=self._values[self._pos].lower())
+        self._pos += 1
+        ident = ASTNode("IDENT", value=self._expect("IDENT"))
+        list_dec = self._list_dec()
+        # <global_statement_tail>: ", IDENT" and "= value" items, never two
+        # assignments in a row. Only the first assignment is kept.
+        assignment = None
+        can_assign = True
+        types = self._types
+        while True:
+            kind = types[self._pos]
+            if kind == "COMMA":
+                self._pos += 1
+                self._expect("IDENT")
+                can_assign = True
+            elif kind == "EQ" and can_assign:
+                self._pos += 1
+                value = self._list_value() if types[self._pos] == "LBRACKET" else self._expression()
+                if assignment is None:
+                    assignment = value
+                can_assign = False
+            else:
+                return ASTNode("global_statement", [data_type, ident, list_dec, assignment])
+
+    def _list_dec(self):
+        if self._types[self._pos] != "LBRACKET":
+            return None
+        self._pos += 1
+        self._expect("RBRACKET")
+        second = None
+        if self._types[self._pos] == "LBRACKET":
+            self._pos += 1
+            self._expect("RBRACKET")
+            second = ASTNode("2d_list", value="2d")
+        return ASTNode("list_dec", [second])
+
+    def _function_declaration(self):
+        ret_type = self._values[self._pos]
+        self._pos += 1
+        ret_node = ASTNode("ret_type", value="void" if ret_type == "function" else ret_type)
+        name = self._expect("FUNCTION_NAME")
+        self._expect("LPAREN")
+        params = []
+        if self._types[self._pos] in _DATA_TYPES:
+            params.append(self._param_decl())
+            while self._types[self._pos] == "COMMA":
+                self._pos += 1
+                if self._types[self._pos] not in _DATA_TYPES:
+                    raise _NoParse
+                params.append(self._param_decl())
+        self._expect("RPAREN")
+        self._expect("LBRACE")
+        self._newlines()
+        statements = self._statements()
+        self._newlines()
+        revive = None
+        if self._types[self._pos] == "REVIVE":
+            self._pos += 1
+            revive = ASTNode("revive_statement", children=[ASTNode("value", [self._value()])])
+        self._newlines()
+        self._expect("RBRACE")
+        return ASTNode("function_declaration", children=[
+            ret_node,
+            ASTNode("FUNCTION_NAME", value=name),
+            ASTNode("parameters", params),
+            ASTNode("statements", statements),
+            revive,
+        ])
+
+    def _param_decl(self):
+        data_type = ASTNode("data_type", value=self._values[self._pos].lower())
+        self._pos += 1
+        return ASTNode("param_decl", children=[data_type, ASTNode("IDENT", value=self._expect("IDENT"))])
+
+    def _main_function(self):
+        name = self._expect("MAIN_CASPER")
+        self._expect("LPAREN")
+        self._expect("RPAREN")
+        self._newlines()
+        return ASTNode("main_function", [self._block()], name)
+
+    def _block(self):
+        """{ maybe_newline <statements> maybe_newline }"""
+        self._expect("LBRACE")
+        self._newlines()
+        statements = self._statements()
+        self._newlines()
+        self._expect("RBRACE")
+        return statements
+
+    # -- statements -----------------------------------------------------------
+
+    def _statements(self):
+        # Same layout as p_statement_list: declarations are lists, and a
+        # statement not preceded by one gets an empty [] slot.
+        items = []
+        types = self._types
+        while True:
+            kind = types[self._pos]
+            if kind in _DATA_TYPES:
+                items.append(self._local_dec())
+            elif kind in self._STATEMENTS:
+                if not items or not isinstance(items[-1], list):
+                    items.append([])
+                items.append(self._STATEMENTS[kind](self))
+                self._required_newlines()
+            else:
+                return items
+
+    def _local_dec(self):
+        data_type = ASTNode("local_data_type", value=self._values[self._pos].lower())
+        self._pos += 1
+        var_node = ASTNode("var_statement", [data_type, ASTNode("IDENT", value=self._expect("IDENT")), self._list_dec()])
+        can_assign = True
+        types = self._types
+        while True:
+            kind = types[self._pos]
+            if kind == "COMMA":
+                self._pos += 1
+                var_node.children.append(
+                    ASTNode("local_var_more", children=[ASTNode("IDENT", value=self._expect("IDENT"))]))
+                can_assign = True
+            elif kind == "EQ" and can_assign:
+                self._pos += 1
+                if types[self._pos] == "LBRACKET":
+                    value = self._list_value()
+                else:
+                    value = ASTNode("value", [self._value()])
+                var_node.children.append(ASTNode("local_var_assign", children=[value]))
+                can_assign = False
+            else:
+                break
+        self._required_newlines()
+        return [var_node]
+
+    def _conditional_statement(self):
+        self._pos += 1
+        condition = self._condition()
+        body = self._block()
+        self._newlines()
+        branches = []
+        while self._types[self._pos] == "OTHERWISE_CHECK":
+            self._pos += 1
+            branch_condition = self._condition()
+            branches.append(ASTNode("otherwise_check", children=[branch_condition, self._block()]))
+            self._newlines()
+        self._newlines()
+        self._expect("OTHERWISE")
+        self._newlines()
+        self._block()
+        # p_conditional_statement stores p[16], the maybe_newline before the
+        # otherwise body, so the body is parsed but the slot is None.
+        return ASTNode("conditional_statement", children=[condition, body, branches, None])
+
+    def _condition(self):
+        """( <expression> )"""
+        self._expect("LPAREN")
+        condition = ASTNode("condition", self._expression().children)
+        self._expect("RPAREN")
+        return condition
+
+    def _switch_statement(self):
+        self._pos += 1
+        self._expect("LPAREN")
+        ident = ASTNode("IDENT", value=self._expect("IDENT"))
+        self._expect("RPAREN")
+        self._expect("LBRACE")
+        self._newlines()
+        cases = []
+        self._expect("SHIFT")
+        while True:
+            value = ASTNode("value", [self._value()])
+            self._expect("COLON")
+            self._newlines()
+            cases.append((value, self._statements()))
+            if self._types[self._pos] != "SHIFT":
+                break
+            self._pos += 1
+        tail = []
+        for value, statements in reversed(cases):
+            condition = ASTNode("switch_condition", children=[value, statements, tail])
+            tail = [condition]
+        self._newlines()
+        self._expect("OTHERWISE")
+        self._newlines()
+        otherwise = self._block()
+        self._newlines()
+        self._expect("RBRACE")
+        return ASTNode("switch_statement", children=[ident, condition, otherwise])
+
+    def _for_loop(self):
+        self._pos += 1
+        self._expect("LPAREN")
+        self._expect("INT")
+        ident = ASTNode("IDENT", value=self._expect("IDENT"))
+        self._expect("EQ")
+        if self._types[self._pos] == "INT_LIT":
+            start = self._values[self._pos]
+            self._pos += 1
+            if isinstance(start, int):
+                start = ASTNode("literal", value=start)
+        else:
+            start = self._var_call()
+        control = ASTNode("control_variable", [ASTNode("data_type", value="int"), ident, start])
+        self._expect("SEMICOLON")
+        condition = self._expression()
+        self._expect("SEMICOLON")
+        var_call = self._var_call()
+        kind = self._types[self._pos]
+        op = self._values[self._pos]
+        if kind in _POSTFIX_OPS:
+            self._pos += 1
+            update_tail = ASTNode("update_tail_postfix", value=op)
+        elif kind in _COMPOUND_OPS:
+            self._pos += 1
+            update_tail = ASTNode("update_tail_compound", children=[op, self._value()])
+        else:
+            raise _NoParse
+        update = ASTNode("update", children=[var_call, update_tail])
+        self._expect("RPAREN")
+        return ASTNode("for_loop", children=[control, condition, update, self._block()])
+
+    def _until_loop(self):
+        self._pos += 1
+        self._expect("LPAREN")
+        condition = self._expression()
+        self._expect("RPAREN")
+        self._expect("LBRACE")
+        statements = self._statements()
+        self._expect("RBRACE")
+        return ASTNode("until_loop", children=[condition, statements])
+
+    def _repeat_until(self):
+        self._pos += 1
+        self._expect("LBRACE")
+        statements = self._statements()
+        self._expect("RBRACE")
+        self._expect("UNTIL")
+        self._expect("LPAREN")
+        condition = self._expression()
+        self._expect("RPAREN")
+        return ASTNode("repeat_until", children=[statements, condition])
+
+    def _function_call(self):
+        if self._types[self._pos] == "INPUT":
+            return self._input_statement()
+        name = self._expect("FUNCTION_NAME")
+        self._expect("LPAREN")
+        args = []
+        if self._types[self._pos] != "RPAREN":
+            args.append(self._arg_value())
+            while self._types[self._pos] == "COMMA":
+                self._pos += 1
+                args.append(self._arg_value())
+        self._expect("RPAREN")
+        return ASTNode("function_call", children=[ASTNode("FUNCTION_NAME", value=name), ASTNode("arguments", children=args)])
+
+    def _arg_value(self):
+        kind = self._types[self._pos]
+        if kind == "IDENT":
+            return self._var_call()
+        return self._literal()
+
+    def _input_statement(self):
+        value = self._values[self._pos]
+        self._pos += 1
+        self._expect("LPAREN")
+        self._expect("RPAREN")
+        return ASTNode("input_statement", value=value)
+
+    def _output_statement(self):
+        self._pos += 1
+        first = ASTNode("value", [self._value()])
+        rest = []
+        while self._types[self._pos] == "COMMA":
+            self._pos += 1
+            rest.append(self._value())
+        return ASTNode("output_statement", children=[first, rest])
+
+    def _assignment_statement(self):
+        name = self._values[self._pos]
+        self._pos += 1
+        kind = self._types[self._pos]
+        if kind == "LBRACKET":
+            self._pos -= 1
+            var_call = self._var_call()
+            op = self._expect("EQ")
+            return ASTNode("assignment_statement", children=[var_call, ASTNode("assign_op", value=op), self._value()])
+        if kind == "EQ" or kind in _COMPOUND_OPS:
+            op = self._values[self._pos]
+            self._pos += 1
+            tail = ASTNode("assign_tail_op", children=[op, self._value()])
+        elif kind == "DOT":
+            self._pos += 1
+            if self._types[self._pos] == "SPLICE":
+                self._pos += 1
+                self._expect("LPAREN")
+                start = self._expect("INT_LIT")
+                self._expect("COMMA")
+                delete_count = None
+                if self._types[self._pos] == "INT_LIT":
+                    delete_count = self._values[self._pos]
+                    self._pos += 1
+                self._expect("COMMA")
+                items = None if self._types[self._pos] == "RPAREN" else self._list_element()
+                self._expect("RPAREN")
+                tail = ASTNode("assign_tail_splice", children=[start, delete_count, items])
+            else:
+                self._expect("PUSH")
+                self._expect("LPAREN")
+                element = self._list_element()
+                self._expect("RPAREN")
+                tail = ASTNode("assign_tail_push", children=[element])
+        else:
+            raise _NoParse
+        return ASTNode("assignment_statement", children=[ASTNode("IDENT", value=name), tail])
+
+    _STATEMENTS = {
+        "SWAP": _switch_statement,
+        "FOR": _for_loop,
+        "UNTIL": _until_loop,
+        "REPEAT": _repeat_until,
+        "FUNCTION_NAME": _function_call,
+        "INPUT": _function_call,
+        "IDENT": _assignment_statement,
+        "DISPLAY": _output_statement,
+        "CHECK": _conditional_statement,
+    }
+
+    # -- values and expressions ----------------------------------------------
+
+    def _value(self):
+        """<value>: a type cast, function call or expression."""
+        kind = self._types[self._pos]
+        if kind in _CONVERSIONS:
+            conversion = self._values[self._pos]
+            self._pos += 1
+            self._expect("LPAREN")
+            kind = self._types[self._pos]
+            if kind == "FUNCTION_NAME":
+                operand = ASTNode("typecast_funcname", value=self._values[self._pos])
+                self._pos += 1
+                self._expect("LPAREN")
+                self._expect("RPAREN")
+            elif kind == "INPUT":
+                operand = self._input_statement()
+            else:
+                operand = self._expression()
+            self._expect("RPAREN")
+            return ASTNode("type_cast", [operand], conversion)
+        if kind == "FUNCTION_NAME" or kind == "INPUT":
+            return self._function_call()
+        return self._expression()
+
+    def _expression(self):
+        operand = self._binary(0)
+        if operand.type == "expression":
+            return operand
+        return ASTNode("expression", [operand])
+
+    def _binary(self, min_level):
+        # Precedence climbing; operands stay bare factors as in _operand().
+        left = self._factor()
+        types = self._types
+        while True:
+            binding = _BINDING_POWERS.get(types[self._pos])
+            if binding is None or binding[0] < min_level:
+                return left
+            level, right_associative = binding
+            operator = ASTNode("operator", value=self._values[self._pos])
+            self._pos += 1
+            right = self._binary(level if right_associative else level + 1)
+            left = ASTNode("expression", [left, ASTNode("factor_tail_binop", [operator, right, None])])
+
+    def _factor(self):
+        pos = self._pos
+        kind = self._types[pos]
+        if kind == "IDENT":
+            var_call = self._var_call()
+            postfix = None
+            if self._types[self._pos] in _POSTFIX_OPS:
+                postfix = self._values[self._pos]
+                self._pos += 1
+            return ASTNode("var_postfix", [var_call, postfix])
+        if kind in _LITERAL1:
+            self._pos = pos + 1
+            return ASTNode("literal", value=self._values[pos])
+        if kind == "TILDE":
+            if self._types[pos + 1] not in ("INT_LIT", "FLT_LIT"):
+                raise _NoParse
+            self._pos = pos + 2
+            number = self._values[pos + 1]
+            if isinstance(number, int):
+                return ASTNode("neg_int", value=number)
+            if isinstance(number, float):
+                return ASTNode("neg_flt", value=number)
+            return ASTNode("paren", [number])
+        if kind == "LPAREN":
+            self._pos = pos + 1
+            inner = self._expression()
+            self._expect("RPAREN")
+            return ASTNode("paren", [inner])
+        raise _NoParse
+
+    def _var_call(self):
+        ident = ASTNode("IDENT", value=self._expect("IDENT"))
+        indexes = []
+        if self._types[self._pos] == "LBRACKET":
+            indexes.append(self._index())
+            if self._types[self._pos] == "LBRACKET":
+                indexes.append(self._index())
+        return ASTNode("var_call", children=[ident, indexes])
+
+    def _index(self):
+        """[ INT_LIT | IDENT ]"""
+        self._pos += 1
+        kind = self._types[self._pos]
+        value = self._values[self._pos]
+        if kind == "INT_LIT":
+            node = ASTNode("literal", value=value)
+        elif kind == "IDENT":
+            node = ASTNode("IDENT", value=value)
+        else:
+            raise _NoParse
+        self._pos += 1
+        self._expect("RBRACKET")
+        return node
+
+    def _literal(self):
+        kind = self._types[self._pos]
+        value = self._values[self._pos]
+        if kind in _LITERAL1:
+            node = ASTNode("literal", value=value)
+        elif kind == "CHR_LIT":
+            node = ASTNode("chr_lit", value=value)
+        else:
+            raise _NoParse
+        self._pos += 1
+        return node
+
+    def _list_value(self):
+        self._expect("LBRACKET")
+        element = self._list_element()
+        self._expect("RBRACKET")
+        return ASTNode("list_value", [element])
+
+    def _list_element(self):
+        nodes = []
+        while True:
+            if self._types[self._pos] == "LBRACKET":
+                nodes.append(self._list_value())
+            else:
+                nodes.append(ASTNode("literal_element", [self._literal()]))
+            if self._types[self._pos] != "COMMA":
+                break
+            self._pos += 1
+        element = None
+        for node in reversed(nodes):
+            element = ASTNode("list_element", [node, element] if element else [node])
+        return element
+
+
 # Build Parser
-def build_parser():
+#
+# The LALR tables are loaded from parsetab.py (and the grammar validated) once
+# per process. PLY keeps the parse stacks on the parser object, so every
+# thread gets its own shallow copy bound to the shared tables.
+_parser_lock = threading.Lock()
+_compiled_parser = None
+_thread_parsers = threading.local()
+
+WARM_UP_SOURCE = "birth\r\n\r\n@main_casper() {\r\n}\r\nghost"
+
+
+def _compile_parser():
+    global _compiled_parser
+    with _parser_lock:
+        if _compiled_parser is None:
+            # Never write parsetab.py/parser.out from a running server;
+            # regenerate them with `python Parser.py` after grammar edits.
+            _compiled_parser = yacc.yacc(
+                debug=False,
+                write_tables=False,
+                errorlog=yacc.NullLogger()
+            )
+    return _compiled_parser
+
+
+def build_lalr_parser():
+    """Returns this thread's PLY parser, compiling the shared tables on first use."""
     global parser
-    parser = yacc.yacc()
-    return parser
+    thread_parser = getattr(_thread_parsers, "parser", None)
+    if thread_parser is None:
+        thread_parser = copy.copy(_compile_parser())
+        _thread_parsers.parser = thread_parser
+    parser = thread_parser
+    return thread_parser
+
+
+def build_descent_parser():
+    """Returns this thread's recursive-descent parser."""
+    thread_parser = getattr(_thread_parsers, "descent", None)
+    if thread_parser is None:
+        thread_parser = _thread_parsers.descent = DescentParser()
+    return thread_parser
+
+
+PARSER_ENGINES = {
+    "lalr": build_lalr_parser,
+    "descent": build_descent_parser,
+}
+
+
+def build_parser(engine=None):
+    """Returns this thread's parser for `engine` (defaults to PARSER_ENGINE)."""
+    return PARSER_ENGINES[engine or PARSER_ENGINE]()
+
+
+def warm_up_parser(engine=None):
+    """Compiles the tables and runs one parse so the first request pays nothing."""
+    _compile_parser()
+    build_parser(engine).parse(lexer=Lexer(WARM_UP_SOURCE))
+
+
+if __name__ == "__main__":
+    # Regenerate parsetab.py and parser.out after editing the grammar.
+    yacc.yacc(debug=True, write_tables=True)
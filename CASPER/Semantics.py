@@ -2,6 +2,7 @@
 
 from Parser import ASTNode
 from Token import TokenType
+from Trace import tracer_from_env
 
 class SemanticError(Exception):
     """Exception raised for semantic errors."""
@@ -35,30 +36,49 @@ allowed_implicit_conversions = {
     ("bln", "int"),
 }
 class SemanticAnalyzer:
-    def __init__(self):
+    def __init__(self, tracer=None):
         self.global_symbols = SymbolTable()
         self.errors = []
         self.reported_undeclared_vars = set()
         self.declared_functions = {} 
         self.array_lengths = {}   
         self.array_2d_lengths = {}  
+        self.expression_types = {}
+        # Binary operations and compound assignments given operand_types.
+        self.typed_operations = []
+        # Bumped whenever an expression turns out untyped because of an error already reported in it.
+        self.failed_lookups = 0
+        self.tracer = tracer if tracer is not None else tracer_from_env()
+        # Checked before building any trace fields, so tracing costs nothing when off.
+        self.tracing = self.tracer.enabled("semantics")
 
     def analyze(self, ast):
-        print("=== DEBUG: AST Structure ===")
-        debug_print_ast(ast)
-        print("=== END DEBUG ===\n")
+        if self.tracing:
+            self.tracer.emit("semantics", "ast", tree=format_ast(ast))
         self.visit(ast, self.global_symbols)
-
-        # Example debug note for 'str $num = 3' usage
-        if "str $num" in str(ast) and not any("Cannot assign" in e for e in self.errors):
-            self.errors.append(
-                "[DEBUG NOTE] The analyzer did NOT detect a type mismatch for 'str $num = 3'."
-            )
-            self.errors.append(
-                "Check your var_tail logic or expand get_expression_type if you still expect an error."
-            )
+        self._mark_numeric_operations(ast)
         return self.errors
 
+    def _mark_numeric_operations(self, ast):
+        """
+        Sets numeric_operands on typed operations whose operands are int or
+        flt, so engines can skip the Budget's size checks on them. Day, Night
+        and chr literals are strings at run time, and implicit conversions
+        let them into int and flt variables, so a program with any of them
+        gets none.
+        """
+        stack = [ast]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, (list, tuple)):
+                stack.extend(node)
+            elif isinstance(node, ASTNode):
+                if node.type == "chr_lit" or node.type == "literal" and node.value in ("Day", "Night"):
+                    return
+                stack.extend(node.children)
+        for node in self.typed_operations:
+            node.numeric_operands = all(value_type in ("int", "flt") for value_type in node.operand_types)
+
     def visit(self, node, symtable):
         if node is None:
             return
@@ -73,6 +93,9 @@ class SemanticAnalyzer:
             return
         if not hasattr(node, "type"):
             return
+        if id(node) in self.expression_types:
+            # Already checked while inferring its type.
+            return
         method_name = 'visit_' + node.type
         
         visitor = getattr(self, method_name, self.generic_visit)
@@ -193,7 +216,8 @@ class SemanticAnalyzer:
         else:
             declared_type = base_type
 
-        print(f"DEBUG: Declaring variable {var_name} with type {declared_type}")
+        if self.tracing:
+            self.tracer.emit("semantics", "declare", name=var_name, type=declared_type)
 
         # 3) Add to symbol table
         if var_name in self.global_symbols.symbols:
@@ -250,6 +274,8 @@ class SemanticAnalyzer:
 
     def check_global_assignment(self, assigned_node, symtable, declared_type, var_name):
         rhs_type = self.get_expression_type(assigned_node, symtable)
+        if rhs_type is None and self.already_reported(assigned_node):
+            return
 
         if '[' in declared_type and rhs_type and '[' in rhs_type:
             declared_dim = declared_type.count("[]")
@@ -315,7 +341,11 @@ class SemanticAnalyzer:
         # If the variable is declared as a list (e.g. "int[]", "int[][]", "flt[]", "bln[][]", etc.)
         if '[' in declared_type:
             rhs_type = self.get_expression_type(var_tail_node, symtable)
-            print(f"DEBUG: {var_name} declared as {declared_type}, initializer type = {rhs_type}")
+            if rhs_type is None and self.already_reported(var_tail_node):
+                return
+            if self.tracing:
+                self.tracer.emit("semantics", "list_initializer", name=var_name,
+                                 declared=declared_type, initializer=rhs_type)
 
             # 1) If the initializer has no type, or is not recognized as a list, mismatch
             if rhs_type is None or '[' not in rhs_type:
@@ -410,14 +440,42 @@ class SemanticAnalyzer:
         return None
     
     def get_expression_type(self, node, symtable):
+        """
+        Returns the type of an expression subtree, inferring it on first use.
+
+        Each node's type is stored in `expression_types`, keyed by node
+        identity, so a subtree is walked once no matter how many callers
+        (assignment checks, argument checks, list validation) ask about it.
+        The node is kept alongside its type so temporary nodes stay alive
+        and their ids are never reused while the analyzer runs, together
+        with whether an error inside it left it untyped (already_reported). The type is
+        also left on the node as `resolved_type` for the optimizer.
+        """
         if node is None:
             return None
+        entry = self.expression_types.get(id(node))
+        if entry is None:
+            errors, failed_lookups = len(self.errors), self.failed_lookups
+            node_type = self._infer_expression_type(node, symtable)
+            failed = node_type is None and (len(self.errors) > errors or self.failed_lookups > failed_lookups)
+            entry = (node, node_type, failed)
+            self.expression_types[id(node)] = entry
+            node.resolved_type = node_type
+        if entry[2]:
+            self.failed_lookups += 1
+        return entry[1]
+
+    def already_reported(self, node):
+        """
+        True when node has no type because of an error already reported
+        inside it, such as an undeclared name or a string mixed with a
+        number. Checks on the enclosing expression or assignment skip it,
+        so one mistake gives one error.
+        """
+        entry = self.expression_types.get(id(node))
+        return entry is not None and entry[2]
 
-        # If not an ASTNode, bail out
-        for child in node.children:
-                self.visit(child, symtable)
-                
-        
+    def _infer_expression_type(self, node, symtable):
         if node.type == "value":
             if node.children:
                 return self.get_expression_type(node.children[0], symtable)
@@ -431,6 +489,14 @@ class SemanticAnalyzer:
                     operator = tail.children[0]
                     op_val = operator if isinstance(operator, str) else operator.value
                     right_type = self.get_expression_type(tail.children[1], symtable)
+                    # The Optimizer only hoists operations these operand types cannot fail for.
+                    node.operand_types = (left_type, right_type)
+                    self.typed_operations.append(node)
+
+                    # An operand without a type has been reported already (or is checked
+                    # where the whole expression is used), so don't report it again here.
+                    if left_type is None or right_type is None:
+                        return None
 
                     if "str" in (left_type, right_type):
                         if left_type == "str" and right_type == "str" and op_val == "+":
@@ -441,9 +507,6 @@ class SemanticAnalyzer:
                             )
                             return None
 
-                    if left_type is None or right_type is None:
-                        return None
-
                     if left_type == right_type:
                         return left_type
                     else:
@@ -482,14 +545,21 @@ class SemanticAnalyzer:
             return "str"
 
         elif node.type == "list_value":
-            return self.get_list_literal_type(node, symtable)
+            list_type = self.get_list_literal_type(node, symtable)
+            # Items after a failed type check still need their names and calls resolved.
+            self.generic_visit(node, symtable)
+            return list_type
         elif node.type == "list_element":
             temp_list_value = ASTNode("list_value", children=[node])
-            return self.get_list_literal_type(temp_list_value, symtable)
+            list_type = self.get_list_literal_type(temp_list_value, symtable)
+            self.generic_visit(node, symtable)
+            return list_type
 
 
         elif node.type == "literal":
-            print("DEBUG in literal:", node.value, type(node.value))
+            if self.tracing:
+                self.tracer.emit("semantics", "literal", value=repr(node.value),
+                                 python_type=type(node.value).__name__)
             val = node.value
             if isinstance(val, int):
                 return "int"
@@ -530,13 +600,12 @@ class SemanticAnalyzer:
                 return None
 
         elif node.type == "function_call":
+            # visit_function_call reports undeclared functions and checks the arguments.
+            self.visit_function_call(node, symtable)
             func_name = node.children[0].value
             if func_name in self.declared_functions:
-                ret_type = self.declared_functions[func_name][0]
-                return ret_type
-            else:
-                self.errors.append(f"Semantic Error: Function '{func_name}' is not declared.")
-                return None
+                return self.declared_functions[func_name][0]
+            return None
 
         elif node.type in ("neg_int", "factor_neg_int"):
             return "int"
@@ -599,6 +668,8 @@ class SemanticAnalyzer:
         if len(node.children) > 2 and node.children[2]:
             initializer = node.children[2]
             init_type = self.get_expression_type(initializer, symtable)
+            if init_type is None and self.already_reported(initializer):
+                return
             if init_type != declared_type:
                 self.errors.append(
                     f"Type Error: Cannot assign '{init_type}' to control variable '{var_name}' of type '{declared_type}'."
@@ -792,9 +863,10 @@ class SemanticAnalyzer:
                 self.errors.append("Return Type Error: Void function should not return a value.")
         else:
             if node.children:
-                self.visit(node.children[0], symtable)
                 expr_type = self.get_expression_type(node.children[0], symtable)
                 if expr_type is None:
+                    if self.already_reported(node.children[0]):
+                        return
                     self.errors.append(f"Return Type Error: Function expects return type '{expected}', but got 'None'.")
                     return
                 allowed_implicit_conversions = {
@@ -860,7 +932,8 @@ class SemanticAnalyzer:
         else:
             base_type = self.get_expression_type(first_item, symtable)
 
-        print(f"DEBUG: list literal dimension={dim}, base_type={base_type}")
+        if self.tracing:
+            self.tracer.emit("semantics", "list_literal", dimension=dim, base_type=base_type)
 
         if base_type is None:
             return None
@@ -939,12 +1012,15 @@ class SemanticAnalyzer:
         """
         left_node = node.children[0]
         # This might be either a var_call or an IDENT, depending on the rule matched.
+        # It stays None when the name is undeclared, which has been reported already.
+        left_type = None
 
         # 1) Figure out the left variable's type
         if left_node.type == "var_call":
             var_name = left_node.children[0].value
-            print("NEW DEBUG: array_lengths =", self.array_lengths)
-            print("NEW DEBUG: Checking var_name =", var_name)
+            if self.tracing:
+                self.tracer.emit("semantics", "indexed_assignment", name=var_name,
+                                 length=self.array_lengths.get(var_name))
 
             # ---------------------------------------------------------
             # Handle up to 2D indexing: e.g. $fruits[1], $fruits[1][9]
@@ -1053,7 +1129,7 @@ class SemanticAnalyzer:
         if right_node.type == "assign_op":
             op = right_node.value  # e.g. '=' or '+='
             value_node = node.children[2]  # The third child
-            self.check_assignment_types(left_node, value_node, symtable, op)
+            self.check_assignment_types(left_node, value_node, symtable, op, right_node)
 
         elif right_node.type == "assign_tail_op":
             op_node = right_node.children[0]  # Might be a string like "="
@@ -1064,22 +1140,18 @@ class SemanticAnalyzer:
             else:
                 op = op_node.value
 
-            self.check_assignment_types(left_node, value_node, symtable, op)
+            self.check_assignment_types(left_node, value_node, symtable, op, right_node)
         elif right_node.type == "assign_tail_push":
             pushed_item = right_node.children[0]
 
             if left_type is not None:
                 self.check_push_operation(var_name, pushed_item, left_type, symtable)
-            else:
-                self.errors.append(
-                    f"Semantic Error: Variable '{var_name}' type not found for '.push' operation."
-                )
         else:
             self.visit(right_node, symtable)
 
 
 
-    def check_assignment_types(self, left_node, value_node, symtable, op):
+    def check_assignment_types(self, left_node, value_node, symtable, op, tail=None):
         left_type = None
         if left_node.type == "var_call":
             var_name = left_node.children[0].value
@@ -1099,6 +1171,10 @@ class SemanticAnalyzer:
         right_type = self.get_expression_type(value_node, symtable)
         if left_type is None or right_type is None:
             return
+        if tail is not None and op != "=":
+            # As for expressions: engines skip the Budget's size checks when both are numbers.
+            tail.operand_types = (left_type, right_type)
+            self.typed_operations.append(tail)
 
         # If the left-hand side is an array access (var_call with indices), compare base types.
         if left_node.type == "var_call" and len(left_node.children) > 1 and left_node.children[1]:
@@ -1242,26 +1318,28 @@ class SemanticAnalyzer:
 
 
 
-def debug_print_ast(node, indent=0):
-    if node is None:
-        print(" " * indent + "None")
-        return
-    if isinstance(node, list):
-        for item in node:
-            debug_print_ast(item, indent)
-        return
-    if not hasattr(node, "type"):
-        print(" " * indent + f"Non-AST node: {node}")
-        return
-    line = f"{node.type}"
-    if node.value is not None:
-        line += f" (value={node.value})"
-    print(" " * indent + line)
-    if hasattr(node, "children") and node.children:
-        for child in node.children:
-            debug_print_ast(child, indent + 2)
-
-def run_semantic_analysis(ast):
-    analyzer = SemanticAnalyzer()
+def format_ast(node):
+    """Renders an AST as an indented outline, one node per line, without recursing."""
+    lines = []
+    stack = [(node, 0)]
+    while stack:
+        item, indent = stack.pop()
+        if item is None:
+            lines.append(" " * indent + "None")
+        elif isinstance(item, list):
+            stack.extend((child, indent) for child in reversed(item))
+        elif not hasattr(item, "type"):
+            lines.append(" " * indent + f"Non-AST node: {item}")
+        else:
+            line = f"{item.type}"
+            if item.value is not None:
+                line += f" (value={item.value})"
+            lines.append(" " * indent + line)
+            if item.children:
+                stack.extend((child, indent + 2) for child in reversed(item.children))
+    return "\n".join(lines)
+
+def run_semantic_analysis(ast, tracer=None):
+    analyzer = SemanticAnalyzer(tracer)
     errors = analyzer.analyze(ast)
     return errors
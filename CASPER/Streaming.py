@@ -0,0 +1,232 @@
+# Streaming.py
+#
+# Runs programs in the background and streams what they display to the
+# browser as Server-Sent Events while they run. A client starts a run, then
+# opens its event stream. It can cancel the run at any time, and closing the
+# stream cancels it as well. main.py serves this at /runs, and at /run as a
+# plain-text stream of the output that starts the run and streams it at once.
+#
+# Events on a run's stream:
+#
+#   event: start    data: {"id": ...}, sent straight away so the response starts
+#   event: output   data: text the program displayed (may span several data lines)
+#   event: end      data: {"status": "finished" | "cancelled" | "error", "message": ...}
+#
+# Each connection is held to an output rate, so one chatty program can't
+# take all of the server's bandwidth. A program that outpaces its reader
+# blocks on its full output queue, which slows it down. Settings come from
+# the environment:
+#
+#   CASPER_STREAM_RATE     characters per second per connection (0: unlimited)
+#   CASPER_STREAM_BURST    characters a connection may send before the rate applies
+#   CASPER_STREAM_RUNS     runs allowed at once
+#   CASPER_STREAM_ATTACH   seconds a started run waits for its stream before it is cancelled
+
+import json
+import os
+import re
+import threading
+import time
+import uuid
+
+from Budget import Budget, RunCancelled
+from CodeGen import run_code_generation
+from Output import OutputCancelled, OutputLimitExceeded, QueueSink
+
+STREAM_RATE = int(os.environ.get("CASPER_STREAM_RATE", "65536"))
+STREAM_BURST = int(os.environ.get("CASPER_STREAM_BURST", "16384"))
+STREAM_RUNS = int(os.environ.get("CASPER_STREAM_RUNS", "32"))
+STREAM_ATTACH = float(os.environ.get("CASPER_STREAM_ATTACH", "30"))
+
+# Largest piece of output sent as one event, so the rate limit paces big writes too.
+EVENT_CHARS = 1024
+
+_LINE_BREAK = re.compile(r"\r\n|\r|\n")
+
+
+class StreamError(Exception):
+    """Raised when a run can't be started or streamed: too many runs, or its stream is already open."""
+    pass
+
+
+class RateLimit:
+    """
+    A token bucket over characters: `burst` may go out at once, then `rate`
+    per second. take(n) books n characters and returns how many seconds the
+    caller should wait before sending them.
+    """
+
+    def __init__(self, rate=None, burst=None):
+        self.rate = STREAM_RATE if rate is None else rate
+        self.burst = STREAM_BURST if burst is None else burst
+        self.allowance = self.burst
+        self.last = time.monotonic()
+
+    def take(self, amount):
+        if not self.rate:
+            return 0.0
+        now = time.monotonic()
+        self.allowance = min(self.burst, self.allowance + (now - self.last) * self.rate) - amount
+        self.last = now
+        return -self.allowance / self.rate if self.allowance < 0 else 0.0
+
+
+def format_event(event, data):
+    """One Server-Sent Event. Every line of data gets its own data: field, which the browser joins with newlines."""
+    lines = "".join(f"data: {line}\n" for line in _LINE_BREAK.split(data))
+    return f"event: {event}\n{lines}\n"
+
+
+class ProgramRun:
+    """
+    One program running in a background thread, writing to a QueueSink.
+
+    events() streams its output and final status. cancel() stops it, from
+    any thread: at its next write or its next budget check, whichever
+    comes first.
+    """
+
+    def __init__(self, run_id, ast, budget=None):
+        self.id = run_id
+        self.sink = QueueSink()
+        self.budget = Budget() if budget is None else budget
+        self.status = "running"
+        self.message = None
+        self.attached = False
+        self.sent = 0
+        self._cancelled = threading.Event()
+        self._thread = threading.Thread(target=self._execute, args=(ast,), daemon=True)
+        self._thread.start()
+
+    def _execute(self, ast):
+        try:
+            run_code_generation(ast, output=self.sink, budget=self.budget)
+            self.status = "finished"
+        except (OutputCancelled, RunCancelled):
+            self.status = "cancelled"
+        except OutputLimitExceeded as e:
+            self.status, self.message = "error", f"[{e}]"
+        except Exception as e:
+            self.status, self.message = "error", f"Runtime Error: {e}"
+        finally:
+            self.sink.close()
+
+    def cancel(self):
+        self._cancelled.set()
+        self.budget.cancel()
+        self.sink.cancel()
+
+    def events(self, rate_limit):
+        """Yields the run's start event, its output events paced by rate_limit, then its end event."""
+        yield format_event("start", json.dumps({"id": self.id}))
+        for piece in self._output(rate_limit):
+            yield format_event("output", piece)
+        yield format_event("end", json.dumps({"status": self.status, "message": self.message}))
+
+    def text(self, rate_limit):
+        """Yields the run's output as plain text paced by rate_limit, then its error message if it failed."""
+        yield from self._output(rate_limit)
+        if self.message is not None:
+            yield f"\n{self.message}\n"
+
+    def _output(self, rate_limit):
+        """Yields the run's output in pieces of up to EVENT_CHARS, paced by rate_limit, until the program ends."""
+        for chunk in self.sink.chunks():
+            for start in range(0, len(chunk), EVENT_CHARS):
+                if self._cancelled.is_set():
+                    # Keep draining, so the program isn't left blocked on a full queue.
+                    break
+                piece = chunk[start:start + EVENT_CHARS]
+                if self._cancelled.wait(rate_limit.take(len(piece))):
+                    break
+                self.sent += len(piece)
+                yield piece
+        self._thread.join()
+
+
+class RunRegistry:
+    """The runs that have been started and not yet streamed to the end, by id."""
+
+    def __init__(self, rate=None, burst=None, max_runs=None, attach_seconds=None):
+        self.rate = rate
+        self.burst = burst
+        self.max_runs = STREAM_RUNS if max_runs is None else max_runs
+        self.attach_seconds = STREAM_ATTACH if attach_seconds is None else attach_seconds
+        self.started = 0
+        self.cancelled = 0
+        self.abandoned = 0
+        self._runs = {}
+        self._timers = {}
+        self._lock = threading.Lock()
+
+    def start(self, ast, budget=None):
+        """Starts running ast and returns its ProgramRun; its stream must be opened within attach_seconds."""
+        with self._lock:
+            if self.max_runs and len(self._runs) >= self.max_runs:
+                raise StreamError("Too many programs are running; try again shortly.")
+            run = ProgramRun(uuid.uuid4().hex, ast, budget)
+            timer = threading.Timer(self.attach_seconds, self._abandon, (run.id,))
+            timer.daemon = True
+            self._runs[run.id] = run
+            self._timers[run.id] = timer
+            self.started += 1
+        timer.start()
+        return run
+
+    def stream(self, run_id, plain=False):
+        """
+        The run's event stream, or its plain-text output if plain; None if
+        there is no such run. Closing the stream cancels the run.
+        """
+        with self._lock:
+            run = self._runs.get(run_id)
+            if run is None:
+                return None
+            if run.attached:
+                raise StreamError("This run is already being streamed.")
+            run.attached = True
+            self._timers.pop(run_id).cancel()
+
+        def events():
+            try:
+                rate_limit = RateLimit(self.rate, self.burst)
+                yield from run.text(rate_limit) if plain else run.events(rate_limit)
+            finally:
+                # Also reached when the client disconnects and the server closes the generator.
+                run.cancel()
+                self._remove(run_id)
+
+        return events()
+
+    def cancel(self, run_id):
+        """Cancels a run; False if there is no such run."""
+        with self._lock:
+            run = self._runs.get(run_id)
+            if run is None:
+                return False
+            self.cancelled += 1
+        run.cancel()
+        return True
+
+    def _abandon(self, run_id):
+        with self._lock:
+            run = self._runs.get(run_id)
+            if run is None or run.attached:
+                return
+            del self._runs[run_id]
+            del self._timers[run_id]
+            self.abandoned += 1
+        run.cancel()
+
+    def _remove(self, run_id):
+        with self._lock:
+            self._runs.pop(run_id, None)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "running": len(self._runs),
+                "started": self.started,
+                "cancelled": self.cancelled,
+                "abandoned": self.abandoned,
+            }
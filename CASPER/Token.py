@@ -151,6 +151,8 @@ class TokenType(Enum):
 
 
 class Token:
+    __slots__ = ("type", "literal", "line_no", "position", "valid_delims")
+
     def __init__(
         self, 
         type, 
@@ -177,6 +179,23 @@ class Token:
     def __repr__(self) -> str:
         return str(self)
 
+
+class ParserToken:
+    """
+    The token shape PLY reads: a string `type`, `value`, `lineno` and
+    `lexpos`. PLY attaches `lexer` itself when it reports a syntax error.
+    """
+    __slots__ = ("type", "value", "lineno", "lexpos", "lexer")
+
+    def __init__(self, type: str, value: Any, lineno: int, lexpos: int) -> None:
+        self.type = type
+        self.value = value
+        self.lineno = lineno
+        self.lexpos = lexpos
+
+    def __repr__(self) -> str:
+        return f"LexToken({self.type},{self.value!r},{self.lineno},{self.lexpos})"
+
 KEYWORDS: dict[str, TokenType] = {
     "birth": TokenType.BIRTH,
     "ghost": TokenType.GHOST,
@@ -0,0 +1,78 @@
+# Trace.py
+#
+# Structured debug tracing for the compiler stages. Tracing is off by default.
+# Set CASPER_TRACE to a comma-separated list of stages (or "all") to trace
+# every compile in the process to stderr, or pass a Tracer to one compile to
+# collect its events, e.g. for a single web request.
+#
+# Stages guard their trace calls with `tracer.enabled(stage)`, so a disabled
+# tracer costs one set lookup per call site and never formats anything.
+
+import os
+import sys
+
+TRACE_STAGES = os.environ.get("CASPER_TRACE", "")
+
+
+class TraceEvent:
+    """One trace record: the stage that emitted it, an event name and its fields."""
+
+    __slots__ = ("stage", "event", "fields")
+
+    def __init__(self, stage, event, fields):
+        self.stage = stage
+        self.event = event
+        self.fields = fields
+
+    def __str__(self):
+        line = f"[{self.stage}] {self.event}"
+        blocks = []
+        for name, value in self.fields.items():
+            text = str(value)
+            if "\n" in text:
+                blocks.append(text)
+            else:
+                line += f" {name}={text}"
+        return "\n".join([line] + blocks)
+
+    def __repr__(self):
+        return f"TraceEvent({self.stage!r}, {self.event!r}, {self.fields!r})"
+
+
+class Tracer:
+    """
+    Collects TraceEvents for the stages it was created for.
+
+    `stages` is an iterable of stage names, or "all". Events are kept in
+    `events`, or written to `stream` as they happen when one is given, so a
+    long-lived tracer does not grow without bound.
+    """
+
+    def __init__(self, stages="all", stream=None):
+        if isinstance(stages, str):
+            stages = [stage.strip() for stage in stages.split(",") if stage.strip()]
+        self.stages = frozenset(stages)
+        self.stream = stream
+        self.events = []
+
+    def enabled(self, stage):
+        return stage in self.stages or "all" in self.stages
+
+    def emit(self, stage, event, **fields):
+        if not self.enabled(stage):
+            return
+        record = TraceEvent(stage, event, fields)
+        if self.stream is None:
+            self.events.append(record)
+        else:
+            print(record, file=self.stream)
+
+    def format(self):
+        return "\n".join(str(record) for record in self.events)
+
+
+def tracer_from_env(stages=TRACE_STAGES):
+    """The process-wide tracer: CASPER_TRACE stages written to stderr, or nothing when unset."""
+    if stages.lower() in ("1", "true", "yes"):
+        stages = "all"
+    return Tracer(stages, stream=sys.stderr)
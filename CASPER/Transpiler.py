@@ -0,0 +1,553 @@
+# Transpiler.py
+#
+# Translates a parsed CASPER program into Python source, compiles that with
+# compile() and runs the resulting code object, so a program executes at
+# CPython speed with no AST interpretation left. Every function declaration
+# becomes a Python function, @main_casper becomes casper_main(), and each
+# variable is the one CodeGen's SlotResolver finds: a local of the enclosing
+# function, or else a module global. CodeGen's tree walker says what a
+# program means and the generated code keeps to it, statement for statement:
+# a check becomes an if/elif chain and a loop a Python `while` loop, and a
+# node the walker only runs for its effects (swap, casts, input()) becomes
+# those effects and None. Conditions that are comparisons are tested as the
+# bools they are; any other goes through _truthy(), since "Night" is false.
+# Runs are held to a Budget as the walker's are: _enter() (each call) and
+# _step() (each loop iteration) take its steps, and + and * go through _add
+# and _multiply, which refuse to build a list or string over its caps,
+# unless the analyzer typed both operands as numbers.
+#
+# Code objects are cached by the SHA-256 of the text they were compiled
+# from, so running the same program again skips lexing, parsing and
+# translation altogether (see compile_source). To see the generated Python:
+#
+#   python Transpiler.py tests/test.lime
+
+import hashlib
+import re
+import sys
+from collections import OrderedDict
+
+from Budget import Budget, BudgetExceeded
+from CodeGen import (
+    MAX_CALL_DEPTH, SlotResolver, _BINARY_OPERATORS, _deep_recursion, _flatten_nodes, _numeric_operands,
+    _operator_of, _split_conditional, _truthy,
+)
+from Parser import ASTNode
+
+
+class TranspileError(Exception):
+    """Raised when a program cannot be translated to Python or fails while running."""
+    pass
+
+
+# Only + and * can build a list or string longer than their operands, so the
+# run's Budget does them (see Budget.add and Budget.multiply).
+_SIZED_OPERATORS = {"+": "_add", "*": "_multiply"}
+# Nodes whose Python text has no effect, so it is dropped where only effects count.
+_PURE = ("literal", "neg_int", "neg_flt", "str_lit", "var_call")
+# Operators whose Python result is already a bool.
+_TESTS = ("<", ">", "<=", ">=", "==", "!=", "&&", "||")
+
+
+def _operand(node):
+    """node without the value, paren and operator-less expression nodes wrapped around it."""
+    while isinstance(node, ASTNode) and node.children:
+        if node.type in ("expression", "condition"):
+            tail = node.children[1] if len(node.children) > 1 else None
+            if tail is not None and len(tail.children) >= 2:
+                break
+        elif node.type not in ("value", "paren"):
+            break
+        node = node.children[0]
+    return node
+
+
+def _is_pure(node):
+    node = _operand(node)
+    if not isinstance(node, ASTNode):
+        return not isinstance(node, list)
+    return node.type in _PURE
+
+
+def _is_number(node):
+    node = _operand(node)
+    return isinstance(node, ASTNode) and node.type in ("literal", "neg_int", "neg_flt") and type(node.value) in (int, float)
+
+# Code objects keyed by the hex digest of their CASPER or Python source.
+CACHE_SIZE = 256
+_code_cache = OrderedDict()
+
+
+def _mangle(prefix, name):
+    """'$total' -> 'v_total'; the prefix keeps CASPER names clear of Python ones."""
+    return prefix + re.sub(r"\W", "_", name.lstrip("$@"))
+
+
+class PythonTranspiler:
+    """
+    Emits Python source for a program AST.
+
+    As in Bytecode.py, a node is translated either for its value or for its
+    effects. _expr_<type> returns the Python text of what
+    CodeGenerator.execute_<type> yields, _stmt_<type> emits the statements
+    that do what it does, and a node the walker has no method for runs its
+    children and yields None, as in generic_execute.
+    """
+
+    def __init__(self):
+        self.global_names = []
+        self._functions = {}
+        self._lines = []
+
+    def transpile(self, ast):
+        children = _flatten_nodes(ast.children)
+        resolver = SlotResolver().resolve(children)
+        self.global_names = [_mangle("g_", name) for name in resolver.global_slots]
+        self._functions = {name: _mangle("f_", name) for name in resolver.functions}
+        if self.global_names:
+            # Every global starts out None, as in the walker's global list.
+            self._lines += [" = ".join(self.global_names) + " = None", ""]
+
+        for function in resolver.functions.values():
+            self._function(function, self._param_names(ast, function.name))
+
+        self._begin()
+        main_function = None
+        for child in children:
+            if getattr(child, "type", None) == "main_function":
+                main_function = child
+            else:
+                self._effect(child)
+        if main_function is None:
+            self._emit("_show('Error: main_function node not found.')")
+        elif main_function.children:
+            # execute_program runs the main function's statements without flattening its children.
+            self._effect(main_function.children[0])
+        else:
+            self._emit("_show('Warning: main_function node has no statements.')")
+        self._finish("def casper_main():")
+        return "\n".join(self._lines) + "\n"
+
+    def _param_names(self, ast, name):
+        """Parameter idents of the declaration SlotResolver kept for name: the last one."""
+        parameters = None
+        for node in _flatten_nodes(ast.children):
+            if getattr(node, "type", None) == "function_declaration":
+                children = [child for child in node.children if not isinstance(child, list)]
+                if children[1].value == name:
+                    parameters = children[2]
+        return [param.children[1] for param in parameters.children] if parameters is not None else []
+
+    # -- functions ------------------------------------------------------------
+
+    def _begin(self):
+        self._body = []
+        self._depth = 1
+        self._locals = {}
+
+    def _finish(self, header, params=()):
+        """Appends the function: header, globals, None for every other local, then the body."""
+        lines = [header]
+        if self.global_names:
+            lines.append("    global " + ", ".join(self.global_names))
+        others = [name for name in self._locals if name not in params]
+        if others:
+            lines.append("    " + " = ".join(others) + " = None")
+        lines.extend(self._body or ["    pass"])
+        self._lines.extend(lines + [""])
+
+    def _function(self, function, params):
+        self._begin()
+        names = [self._name(param) for param in params]
+        if len(set(names)) != len(names):
+            raise TranspileError(f"Function '{function.name}' repeats a parameter name.")
+        self._emit("_enter()")
+        self._effect(function.body)
+        self._emit(f"_result = {self._value(function.revive)}")
+        self._emit("_leave()")
+        self._emit("return _result")
+        # Missing arguments read None, and extra ones are ignored, as with the walker's frames.
+        signature = ", ".join([f"{name}=None" for name in names] + ["*_"])
+        self._finish(f"def {self._functions[function.name]}({signature}):", names)
+
+    # -- emission and names ---------------------------------------------------
+
+    def _emit(self, line):
+        self._body.append("    " * self._depth + line)
+
+    def _block(self, statements):
+        self._depth += 1
+        start = len(self._body)
+        self._effect(statements)
+        if len(self._body) == start:
+            self._emit("pass")
+        self._depth -= 1
+
+    def _name(self, ident):
+        if ident.is_global:
+            return _mangle("g_", ident.value)
+        name = _mangle("v_", ident.value)
+        self._locals[name] = None
+        return name
+
+    # -- nodes ----------------------------------------------------------------
+
+    def _value(self, node):
+        """Python text that does what CodeGenerator.execute_node(node) does and yields its result."""
+        if not isinstance(node, ASTNode):
+            # None, and the bare operator strings and numbers some nodes hold.
+            if isinstance(node, list):
+                raise TranspileError("Cannot translate a statement list as a value.")
+            return "None"
+        children = _flatten_nodes(node.children) if node.children else []
+        if hasattr(self, f"_stmt_{node.type}"):
+            raise TranspileError(f"Cannot translate '{node.type}' as a value.")
+        translate = getattr(self, f"_expr_{node.type}", None)
+        if translate is not None:
+            return translate(node, children)
+        texts = [text for text in map(self._value, children) if text != "None"]
+        return f"({', '.join(texts + ['None'])})[-1]" if texts else "None"
+
+    def _effect(self, node):
+        """Emits statements that run node for what it does."""
+        if isinstance(node, list):
+            for item in _flatten_nodes(node):
+                self._effect(item)
+            return
+        if _is_pure(node):
+            return
+        children = _flatten_nodes(node.children) if node.children else []
+        handler = getattr(self, f"_stmt_{node.type}", None)
+        if handler is not None:
+            handler(node, children)
+        elif hasattr(self, f"_expr_{node.type}"):
+            text = self._value(node)
+            if text != "None":
+                self._emit(text)
+        else:
+            for child in children:
+                self._effect(child)
+
+    def _test(self, node):
+        """Python text that is true when node's value is, as _truthy() decides."""
+        text = self._value(node)
+        node = _operand(node)
+        if isinstance(node, ASTNode) and node.type in ("expression", "condition") and len(node.children) > 1:
+            tail = node.children[1]
+            if tail is not None and len(tail.children) >= 2 and _operator_of(tail) in _TESTS:
+                return text
+        return f"_truthy({text})"
+
+    @staticmethod
+    def _adds_number(operator, *operands):
+        # Adding a number constant cannot build a list or string, so the Budget need not check it.
+        return operator == "+" and any(map(_is_number, operands))
+
+    def _compound(self, ident, tail):
+        """Emits `ident op= value` for the tail holding op and value; the value is evaluated before the variable is read."""
+        op, value_node = _operator_of(tail), tail.children[1]
+        if op[0] not in _BINARY_OPERATORS:
+            raise TranspileError(f"Cannot translate the '{op}' operator to Python.")
+        name, value = self._name(ident), self._value(value_node)
+        if not _is_pure(value_node):
+            self._emit(f"_right = {value}")
+            value = "_right"
+        if op[0] in _SIZED_OPERATORS and not (_numeric_operands(tail) or self._adds_number(op[0], value_node)):
+            self._emit(f"{name} = {_SIZED_OPERATORS[op[0]]}({name}, {value})")
+        else:
+            self._emit(f"{name} = {name} {op[0]} {value}")
+
+    def _stmt_output_statement(self, node, children):
+        if children:
+            self._emit(f"_show({self._value(children[0])})")
+        else:
+            self._emit("_show('Warning: output_statement has no children.')")
+
+    def _expr_value(self, node, children):
+        return self._value(children[0] if children else None)
+
+    def _expr_expression(self, node, children):
+        tail = children[1] if len(children) > 1 else None
+        if tail is None or len(tail.children) < 2:
+            return self._value(children[0])
+        operator = _operator_of(tail)
+        left, right = self._value(children[0]), self._value(tail.children[1])
+        if operator in ("&&", "||"):
+            # && and || short-circuit, so the right operand may never run.
+            return f"(_truthy({left}) {'and' if operator == '&&' else 'or'} _truthy({right}))"
+        if operator in _SIZED_OPERATORS and not (
+                _numeric_operands(node) or self._adds_number(operator, children[0], tail.children[1])):
+            return f"{_SIZED_OPERATORS[operator]}({left}, {right})"
+        if operator in _BINARY_OPERATORS:
+            return f"({left} {operator} {right})"
+        # Other operators still evaluate the right operand, then yield the left one.
+        return f"({left}, {right})[0]"
+
+    _expr_condition = _expr_expression
+
+    def _expr_paren(self, node, children):
+        return self._value(children[0])
+
+    def _expr_neg_int(self, node, children):
+        return f"({-node.value!r})"
+
+    _expr_neg_flt = _expr_neg_int
+
+    def _expr_literal(self, node, children):
+        return repr(node.value)
+
+    def _expr_str_lit(self, node, children):
+        return repr(node.value.strip('"'))
+
+    def _stmt_global_statement(self, node, children):
+        self._emit(f"{self._name(children[1])} = {self._value(children[3] if len(children) > 3 else None)}")
+
+    def _stmt_var_statement(self, node, children):
+        # `int $a, $b = 1` declares both names; each `= value` belongs to the name before it.
+        ident = children[1] if len(children) > 1 else None
+        for extra in children[3:]:
+            if extra is None:
+                continue
+            if extra.type == "local_var_more":
+                if ident is not None:
+                    self._emit(f"{self._name(ident)} = None")
+                ident = extra.children[0]
+            elif extra.type == "local_var_assign":
+                if ident is not None:
+                    self._emit(f"{self._name(ident)} = {self._value(extra)}")
+                else:
+                    self._effect(extra)
+                ident = None
+        if ident is not None:
+            self._emit(f"{self._name(ident)} = None")
+
+    def _stmt_control_variable(self, node, children):
+        self._emit(f"{self._name(children[1])} = {self._value(children[2])}")
+
+    def _expr_local_var_assign(self, node, children):
+        return self._value(children[0])
+
+    def _expr_var_call(self, node, children):
+        return self._name(children[0]) if children else "None"
+
+    def _expr_var_postfix(self, node, children):
+        var_call, postfix = children[0], children[1] if len(children) > 1 else None
+        value = self._value(var_call)
+        if postfix not in ("++", "--"):
+            return value
+        # Postfix yields the old value, then stores the updated one.
+        name = self._name(var_call.children[0])
+        return f"({value}, {name} := {name} {postfix[0]} 1)[0]"
+
+    def _stmt_assignment_statement(self, node, children):
+        target = children[0] if children else None
+        if target is not None and target.type == "IDENT":
+            tail = children[1]
+            if tail.type != "assign_tail_op":
+                # .push() and .splice() change nothing; their items are only evaluated.
+                for child in children:
+                    self._effect(child)
+                return
+            op = _operator_of(tail)
+            if op == "=":
+                self._emit(f"{self._name(target)} = {self._value(tail.children[1])}")
+            else:
+                self._compound(target, tail)
+            return
+        # An element or list target replaces the whole variable; its indexes are never evaluated.
+        value = self._value(children[2] if len(children) > 2 else None)
+        if target is not None and target.children:
+            self._emit(f"{self._name(target.children[0])} = {value}")
+        elif value != "None":
+            self._emit(value)
+
+    def _stmt_conditional_statement(self, node, children):
+        condition, body, branches = _split_conditional(children)
+        self._emit(f"if {self._test(condition)}:")
+        self._block(body)
+        for branch in branches:
+            branch_children = _flatten_nodes(branch.children)
+            self._emit(f"elif {self._test(branch_children[0])}:")
+            self._block(branch_children[1:])
+
+    def _stmt_for_loop(self, node, children):
+        self._effect(children[0])
+        self._emit(f"while {self._test(children[1])}:")
+        self._loop_body(children[3:], children[2])
+
+    def _stmt_until_loop(self, node, children):
+        self._emit(f"while not {self._test(children[0])}:")
+        self._loop_body(children[1:])
+
+    def _stmt_repeat_until(self, node, children):
+        self._emit("while True:")
+        self._loop_body(children[:-1])
+        self._depth += 1
+        self._emit(f"if {self._test(children[-1])}:")
+        self._emit("    break")
+        self._depth -= 1
+
+    def _loop_body(self, statements, update=None):
+        """Emits one iteration: a budget step, the statements, then the update."""
+        self._depth += 1
+        self._emit("_step()")
+        self._effect(statements)
+        if update is not None:
+            self._effect(update)
+        self._depth -= 1
+
+    def _stmt_update(self, node, children):
+        var_call, tail = children[0], children[1]
+        ident = var_call.children[0]
+        if tail.type == "update_tail_postfix":
+            name = self._name(ident)
+            self._emit(f"{name} = {name} {'+' if tail.value == '++' else '-'} 1")
+        else:
+            self._compound(ident, tail)
+
+    def _stmt_function_declaration(self, node, children):
+        # Bodies run when called; every function is translated up front.
+        pass
+
+    def _expr_function_call(self, node, children):
+        if not children:
+            return "None"
+        name = getattr(children[0], "value", None)
+        args_node = children[1] if len(children) > 1 else None
+        args = [self._value(arg) for arg in _flatten_nodes(args_node.children)] if args_node and args_node.children else []
+        if name == "display":
+            return f"_show({', '.join(args)})"
+        if name in self._functions:
+            return f"{self._functions[name]}({', '.join(args)})"
+        # A function declared nowhere still evaluates its arguments, then yields None.
+        return f"({', '.join(args + ['None'])})[-1]" if args else "None"
+
+
+def transpile_program(ast):
+    """Returns the Python source of a parsed program."""
+    return PythonTranspiler().transpile(ast)
+
+
+def _cached(key, build):
+    code = _code_cache.get(key)
+    if code is None:
+        code = _code_cache[key] = build()
+        if len(_code_cache) > CACHE_SIZE:
+            _code_cache.popitem(last=False)
+    else:
+        _code_cache.move_to_end(key)
+    return code
+
+
+def compile_python(python_source):
+    """Compiles generated Python source, reusing the code object cached for identical source."""
+    key = hashlib.sha256(python_source.encode()).hexdigest()
+
+    def build():
+        try:
+            return compile(python_source, f"<casper {key[:12]}>", "exec")
+        except (SyntaxError, RecursionError, MemoryError):
+            # CPython's parser caps how deeply expressions may nest.
+            raise TranspileError("The program nests expressions too deeply to compile as Python.") from None
+    return _cached(key, build)
+
+
+def compile_program(ast):
+    """Translates and compiles a parsed program to a Python code object."""
+    return compile_python(transpile_program(ast))
+
+
+def compile_source(source, parser=None):
+    """
+    Compiles CASPER source text to a code object. A program seen before is
+    served from the cache by the hash of its text, without being lexed or
+    parsed again; syntax errors are raised as SyntaxError and never cached.
+    """
+    key = hashlib.sha256(source.encode()).hexdigest()
+
+    def build():
+        from Lexer import TokenStream
+        from Parser import build_parser
+
+        ast = (parser or build_parser()).parse(lexer=TokenStream(source))
+        return compile_program(ast)
+    return _cached(key, build)
+
+
+def clear_cache():
+    _code_cache.clear()
+
+
+def execute(code, display=print, budget=None):
+    """Runs a compiled program in a fresh namespace, so globals never leak between runs."""
+    budget = budget if budget is not None else Budget()
+    depth = 0
+    fuel = budget.start()
+
+    def enter():
+        # The walker's CodeGenerator.call: the depth limit, then one budget step.
+        nonlocal depth, fuel
+        if depth >= MAX_CALL_DEPTH:
+            raise RecursionError("maximum call depth exceeded")
+        fuel -= 1
+        if not fuel:
+            fuel = budget.refuel()
+        depth += 1
+
+    def step():
+        nonlocal fuel
+        fuel -= 1
+        if not fuel:
+            fuel = budget.refuel()
+
+    def leave():
+        nonlocal depth
+        depth -= 1
+
+    def show(*values):
+        display(" ".join(str(value) for value in values))
+
+    namespace = {
+        "__builtins__": __builtins__,
+        "_show": show,
+        "_enter": enter,
+        "_leave": leave,
+        "_step": step,
+        "_add": budget.add,
+        "_multiply": budget.multiply,
+        "_truthy": _truthy,
+    }
+    try:
+        with _deep_recursion():
+            exec(code, namespace)
+            namespace["casper_main"]()
+    except (BudgetExceeded, ArithmeticError, AttributeError, IndexError, KeyError, MemoryError,
+            RecursionError, TypeError, ValueError) as error:
+        raise TranspileError(f"Runtime Error: {error}") from error
+
+
+def run_program(ast, display=print, budget=None):
+    """Translates, compiles and runs a parsed program."""
+    execute(compile_program(ast), display, budget)
+
+
+def run_source(source, display=print, parser=None, budget=None):
+    """Runs CASPER source text, reusing a cached code object when the same text ran before."""
+    execute(compile_source(source, parser), display, budget)
+
+
+if __name__ == "__main__":
+    from Lexer import TokenStream
+    from Parser import build_parser
+
+    with open(sys.argv[1]) as f:
+        text = f.read()
+    parser = build_parser()
+    for source in (chunk.strip() for chunk in re.split(r"(?<=ghost)", text)):
+        if source:
+            try:
+                python_source = transpile_program(parser.parse(lexer=TokenStream(source.replace("\n", "\r\n"))))
+            except (SyntaxError, TranspileError) as error:
+                print(f"{error}\n")
+                continue
+            print(python_source)
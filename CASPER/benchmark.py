@@ -0,0 +1,650 @@
+# benchmark.py
+#
+# Micro-benchmarks for the CASPER pipeline. Run from the CASPER directory:
+#   python benchmark.py parser
+#
+# These only time things. Whether the engines behave the same is checked by
+# test_casper.py, which also holds the programs timed here.
+
+import argparse
+import concurrent.futures
+import contextlib
+import gc
+import io
+import os
+import tempfile
+import time
+import tracemalloc
+
+import ply.yacc as yacc
+
+from Budget import Budget
+from Lexer import LEXER_ENGINES, Lexer, TokenArray, TokenStream, make_lexer
+from Token import TokenType
+import Bytecode
+import CBackend
+import CodeGen
+import CompileCache
+import DocumentSync
+import ExecutionPool
+import LanguageServer
+import LLVMBackend
+import Optimizer
+import Parser
+from Output import BufferSink, ChunkedSink
+import Streaming
+import Transpiler
+from Semantics import SemanticAnalyzer
+from test_casper import (CONSTANT_HEAVY, CUBE_ITERATION, FIBONACCI, LOOP_INVARIANT,
+                         ast_signature, display_heavy, generate_program, load_programs, straight_line)
+
+
+def parse_quietly(parser, source):
+    try:
+        return parser.parse(lexer=Lexer(source))
+    except SyntaxError:
+        return None
+
+
+def best_of(repeat, func):
+    """Runs func() `repeat` times and returns the fastest wall time in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_parser(args):
+    programs = load_programs(args.file)
+
+    def cold():
+        # What every request used to pay: grammar reflection + table load.
+        for source in programs:
+            parser = yacc.yacc(module=Parser, debug=False, write_tables=False, errorlog=yacc.NullLogger())
+            parse_quietly(parser, source)
+
+    def warm():
+        for source in programs:
+            parse_quietly(Parser.build_parser(), source)
+
+    Parser.warm_up_parser()
+    cold_time = best_of(args.repeat, cold) / len(programs)
+    warm_time = best_of(args.repeat, warm) / len(programs)
+    print(f"{len(programs)} programs from {args.file}")
+    print(f"cold (yacc.yacc per request): {cold_time * 1000:8.3f} ms/parse")
+    print(f"warm (shared tables):         {warm_time * 1000:8.3f} ms/parse")
+    print(f"speedup: {cold_time / warm_time:.1f}x")
+
+
+def bench_parser_tables(args):
+    def load():
+        # What the first request of a fresh worker pays: reflection plus parsetab.py.
+        return yacc.yacc(module=Parser, debug=False, write_tables=False, errorlog=yacc.NullLogger())
+
+    tables = load()
+    actions = sum(len(row) for row in tables.action.values())
+    gotos = sum(len(row) for row in tables.goto.values())
+    print(f"{len(tables.action)} LALR states, {len(tables.productions)} productions")
+    print(f"{actions} action entries, {gotos} goto entries")
+    print(f"parsetab.py: {os.path.getsize('parsetab.py') / 1024:.1f} KiB")
+    print(f"table load: {best_of(args.repeat, load) * 1000:.2f} ms")
+
+
+def bench_token_stream(args):
+    source = generate_program(args.size)
+    parser = Parser.build_parser()
+
+    def two_pass():
+        # The old request path: one lexer for diagnostics, a second one for PLY.
+        lexer = Lexer(source)
+        while lexer.current_char is not None:
+            lexer.next_token()
+        parser.parse(lexer=Lexer(source))
+
+    def one_pass():
+        parser.parse(lexer=TokenStream(source))
+
+    two_pass_time = best_of(args.repeat, two_pass)
+    one_pass_time = best_of(args.repeat, one_pass)
+    print(f"{args.size} statements, {len(source)} chars")
+    print(f"lex twice + parse:         {two_pass_time * 1000:8.2f} ms")
+    print(f"TokenStream once + parse:  {one_pass_time * 1000:8.2f} ms")
+
+
+class StackProbe:
+    """Replays a TokenStream and records the deepest PLY state stack seen."""
+
+    def __init__(self, source, parser):
+        self.stream = TokenStream(source)
+        self.parser = parser
+        self.max_depth = 0
+
+    def token(self):
+        self.max_depth = max(self.max_depth, len(self.parser.statestack))
+        return self.stream.token()
+
+
+def bench_parser_engines(args):
+    source = generate_program(args.size)
+    stream = TokenStream(source)
+    timings = {}
+    for engine in Parser.PARSER_ENGINES:
+        parser = Parser.build_parser(engine)
+
+        def parse():
+            stream.reset()
+            parser.parse(lexer=stream)
+
+        gc.disable()
+        try:
+            timings[engine] = best_of(args.repeat, parse)
+        finally:
+            gc.enable()
+        print(f"{engine:>8} engine: {timings[engine] * 1000:8.2f} ms for {args.size} statements")
+    print(f"descent speedup: {timings['lalr'] / timings['descent']:.1f}x")
+
+
+def bench_parser_scaling(args):
+    parser = Parser.build_parser()
+    previous = None
+    for size in (int(size) for size in args.sizes.split(",")):
+        source = generate_program(size)
+        stream = TokenStream(source)
+
+        def parse():
+            stream.reset()
+            parser.parse(lexer=stream)
+
+        # Like timeit, keep the cyclic GC out of the measurement; its full
+        # collections grow with the live AST and would hide the parser's own scaling.
+        gc.disable()
+        try:
+            elapsed = best_of(args.repeat, parse)
+        finally:
+            gc.enable()
+        probe = StackProbe(source, parser)
+        parser.parse(lexer=probe)
+        per_statement = elapsed / size * 1e6
+        growth = f"  x{per_statement / previous:.2f} per statement" if previous else ""
+        print(f"{size:>7} statements: {elapsed * 1000:9.1f} ms  {per_statement:6.1f} us/statement  "
+              f"max stack {probe.max_depth}{growth}")
+        previous = per_statement
+
+
+def nested_expression(shape, depth):
+    """A `depth`-level int expression: a left-leaning operator chain or nested parentheses."""
+    if shape == "chain":
+        return " ".join(["$x"] + [f"{'+-*'[i % 3]} {i + 1}" for i in range(depth)])
+    text = "$x"
+    for i in range(depth):
+        text = f"({text} {'+-*'[i % 3]} {i + 1})"
+    return text
+
+
+def bench_type_inference(args):
+    """Type-checks one deeply nested initializer; time per AST node should stay flat as depth grows."""
+    parser = Parser.build_parser()
+    for shape in ("chain", "paren"):
+        previous = None
+        for depth in (int(depth) for depth in args.depths.split(",")):
+            source = "\r\n".join([
+                "birth", "@main_casper() {", "    int $x = 1",
+                f"    int $y = {nested_expression(shape, depth)}", "}", "ghost",
+            ])
+            ast = parser.parse(lexer=TokenStream(source))
+            nodes = sum(1 for entry in ast_signature(ast) if entry[0] not in ("list", "leaf"))
+            errors = []
+
+            def analyze():
+                errors[:] = SemanticAnalyzer().analyze(ast)
+
+            elapsed = best_of(args.repeat, analyze)
+            assert not errors, errors
+            per_node = elapsed / nodes * 1e6
+            growth = f"  x{per_node / previous:.2f} per node" if previous else ""
+            print(f"{shape:>5} depth {depth:>4}: {nodes:>5} nodes  {elapsed * 1000:8.2f} ms  "
+                  f"{per_node:6.2f} us/node{growth}")
+            previous = per_node
+
+
+def bench_codegen(args):
+    source = generate_program(args.size)
+    ast = Parser.build_parser().parse(lexer=TokenStream(source))
+    with open(os.devnull, "w") as sink, contextlib.redirect_stdout(sink):
+        walk = best_of(args.repeat, lambda: CodeGen.CodeGenerator().generate(ast))
+        compiler = CodeGen.ClosureCompiler()
+        compile_time = best_of(args.repeat, lambda: compiler.compile(ast))
+        program = compiler.compile(ast)
+        run_time = best_of(args.repeat, program)
+    print(f"tree walker:      {walk * 1000:8.2f} ms for {args.size} statements")
+    print(f"closure compile:  {compile_time * 1000:8.2f} ms")
+    print(f"closure run:      {run_time * 1000:8.2f} ms  ({walk / run_time:.1f}x faster than walking)")
+
+    # Call-heavy: every @fib call gets a fresh frame of slots.
+    ast = Parser.build_parser().parse(lexer=TokenStream(FIBONACCI.replace("\n", "\r\n") % 18))
+    timings = {}
+    with open(os.devnull, "w") as sink, contextlib.redirect_stdout(sink):
+        for engine in CodeGen.CODEGEN_ENGINES:
+            timings[engine] = best_of(args.repeat, lambda: CodeGen.run_code_generation(ast, engine))
+    for engine, elapsed in timings.items():
+        print(f"@fib(18) {engine:>8}: {elapsed * 1000:8.2f} ms  ({elapsed / 8361 * 1e6:.2f} us per call)")
+
+
+def bench_optimizer(args):
+    parser = Parser.build_parser()
+
+    def prepare(source, passes):
+        ast = parser.parse(lexer=TokenStream(source.replace("\n", "\r\n")))
+        assert SemanticAnalyzer().analyze(ast) == []
+        return ast, Optimizer.optimize(ast, passes)
+
+    timings = {}
+    source = CONSTANT_HEAVY % 16
+    for passes in ("none", "fold", "fold,branches"):
+        ast, report = prepare(source, passes)
+        optimize_time = best_of(args.repeat, lambda: prepare(source, passes))
+        with open(os.devnull, "w") as sink, contextlib.redirect_stdout(sink):
+            program = CodeGen.ClosureCompiler().compile(ast)
+            closure = best_of(args.repeat, program)
+        module = Bytecode.compile_program(ast)
+        vm = best_of(args.repeat, lambda: Bytecode.VirtualMachine(module, display=len).run())
+        timings[passes] = (report.count(), closure, vm)
+    print("@fib(16) with constant subexpressions and constant checks:")
+    for passes, (count, closure, vm) in timings.items():
+        print(f"  {passes:>13}: {count:3d} rewrites  closure run {closure * 1000:8.2f} ms  "
+              f"({timings['none'][1] / closure:.2f}x)  vm run {vm * 1000:8.2f} ms  ({timings['none'][2] / vm:.2f}x)")
+    print(f"  parsing, analyzing and optimizing it takes {optimize_time * 1000:.2f} ms")
+
+    outer = max(args.size, 10)
+    source = LOOP_INVARIANT % outer
+    timings = {}
+    for passes in ("none", "hoist"):
+        ast, report = prepare(source, passes)
+        with open(os.devnull, "w") as sink, contextlib.redirect_stdout(sink):
+            closure = best_of(args.repeat, CodeGen.ClosureCompiler().compile(ast))
+        module = Bytecode.compile_program(ast)
+        vm = best_of(args.repeat, lambda: Bytecode.VirtualMachine(module, display=len).run())
+        timings[passes] = (report.count(), closure, vm)
+    # The inner body runs outer * 10 times; hoisting takes its invariant expression out of both loops.
+    print(f"nested loops, {outer * 10} iterations of a body with an invariant expression:")
+    for passes, (count, closure, vm) in timings.items():
+        print(f"  {passes:>13}: {count:3d} rewrites  closure run {closure * 1000:8.2f} ms  "
+              f"({timings['none'][1] / closure:.2f}x)  vm run {vm * 1000:8.2f} ms  ({timings['none'][2] / vm:.2f}x)")
+
+
+def bench_output(args):
+    source = display_heavy(args.size * 10)
+    ast = Parser.build_parser().parse(lexer=TokenStream(source))
+
+    def swap_stdout():
+        # What main.py did before sinks: every run rebinds the process-wide sys.stdout.
+        with contextlib.redirect_stdout(io.StringIO()):
+            CodeGen.run_code_generation(ast, "closure")
+
+    chunks = []
+    writers = {
+        "sys.stdout swap": swap_stdout,
+        "BufferSink": lambda: CodeGen.run_code_generation(ast, "closure", output=BufferSink(0)),
+        "ChunkedSink": lambda: CodeGen.run_code_generation(ast, "closure", output=ChunkedSink(chunks.append, limit=0)),
+    }
+    timings = {name: best_of(args.repeat, write) for name, write in writers.items()}
+    for name, elapsed in timings.items():
+        print(f"{name:>16}: {elapsed * 1000:8.2f} ms for {args.size * 10} display lines")
+
+
+def bench_budget(args):
+    # What the limits cost: the default Budget against Budget.unlimited(), on the plain tree and on one
+    # the analyzer typed, whose numeric + and * (here every one of them) skip the size checks.
+    source = (CUBE_ITERATION % args.size).replace("\n", "\r\n")
+    print(f"@cubeIteration in a loop, {args.size * 4} iterations:")
+    for analyzed in (False, True):
+        ast = Parser.build_parser().parse(lexer=TokenStream(source))
+        if analyzed:
+            assert SemanticAnalyzer().analyze(ast) == []
+        module = Bytecode.compile_program(ast)
+        engines = {
+            "vm": lambda budget: Bytecode.VirtualMachine(module, display=len, budget=budget).run,
+            "closure": lambda budget: CodeGen.ClosureCompiler(BufferSink(), budget).compile(ast),
+        }
+        for name, build in engines.items():
+            limited = best_of(args.repeat, build(Budget()))
+            unlimited = best_of(args.repeat, build(Budget.unlimited()))
+            print(f"  {name:>7}, {'typed' if analyzed else 'plain'}: {limited * 1000:8.2f} ms with the limits, "
+                  f"{unlimited * 1000:8.2f} ms unlimited  ({limited / unlimited:.2f}x)")
+
+
+def bench_compile_cache(args):
+    source = generate_program(args.size)
+    with tempfile.TemporaryDirectory() as directory:
+        cache = CompileCache.CompileCache(directory=directory)
+        timings = {
+            "compile (miss)": best_of(args.repeat, lambda: CompileCache.compile_source(source).ast()),
+        }
+        cache.compile(source)
+        timings["memory hit"] = best_of(args.repeat, lambda: cache.compile(source))
+        timings["memory hit + ast()"] = best_of(args.repeat, lambda: cache.compile(source).ast())
+        # Another worker process: empty memory, same directory.
+        timings["disk hit + ast()"] = best_of(
+            args.repeat, lambda: CompileCache.CompileCache(directory=directory).compile(source).ast())
+    print(f"{args.size} statements, {len(source)} characters")
+    for name, elapsed in timings.items():
+        print(f"{name:>20}: {elapsed * 1000:8.2f} ms")
+
+
+def bench_execution_pool(args):
+    source = (FIBONACCI % 20).replace("\n", "\r\n")
+    jobs = 16
+    ExecutionPool.run_source(source)
+    print(f"{jobs} x @fib(20) jobs, {os.cpu_count()} cores")
+    for workers in (1, 2, 4):
+        with concurrent.futures.ThreadPoolExecutor(workers) as threads:
+            inline = best_of(args.repeat, lambda: list(threads.map(ExecutionPool.run_source, [source] * jobs)))
+        with ExecutionPool.ExecutionPool(workers=workers) as pool:
+            pooled = best_of(args.repeat, lambda: [future.result() for future in [pool.submit(source) for _ in range(jobs)]])
+            metrics = pool.metrics()
+        print(f"{workers} workers: threads {jobs / inline:6.1f} jobs/s   processes {jobs / pooled:6.1f} jobs/s  "
+              f"(x{inline / pooled:.2f}, mean wait {metrics['mean_wait_seconds'] * 1000:.0f} ms)")
+
+
+def bench_vm(args):
+    parser = Parser.build_parser()
+
+    # Straight-line arithmetic: every engine executes each statement once.
+    ast = parser.parse(lexer=TokenStream(straight_line(args.size)))
+    module = Bytecode.compile_program(ast)
+    timings = {}
+    with open(os.devnull, "w") as sink, contextlib.redirect_stdout(sink):
+        for engine in CodeGen.CODEGEN_ENGINES:
+            timings[engine] = best_of(args.repeat, lambda: CodeGen.run_code_generation(ast, engine))
+        timings["vm"] = best_of(args.repeat, lambda: Bytecode.run_program(ast))
+        vm_run = best_of(args.repeat, lambda: Bytecode.VirtualMachine(module).run())
+    print(f"{args.size} display statements, from AST to output:")
+    for engine, elapsed in timings.items():
+        print(f"  {engine:>8}: {elapsed * 1000:8.2f} ms  ({timings['walk'] / elapsed:.1f}x the tree walker)")
+    print(f"  {'':>8}  of which {vm_run * 1000:.2f} ms runs the compiled module")
+
+    # Loop-heavy: @cubeIteration loops three times per call, in a loop of args.size calls.
+    iterations = args.size * 4
+    ast = parser.parse(lexer=TokenStream(CUBE_ITERATION.replace("\n", "\r\n") % args.size))
+    module = Bytecode.compile_program(ast)
+    vm = best_of(args.repeat, lambda: Bytecode.VirtualMachine(module, display=len).run())
+    with open(os.devnull, "w") as sink, contextlib.redirect_stdout(sink):
+        walk = best_of(args.repeat, lambda: CodeGen.run_code_generation(ast, "walk"))
+        closure = best_of(args.repeat, CodeGen.ClosureCompiler().compile(ast))
+    print(f"@cubeIteration in a loop, {iterations} iterations:")
+    print(f"  vm run:      {vm * 1000:8.2f} ms  ({vm / iterations * 1e6:.2f} us per iteration)")
+    print(f"  tree walk:   {walk * 1000:8.2f} ms  ({walk / vm:.1f}x the vm)")
+    print(f"  closure run: {closure * 1000:8.2f} ms  ({closure / vm:.1f}x the vm)")
+
+    # Call-heavy: @fib(18) makes 8361 calls.
+    ast = parser.parse(lexer=TokenStream(FIBONACCI.replace("\n", "\r\n") % 18))
+    compile_time = best_of(args.repeat, lambda: Bytecode.compile_program(ast))
+    module = Bytecode.compile_program(ast)
+    vm = best_of(args.repeat, lambda: Bytecode.VirtualMachine(module, display=len).run())
+    with open(os.devnull, "w") as sink, contextlib.redirect_stdout(sink):
+        walk = best_of(args.repeat, lambda: CodeGen.run_code_generation(ast, "walk"))
+    print("@fib(18):")
+    print(f"  vm compile: {compile_time * 1000:8.2f} ms, {sum(len(code.code) // 2 for code in module.functions + [module.main])} instructions")
+    print(f"  vm run:     {vm * 1000:8.2f} ms  ({vm / 8361 * 1e6:.2f} us per call)")
+    print(f"  tree walk:  {walk * 1000:8.2f} ms  ({walk / vm:.1f}x the vm)")
+
+
+def bench_transpile(args):
+    parser = Parser.build_parser()
+    for title, source in ((f"@cubeIteration in a loop, {args.size * 4} iterations:", CUBE_ITERATION % args.size),
+                          ("@fib(18):", FIBONACCI % 18)):
+        ast = parser.parse(lexer=TokenStream(source.replace("\n", "\r\n")))
+        program = CodeGen.ClosureCompiler().compile(ast)
+        with open(os.devnull, "w") as sink, contextlib.redirect_stdout(sink):
+            closure = best_of(args.repeat, program)
+        code = Transpiler.compile_program(ast)
+        python = best_of(args.repeat, lambda: Transpiler.execute(code, display=len))
+        print(title)
+        print(f"  closure run:    {closure * 1000:8.2f} ms")
+        print(f"  python run:     {python * 1000:8.2f} ms  ({closure / python:.1f}x the closure engine)")
+
+    # From source text: the first run lexes, parses, translates and compiles; later runs hit the cache.
+    source = (FIBONACCI % 18).replace("\n", "\r\n")
+    def cold():
+        Transpiler.clear_cache()
+        Transpiler.run_source(source, display=len, parser=parser)
+    cold_time = best_of(args.repeat, cold)
+    warm_time = best_of(args.repeat, lambda: Transpiler.run_source(source, display=len, parser=parser))
+    print(f"  run_source cold: {cold_time * 1000:7.2f} ms")
+    print(f"  run_source warm: {warm_time * 1000:7.2f} ms  (code object cached by source hash)")
+
+
+def bench_native(args):
+    parser = Parser.build_parser()
+    # @fib(22) makes about 57,000 calls; the loop runs @cubeIteration args.size * 10 times.
+    calls = args.size * 10
+    for title, source in (("@fib(22):", FIBONACCI % 22),
+                          (f"@cubeIteration in a loop, {calls * 4} iterations:", CUBE_ITERATION % calls)):
+        ast = parser.parse(lexer=TokenStream(source.replace("\n", "\r\n")))
+        c_source = CBackend.translate_program(ast)
+        with tempfile.TemporaryDirectory() as cache_dir:
+            CBackend.CACHE_DIR = cache_dir
+            start = time.perf_counter()
+            binary = CBackend.build(c_source)
+            cold = time.perf_counter() - start
+            cached = best_of(args.repeat, lambda: CBackend.build(c_source))
+            native = best_of(args.repeat, lambda: CBackend.execute(binary, display=len))
+        program = CodeGen.ClosureCompiler().compile(ast)
+        with open(os.devnull, "w") as sink, contextlib.redirect_stdout(sink):
+            closure = best_of(args.repeat, program)
+        code = Transpiler.compile_program(ast)
+        python = best_of(args.repeat, lambda: Transpiler.execute(code, display=len))
+        print(title)
+        print(f"  cc build:    {cold * 1000:8.2f} ms cold, {cached * 1000:.3f} ms from the cache")
+        print(f"  native run:  {native * 1000:8.2f} ms  (including process start-up)")
+        print(f"  python run:  {python * 1000:8.2f} ms  ({python / native:.1f}x native)")
+        print(f"  closure run: {closure * 1000:8.2f} ms  ({closure / native:.1f}x native)")
+
+
+def bench_llvm(args):
+    parser = Parser.build_parser()
+    calls = args.size * 10
+    ast = parser.parse(lexer=TokenStream((CUBE_ITERATION % calls).replace("\n", "\r\n")))
+    start = time.perf_counter()
+    ir = LLVMBackend.generate_ir(ast)
+    lowering = time.perf_counter() - start
+    with open(os.devnull, "w") as sink, contextlib.redirect_stdout(sink):
+        interpreted = best_of(args.repeat, lambda: CodeGen.run_code_generation(ast))
+    print(f"@cubeIteration in a loop, {calls * 4} iterations:")
+    print(f"  IR generation: {lowering * 1000:8.2f} ms, {ir.count(chr(10)) + 1} lines")
+    print(f"  codegen run:   {interpreted * 1000:8.2f} ms  ({CodeGen.CODEGEN_ENGINE} engine)")
+    if LLVMBackend.llvm is None:
+        print("  llvmlite is not installed; skipping the JIT")
+        return
+
+    start = time.perf_counter()
+    main = LLVMBackend.jit_compile(ir)
+    jit_time = time.perf_counter() - start
+    jit = best_of(args.repeat, lambda: LLVMBackend.execute(main, display=len))
+    print(f"  jit compile:   {jit_time * 1000:8.2f} ms (O2, cached by IR hash afterwards)")
+    print(f"  jit run:       {jit * 1000:8.2f} ms  ({interpreted / jit:.0f}x the codegen run)")
+
+
+def lex_all(source, engine):
+    lexer = make_lexer(source, engine)
+    result = []
+    while lexer.current_char is not None:
+        tok = lexer.next_token()
+        result.append((tok.type, tok.literal, tok.line_no, tok.position, tok.valid_delims))
+    return result
+
+
+def bench_lexer(args):
+    source = generate_program(args.size)
+    print(f"{source.count(chr(10)) + 1} lines, {len(source)} chars, {len(lex_all(source, 'char'))} tokens")
+    timings = {}
+    for engine in LEXER_ENGINES:
+        timings[engine] = best_of(args.repeat, lambda: lex_all(source, engine))
+        print(f"{engine:>6} engine: {timings[engine] * 1000:8.2f} ms")
+    print(f"regex speedup: {timings['char'] / timings['regex']:.1f}x")
+    # The request path: the whole source scanned straight into a TokenStream.
+    for engine in LEXER_ENGINES:
+        elapsed = best_of(args.repeat, lambda: TokenStream(source, engine))
+        print(f"{engine:>6} TokenStream: {elapsed * 1000:8.2f} ms")
+
+
+class DictToken:
+    """The pre-__slots__ Token after TokenStream had added the PLY attributes to it."""
+
+    def __init__(self, tok):
+        self.type = tok.type
+        self.literal = tok.literal
+        self.line_no = tok.line_no
+        self.position = tok.position
+        self.valid_delims = tok.valid_delims
+        self.type = tok.type.name
+        self.value = tok.literal
+        self.lineno = tok.line_no
+
+
+def retained_bytes(build):
+    """Returns the bytes still allocated by build()'s result once it returns."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def lex_tokens(source):
+    """Yields the tokens a parser would see (no comments, no EOF)."""
+    lexer = make_lexer(source)
+    while lexer.current_char is not None:
+        tok = lexer.next_token()
+        if tok.type not in (TokenType.COMMENT, TokenType.EOF):
+            yield tok
+
+
+def bench_token_memory(args):
+    source = generate_program(args.size)
+    token_count = sum(1 for _ in lex_tokens(source))
+
+    def token_array():
+        tokens = TokenArray()
+        for tok in lex_tokens(source):
+            tokens.append(tok)
+        return tokens
+
+    layouts = {
+        "dict Token + PLY attrs": lambda: [DictToken(tok) for tok in lex_tokens(source)],
+        "slotted Token": lambda: list(lex_tokens(source)),
+        "TokenArray": token_array,
+    }
+    print(f"{args.size} statements, {token_count} parser tokens")
+    for name, build in layouts.items():
+        print(f"{name:>24}: {retained_bytes(build) / token_count:7.1f} bytes/token")
+
+
+def bench_document_sync(args):
+    source = generate_program(args.size)
+    document = DocumentSync.Document(source)
+    middle = len(document.line_starts) // 2 + 1
+
+    def type_and_erase():
+        document.apply_change(middle, 1, middle, 1, "x")
+        document.apply_change(middle, 1, middle, 2, "")
+
+    full = best_of(args.repeat, lambda: TokenStream(source))
+    edit = best_of(args.repeat, type_and_erase) / 2
+    check = best_of(args.repeat, document.check)
+    print(f"{args.size} statements, {len(document.line_starts)} lines, {len(source)} characters")
+    print(f"       full lex: {full * 1000:8.2f} ms")
+    print(f"  one-char edit: {edit * 1000:8.2f} ms  ({document.relexed_lines} lines re-lexed, x{full / edit:.0f})")
+    print(f"  check (parse): {check * 1000:8.2f} ms")
+
+
+def bench_language_server(args):
+    source = generate_program(args.size)
+    uri = "file:///bench.lime"
+    server = LanguageServer.LanguageServer(None, io.BytesIO(), debounce=3600)
+    server.did_open({"textDocument": {"uri": uri, "version": 0, "text": source}})
+    middle = len(source.split("\n")) // 2
+    version = 0
+
+    def keystroke():
+        nonlocal version
+        for text, end in (("x", 0), ("", 1)):
+            version += 1
+            change = {"range": {"start": {"line": middle, "character": 0}, "end": {"line": middle, "character": end}},
+                      "text": text}
+            server.did_change({"textDocument": {"uri": uri, "version": version}, "contentChanges": [change]})
+
+    request = {"textDocument": {"uri": uri}}
+    timings = {
+        "didChange": best_of(args.repeat, keystroke) / 2,
+        "diagnostics": best_of(args.repeat, lambda: server._diagnose(uri) or server.analyses.pop(uri)),
+        "semantic tokens": best_of(args.repeat, lambda: server.semantic_tokens(request) and server.analyses.pop(uri)),
+        "document symbols": best_of(args.repeat, lambda: server.document_symbols(request) and server.analyses.pop(uri)),
+    }
+    server.semantic_tokens(request)
+    timings["cached semantic tokens"] = best_of(args.repeat, lambda: server.semantic_tokens(request))
+    server._forget(uri)
+    print(f"{args.size} statements, {len(source)} characters")
+    for name, elapsed in timings.items():
+        print(f"{name:>22}: {elapsed * 1000:8.2f} ms")
+
+
+def bench_streaming(args):
+    ast = Parser.build_parser().parse(lexer=TokenStream(display_heavy(args.size)))
+    registry = Streaming.RunRegistry(rate=0)
+
+    def stream():
+        run = registry.start(ast)
+        return sum(len(event) for event in registry.stream(run.id))
+
+    size = stream()
+    elapsed = best_of(args.repeat, stream)
+    buffered = best_of(args.repeat, lambda: CodeGen.run_code_generation(ast, output=BufferSink()))
+    print(f"{args.size} display statements, {size} bytes of events")
+    print(f"  streamed: {elapsed * 1000:8.2f} ms")
+    print(f"  buffered: {buffered * 1000:8.2f} ms")
+
+
+BENCHMARKS = {
+    "budget": bench_budget,
+    "codegen": bench_codegen,
+    "compile_cache": bench_compile_cache,
+    "document_sync": bench_document_sync,
+    "execution_pool": bench_execution_pool,
+    "language_server": bench_language_server,
+    "lexer": bench_lexer,
+    "llvm": bench_llvm,
+    "native": bench_native,
+    "optimizer": bench_optimizer,
+    "output": bench_output,
+    "parser": bench_parser,
+    "parser_engines": bench_parser_engines,
+    "parser_scaling": bench_parser_scaling,
+    "parser_tables": bench_parser_tables,
+    "streaming": bench_streaming,
+    "token_memory": bench_token_memory,
+    "token_stream": bench_token_stream,
+    "transpile": bench_transpile,
+    "type_inference": bench_type_inference,
+    "vm": bench_vm,
+}
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="CASPER benchmarks")
+    arg_parser.add_argument("benchmark", choices=sorted(BENCHMARKS))
+    arg_parser.add_argument("--file", default="tests/test.lime")
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    arg_parser.add_argument("--size", type=int, default=2000, help="statements in generated programs")
+    arg_parser.add_argument("--sizes", default="1000,10000,50000", help="comma-separated sizes for parser_scaling")
+    arg_parser.add_argument("--depths", default="25,50,100,200", help="comma-separated nesting depths for type_inference")
+    args = arg_parser.parse_args()
+    BENCHMARKS[args.benchmark](args)
+
+
+if __name__ == "__main__":
+    main()
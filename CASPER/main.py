@@ -1,19 +1,59 @@
-from flask import Flask, request, render_template, jsonify
-import io
-import sys
+from flask import Flask, Response, request, render_template, jsonify
+import threading
 
-from Lexer import Lexer
-from Parser import build_parser
-from Token import TokenType
-from Semantics import run_semantic_analysis
-from CodeGen import run_code_generation
+from CompileCache import CompileCache
+from DocumentSync import DocumentStore, DocumentSyncError
+from ExecutionPool import POOL_WORKERS, ExecutionPool, ExecutionPoolError, run_source
+from Parser import warm_up_parser
+from Streaming import RunRegistry, StreamError
+from Trace import Tracer
 
 app = Flask(__name__)
 
+# Load the parse tables once at startup instead of on the first request.
+warm_up_parser()
+
+# Compile results shared by every request in this process (see CompileCache.py).
+compile_cache = CompileCache()
+
+# The editor sessions' documents, kept in step with Monaco's edits (see DocumentSync.py).
+documents = DocumentStore()
+
+# Programs running for a live output stream (see Streaming.py).
+runs = RunRegistry()
+
 LEXER_DEBUG = True
 PARSER_DEBUG = True
 SEMANTICS_DEBUG = True
 
+_execution_pool = None
+_execution_pool_lock = threading.Lock()
+
+def execution_pool():
+    """The worker processes that run programs, started on first use; None if CASPER_POOL_WORKERS is 0."""
+    global _execution_pool
+    if not POOL_WORKERS:
+        return None
+    with _execution_pool_lock:
+        if _execution_pool is None:
+            _execution_pool = ExecutionPool()
+        return _execution_pool
+
+def compile_and_run(code, tracer=None):
+    """
+    Compiles code through the cache and runs it if it compiled cleanly;
+    returns (diagnostics, program output). With CASPER_POOL_WORKERS set this
+    happens in a worker process, except for traced compiles, whose events
+    have to be collected here.
+    """
+    pool = execution_pool()
+    if pool is None or tracer is not None:
+        return run_source(code, compile_cache, tracer)
+    job = pool.run(code)
+    if job.status != "ok":
+        raise ExecutionPoolError(job.error)
+    return job.diagnostics, job.output
+
 @app.route("/", methods=["GET", "POST"])
 def home():
     code = ""
@@ -29,56 +69,36 @@ def home():
 
     if request.method == "POST":
         code = request.form.get("code_input", "")
+        # ?trace=semantics (or a "trace" form field) traces just this compile.
+        trace_stages = request.values.get("trace")
+        tracer = Tracer(trace_stages) if trace_stages else None
 
-        # 1. LEXICAL ANALYSIS
-        lexer = Lexer(source=code)
-        while lexer.current_char is not None:
-            token = lexer.next_token()
-            token_type = str(token.type).split(".")[-1]
-            if token_type == "ILLEGAL":
-                illegal_tokens.append(str(token))
-
-        if illegal_tokens:
-            error_count += len(illegal_tokens)
+        # 1-5. LEX, PARSE, ANALYZE, OPTIMIZE AND RUN (see compile_and_run)
+        try:
+            result, codegen_output = compile_and_run(code, tracer)
+            illegal_tokens = [message for message, _, _, _ in result.illegal_tokens]
 
-        if not illegal_tokens:
-            # 2. PARSING
-            parser = build_parser()
-            try:
-                ast = parser.parse(lexer=Lexer(code))
+            if illegal_tokens:
+                error_count += len(illegal_tokens)
+            elif result.syntax_error is not None:
+                parser_output = result.syntax_error
+                error_count += 1
+            else:
                 parser_output = "No Syntax Error"
-
-                # 3. SEMANTIC ANALYSIS
-                semantic_errors = run_semantic_analysis(ast)
-                if semantic_errors:
-                    semantic_output = "Semantic Errors:\n" + "\n".join(semantic_errors)
-                    error_count += len(semantic_errors)
+                if result.semantic_errors:
+                    semantic_output = "Semantic Errors:\n" + "\n".join(result.semantic_errors)
+                    error_count += len(result.semantic_errors)
                 else:
                     # If no semantic errors, set success message
                     semantic_output = "Compilation successful: no lexical, syntax, or semantic errors detected."
                     generated_code = "Code Generation Executed Successfully."
 
-                    # 4. CAPTURE CODE GENERATION OUTPUT
-                    backup_stdout = sys.stdout
-                    codegen_buffer = io.StringIO()
-                    try:
-                        sys.stdout = codegen_buffer
-                        run_code_generation(ast)
-                    finally:
-                        sys.stdout = backup_stdout
-
-                    # The codegen_buffer now holds whatever the code generator printed
-                    codegen_output = codegen_buffer.getvalue()
-
                     # We'll combine the success message and the codegen prints
                     output = f"{semantic_output}\n{codegen_output}"
 
-            except SyntaxError as e:
-                parser_output = str(e)
-                error_count += 1
-            except Exception as e:
-                parser_output = f"Unexpected Error: {str(e)}"
-                error_count += 1
+        except Exception as e:
+            parser_output = f"Unexpected Error: {str(e)}"
+            error_count += 1
 
         # 5. SET ERRORS AND OUTPUT
         if illegal_tokens:
@@ -95,6 +115,9 @@ def home():
         if not output:
             output = semantic_output or "WIP WIP WIP"
 
+        if tracer is not None and tracer.events:
+            generated_code = "\n".join(filter(None, [generated_code, "=== Trace ===", tracer.format()]))
+
     return render_template(
         "index.html",
         code=code,
@@ -106,45 +129,147 @@ def home():
         error_count=error_count
     )
 
-@app.route('/check_errors', methods=['POST'])
-def check_errors():
-    """Provides quick error-checking for the Monaco editor (AJAX)."""
-    code = request.json.get('code', '')
-    lexer = Lexer(code)
+def _compile_or_errors(code):
+    """(ast, None) if code compiles cleanly through the cache, else (None, a 400 response listing its errors)."""
+    try:
+        result = compile_cache.compile(code)
+    except Exception as e:
+        return None, (jsonify({"errors": [f"Unexpected Error: {e}"]}), 400)
+    if result.illegal_tokens:
+        return None, (jsonify({"errors": [message for message, _, _, _ in result.illegal_tokens]}), 400)
+    if result.syntax_error is not None:
+        return None, (jsonify({"errors": [result.syntax_error]}), 400)
+    if result.semantic_errors:
+        return None, (jsonify({"errors": result.semantic_errors}), 400)
+    return result.ast(), None
+
+@app.route('/run', methods=['POST'])
+def run():
+    """Runs a program and streams what it displays as plain text while it runs."""
+    code = request.json.get('code', '') if request.is_json else request.form.get('code_input', '')
+    ast, errors = _compile_or_errors(code)
+    if errors is not None:
+        return errors
+    # Started through the registry, so these runs count against its limit and get its budget.
+    try:
+        program = runs.start(ast)
+    except StreamError as e:
+        return jsonify({"errors": [str(e)]}), 503
+    return Response(runs.stream(program.id, plain=True), mimetype='text/plain')
+
+def editor_errors(result):
+    """Monaco markers for the illegal tokens or, failing those, the syntax error in a CompileResult."""
     illegal_tokens = []
 
-    while lexer.current_char is not None:
-        token = lexer.next_token()
-        if token.type == TokenType.ILLEGAL:
-            illegal_tokens.append({
-                "line": token.line_no,
-                "startColumn": token.position,
-                "endColumn": token.position + len(token.literal),
-                "message": f"Illegal Token: {token.literal}"
-            })
+    for _, line_no, position, literal in result.illegal_tokens:
+        illegal_tokens.append({
+            "line": line_no,
+            "startColumn": position,
+            "endColumn": position + len(literal),
+            "message": f"Illegal Token: {literal}"
+        })
 
     if illegal_tokens:
-        return jsonify({"errors": illegal_tokens})
+        return illegal_tokens
+
+    if result.syntax_error is None:
+        return []
+
+    import re
+    full_msg = result.syntax_error
+    match = re.search(r'line\s+(\d+)', full_msg)
+    if match:
+        line_no = int(match.group(1))
+    else:
+        line_no = 1
+    error_info = {
+        "message": full_msg,
+        "line": line_no,
+        "startColumn": 0,
+        "endColumn": 9999
+    }
+    return [error_info]
+
+@app.route('/runs', methods=['POST'])
+def start_run():
+    """Starts a program for a live run; its output is streamed from /runs/<id>/events."""
+    code = request.json.get('code', '')
+    ast, errors = _compile_or_errors(code)
+    if errors is not None:
+        return errors
+    try:
+        run = runs.start(ast)
+    except StreamError as e:
+        return jsonify({"errors": [str(e)]}), 503
+    return jsonify({"id": run.id}), 201
+
+@app.route('/runs/<run_id>/events')
+def run_events(run_id):
+    """Streams a live run's output as Server-Sent Events; disconnecting cancels the run."""
+    try:
+        events = runs.stream(run_id)
+    except StreamError as e:
+        return jsonify({"errors": [str(e)]}), 409
+    if events is None:
+        return jsonify({"errors": ["No such run."]}), 404
+    headers = {'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    return Response(events, mimetype='text/event-stream', headers=headers)
+
+@app.route('/runs/<run_id>/cancel', methods=['POST'])
+def cancel_run(run_id):
+    """Stops a live run; its stream ends with status "cancelled"."""
+    if not runs.cancel(run_id):
+        return jsonify({"errors": ["No such run."]}), 404
+    return jsonify({"cancelled": True})
+
+@app.route('/check_errors', methods=['POST'])
+def check_errors():
+    """
+    Provides quick error-checking for the Monaco editor (AJAX).
+
+    {"code"} checks a whole text. With a "session" the server keeps the text
+    (see DocumentSync.py): {"session", "version", "code"} opens it, and
+    {"session", "base", "version", "changes"} applies Monaco's edits to the
+    copy at version "base". A 409 {"resync": true} asks for the whole text.
+    """
+    data = request.json
+    session = data.get('session')
+    if session is None:
+        # The editor only shows illegal tokens and syntax errors, so the analyzer isn't run.
+        result = compile_cache.check(data.get('code', ''))
+        return jsonify({"errors": editor_errors(result)})
 
-    parser = build_parser()
     try:
-        parser.parse(lexer=Lexer(code))
-        return jsonify({"errors": []})
-    except SyntaxError as e:
-        import re
-        full_msg = str(e)
-        match = re.search(r'line\s+(\d+)', full_msg)
-        if match:
-            line_no = int(match.group(1))
+        if 'changes' in data:
+            document = documents.change(session, data.get('base'), data.get('version'), data['changes'])
         else:
-            line_no = 1
-        error_info = {
-            "message": full_msg,
-            "line": line_no,
-            "startColumn": 0,
-            "endColumn": 9999
-        }
-        return jsonify({"errors": [error_info]})
+            document = documents.open(session, data.get('code', ''), data.get('version', 0))
+    except DocumentSyncError:
+        return jsonify({"resync": True}), 409
+    with document.lock:
+        version = document.version
+        result = document.check()
+    return jsonify({"errors": editor_errors(result), "version": version})
+
+@app.route('/cache_stats')
+def cache_stats():
+    """Hit, miss and eviction counters of the compile cache."""
+    return jsonify(compile_cache.stats())
+
+@app.route('/session_stats')
+def session_stats():
+    """Open editor sessions, their approximate memory and how many were dropped."""
+    return jsonify(documents.stats())
+
+@app.route('/run_stats')
+def run_stats():
+    """Live runs in progress, and how many were started, cancelled or never streamed."""
+    return jsonify(runs.stats())
+
+@app.route('/pool_stats')
+def pool_stats():
+    """Throughput and worker metrics of the execution pool, if it is running."""
+    return jsonify(_execution_pool.metrics() if _execution_pool is not None else {})
 
 if __name__ == "__main__":
     app.run(debug=True)
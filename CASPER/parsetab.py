@@ -6,9 +6,9 @@ _tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'rightEXPONENTrightNOTMINUSleftMULTIPLYDIVISIONMODULOleftPLUSMINUSleftPLUS_PLUSMINUS_MINUSleftEQ_EQNOT_EQLTGTLT_EQGT_EQleftANDleftORrightEQPLUS_EQMINUS_EQMUL_EQDIV_EQMOD_EQAND BIRTH BLN BLN_LIT CARRIAGE_RETURN CHECK CHR CHR_LIT COLON COMMA COMMENT CONVERT_TO_BLN CONVERT_TO_FLT CONVERT_TO_INT CONVERT_TO_STR DAY DISPLAY DIVISION DIV_EQ DOT DOUBLE_LT DOUBLE_SLASH EOF EQ EQ_EQ EXPONENT FLT FLT_LIT FOR FUNCTION FUNCTION_BLN FUNCTION_CHR FUNCTION_FLT FUNCTION_INT FUNCTION_LIST_BLN FUNCTION_LIST_BLN2D FUNCTION_LIST_CHR FUNCTION_LIST_CHR2D FUNCTION_LIST_FLT FUNCTION_LIST_FLT2D FUNCTION_LIST_INT FUNCTION_LIST_INT2D FUNCTION_LIST_STR FUNCTION_LIST_STR2D FUNCTION_NAME FUNCTION_STR GHOST GT GT_EQ IDENT ILLEGAL IN INPUT INT INT_LIT LBRACE LBRACKET LIST_BLN LIST_BLN2D LIST_CHR LIST_CHR2D LIST_FLT LIST_FLT2D LIST_INT LIST_INT2D LIST_STR LIST_STR2D LPAREN LT LT_EQ MAIN_CASPER MEASURE MINUS MINUS_EQ MINUS_MINUS MODULO MOD_EQ MULTIPLY MUL_EQ NEWLINE NIGHT NOT NOT_EQ OR OTHERWISE OTHERWISE_CHECK PLUS PLUS_EQ PLUS_PLUS POW PUSH RBRACE RBRACKET REPEAT REVIVE RPAREN SEMICOLON SHIFT SKIP SPLICE STOP STR STR_LIT SWAP TILDE TYPE UNTILprogram : BIRTH unli_newline global_dec maybe_newline function_statements maybe_newline main_function unli_newline GHOST\n    maybe_newline : empty\n                  | NEWLINE maybe_newline\n    \n    unli_newline : NEWLINE\n                 | NEWLINE unli_newline\n    main_function : MAIN_CASPER LPAREN RPAREN maybe_newline LBRACE maybe_newline statements maybe_newline RBRACE\n    global_dec : global_statement unli_newline global_tail     \n               | empty                            \n    \n        global_tail : global_dec\n    \n    global_statement : var_statement global_statement_tail\n    \n        var_statement : data_type IDENT list_dec\n    \n    list_dec : empty               \n             | LBRACKET RBRACKET _2d_list \n    \n    _2d_list : empty            \n             | LBRACKET RBRACKET \n    \n    global_statement_tail : empty                        \n                          | COMMA IDENT global_statement_tail \n                          | EQ global_value global_statement_tail2 \n    \n    global_statement_tail2 : COMMA IDENT global_statement_tail \n                           | empty                           \n    \n    global_value : expression   \n                 | list_value   \n    \n     list_value : LBRACKET list_element RBRACKET\n    \n    list_element : literal element_tail\n                 | list_value element_tail\n    \n    element_tail : COMMA list_element  \n                 | empty              \n    \n    data_type : INT   \n              | FLT   \n              | BLN  \n              | CHR  \n              | STR  \n    \n    expression : factor factor_tail\n    \n    factor : var_call postfix           \n           | literal1                    \n           | TILDE INT_LIT               \n           | TILDE FLT_LIT                \n           | LPAREN factor_expression RPAREN    \n    \n    factor_expression : factor_expression_factor factor_expression_tail\n    \n    factor_expression_factor : factor_var_call factor_postfix           \n           | factor_expression1                    \n           | TILDE INT_LIT               \n           | TILDE FLT_LIT                \n           | LPAREN factor_expression RPAREN    \n    \n    factor_var_call : IDENT factor_list_index  \n    \n    factor_postfix_op : PLUS_PLUS   \n               | MINUS_MINUS \n    \n    factor_postfix : empty        \n            | factor_postfix_op  \n    \n    factor_list_index : LBRACKET factor_index RBRACKET factor_list_index2  \n               | empty                                \n    \n    factor_list_index2 : LBRACKET factor_index RBRACKET \n                | empty                   \n    factor_index : INT_LITfactor_index : IDENT\n    factor_expression_tail : PLUS factor_expression_factor factor_expression_tail\n                | MINUS factor_expression_factor factor_expression_tail\n                | MULTIPLY factor_expression_factor factor_expression_tail\n                | DIVISION factor_expression_factor factor_expression_tail\n                | MODULO factor_expression_factor factor_expression_tail\n                | EXPONENT factor_expression_factor factor_expression_tail\n                | GT factor_expression_factor factor_expression_tail\n                | LT factor_expression_factor factor_expression_tail\n                | EQ_EQ factor_expression_factor factor_expression_tail\n                | GT_EQ factor_expression_factor factor_expression_tail\n                | LT_EQ factor_expression_factor factor_expression_tail\n                | NOT_EQ factor_expression_factor factor_expression_tail\n                | AND factor_expression_factor factor_expression_tail\n                | OR factor_expression_factor factor_expression_tail\n                | empty\n    \n    factor_expression1  : INT_LIT\n             | FLT_LIT\n             | DAY\n             | NIGHT\n             | STR_LIT\n    \n    factor_tail : PLUS factor factor_tail\n                | MINUS factor factor_tail\n                | MULTIPLY factor factor_tail\n                | DIVISION factor factor_tail\n                | MODULO factor factor_tail\n                | EXPONENT factor factor_tail\n                | GT factor factor_tail\n                | LT factor factor_tail\n                | EQ_EQ factor factor_tail\n                | GT_EQ factor factor_tail\n                | LT_EQ factor factor_tail\n                | NOT_EQ factor factor_tail\n                | AND factor factor_tail\n                | OR factor factor_tail\n                | empty\n    \n    literal : literal1\n            | literal2\n    \n    literal1 : INT_LIT\n             | FLT_LIT\n             | DAY\n             | NIGHT\n             | STR_LIT\n    \n    literal2 : CHR_LIT\n    \n    function_statements : ret_type FUNCTION_NAME LPAREN parameters RPAREN LBRACE maybe_newline statements maybe_newline revive maybe_newline RBRACE unli_newline function_statements_tail  \n                        | empty                                                          \n    \n    function_statements_tail : function_statements \n                             | empty               \n    \n    ret_type : FUNCTION           \n             | function_dtype    \n    \n    function_dtype : FUNCTION_INT       \n                   | FUNCTION_FLT      \n                   | FUNCTION_CHR       \n                   | FUNCTION_BLN       \n                   | FUNCTION_STR       \n                   | FUNCTION_LIST_INT \n                   | FUNCTION_LIST_FLT  \n                   | FUNCTION_LIST_CHR \n                   | FUNCTION_LIST_STR  \n                   | FUNCTION_LIST_BLN  \n    \n    parameters : data_type IDENT parameters_tail  \n               | empty                            \n    \n    parameters_tail : COMMA data_type IDENT parameters_tail \n                    | empty                                 \n    \n    revive : REVIVE revive_value  \n           | empty        \n    revive_value : revive_type_cast\n             | revive_expression\n             | function_call\n    revive_expression : revive_factor revive_factor_tail\n    \n    revive_factor : revive_var_call revive_postfix           \n           | revive_factor1                    \n           | TILDE INT_LIT               \n           | TILDE FLT_LIT                \n           | LPAREN revive_factor RPAREN    \n    \n    revive_var_call : IDENT revive_list_index  \n    \n    revive_postfix_op : PLUS_PLUS   \n               | MINUS_MINUS \n    \n    revive_postfix : empty        \n            | revive_postfix_op  \n    \n    revive_list_index : LBRACKET revive_index RBRACKET revive_list_index2  \n               | empty                                \n    \n    revive_list_index2 : LBRACKET revive_index RBRACKET \n                | empty                   \n    revive_index : INT_LITrevive_index : IDENT\n    revive_factor_tail : PLUS revive_factor revive_factor_tail\n                | MINUS revive_factor revive_factor_tail\n                | MULTIPLY revive_factor revive_factor_tail\n                | DIVISION revive_factor revive_factor_tail\n                | MODULO revive_factor revive_factor_tail\n                | EXPONENT revive_factor revive_factor_tail\n                | GT revive_factor revive_factor_tail\n                | LT revive_factor revive_factor_tail\n                | EQ_EQ revive_factor revive_factor_tail\n                | GT_EQ revive_factor revive_factor_tail\n                | LT_EQ revive_factor revive_factor_tail\n                | NOT_EQ revive_factor revive_factor_tail\n                | AND revive_factor revive_factor_tail\n                | OR revive_factor revive_factor_tail\n                | empty\n    \n    revive_factor1  : INT_LIT\n             | FLT_LIT\n             | DAY\n             | NIGHT\n             | STR_LIT\n    revive_type_cast : CONVERT_TO_INT LPAREN typecast_value RPAREN\n                 | CONVERT_TO_FLT LPAREN typecast_value RPAREN\n                 | CONVERT_TO_BLN LPAREN typecast_value RPAREN\n                 | CONVERT_TO_STR LPAREN typecast_value RPARENstatements : empty\n           | local_dec maybe_newline statements_tail \n    statements_tail : switch_statement unli_newline statements\n                    | loop_statement unli_newline statements\n                    | function_call unli_newline statements\n                    | assignment_statement unli_newline statements\n                    | output_statement unli_newline statements\n                    | conditional_statement unli_newline statements\n                    | statements\n    \n    local_dec : local_var_statement local_dec_tail unli_newline\n              | empty\n    \n        local_var_statement : local_data_type IDENT local_list_dec\n    \n    local_data_type : INT   \n              | FLT   \n              | BLN  \n              | CHR  \n              | STR  \n    \n    local_list_dec : empty               \n             | LBRACKET RBRACKET local_2d_list \n    \n    local_2d_list : empty            \n             | LBRACKET RBRACKET \n    \n    local_dec_tail : empty                          \n                   | COMMA IDENT local_dec_tail     \n                   | EQ local_value local_dec_tail2  \n    \n    local_dec_tail2 : COMMA IDENT local_dec_tail  \n                    | empty                      \n    \n    local_value : local_value_value      \n                | list_value  \n    local_value_value  : local_type_cast\n             | local_expression\n             | function_call\n    local_expression : local_factor local_factor_tail\n    \n    local_factor : local_var_call local_postfix           \n           | local_factor1                    \n           | TILDE INT_LIT               \n           | TILDE FLT_LIT                \n           | LPAREN local_factor RPAREN    \n    \n    local_var_call : IDENT local_list_index  \n    \n    local_postfix_op : PLUS_PLUS   \n               | MINUS_MINUS \n    \n    local_postfix : empty        \n            | local_postfix_op  \n    \n    local_list_index : LBRACKET local_index RBRACKET local_list_index2  \n               | empty                                \n    \n    local_list_index2 : LBRACKET local_index RBRACKET \n                | empty                   \n    local_index : INT_LITlocal_index : IDENT\n    local_factor_tail : PLUS local_factor local_factor_tail\n                | MINUS local_factor local_factor_tail\n                | MULTIPLY local_factor local_factor_tail\n                | DIVISION local_factor local_factor_tail\n                | MODULO local_factor local_factor_tail\n                | EXPONENT local_factor local_factor_tail\n                | GT local_factor local_factor_tail\n                | LT local_factor local_factor_tail\n                | EQ_EQ local_factor local_factor_tail\n                | GT_EQ local_factor local_factor_tail\n                | LT_EQ local_factor local_factor_tail\n                | NOT_EQ local_factor local_factor_tail\n                | AND local_factor local_factor_tail\n                | OR local_factor local_factor_tail\n                | empty\n    \n    local_factor1  : INT_LIT\n             | FLT_LIT\n             | DAY\n             | NIGHT\n             | STR_LIT\n    local_type_cast : CONVERT_TO_INT LPAREN typecast_value RPAREN\n                 | CONVERT_TO_FLT LPAREN typecast_value RPAREN\n                 | CONVERT_TO_BLN LPAREN typecast_value RPAREN\n                 | CONVERT_TO_STR LPAREN typecast_value RPAREN\n    conditional_statement : CHECK LPAREN condition RPAREN LBRACE maybe_newline statements maybe_newline RBRACE  maybe_newline conditional_tail  maybe_newline OTHERWISE  maybe_newline LBRACE  maybe_newline statements  maybe_newline RBRACE  \n    \n    conditional_tail : OTHERWISE_CHECK LPAREN condition RPAREN LBRACE maybe_newline statements maybe_newline RBRACE maybe_newline conditional_tail \n                     | empty                                            \n    \n    condition : condition_factor condition_tail\n    \n    condition_factor : condition_var_call condition_postfix           \n           | condition1                    \n           | TILDE INT_LIT               \n           | TILDE FLT_LIT                \n           | LPAREN condition RPAREN    \n    \n    condition_var_call : IDENT condition_list_index  \n    \n    condition_postfix_op : PLUS_PLUS   \n               | MINUS_MINUS \n    \n    condition_postfix : empty        \n            | condition_postfix_op  \n    \n    condition_list_index : LBRACKET condition_index RBRACKET condition_list_index2  \n               | empty                                \n    \n    condition_list_index2 : LBRACKET condition_index RBRACKET \n                | empty                   \n    condition_index : INT_LITcondition_index : IDENT\n    condition_tail : PLUS condition_factor condition_tail\n                | MINUS condition_factor condition_tail\n                | MULTIPLY condition_factor condition_tail\n                | DIVISION condition_factor condition_tail\n                | MODULO condition_factor condition_tail\n                | EXPONENT condition_factor condition_tail\n                | GT condition_factor condition_tail\n                | LT condition_factor condition_tail\n                | EQ_EQ condition_factor condition_tail\n                | GT_EQ condition_factor condition_tail\n                | LT_EQ condition_factor condition_tail\n                | NOT_EQ condition_factor condition_tail\n                | AND condition_factor condition_tail\n                | OR condition_factor condition_tail\n                | empty\n    \n    condition1 : INT_LIT\n             | FLT_LIT\n             | DAY\n             | NIGHT\n             | STR_LIT\n    \n    switch_statement : SWAP LPAREN IDENT RPAREN LBRACE maybe_newline switch_condition maybe_newline OTHERWISE maybe_newline LBRACE maybe_newline statements maybe_newline RBRACE maybe_newline RBRACE\n    \n    switch_condition : SHIFT switch_value COLON maybe_newline statements switchcond_tail\n    switch_value  : switch_type_cast\n             | switch_expression\n             | function_call\n    switch_expression : switch_factor switch_factor_tail\n    \n    switch_factor : switch_var_call switch_postfix           \n           | switch_factor1                    \n           | TILDE INT_LIT               \n           | TILDE FLT_LIT                \n           | LPAREN switch_factor RPAREN    \n    \n    switch_var_call : IDENT switch_list_index  \n    \n    switch_postfix_op : PLUS_PLUS   \n               | MINUS_MINUS \n    \n    switch_postfix : empty        \n            | switch_postfix_op  \n    \n    switch_list_index : LBRACKET switch_index RBRACKET switch_list_index2  \n               | empty                                \n    \n    switch_list_index2 : LBRACKET switch_index RBRACKET \n                | empty                   \n    switch_index : INT_LITswitch_index : IDENT\n    switch_factor_tail : PLUS switch_factor switch_factor_tail\n                | MINUS switch_factor switch_factor_tail\n                | MULTIPLY switch_factor switch_factor_tail\n                | DIVISION switch_factor switch_factor_tail\n                | MODULO switch_factor switch_factor_tail\n                | EXPONENT switch_factor switch_factor_tail\n                | GT switch_factor switch_factor_tail\n                | LT switch_factor switch_factor_tail\n                | EQ_EQ switch_factor switch_factor_tail\n                | GT_EQ switch_factor switch_factor_tail\n                | LT_EQ switch_factor switch_factor_tail\n                | NOT_EQ switch_factor switch_factor_tail\n                | AND switch_factor switch_factor_tail\n                | OR switch_factor switch_factor_tail\n                | empty\n    \n    switch_factor1  : INT_LIT\n             | FLT_LIT\n             | DAY\n             | NIGHT\n             | STR_LIT  \n    switch_type_cast : CONVERT_TO_INT LPAREN typecast_value RPAREN\n                 | CONVERT_TO_FLT LPAREN typecast_value RPAREN\n                 | CONVERT_TO_BLN LPAREN typecast_value RPAREN\n                 | CONVERT_TO_STR LPAREN typecast_value RPAREN\n    switchcond_tail : switch_condition  \n                    | empty          \n    \n    loop_statement : for_loop    \n                   | until_loop  \n                   | repeat_until\n    for_loop : FOR LPAREN control_variable SEMICOLON for_expression SEMICOLON update RPAREN LBRACE maybe_newline statements maybe_newline RBRACE\n    for_expression : for_factor for_factor_tail\n    \n    for_factor : for_var_call for_postfix           \n           | for_factor1                    \n           | TILDE INT_LIT               \n           | TILDE FLT_LIT                \n           | LPAREN for_factor RPAREN    \n    \n    for_var_call : IDENT for_list_index  \n    \n    for_postfix_op : PLUS_PLUS   \n               | MINUS_MINUS \n    \n    for_postfix : empty        \n            | for_postfix_op  \n    \n    for_list_index : LBRACKET for_index RBRACKET for_list_index2  \n               | empty                                \n    \n    for_list_index2 : LBRACKET for_index RBRACKET \n                | empty                   \n    for_index : INT_LITfor_index : IDENT\n    for_factor_tail : PLUS for_factor for_factor_tail\n                | MINUS for_factor for_factor_tail\n                | MULTIPLY for_factor for_factor_tail\n                | DIVISION for_factor for_factor_tail\n                | MODULO for_factor for_factor_tail\n                | EXPONENT for_factor for_factor_tail\n                | GT for_factor for_factor_tail\n                | LT for_factor for_factor_tail\n                | EQ_EQ for_factor for_factor_tail\n                | GT_EQ for_factor for_factor_tail\n                | LT_EQ for_factor for_factor_tail\n                | NOT_EQ for_factor for_factor_tail\n                | AND for_factor for_factor_tail\n                | OR for_factor for_factor_tail\n                | empty\n    \n    for_factor1  : INT_LIT\n             | FLT_LIT\n             | DAY\n             | NIGHT\n             | STR_LIT  \n    \n    until_loop : UNTIL LPAREN until_expression RPAREN LBRACE statements RBRACE  \n    \n    until_expression : until_factor until_factor_tail\n    \n    until_factor : until_var_call until_postfix           \n           | until_factor1                    \n           | TILDE INT_LIT               \n           | TILDE FLT_LIT                \n           | LPAREN until_factor RPAREN    \n    \n    until_var_call : IDENT until_list_index  \n    \n    until_postfix_op : PLUS_PLUS   \n               | MINUS_MINUS \n    \n    until_postfix : empty        \n            | until_postfix_op  \n    \n    until_list_index : LBRACKET until_index RBRACKET until_list_index2  \n               | empty                                \n    \n    until_list_index2 : LBRACKET until_index RBRACKET \n                | empty                   \n    until_index : INT_LITuntil_index : IDENT\n    until_factor_tail : PLUS until_factor until_factor_tail\n                | MINUS until_factor until_factor_tail\n                | MULTIPLY until_factor until_factor_tail\n                | DIVISION until_factor until_factor_tail\n                | MODULO until_factor until_factor_tail\n                | EXPONENT until_factor until_factor_tail\n                | GT until_factor until_factor_tail\n                | LT until_factor until_factor_tail\n                | EQ_EQ until_factor until_factor_tail\n                | GT_EQ until_factor until_factor_tail\n                | LT_EQ until_factor until_factor_tail\n                | NOT_EQ until_factor until_factor_tail\n                | AND until_factor until_factor_tail\n                | OR until_factor until_factor_tail\n                | empty\n    \n    until_factor1  : INT_LIT\n             | FLT_LIT\n             | DAY\n             | NIGHT\n             | STR_LIT  \n    \n    repeat_until : REPEAT LBRACE statements RBRACE UNTIL LPAREN until_expression RPAREN \n    control_variable : INT IDENT EQ control_var_tailcontrol_var_tail : INT_LIT \n                        | var_call\n    \n    update : var_call update_tail  \n    \n    update_tail : postfix_op         \n                | compound_op value   \n    \n    postfix_op : PLUS_PLUS   \n               | MINUS_MINUS \n    \n    function_call : FUNCTION_NAME LPAREN arguments RPAREN  \n                  | input_statement                      \n    \n    arguments : empty                  \n              | arg_value arg_tail    \n    \n    arg_tail : COMMA arg_value arg_tail   \n             | empty                     \n    \n    arg_value : literal   \n              | var_call \n    \n    output_statement : DISPLAY output_value next_val   \n    output_value : output_type_cast\n             | output_expression\n             | function_call\n    output_expression : output_factor output_factor_tail\n    \n    output_factor : output_var_call output_postfix           \n           | output_factor1                    \n           | TILDE INT_LIT               \n           | TILDE FLT_LIT                \n           | LPAREN output_factor RPAREN    \n    \n    output_var_call : IDENT output_list_index  \n    \n    output_postfix_op : PLUS_PLUS   \n               | MINUS_MINUS \n    \n    output_postfix : empty        \n            | output_postfix_op  \n    \n    output_list_index : LBRACKET output_index RBRACKET output_list_index2  \n               | empty                                \n    \n    output_list_index2 : LBRACKET output_index RBRACKET \n                | empty                   \n    output_index : INT_LIToutput_index : IDENT\n    output_factor_tail : PLUS output_factor output_factor_tail\n                | MINUS output_factor output_factor_tail\n                | MULTIPLY output_factor output_factor_tail\n                | DIVISION output_factor output_factor_tail\n                | MODULO output_factor output_factor_tail\n                | EXPONENT output_factor output_factor_tail\n                | GT output_factor output_factor_tail\n                | LT output_factor output_factor_tail\n                | EQ_EQ output_factor output_factor_tail\n                | GT_EQ output_factor output_factor_tail\n                | LT_EQ output_factor output_factor_tail\n                | NOT_EQ output_factor output_factor_tail\n                | AND output_factor output_factor_tail\n                | OR output_factor output_factor_tail\n                | empty\n    \n    output_factor1  : INT_LIT\n             | FLT_LIT\n             | DAY\n             | NIGHT\n             | STR_LIT\n    output_type_cast : CONVERT_TO_INT LPAREN typecast_value RPAREN\n                 | CONVERT_TO_FLT LPAREN typecast_value RPAREN\n                 | CONVERT_TO_BLN LPAREN typecast_value RPAREN\n                 | CONVERT_TO_STR LPAREN typecast_value RPAREN\n    next_val : COMMA value next_val  \n             | empty                \n    \n    assignment_statement : var_call EQ value\n    \n    assignment_statement : IDENT assign_tail  \n    \n    assign_tail : DOT SPLICE LPAREN start COMMA deleteCount COMMA splice_items RPAREN  \n                | DOT PUSH LPAREN list_element RPAREN                                  \n                | assign_op value                                                     \n    \n    assign_op : compound_op  \n              | EQ           \n    \n    compound_op : PLUS_EQ \n                | MINUS_EQ  \n                | MUL_EQ   \n                | DIV_EQ    \n                | MOD_EQ   \n    \n    start : INT_LIT \n    \n    deleteCount : empty     \n                | INT_LIT  \n    \n    splice_items : empty          \n                 | list_element  \n    \n    var_call : IDENT list_index  \n    \n    list_index : LBRACKET index RBRACKET list_index2  \n               | empty                                \n    \n    list_index2 : LBRACKET index RBRACKET \n                | empty                   \n    index : INT_LITindex : IDENT\n    postfix : empty        \n            | postfix_op  \n    \n    value : type_cast     \n          | value_expression   \n          | function_call \n    \n    value_expression : value_factor value_factor_tail\n    \n    value_factor : value_var_call value_postfix           \n           | value_factor1                    \n           | TILDE INT_LIT               \n           | TILDE FLT_LIT                \n           | LPAREN value_factor RPAREN    \n    \n    value_var_call : IDENT value_list_index  \n    \n    value_postfix_op : PLUS_PLUS   \n               | MINUS_MINUS \n    \n    value_postfix : empty        \n            | value_postfix_op  \n    \n    value_list_index : LBRACKET value_index RBRACKET value_list_index2  \n               | empty                                \n    \n    value_list_index2 : LBRACKET value_index RBRACKET \n                | empty                   \n    value_index : INT_LITvalue_index : IDENT\n    value_factor_tail : PLUS value_factor value_factor_tail\n                | MINUS value_factor value_factor_tail\n                | MULTIPLY value_factor value_factor_tail\n                | DIVISION value_factor value_factor_tail\n                | MODULO value_factor value_factor_tail\n                | EXPONENT value_factor value_factor_tail\n                | GT value_factor value_factor_tail\n                | LT value_factor value_factor_tail\n                | EQ_EQ value_factor value_factor_tail\n                | GT_EQ value_factor value_factor_tail\n                | LT_EQ value_factor value_factor_tail\n                | NOT_EQ value_factor value_factor_tail\n                | AND value_factor value_factor_tail\n                | OR value_factor value_factor_tail\n                | empty\n    \n    value_factor1  : INT_LIT\n             | FLT_LIT\n             | DAY\n             | NIGHT\n             | STR_LIT  \n    \n    type_cast : CONVERT_TO_INT LPAREN typecast_value RPAREN \n              | CONVERT_TO_FLT LPAREN typecast_value RPAREN  \n              | CONVERT_TO_BLN LPAREN typecast_value RPAREN  \n              | CONVERT_TO_STR LPAREN typecast_value RPAREN \n    \n    typecast_value : typecast_expression                           \n                   | FUNCTION_NAME LPAREN RPAREN          \n                   | input_statement                     \n    \n    typecast_expression : typecast_factor typecast_factor_tail\n    \n    typecast_factor : var_call postfix           \n           | typecast_factor1                    \n           | TILDE INT_LIT               \n           | TILDE FLT_LIT                \n           | LPAREN typecast_factor RPAREN    \n    \n    typecast_factor_tail : PLUS typecast_factor typecast_factor_tail\n                | MINUS typecast_factor typecast_factor_tail\n                | MULTIPLY typecast_factor typecast_factor_tail\n                | DIVISION typecast_factor typecast_factor_tail\n                | MODULO typecast_factor typecast_factor_tail\n                | EXPONENT typecast_factor typecast_factor_tail\n                | GT typecast_factor typecast_factor_tail\n                | LT typecast_factor typecast_factor_tail\n                | EQ_EQ typecast_factor typecast_factor_tail\n                | GT_EQ typecast_factor typecast_factor_tail\n                | LT_EQ typecast_factor typecast_factor_tail\n                | NOT_EQ typecast_factor typecast_factor_tail\n                | AND typecast_factor typecast_factor_tail\n                | OR typecast_factor typecast_factor_tail\n                | empty\n    \n    typecast_factor1  : INT_LIT\n             | FLT_LIT\n             | DAY\n             | NIGHT\n             | STR_LIT\n    \n    input_statement : INPUT LPAREN RPAREN  \n    empty :'
+_lr_signature = 'rightEQPLUS_EQMINUS_EQMUL_EQDIV_EQMOD_EQleftORleftANDleftEQ_EQNOT_EQLTGTLT_EQGT_EQleftPLUS_PLUSMINUS_MINUSleftPLUSMINUSleftMULTIPLYDIVISIONMODULOrightNOTrightEXPONENTAND BIRTH BLN BLN_LIT CARRIAGE_RETURN CHECK CHR CHR_LIT COLON COMMA COMMENT CONVERT_TO_BLN CONVERT_TO_FLT CONVERT_TO_INT CONVERT_TO_STR DAY DISPLAY DIVISION DIV_EQ DOT DOUBLE_LT DOUBLE_SLASH EOF EQ EQ_EQ EXPONENT FLT FLT_LIT FOR FUNCTION FUNCTION_BLN FUNCTION_CHR FUNCTION_FLT FUNCTION_INT FUNCTION_LIST_BLN FUNCTION_LIST_BLN2D FUNCTION_LIST_CHR FUNCTION_LIST_CHR2D FUNCTION_LIST_FLT FUNCTION_LIST_FLT2D FUNCTION_LIST_INT FUNCTION_LIST_INT2D FUNCTION_LIST_STR FUNCTION_LIST_STR2D FUNCTION_NAME FUNCTION_STR GHOST GT GT_EQ IDENT ILLEGAL IN INPUT INT INT_LIT LBRACE LBRACKET LIST_BLN LIST_BLN2D LIST_CHR LIST_CHR2D LIST_FLT LIST_FLT2D LIST_INT LIST_INT2D LIST_STR LIST_STR2D LPAREN LT LT_EQ MAIN_CASPER MEASURE MINUS MINUS_EQ MINUS_MINUS MODULO MOD_EQ MULTIPLY MUL_EQ NEWLINE NIGHT NOT NOT_EQ OR OTHERWISE OTHERWISE_CHECK PLUS PLUS_EQ PLUS_PLUS POW PUSH RBRACE RBRACKET REPEAT REVIVE RPAREN SEMICOLON SHIFT SKIP SPLICE STOP STR STR_LIT SWAP TILDE TYPE UNTILprogram : BIRTH unli_newline global_dec maybe_newline function_statements maybe_newline main_function unli_newline GHOST\n    maybe_newline : empty\n                  | NEWLINE maybe_newline\n    \n    unli_newline : NEWLINE\n                 | NEWLINE unli_newline\n    main_function : MAIN_CASPER LPAREN RPAREN maybe_newline LBRACE maybe_newline statements maybe_newline RBRACE\n    global_dec : global_list\n               | empty                            \n    \n    global_list : global_list global_statement unli_newline\n                | global_statement unli_newline\n    \n    global_statement : var_statement global_statement_tail\n    \n        var_statement : data_type IDENT list_dec\n    \n    list_dec : empty               \n             | LBRACKET RBRACKET _2d_list \n    \n    _2d_list : empty            \n             | LBRACKET RBRACKET \n    \n    global_statement_tail : global_statement_tail2\n                          | global_statement_tail2 EQ global_value\n    \n    global_statement_tail2 : global_statement_tail COMMA IDENT\n                           | empty                           \n    \n    global_value : expression   \n                 | list_value   \n    \n     list_value : LBRACKET list_element RBRACKET\n    \n    list_element : literal element_tail\n                 | list_value element_tail\n    \n    element_tail : COMMA list_element  \n                 | empty              \n    \n    data_type : INT   \n              | FLT   \n              | BLN  \n              | CHR  \n              | STR  \n    \n    expression : expression PLUS expression\n               | expression MINUS expression\n               | expression MULTIPLY expression\n               | expression DIVISION expression\n               | expression MODULO expression\n               | expression EXPONENT expression\n               | expression GT expression\n               | expression LT expression\n               | expression EQ_EQ expression\n               | expression GT_EQ expression\n               | expression LT_EQ expression\n               | expression NOT_EQ expression\n               | expression AND expression\n               | expression OR expression\n               | factor\n    \n    factor : var_call postfix           \n           | literal1                    \n           | TILDE INT_LIT               \n           | TILDE FLT_LIT                \n           | LPAREN expression RPAREN    \n    \n    literal : literal1\n            | literal2\n    \n    literal1 : INT_LIT\n             | FLT_LIT\n             | DAY\n             | NIGHT\n             | STR_LIT\n    \n    literal2 : CHR_LIT\n    \n    function_statements : ret_type FUNCTION_NAME LPAREN parameters RPAREN LBRACE maybe_newline statements maybe_newline revive maybe_newline RBRACE unli_newline function_statements_tail  \n                        | empty                                                          \n    \n    function_statements_tail : function_statements \n                             | empty               \n    \n    ret_type : FUNCTION           \n             | function_dtype    \n    \n    function_dtype : FUNCTION_INT       \n                   | FUNCTION_FLT      \n                   | FUNCTION_CHR       \n                   | FUNCTION_BLN       \n                   | FUNCTION_STR       \n                   | FUNCTION_LIST_INT \n                   | FUNCTION_LIST_FLT  \n                   | FUNCTION_LIST_CHR \n                   | FUNCTION_LIST_STR  \n                   | FUNCTION_LIST_BLN  \n    \n    parameters : data_type IDENT parameters_tail  \n               | empty                            \n    \n    parameters_tail : COMMA data_type IDENT parameters_tail \n                    | empty                                 \n    \n    revive : REVIVE revive_value  \n           | empty        \n    revive_value : type_cast\n             | expression\n             | function_callstatements : empty\n           | statement_list \n    statement_list : statement_list local_dec maybe_newline\n                   | statement_list statements_tail unli_newline\n                   | local_dec maybe_newline\n                   | statements_tail unli_newline\n    \n    statements_tail : switch_statement\n                    | loop_statement\n                    | function_call\n                    | assignment_statement\n                    | output_statement\n                    | conditional_statement\n    \n    local_dec : local_var_statement local_dec_tail unli_newline\n    \n        local_var_statement : local_data_type IDENT local_list_dec\n    \n    local_data_type : INT   \n              | FLT   \n              | BLN  \n              | CHR  \n              | STR  \n    \n    local_list_dec : empty               \n             | LBRACKET RBRACKET local_2d_list \n    \n    local_2d_list : empty            \n             | LBRACKET RBRACKET \n    \n    local_dec_tail : empty                          \n                   | COMMA IDENT local_dec_tail     \n                   | EQ local_value local_dec_tail2  \n    \n    local_dec_tail2 : COMMA IDENT local_dec_tail  \n                    | empty                      \n    \n    local_value : local_value_value      \n                | list_value  \n    local_value_value  : type_cast\n             | expression\n             | function_call\n    conditional_statement : CHECK LPAREN condition RPAREN LBRACE maybe_newline statements maybe_newline RBRACE  maybe_newline conditional_tail  maybe_newline OTHERWISE  maybe_newline LBRACE  maybe_newline statements  maybe_newline RBRACE  \n    \n    conditional_tail : conditional_tail OTHERWISE_CHECK LPAREN condition RPAREN LBRACE maybe_newline statements maybe_newline RBRACE maybe_newline\n                     | empty                                            \n    \n    condition : expression\n    \n    switch_statement : SWAP LPAREN IDENT RPAREN LBRACE maybe_newline switch_condition maybe_newline OTHERWISE maybe_newline LBRACE maybe_newline statements maybe_newline RBRACE maybe_newline RBRACE\n    \n    switch_condition : SHIFT switch_value COLON maybe_newline statements switchcond_tail\n    switch_value  : type_cast\n             | expression\n             | function_call\n    switchcond_tail : switch_condition  \n                    | empty          \n    \n    loop_statement : for_loop    \n                   | until_loop  \n                   | repeat_until\n    for_loop : FOR LPAREN control_variable SEMICOLON expression SEMICOLON update RPAREN LBRACE maybe_newline statements maybe_newline RBRACE\n    until_loop : UNTIL LPAREN expression RPAREN LBRACE statements RBRACE  \n    \n    repeat_until : REPEAT LBRACE statements RBRACE UNTIL LPAREN expression RPAREN \n    control_variable : INT IDENT EQ control_var_tailcontrol_var_tail : INT_LIT \n                        | var_call\n    \n    update : var_call update_tail  \n    \n    update_tail : postfix_op         \n                | compound_op value   \n    \n    postfix_op : PLUS_PLUS   \n               | MINUS_MINUS \n    \n    function_call : FUNCTION_NAME LPAREN arguments RPAREN  \n                  | input_statement                      \n    \n    arguments : empty                  \n              | arg_list\n    \n    arg_list : arg_list COMMA arg_value\n             | arg_value\n    \n    arg_value : literal   \n              | var_call \n    \n    output_statement : DISPLAY output_value next_val   \n    output_value : type_cast\n             | expression\n             | function_call\n    next_val : COMMA value next_val  \n             | empty                \n    \n    assignment_statement : var_call EQ value\n    \n    assignment_statement : IDENT assign_tail  \n    \n    assign_tail : DOT SPLICE LPAREN start COMMA deleteCount COMMA splice_items RPAREN  \n                | DOT PUSH LPAREN list_element RPAREN                                  \n                | assign_op value                                                     \n    \n    assign_op : compound_op  \n              | EQ           \n    \n    compound_op : PLUS_EQ \n                | MINUS_EQ  \n                | MUL_EQ   \n                | DIV_EQ    \n                | MOD_EQ   \n    \n    start : INT_LIT \n    \n    deleteCount : empty     \n                | INT_LIT  \n    \n    splice_items : empty          \n                 | list_element  \n    \n    var_call : IDENT list_index  \n    \n    list_index : LBRACKET index RBRACKET list_index2  \n               | empty                                \n    \n    list_index2 : LBRACKET index RBRACKET \n                | empty                   \n    index : INT_LITindex : IDENT\n    postfix : empty        \n            | postfix_op  \n    \n    value : type_cast     \n          | expression   \n          | function_call \n    \n    type_cast : CONVERT_TO_INT LPAREN typecast_value RPAREN \n              | CONVERT_TO_FLT LPAREN typecast_value RPAREN  \n              | CONVERT_TO_BLN LPAREN typecast_value RPAREN  \n              | CONVERT_TO_STR LPAREN typecast_value RPAREN \n    \n    typecast_value : expression                                     \n                   | FUNCTION_NAME LPAREN RPAREN          \n                   | input_statement                     \n    \n    input_statement : INPUT LPAREN RPAREN  \n    empty :'
     
-_lr_action_items = {'BIRTH':([0,],[2,]),'$end':([1,211,],[0,-1,]),'NEWLINE':([2,3,4,5,6,7,8,15,16,17,18,19,20,21,24,25,27,40,41,42,43,44,45,46,47,49,50,52,53,55,56,57,58,59,60,64,65,67,68,83,90,91,92,93,94,95,96,109,111,112,113,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,137,168,169,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,209,210,212,231,232,234,242,243,246,247,248,249,250,251,260,261,262,263,264,267,270,272,273,274,275,276,277,278,279,280,283,284,285,287,295,296,297,298,299,300,301,302,308,309,310,312,313,314,315,316,317,318,319,321,323,324,325,326,332,333,334,336,337,338,339,340,341,342,343,344,345,346,347,349,361,362,363,364,370,371,372,374,375,376,377,378,379,383,385,386,388,394,409,410,411,412,413,414,415,416,417,419,420,421,427,442,443,444,445,446,447,448,449,450,452,453,454,455,456,457,458,462,463,464,465,471,472,473,475,476,477,478,479,480,486,487,489,495,510,511,512,513,514,515,516,517,518,520,548,549,564,568,569,570,571,572,573,574,575,576,577,578,579,580,581,586,587,588,590,594,595,596,597,598,599,600,601,602,603,604,605,606,607,619,634,635,636,637,638,639,640,641,642,644,645,649,651,655,656,657,658,659,660,661,662,663,664,665,666,667,668,731,733,754,755,756,757,758,759,760,761,762,763,764,765,766,767,768,769,770,771,772,773,774,775,776,777,778,779,780,781,782,783,784,785,786,787,788,789,790,791,792,793,794,795,800,804,805,806,807,808,809,810,811,812,813,814,815,816,817,822,823,824,825,826,827,828,829,830,831,832,833,834,835,836,837,838,839,840,841,843,875,911,912,914,915,918,919,920,921,922,923,924,925,926,927,928,929,930,931,932,933,934,935,936,937,940,941,942,1022,1028,1029,1031,1055,1060,1061,1084,1107,1108,1109,1144,1145,1147,1154,1177,1178,1179,1181,1182,1202,1204,1205,1207,1208,1209,1210,1217,1219,1221,1226,1227,1228,1230,1231,1232,1233,1234,1237,1238,1239,1240,],[4,-568,4,18,4,-8,-568,-5,-568,-2,18,-568,-10,-16,-568,18,-100,-3,-7,-9,-568,-568,-21,-22,-568,-568,-35,-93,-94,-568,-95,-96,-97,-11,-12,-17,-18,-20,-33,-90,-34,-492,-493,-411,-412,-36,-37,-485,-487,-568,4,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-23,-38,-13,-14,-19,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-568,-15,18,-486,-489,18,18,-568,-488,-568,18,-165,18,-568,18,-568,-568,4,-186,-568,18,-120,-166,4,-173,4,4,4,4,4,-325,-326,-327,-414,-174,-568,-568,-191,-192,-193,-194,-195,-568,-568,-198,-228,-229,-568,-230,-231,-232,-176,-182,-6,-119,-121,-122,-123,-568,-568,-126,-156,-157,-568,-158,-159,-160,-568,-568,-568,-568,-568,-568,-469,-568,-422,-423,-424,-568,-568,-427,-457,-458,-568,-459,-460,-461,-568,-187,-188,-190,-196,-227,-197,-205,-206,-203,-204,-199,-200,-202,-208,-568,4,-124,-155,-125,-133,-134,-131,-132,-127,-128,-130,-136,-167,-168,-169,-170,-171,-172,-472,-494,-495,-496,-568,-568,-499,-529,-530,-568,-531,-532,-533,-468,-421,-467,-425,-456,-426,-434,-435,-432,-433,-428,-429,-431,-437,-567,-568,-201,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-183,-184,-568,-129,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-497,-528,-498,-506,-507,-504,-505,-500,-501,-503,-509,-413,-568,-430,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-189,-233,-234,-235,-236,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-568,-185,-99,-101,-100,-161,-162,-163,-164,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-153,-154,-568,18,-502,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-466,-462,-463,-464,-465,-442,-443,-444,-445,-446,-447,-448,-449,-450,-451,-452,-453,-454,-455,-568,18,-568,-207,-210,-135,-138,-471,-534,-535,-536,-537,-514,-515,-516,-517,-518,-519,-520,-521,-522,-523,-524,-525,-526,-527,-568,-436,-439,-568,18,-508,-511,18,-366,-209,-137,-438,-404,18,18,-510,18,18,-568,-470,-568,-568,18,-568,18,-239,18,-568,-278,-323,-324,18,18,-328,18,18,18,-568,-568,-277,18,18,-237,18,-568,-238,]),'FUNCTION':([3,4,5,7,15,16,17,18,19,40,41,42,588,],[-568,-4,-568,-8,-5,28,-2,-568,-568,-3,-7,-9,28,]),'FUNCTION_INT':([3,4,5,7,15,16,17,18,19,40,41,42,588,],[-568,-4,-568,-8,-5,30,-2,-568,-568,-3,-7,-9,30,]),'FUNCTION_FLT':([3,4,5,7,15,16,17,18,19,40,41,42,588,],[-568,-4,-568,-8,-5,31,-2,-568,-568,-3,-7,-9,31,]),'FUNCTION_CHR':([3,4,5,7,15,16,17,18,19,40,41,42,588,],[-568,-4,-568,-8,-5,32,-2,-568,-568,-3,-7,-9,32,]),'FUNCTION_BLN':([3,4,5,7,15,16,17,18,19,40,41,42,588,],[-568,-4,-568,-8,-5,33,-2,-568,-568,-3,-7,-9,33,]),'FUNCTION_STR':([3,4,5,7,15,16,17,18,19,40,41,42,588,],[-568,-4,-568,-8,-5,34,-2,-568,-568,-3,-7,-9,34,]),'FUNCTION_LIST_INT':([3,4,5,7,15,16,17,18,19,40,41,42,588,],[-568,-4,-568,-8,-5,35,-2,-568,-568,-3,-7,-9,35,]),'FUNCTION_LIST_FLT':([3,4,5,7,15,16,17,18,19,40,41,42,588,],[-568,-4,-568,-8,-5,36,-2,-568,-568,-3,-7,-9,36,]),'FUNCTION_LIST_CHR':([3,4,5,7,15,16,17,18,19,40,41,42,588,],[-568,-4,-568,-8,-5,37,-2,-568,-568,-3,-7,-9,37,]),'FUNCTION_LIST_STR':([3,4,5,7,15,16,17,18,19,40,41,42,588,],[-568,-4,-568,-8,-5,38,-2,-568,-568,-3,-7,-9,38,]),'FUNCTION_LIST_BLN':([3,4,5,7,15,16,17,18,19,40,41,42,588,],[-568,-4,-568,-8,-5,39,-2,-568,-568,-3,-7,-9,39,]),'MAIN_CASPER':([3,4,5,7,15,16,17,18,19,25,27,40,41,42,62,588,773,774,775,],[-568,-4,-568,-8,-5,-568,-2,-568,-568,-568,-100,-3,-7,-9,114,-568,-99,-101,-100,]),'INT':([3,4,15,17,18,19,40,115,234,236,242,243,247,249,250,262,295,342,343,344,345,346,347,381,383,843,875,942,1109,1147,1154,1179,1181,1207,1227,1228,1230,1231,],[10,-4,-5,-2,-568,10,-3,10,-568,10,-568,253,253,-175,-568,253,-174,253,253,253,253,253,253,534,253,-568,253,253,-568,-568,253,253,-568,253,-568,-568,253,253,]),'FLT':([3,4,15,17,18,19,40,115,234,236,242,243,247,249,250,262,295,342,343,344,345,346,347,383,843,875,942,1109,1147,1154,1179,1181,1207,1227,1228,1230,1231,],[11,-4,-5,-2,-568,11,-3,11,-568,11,-568,254,254,-175,-568,254,-174,254,254,254,254,254,254,254,-568,254,254,-568,-568,254,254,-568,254,-568,-568,254,254,]),'BLN':([3,4,15,17,18,19,40,115,234,236,242,243,247,249,250,262,295,342,343,344,345,346,347,383,843,875,942,1109,1147,1154,1179,1181,1207,1227,1228,1230,1231,],[12,-4,-5,-2,-568,12,-3,12,-568,12,-568,255,255,-175,-568,255,-174,255,255,255,255,255,255,255,-568,255,255,-568,-568,255,255,-568,255,-568,-568,255,255,]),'CHR':([3,4,15,17,18,19,40,115,234,236,242,243,247,249,250,262,295,342,343,344,345,346,347,383,843,875,942,1109,1147,1154,1179,1181,1207,1227,1228,1230,1231,],[13,-4,-5,-2,-568,13,-3,13,-568,13,-568,256,256,-175,-568,256,-174,256,256,256,256,256,256,256,-568,256,256,-568,-568,256,256,-568,256,-568,-568,256,256,]),'STR':([3,4,15,17,18,19,40,115,234,236,242,243,247,249,250,262,295,342,343,344,345,346,347,383,843,875,942,1109,1147,1154,1179,1181,1207,1227,1228,1230,1231,],[14,-4,-5,-2,-568,14,-3,14,-568,14,-568,257,257,-175,-568,257,-174,257,257,257,257,257,257,257,-568,257,257,-568,-568,257,257,-568,257,-568,-568,257,257,]),'GHOST':([4,15,170,],[-4,-5,211,]),'SWAP':([4,15,17,18,40,234,242,243,247,249,250,262,295,342,343,344,345,346,347,383,843,875,942,1109,1147,1154,1179,1181,1207,1227,1228,1230,1231,],[-4,-5,-2,-568,-3,-568,-568,-568,-568,-175,-568,281,-174,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,]),'FUNCTION_NAME':([4,15,17,18,26,28,29,30,31,32,33,34,35,36,37,38,39,40,234,242,243,247,249,250,262,266,271,289,295,342,343,344,345,346,347,351,352,353,354,355,356,357,358,360,383,389,391,392,393,422,424,425,426,488,490,492,493,494,614,616,617,618,843,875,942,1023,1090,1109,1110,1112,1113,1114,1147,1154,1179,1181,1207,1227,1228,1230,1231,],[-4,-5,-2,-568,63,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-3,-568,-568,-568,-568,-175,-568,286,286,286,286,-174,-568,-568,-568,-568,-568,-568,286,-473,-474,-475,-476,-477,-478,-479,286,-568,553,553,553,553,553,553,553,553,286,553,553,553,553,553,553,553,553,-568,-568,-568,286,286,-568,553,553,553,553,-568,-568,-568,-568,-568,-568,-568,-568,-568,]),'IDENT':([4,9,10,11,12,13,14,15,17,18,22,23,40,54,66,69,70,71,72,73,74,75,76,77,78,79,80,81,82,97,110,139,140,141,142,143,144,145,146,147,148,149,150,151,152,162,173,230,234,238,242,243,244,247,249,250,252,253,254,255,256,257,262,265,266,271,289,295,304,328,342,343,344,345,346,347,348,351,352,353,354,355,356,357,358,359,360,366,380,382,383,387,389,391,392,393,395,396,397,398,399,400,401,402,403,404,405,406,407,408,418,422,424,425,426,428,429,430,431,432,433,434,435,436,437,438,439,440,441,451,467,488,490,492,493,494,496,497,498,499,500,501,502,503,504,505,506,507,508,509,519,521,534,535,550,614,616,617,618,620,621,622,623,624,625,626,627,628,629,630,631,632,633,643,647,675,676,677,678,679,680,681,682,683,684,685,686,687,688,698,700,705,706,707,708,709,710,711,712,713,714,715,716,717,718,728,736,737,738,739,740,741,742,743,744,745,746,747,748,749,843,861,873,875,910,913,939,942,959,961,962,963,964,965,966,967,968,969,970,971,972,973,974,984,1005,1023,1027,1032,1056,1068,1090,1109,1110,1112,1113,1114,1116,1117,1118,1119,1120,1121,1122,1123,1124,1125,1126,1127,1128,1129,1139,1147,1149,1154,1179,1181,1207,1211,1215,1227,1228,1230,1231,],[-4,24,-28,-29,-30,-31,-32,-5,-2,-568,43,55,-3,105,116,55,55,55,55,55,55,55,55,55,55,55,55,55,55,105,166,105,105,105,105,105,105,105,105,105,105,105,105,105,105,208,214,166,-568,208,-568,-568,258,-568,-175,-568,267,-177,-178,-179,-180,-181,282,296,314,338,376,-174,314,338,-568,-568,-568,-568,-568,-568,459,477,-473,-474,-475,-476,-477,-478,-479,55,477,376,529,543,-568,549,55,55,55,55,314,314,314,314,314,314,314,314,314,314,314,314,314,314,584,55,55,55,55,338,338,338,338,338,338,338,338,338,338,338,338,338,338,610,477,477,55,55,55,55,376,376,376,376,376,376,376,376,376,376,376,376,376,376,671,529,701,543,55,55,55,55,55,477,477,477,477,477,477,477,477,477,477,477,477,477,477,820,55,529,529,529,529,529,529,529,529,529,529,529,529,529,529,860,869,543,543,543,543,543,543,543,543,543,543,543,543,543,543,892,55,55,55,55,55,55,55,55,55,55,55,55,55,55,-568,869,55,-568,584,610,671,-568,55,869,869,869,869,869,869,869,869,869,869,869,869,869,869,1054,543,1078,820,860,892,1078,477,-568,55,55,55,55,1078,1078,1078,1078,1078,1078,1078,1078,1078,1078,1078,1078,1078,1078,1176,-568,1054,-568,-568,-568,-568,1176,529,-568,-568,-568,-568,]),'DISPLAY':([4,15,17,18,40,234,242,243,247,249,250,262,295,342,343,344,345,346,347,383,843,875,942,1109,1147,1154,1179,1181,1207,1227,1228,1230,1231,],[-4,-5,-2,-568,-3,-568,-568,-568,-568,-175,-568,289,-174,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,]),'CHECK':([4,15,17,18,40,234,242,243,247,249,250,262,295,342,343,344,345,346,347,383,843,875,942,1109,1147,1154,1179,1181,1207,1227,1228,1230,1231,],[-4,-5,-2,-568,-3,-568,-568,-568,-568,-175,-568,290,-174,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,]),'FOR':([4,15,17,18,40,234,242,243,247,249,250,262,295,342,343,344,345,346,347,383,843,875,942,1109,1147,1154,1179,1181,1207,1227,1228,1230,1231,],[-4,-5,-2,-568,-3,-568,-568,-568,-568,-175,-568,291,-174,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,]),'UNTIL':([4,15,17,18,40,234,242,243,247,249,250,262,295,342,343,344,345,346,347,383,730,843,875,942,1109,1147,1154,1179,1181,1207,1227,1228,1230,1231,],[-4,-5,-2,-568,-3,-568,-568,-568,-568,-175,-568,292,-174,-568,-568,-568,-568,-568,-568,-568,893,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,]),'REPEAT':([4,15,17,18,40,234,242,243,247,249,250,262,295,342,343,344,345,346,347,383,843,875,942,1109,1147,1154,1179,1181,1207,1227,1228,1230,1231,],[-4,-5,-2,-568,-3,-568,-568,-568,-568,-175,-568,293,-174,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,]),'INPUT':([4,15,17,18,40,234,242,243,247,249,250,262,266,271,289,295,342,343,344,345,346,347,351,352,353,354,355,356,357,358,360,383,389,391,392,393,422,424,425,426,488,490,492,493,494,614,616,617,618,843,875,942,1023,1090,1109,1110,1112,1113,1114,1147,1154,1179,1181,1207,1227,1228,1230,1231,],[-4,-5,-2,-568,-3,-568,-568,-568,-568,-175,-568,294,294,294,294,-174,-568,-568,-568,-568,-568,-568,294,-473,-474,-475,-476,-477,-478,-479,294,-568,294,294,294,294,294,294,294,294,294,294,294,294,294,294,294,294,294,-568,-568,-568,294,294,-568,294,294,294,294,-568,-568,-568,-568,-568,-568,-568,-568,-568,]),'REVIVE':([4,15,17,18,40,234,243,248,249,250,261,262,273,275,295,342,343,344,345,346,347,453,454,455,456,457,458,],[-4,-5,-2,-568,-3,-568,-568,-568,-165,-568,271,-568,-166,-173,-174,-568,-568,-568,-568,-568,-568,-167,-168,-169,-170,-171,-172,]),'RBRACE':([4,15,17,18,40,234,242,243,247,248,249,250,260,261,262,269,270,272,273,275,287,295,322,323,324,325,326,332,333,334,336,337,338,339,340,341,342,343,344,345,346,347,383,427,442,443,444,445,446,447,448,449,450,452,453,454,455,456,457,458,547,548,590,594,595,596,597,598,599,600,601,602,603,604,605,606,607,645,776,777,778,779,780,781,782,783,784,785,786,787,788,789,790,791,792,793,794,843,875,914,915,942,989,1031,1061,1085,1147,1179,1181,1205,1207,1216,1217,1222,1226,1227,1228,1229,1230,1231,1233,1234,1235,1236,],[-4,-5,-2,-568,-3,-568,-568,-568,-568,-568,-165,-568,-568,-568,-568,321,-568,-120,-166,-173,-414,-174,421,-119,-121,-122,-123,-568,-568,-126,-156,-157,-568,-158,-159,-160,-568,-568,-568,-568,-568,-568,-568,-124,-155,-125,-133,-134,-131,-132,-127,-128,-130,-136,-167,-168,-169,-170,-171,-172,730,-567,-129,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-413,-161,-162,-163,-164,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-153,-154,-568,-568,-568,-135,-138,-568,1055,-568,-137,1145,-568,-568,-568,-568,-568,1221,-568,1226,-568,-568,-568,1232,-568,-568,-568,-568,1237,1238,]),'SHIFT':([4,15,17,18,40,249,250,262,273,275,295,342,343,344,345,346,347,453,454,455,456,457,458,795,916,1109,1154,1182,],[-4,-5,-2,-568,-3,-165,-568,-568,-166,-173,-174,-568,-568,-568,-568,-568,-568,-167,-168,-169,-170,-171,-172,-568,1023,-568,-568,1023,]),'OTHERWISE':([4,15,17,18,40,249,250,262,273,275,295,342,343,344,345,346,347,453,454,455,456,457,458,1022,1062,1109,1145,1154,1178,1182,1202,1204,1208,1209,1210,1214,1238,1239,1240,],[-4,-5,-2,-568,-3,-165,-568,-568,-166,-173,-174,-568,-568,-568,-568,-568,-568,-167,-168,-169,-170,-171,-172,-568,1108,-568,-568,-568,-568,-568,-568,-239,-278,-323,-324,1219,-568,-568,-238,]),'COMMA':([8,24,43,44,45,46,47,49,50,52,53,55,56,57,58,59,60,68,83,85,86,87,88,89,90,91,92,93,94,95,96,109,111,112,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,137,168,169,176,177,178,179,180,181,182,183,184,185,186,187,188,189,209,210,214,231,232,246,251,258,267,287,296,297,298,299,300,301,302,308,309,310,312,313,314,315,316,317,318,319,361,362,363,364,370,371,372,374,375,376,377,378,379,394,409,410,411,412,413,414,415,416,417,419,420,463,464,465,471,472,473,475,476,477,478,479,480,483,484,485,495,510,511,512,513,514,515,516,517,518,520,548,549,564,568,569,570,571,572,573,574,575,576,577,578,579,580,581,586,587,619,634,635,636,637,638,639,640,641,642,644,645,649,651,655,656,657,658,659,660,661,662,663,664,665,666,667,668,733,754,755,756,757,758,759,760,761,762,763,764,765,766,767,768,769,770,771,772,796,797,800,804,805,806,807,808,809,810,811,812,813,814,815,816,817,821,823,824,825,826,827,828,829,830,831,832,833,834,835,836,837,838,839,840,841,911,912,917,919,920,921,922,923,924,925,926,927,928,929,930,931,932,933,934,935,936,937,940,941,1024,1025,1026,1028,1029,1060,1084,1144,],[22,-568,22,66,-21,-22,-568,-568,-35,-93,-94,-568,-95,-96,-97,-11,-12,-33,-90,133,133,-91,-92,-98,-34,-492,-493,-411,-412,-36,-37,-485,-487,-568,22,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-23,-38,-13,-14,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-568,-15,236,-486,-489,-488,265,236,-568,-414,265,387,-191,-192,-193,-194,-195,-568,-568,-198,-228,-229,-568,-230,-231,-232,-176,-182,488,-422,-423,-424,-568,-568,-427,-457,-458,-568,-459,-460,-461,-196,-227,-197,-205,-206,-203,-204,-199,-200,-202,-208,-568,-494,-495,-496,-568,-568,-499,-529,-530,-568,-531,-532,-533,647,-419,-420,-425,-456,-426,-434,-435,-432,-433,-428,-429,-431,-437,-567,265,-201,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-183,-184,-497,-528,-498,-506,-507,-504,-505,-500,-501,-503,-509,-413,488,-430,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-233,-234,-235,-236,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-568,-185,917,-480,-502,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,647,-462,-463,-464,-465,-442,-443,-444,-445,-446,-447,-448,-449,-450,-451,-452,-453,-454,-455,-568,-207,-210,-568,-534,-535,-536,-537,-514,-515,-516,-517,-518,-519,-520,-521,-522,-523,-524,-525,-526,-527,-568,-436,-439,1082,-481,-482,-508,-511,-209,-438,-510,]),'EQ':([8,24,43,59,60,109,111,112,116,168,169,209,210,231,232,246,251,267,282,288,296,318,319,420,549,586,587,701,772,],[23,-568,23,-11,-12,-485,-487,-568,23,-13,-14,-568,-15,-486,-489,-488,266,-568,353,360,266,-176,-182,-568,266,-183,-184,873,-185,]),'LBRACE':([17,18,40,212,213,233,293,611,673,703,1087,1108,1153,1219,1224,1225,],[-2,-568,-3,-568,234,242,383,795,843,875,1147,-568,1181,-568,1227,1228,]),'OTHERWISE_CHECK':([17,18,40,1145,1178,1238,1239,],[-2,-568,-3,-568,1203,-568,1203,]),'LBRACKET':([23,24,48,55,105,112,133,209,229,266,267,282,314,338,376,420,477,529,543,613,771,794,841,869,937,957,1004,1078,1082,1105,1201,],[48,61,48,110,162,167,48,230,238,48,320,110,418,451,519,585,643,698,728,48,910,913,939,984,1027,1032,1056,1139,48,1149,1211,]),'TILDE':([23,54,69,70,71,72,73,74,75,76,77,78,79,80,81,82,97,139,140,141,142,143,144,145,146,147,148,149,150,151,152,266,271,289,304,328,351,352,353,354,355,356,357,358,360,366,380,382,389,391,392,393,395,396,397,398,399,400,401,402,403,404,405,406,407,408,422,424,425,426,428,429,430,431,432,433,434,435,436,437,438,439,440,441,467,488,490,492,493,494,496,497,498,499,500,501,502,503,504,505,506,507,508,509,521,535,550,614,616,617,618,620,621,622,623,624,625,626,627,628,629,630,631,632,633,675,676,677,678,679,680,681,682,683,684,685,686,687,688,700,705,706,707,708,709,710,711,712,713,714,715,716,717,718,736,737,738,739,740,741,742,743,744,745,746,747,748,749,861,961,962,963,964,965,966,967,968,969,970,971,972,973,974,1005,1023,1068,1090,1110,1112,1113,1114,1116,1117,1118,1119,1120,1121,1122,1123,1124,1125,1126,1127,1128,1129,1215,],[51,102,51,51,51,51,51,51,51,51,51,51,51,51,51,51,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,311,335,373,311,335,474,-473,-474,-475,-476,-477,-478,-479,474,373,526,540,558,558,558,558,311,311,311,311,311,311,311,311,311,311,311,311,311,311,558,558,558,558,335,335,335,335,335,335,335,335,335,335,335,335,335,335,474,474,558,558,558,558,373,373,373,373,373,373,373,373,373,373,373,373,373,373,526,540,558,558,558,558,558,474,474,474,474,474,474,474,474,474,474,474,474,474,474,526,526,526,526,526,526,526,526,526,526,526,526,526,526,866,540,540,540,540,540,540,540,540,540,540,540,540,540,540,558,558,558,558,558,558,558,558,558,558,558,558,558,558,866,866,866,866,866,866,866,866,866,866,866,866,866,866,866,540,1075,1075,474,558,558,558,558,1075,1075,1075,1075,1075,1075,1075,1075,1075,1075,1075,1075,1075,1075,526,]),'LPAREN':([23,54,63,69,70,71,72,73,74,75,76,77,78,79,80,81,82,97,114,139,140,141,142,143,144,145,146,147,148,149,150,151,152,266,271,281,286,289,290,291,292,294,303,304,305,306,307,327,328,329,330,331,351,352,353,354,355,356,357,358,360,365,366,367,368,369,380,382,389,391,392,393,395,396,397,398,399,400,401,402,403,404,405,406,407,408,422,424,425,426,428,429,430,431,432,433,434,435,436,437,438,439,440,441,460,461,466,467,468,469,470,488,490,492,493,494,496,497,498,499,500,501,502,503,504,505,506,507,508,509,521,535,550,553,614,616,617,618,620,621,622,623,624,625,626,627,628,629,630,631,632,633,675,676,677,678,679,680,681,682,683,684,685,686,687,688,700,705,706,707,708,709,710,711,712,713,714,715,716,717,718,736,737,738,739,740,741,742,743,744,745,746,747,748,749,861,893,961,962,963,964,965,966,967,968,969,970,971,972,973,974,1005,1023,1067,1068,1069,1070,1071,1090,1110,1112,1113,1114,1116,1117,1118,1119,1120,1121,1122,1123,1124,1125,1126,1127,1128,1129,1203,1215,],[54,97,115,54,54,54,54,54,54,54,54,54,54,54,54,54,54,97,171,97,97,97,97,97,97,97,97,97,97,97,97,97,97,304,328,348,359,366,380,381,382,384,389,304,391,392,393,422,328,424,425,426,467,-473,-474,-475,-476,-477,-478,-479,467,490,366,492,493,494,521,535,550,550,550,550,304,304,304,304,304,304,304,304,304,304,304,304,304,304,550,550,550,550,328,328,328,328,328,328,328,328,328,328,328,328,328,328,612,613,614,467,616,617,618,467,550,550,550,550,366,366,366,366,366,366,366,366,366,366,366,366,366,366,521,535,550,734,550,550,550,550,467,467,467,467,467,467,467,467,467,467,467,467,467,467,521,521,521,521,521,521,521,521,521,521,521,521,521,521,861,535,535,535,535,535,535,535,535,535,535,535,535,535,535,550,550,550,550,550,550,550,550,550,550,550,550,550,550,861,1005,861,861,861,861,861,861,861,861,861,861,861,861,861,861,535,1068,1110,1068,1112,1113,1114,467,550,550,550,550,1068,1068,1068,1068,1068,1068,1068,1068,1068,1068,1068,1068,1068,1068,1215,521,]),'INT_LIT':([23,48,51,54,69,70,71,72,73,74,75,76,77,78,79,80,81,82,97,102,110,133,139,140,141,142,143,144,145,146,147,148,149,150,151,152,162,230,238,266,271,289,304,311,328,335,351,352,353,354,355,356,357,358,359,360,366,373,380,382,389,391,392,393,395,396,397,398,399,400,401,402,403,404,405,406,407,408,418,422,424,425,426,428,429,430,431,432,433,434,435,436,437,438,439,440,441,451,467,474,488,490,492,493,494,496,497,498,499,500,501,502,503,504,505,506,507,508,509,519,521,526,535,540,550,558,612,613,614,616,617,618,620,621,622,623,624,625,626,627,628,629,630,631,632,633,643,647,675,676,677,678,679,680,681,682,683,684,685,686,687,688,698,700,705,706,707,708,709,710,711,712,713,714,715,716,717,718,728,736,737,738,739,740,741,742,743,744,745,746,747,748,749,861,866,873,910,913,917,939,961,962,963,964,965,966,967,968,969,970,971,972,973,974,984,1005,1023,1027,1032,1056,1068,1075,1082,1090,1110,1112,1113,1114,1116,1117,1118,1119,1120,1121,1122,1123,1124,1125,1126,1127,1128,1129,1139,1149,1211,1215,],[52,52,95,103,52,52,52,52,52,52,52,52,52,52,52,52,52,52,103,159,165,52,103,103,103,103,103,103,103,103,103,103,103,103,103,103,207,165,207,312,336,374,312,415,336,448,475,-473,-474,-475,-476,-477,-478,-479,52,475,374,516,527,541,559,559,559,559,312,312,312,312,312,312,312,312,312,312,312,312,312,312,583,559,559,559,559,336,336,336,336,336,336,336,336,336,336,336,336,336,336,609,475,640,475,559,559,559,559,374,374,374,374,374,374,374,374,374,374,374,374,374,374,670,527,695,541,725,559,752,797,52,559,559,559,559,475,475,475,475,475,475,475,475,475,475,475,475,475,475,819,52,527,527,527,527,527,527,527,527,527,527,527,527,527,527,859,867,541,541,541,541,541,541,541,541,541,541,541,541,541,541,891,559,559,559,559,559,559,559,559,559,559,559,559,559,559,867,981,987,583,609,1026,670,867,867,867,867,867,867,867,867,867,867,867,867,867,867,1053,541,1076,819,859,891,1076,1136,52,475,559,559,559,559,1076,1076,1076,1076,1076,1076,1076,1076,1076,1076,1076,1076,1076,1076,1175,1053,1175,527,]),'FLT_LIT':([23,48,51,54,69,70,71,72,73,74,75,76,77,78,79,80,81,82,97,102,133,139,140,141,142,143,144,145,146,147,148,149,150,151,152,266,271,289,304,311,328,335,351,352,353,354,355,356,357,358,359,360,366,373,380,382,389,391,392,393,395,396,397,398,399,400,401,402,403,404,405,406,407,408,422,424,425,426,428,429,430,431,432,433,434,435,436,437,438,439,440,441,467,474,488,490,492,493,494,496,497,498,499,500,501,502,503,504,505,506,507,508,509,521,526,535,540,550,558,613,614,616,617,618,620,621,622,623,624,625,626,627,628,629,630,631,632,633,647,675,676,677,678,679,680,681,682,683,684,685,686,687,688,700,705,706,707,708,709,710,711,712,713,714,715,716,717,718,736,737,738,739,740,741,742,743,744,745,746,747,748,749,861,866,961,962,963,964,965,966,967,968,969,970,971,972,973,974,1005,1023,1068,1075,1082,1090,1110,1112,1113,1114,1116,1117,1118,1119,1120,1121,1122,1123,1124,1125,1126,1127,1128,1129,1215,],[53,53,96,104,53,53,53,53,53,53,53,53,53,53,53,53,53,53,104,160,53,104,104,104,104,104,104,104,104,104,104,104,104,104,104,313,337,375,313,416,337,449,476,-473,-474,-475,-476,-477,-478,-479,53,476,375,517,528,542,560,560,560,560,313,313,313,313,313,313,313,313,313,313,313,313,313,313,560,560,560,560,337,337,337,337,337,337,337,337,337,337,337,337,337,337,476,641,476,560,560,560,560,375,375,375,375,375,375,375,375,375,375,375,375,375,375,528,696,542,726,560,753,53,560,560,560,560,476,476,476,476,476,476,476,476,476,476,476,476,476,476,53,528,528,528,528,528,528,528,528,528,528,528,528,528,528,868,542,542,542,542,542,542,542,542,542,542,542,542,542,542,560,560,560,560,560,560,560,560,560,560,560,560,560,560,868,982,868,868,868,868,868,868,868,868,868,868,868,868,868,868,542,1077,1077,1137,53,476,560,560,560,560,1077,1077,1077,1077,1077,1077,1077,1077,1077,1077,1077,1077,1077,1077,528,]),'DAY':([23,48,54,69,70,71,72,73,74,75,76,77,78,79,80,81,82,97,133,139,140,141,142,143,144,145,146,147,148,149,150,151,152,266,271,289,304,328,351,352,353,354,355,356,357,358,359,360,366,380,382,389,391,392,393,395,396,397,398,399,400,401,402,403,404,405,406,407,408,422,424,425,426,428,429,430,431,432,433,434,435,436,437,438,439,440,441,467,488,490,492,493,494,496,497,498,499,500,501,502,503,504,505,506,507,508,509,521,535,550,613,614,616,617,618,620,621,622,623,624,625,626,627,628,629,630,631,632,633,647,675,676,677,678,679,680,681,682,683,684,685,686,687,688,700,705,706,707,708,709,710,711,712,713,714,715,716,717,718,736,737,738,739,740,741,742,743,744,745,746,747,748,749,861,961,962,963,964,965,966,967,968,969,970,971,972,973,974,1005,1023,1068,1082,1090,1110,1112,1113,1114,1116,1117,1118,1119,1120,1121,1122,1123,1124,1125,1126,1127,1128,1129,1215,],[56,56,106,56,56,56,56,56,56,56,56,56,56,56,56,56,56,106,56,106,106,106,106,106,106,106,106,106,106,106,106,106,106,315,339,377,315,339,478,-473,-474,-475,-476,-477,-478,-479,56,478,377,530,544,561,561,561,561,315,315,315,315,315,315,315,315,315,315,315,315,315,315,561,561,561,561,339,339,339,339,339,339,339,339,339,339,339,339,339,339,478,478,561,561,561,561,377,377,377,377,377,377,377,377,377,377,377,377,377,377,530,544,561,56,561,561,561,561,478,478,478,478,478,478,478,478,478,478,478,478,478,478,56,530,530,530,530,530,530,530,530,530,530,530,530,530,530,870,544,544,544,544,544,544,544,544,544,544,544,544,544,544,561,561,561,561,561,561,561,561,561,561,561,561,561,561,870,870,870,870,870,870,870,870,870,870,870,870,870,870,870,544,1079,1079,56,478,561,561,561,561,1079,1079,1079,1079,1079,1079,1079,1079,1079,1079,1079,1079,1079,1079,530,]),'NIGHT':([23,48,54,69,70,71,72,73,74,75,76,77,78,79,80,81,82,97,133,139,140,141,142,143,144,145,146,147,148,149,150,151,152,266,271,289,304,328,351,352,353,354,355,356,357,358,359,360,366,380,382,389,391,392,393,395,396,397,398,399,400,401,402,403,404,405,406,407,408,422,424,425,426,428,429,430,431,432,433,434,435,436,437,438,439,440,441,467,488,490,492,493,494,496,497,498,499,500,501,502,503,504,505,506,507,508,509,521,535,550,613,614,616,617,618,620,621,622,623,624,625,626,627,628,629,630,631,632,633,647,675,676,677,678,679,680,681,682,683,684,685,686,687,688,700,705,706,707,708,709,710,711,712,713,714,715,716,717,718,736,737,738,739,740,741,742,743,744,745,746,747,748,749,861,961,962,963,964,965,966,967,968,969,970,971,972,973,974,1005,1023,1068,1082,1090,1110,1112,1113,1114,1116,1117,1118,1119,1120,1121,1122,1123,1124,1125,1126,1127,1128,1129,1215,],[57,57,107,57,57,57,57,57,57,57,57,57,57,57,57,57,57,107,57,107,107,107,107,107,107,107,107,107,107,107,107,107,107,316,340,378,316,340,479,-473,-474,-475,-476,-477,-478,-479,57,479,378,531,545,562,562,562,562,316,316,316,316,316,316,316,316,316,316,316,316,316,316,562,562,562,562,340,340,340,340,340,340,340,340,340,340,340,340,340,340,479,479,562,562,562,562,378,378,378,378,378,378,378,378,378,378,378,378,378,378,531,545,562,57,562,562,562,562,479,479,479,479,479,479,479,479,479,479,479,479,479,479,57,531,531,531,531,531,531,531,531,531,531,531,531,531,531,871,545,545,545,545,545,545,545,545,545,545,545,545,545,545,562,562,562,562,562,562,562,562,562,562,562,562,562,562,871,871,871,871,871,871,871,871,871,871,871,871,871,871,871,545,1080,1080,57,479,562,562,562,562,1080,1080,1080,1080,1080,1080,1080,1080,1080,1080,1080,1080,1080,1080,531,]),'STR_LIT':([23,48,54,69,70,71,72,73,74,75,76,77,78,79,80,81,82,97,133,139,140,141,142,143,144,145,146,147,148,149,150,151,152,266,271,289,304,328,351,352,353,354,355,356,357,358,359,360,366,380,382,389,391,392,393,395,396,397,398,399,400,401,402,403,404,405,406,407,408,422,424,425,426,428,429,430,431,432,433,434,435,436,437,438,439,440,441,467,488,490,492,493,494,496,497,498,499,500,501,502,503,504,505,506,507,508,509,521,535,550,613,614,616,617,618,620,621,622,623,624,625,626,627,628,629,630,631,632,633,647,675,676,677,678,679,680,681,682,683,684,685,686,687,688,700,705,706,707,708,709,710,711,712,713,714,715,716,717,718,736,737,738,739,740,741,742,743,744,745,746,747,748,749,861,961,962,963,964,965,966,967,968,969,970,971,972,973,974,1005,1023,1068,1082,1090,1110,1112,1113,1114,1116,1117,1118,1119,1120,1121,1122,1123,1124,1125,1126,1127,1128,1129,1215,],[58,58,108,58,58,58,58,58,58,58,58,58,58,58,58,58,58,108,58,108,108,108,108,108,108,108,108,108,108,108,108,108,108,317,341,379,317,341,480,-473,-474,-475,-476,-477,-478,-479,58,480,379,532,546,563,563,563,563,317,317,317,317,317,317,317,317,317,317,317,317,317,317,563,563,563,563,341,341,341,341,341,341,341,341,341,341,341,341,341,341,480,480,563,563,563,563,379,379,379,379,379,379,379,379,379,379,379,379,379,379,532,546,563,58,563,563,563,563,480,480,480,480,480,480,480,480,480,480,480,480,480,480,58,532,532,532,532,532,532,532,532,532,532,532,532,532,532,872,546,546,546,546,546,546,546,546,546,546,546,546,546,546,563,563,563,563,563,563,563,563,563,563,563,563,563,563,872,872,872,872,872,872,872,872,872,872,872,872,872,872,872,546,1081,1081,58,480,563,563,563,563,1081,1081,1081,1081,1081,1081,1081,1081,1081,1081,1081,1081,1081,1081,532,]),'PLUS':([47,49,50,52,53,55,56,57,58,90,91,92,93,94,95,96,99,100,101,103,104,105,106,107,108,109,111,117,118,119,120,121,122,123,124,125,126,127,128,129,130,137,154,155,156,157,158,159,160,161,163,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,209,229,231,232,239,240,246,259,308,309,310,312,313,314,315,316,317,332,333,334,336,337,338,339,340,341,370,371,372,374,375,376,377,378,379,410,411,412,413,414,415,416,417,419,443,444,445,446,447,448,449,450,452,471,472,473,475,476,477,478,479,480,511,512,513,514,515,516,517,518,520,523,524,525,527,528,529,530,531,532,537,538,539,541,542,543,544,545,546,555,556,557,559,560,561,562,563,564,568,569,570,571,572,573,574,575,576,577,578,579,580,581,590,594,595,596,597,598,599,600,601,602,603,604,605,606,607,635,636,637,638,639,640,641,642,644,651,655,656,657,658,659,660,661,662,663,664,665,666,667,668,690,691,692,693,694,695,696,697,699,720,721,722,723,724,725,726,727,729,751,752,753,771,794,800,804,805,806,807,808,809,810,811,812,813,814,815,816,817,841,842,844,845,846,847,848,849,850,851,852,853,854,855,856,857,863,864,865,867,868,869,870,871,872,874,876,877,878,879,880,881,882,883,884,885,886,887,888,889,894,896,897,898,899,900,901,902,903,904,905,906,907,908,909,911,912,914,915,937,940,941,957,976,977,978,979,980,981,982,983,985,1004,1028,1029,1033,1034,1035,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049,1050,1051,1057,1058,1060,1061,1072,1073,1074,1076,1077,1078,1079,1080,1081,1084,1105,1131,1132,1133,1134,1135,1136,1137,1138,1140,1144,1146,1150,1151,1152,1156,1160,1161,1162,1163,1164,1165,1166,1167,1168,1169,1170,1171,1172,1173,1201,1206,1212,1213,1223,],[69,-568,-35,-93,-94,-568,-95,-96,-97,-34,-492,-493,-411,-412,-36,-37,139,-568,-41,-71,-72,-568,-73,-74,-75,-485,-487,69,69,69,69,69,69,69,69,69,69,69,69,69,69,-38,-40,-48,-49,-46,-47,-42,-43,-45,-51,-44,139,139,139,139,139,139,139,139,139,139,139,139,139,139,-568,-568,-486,-489,-50,-53,-488,-52,395,-568,-198,-228,-229,-568,-230,-231,-232,428,-568,-126,-156,-157,-568,-158,-159,-160,496,-568,-427,-457,-458,-568,-459,-460,-461,-197,-205,-206,-203,-204,-199,-200,-202,-208,-125,-133,-134,-131,-132,-127,-128,-130,-136,620,-568,-499,-529,-530,-568,-531,-532,-533,-426,-434,-435,-432,-433,-428,-429,-431,-437,675,-568,-242,-272,-273,-568,-274,-275,-276,705,-568,-369,-399,-400,-568,-401,-402,-403,736,-568,-543,-562,-563,-564,-565,-566,-201,395,395,395,395,395,395,395,395,395,395,395,395,395,395,-129,428,428,428,428,428,428,428,428,428,428,428,428,428,428,-498,-506,-507,-504,-505,-500,-501,-503,-509,-430,496,496,496,496,496,496,496,496,496,496,496,496,496,496,-241,-249,-250,-247,-248,-243,-244,-246,-252,-368,-376,-377,-374,-375,-370,-371,-373,-379,-542,-544,-545,-568,-568,-502,620,620,620,620,620,620,620,620,620,620,620,620,620,620,-568,-245,675,675,675,675,675,675,675,675,675,675,675,675,675,675,961,-568,-331,-361,-362,-568,-363,-364,-365,-372,705,705,705,705,705,705,705,705,705,705,705,705,705,705,-546,736,736,736,736,736,736,736,736,736,736,736,736,736,736,-207,-210,-135,-138,-568,-436,-439,-568,-330,-338,-339,-336,-337,-332,-333,-335,-341,-568,-508,-511,-251,-254,-334,961,961,961,961,961,961,961,961,961,961,961,961,961,961,-378,-381,-209,-137,1116,-568,-284,-314,-315,-568,-316,-317,-318,-438,-568,-283,-291,-292,-289,-290,-285,-286,-288,-294,-510,-253,-340,-343,-380,-287,1116,1116,1116,1116,1116,1116,1116,1116,1116,1116,1116,1116,1116,1116,-568,-342,-293,-296,-295,]),'MINUS':([47,49,50,52,53,55,56,57,58,90,91,92,93,94,95,96,99,100,101,103,104,105,106,107,108,109,111,117,118,119,120,121,122,123,124,125,126,127,128,129,130,137,154,155,156,157,158,159,160,161,163,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,209,229,231,232,239,240,246,259,308,309,310,312,313,314,315,316,317,332,333,334,336,337,338,339,340,341,370,371,372,374,375,376,377,378,379,410,411,412,413,414,415,416,417,419,443,444,445,446,447,448,449,450,452,471,472,473,475,476,477,478,479,480,511,512,513,514,515,516,517,518,520,523,524,525,527,528,529,530,531,532,537,538,539,541,542,543,544,545,546,555,556,557,559,560,561,562,563,564,568,569,570,571,572,573,574,575,576,577,578,579,580,581,590,594,595,596,597,598,599,600,601,602,603,604,605,606,607,635,636,637,638,639,640,641,642,644,651,655,656,657,658,659,660,661,662,663,664,665,666,667,668,690,691,692,693,694,695,696,697,699,720,721,722,723,724,725,726,727,729,751,752,753,771,794,800,804,805,806,807,808,809,810,811,812,813,814,815,816,817,841,842,844,845,846,847,848,849,850,851,852,853,854,855,856,857,863,864,865,867,868,869,870,871,872,874,876,877,878,879,880,881,882,883,884,885,886,887,888,889,894,896,897,898,899,900,901,902,903,904,905,906,907,908,909,911,912,914,915,937,940,941,957,976,977,978,979,980,981,982,983,985,1004,1028,1029,1033,1034,1035,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049,1050,1051,1057,1058,1060,1061,1072,1073,1074,1076,1077,1078,1079,1080,1081,1084,1105,1131,1132,1133,1134,1135,1136,1137,1138,1140,1144,1146,1150,1151,1152,1156,1160,1161,1162,1163,1164,1165,1166,1167,1168,1169,1170,1171,1172,1173,1201,1206,1212,1213,1223,],[70,-568,-35,-93,-94,-568,-95,-96,-97,-34,-492,-493,-411,-412,-36,-37,140,-568,-41,-71,-72,-568,-73,-74,-75,-485,-487,70,70,70,70,70,70,70,70,70,70,70,70,70,70,-38,-40,-48,-49,-46,-47,-42,-43,-45,-51,-44,140,140,140,140,140,140,140,140,140,140,140,140,140,140,-568,-568,-486,-489,-50,-53,-488,-52,396,-568,-198,-228,-229,-568,-230,-231,-232,429,-568,-126,-156,-157,-568,-158,-159,-160,497,-568,-427,-457,-458,-568,-459,-460,-461,-197,-205,-206,-203,-204,-199,-200,-202,-208,-125,-133,-134,-131,-132,-127,-128,-130,-136,621,-568,-499,-529,-530,-568,-531,-532,-533,-426,-434,-435,-432,-433,-428,-429,-431,-437,676,-568,-242,-272,-273,-568,-274,-275,-276,706,-568,-369,-399,-400,-568,-401,-402,-403,737,-568,-543,-562,-563,-564,-565,-566,-201,396,396,396,396,396,396,396,396,396,396,396,396,396,396,-129,429,429,429,429,429,429,429,429,429,429,429,429,429,429,-498,-506,-507,-504,-505,-500,-501,-503,-509,-430,497,497,497,497,497,497,497,497,497,497,497,497,497,497,-241,-249,-250,-247,-248,-243,-244,-246,-252,-368,-376,-377,-374,-375,-370,-371,-373,-379,-542,-544,-545,-568,-568,-502,621,621,621,621,621,621,621,621,621,621,621,621,621,621,-568,-245,676,676,676,676,676,676,676,676,676,676,676,676,676,676,962,-568,-331,-361,-362,-568,-363,-364,-365,-372,706,706,706,706,706,706,706,706,706,706,706,706,706,706,-546,737,737,737,737,737,737,737,737,737,737,737,737,737,737,-207,-210,-135,-138,-568,-436,-439,-568,-330,-338,-339,-336,-337,-332,-333,-335,-341,-568,-508,-511,-251,-254,-334,962,962,962,962,962,962,962,962,962,962,962,962,962,962,-378,-381,-209,-137,1117,-568,-284,-314,-315,-568,-316,-317,-318,-438,-568,-283,-291,-292,-289,-290,-285,-286,-288,-294,-510,-253,-340,-343,-380,-287,1117,1117,1117,1117,1117,1117,1117,1117,1117,1117,1117,1117,1117,1117,-568,-342,-293,-296,-295,]),'MULTIPLY':([47,49,50,52,53,55,56,57,58,90,91,92,93,94,95,96,99,100,101,103,104,105,106,107,108,109,111,117,118,119,120,121,122,123,124,125,126,127,128,129,130,137,154,155,156,157,158,159,160,161,163,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,209,229,231,232,239,240,246,259,308,309,310,312,313,314,315,316,317,332,333,334,336,337,338,339,340,341,370,371,372,374,375,376,377,378,379,410,411,412,413,414,415,416,417,419,443,444,445,446,447,448,449,450,452,471,472,473,475,476,477,478,479,480,511,512,513,514,515,516,517,518,520,523,524,525,527,528,529,530,531,532,537,538,539,541,542,543,544,545,546,555,556,557,559,560,561,562,563,564,568,569,570,571,572,573,574,575,576,577,578,579,580,581,590,594,595,596,597,598,599,600,601,602,603,604,605,606,607,635,636,637,638,639,640,641,642,644,651,655,656,657,658,659,660,661,662,663,664,665,666,667,668,690,691,692,693,694,695,696,697,699,720,721,722,723,724,725,726,727,729,751,752,753,771,794,800,804,805,806,807,808,809,810,811,812,813,814,815,816,817,841,842,844,845,846,847,848,849,850,851,852,853,854,855,856,857,863,864,865,867,868,869,870,871,872,874,876,877,878,879,880,881,882,883,884,885,886,887,888,889,894,896,897,898,899,900,901,902,903,904,905,906,907,908,909,911,912,914,915,937,940,941,957,976,977,978,979,980,981,982,983,985,1004,1028,1029,1033,1034,1035,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049,1050,1051,1057,1058,1060,1061,1072,1073,1074,1076,1077,1078,1079,1080,1081,1084,1105,1131,1132,1133,1134,1135,1136,1137,1138,1140,1144,1146,1150,1151,1152,1156,1160,1161,1162,1163,1164,1165,1166,1167,1168,1169,1170,1171,1172,1173,1201,1206,1212,1213,1223,],[71,-568,-35,-93,-94,-568,-95,-96,-97,-34,-492,-493,-411,-412,-36,-37,141,-568,-41,-71,-72,-568,-73,-74,-75,-485,-487,71,71,71,71,71,71,71,71,71,71,71,71,71,71,-38,-40,-48,-49,-46,-47,-42,-43,-45,-51,-44,141,141,141,141,141,141,141,141,141,141,141,141,141,141,-568,-568,-486,-489,-50,-53,-488,-52,397,-568,-198,-228,-229,-568,-230,-231,-232,430,-568,-126,-156,-157,-568,-158,-159,-160,498,-568,-427,-457,-458,-568,-459,-460,-461,-197,-205,-206,-203,-204,-199,-200,-202,-208,-125,-133,-134,-131,-132,-127,-128,-130,-136,622,-568,-499,-529,-530,-568,-531,-532,-533,-426,-434,-435,-432,-433,-428,-429,-431,-437,677,-568,-242,-272,-273,-568,-274,-275,-276,707,-568,-369,-399,-400,-568,-401,-402,-403,738,-568,-543,-562,-563,-564,-565,-566,-201,397,397,397,397,397,397,397,397,397,397,397,397,397,397,-129,430,430,430,430,430,430,430,430,430,430,430,430,430,430,-498,-506,-507,-504,-505,-500,-501,-503,-509,-430,498,498,498,498,498,498,498,498,498,498,498,498,498,498,-241,-249,-250,-247,-248,-243,-244,-246,-252,-368,-376,-377,-374,-375,-370,-371,-373,-379,-542,-544,-545,-568,-568,-502,622,622,622,622,622,622,622,622,622,622,622,622,622,622,-568,-245,677,677,677,677,677,677,677,677,677,677,677,677,677,677,963,-568,-331,-361,-362,-568,-363,-364,-365,-372,707,707,707,707,707,707,707,707,707,707,707,707,707,707,-546,738,738,738,738,738,738,738,738,738,738,738,738,738,738,-207,-210,-135,-138,-568,-436,-439,-568,-330,-338,-339,-336,-337,-332,-333,-335,-341,-568,-508,-511,-251,-254,-334,963,963,963,963,963,963,963,963,963,963,963,963,963,963,-378,-381,-209,-137,1118,-568,-284,-314,-315,-568,-316,-317,-318,-438,-568,-283,-291,-292,-289,-290,-285,-286,-288,-294,-510,-253,-340,-343,-380,-287,1118,1118,1118,1118,1118,1118,1118,1118,1118,1118,1118,1118,1118,1118,-568,-342,-293,-296,-295,]),'DIVISION':([47,49,50,52,53,55,56,57,58,90,91,92,93,94,95,96,99,100,101,103,104,105,106,107,108,109,111,117,118,119,120,121,122,123,124,125,126,127,128,129,130,137,154,155,156,157,158,159,160,161,163,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,209,229,231,232,239,240,246,259,308,309,310,312,313,314,315,316,317,332,333,334,336,337,338,339,340,341,370,371,372,374,375,376,377,378,379,410,411,412,413,414,415,416,417,419,443,444,445,446,447,448,449,450,452,471,472,473,475,476,477,478,479,480,511,512,513,514,515,516,517,518,520,523,524,525,527,528,529,530,531,532,537,538,539,541,542,543,544,545,546,555,556,557,559,560,561,562,563,564,568,569,570,571,572,573,574,575,576,577,578,579,580,581,590,594,595,596,597,598,599,600,601,602,603,604,605,606,607,635,636,637,638,639,640,641,642,644,651,655,656,657,658,659,660,661,662,663,664,665,666,667,668,690,691,692,693,694,695,696,697,699,720,721,722,723,724,725,726,727,729,751,752,753,771,794,800,804,805,806,807,808,809,810,811,812,813,814,815,816,817,841,842,844,845,846,847,848,849,850,851,852,853,854,855,856,857,863,864,865,867,868,869,870,871,872,874,876,877,878,879,880,881,882,883,884,885,886,887,888,889,894,896,897,898,899,900,901,902,903,904,905,906,907,908,909,911,912,914,915,937,940,941,957,976,977,978,979,980,981,982,983,985,1004,1028,1029,1033,1034,1035,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049,1050,1051,1057,1058,1060,1061,1072,1073,1074,1076,1077,1078,1079,1080,1081,1084,1105,1131,1132,1133,1134,1135,1136,1137,1138,1140,1144,1146,1150,1151,1152,1156,1160,1161,1162,1163,1164,1165,1166,1167,1168,1169,1170,1171,1172,1173,1201,1206,1212,1213,1223,],[72,-568,-35,-93,-94,-568,-95,-96,-97,-34,-492,-493,-411,-412,-36,-37,142,-568,-41,-71,-72,-568,-73,-74,-75,-485,-487,72,72,72,72,72,72,72,72,72,72,72,72,72,72,-38,-40,-48,-49,-46,-47,-42,-43,-45,-51,-44,142,142,142,142,142,142,142,142,142,142,142,142,142,142,-568,-568,-486,-489,-50,-53,-488,-52,398,-568,-198,-228,-229,-568,-230,-231,-232,431,-568,-126,-156,-157,-568,-158,-159,-160,499,-568,-427,-457,-458,-568,-459,-460,-461,-197,-205,-206,-203,-204,-199,-200,-202,-208,-125,-133,-134,-131,-132,-127,-128,-130,-136,623,-568,-499,-529,-530,-568,-531,-532,-533,-426,-434,-435,-432,-433,-428,-429,-431,-437,678,-568,-242,-272,-273,-568,-274,-275,-276,708,-568,-369,-399,-400,-568,-401,-402,-403,739,-568,-543,-562,-563,-564,-565,-566,-201,398,398,398,398,398,398,398,398,398,398,398,398,398,398,-129,431,431,431,431,431,431,431,431,431,431,431,431,431,431,-498,-506,-507,-504,-505,-500,-501,-503,-509,-430,499,499,499,499,499,499,499,499,499,499,499,499,499,499,-241,-249,-250,-247,-248,-243,-244,-246,-252,-368,-376,-377,-374,-375,-370,-371,-373,-379,-542,-544,-545,-568,-568,-502,623,623,623,623,623,623,623,623,623,623,623,623,623,623,-568,-245,678,678,678,678,678,678,678,678,678,678,678,678,678,678,964,-568,-331,-361,-362,-568,-363,-364,-365,-372,708,708,708,708,708,708,708,708,708,708,708,708,708,708,-546,739,739,739,739,739,739,739,739,739,739,739,739,739,739,-207,-210,-135,-138,-568,-436,-439,-568,-330,-338,-339,-336,-337,-332,-333,-335,-341,-568,-508,-511,-251,-254,-334,964,964,964,964,964,964,964,964,964,964,964,964,964,964,-378,-381,-209,-137,1119,-568,-284,-314,-315,-568,-316,-317,-318,-438,-568,-283,-291,-292,-289,-290,-285,-286,-288,-294,-510,-253,-340,-343,-380,-287,1119,1119,1119,1119,1119,1119,1119,1119,1119,1119,1119,1119,1119,1119,-568,-342,-293,-296,-295,]),'MODULO':([47,49,50,52,53,55,56,57,58,90,91,92,93,94,95,96,99,100,101,103,104,105,106,107,108,109,111,117,118,119,120,121,122,123,124,125,126,127,128,129,130,137,154,155,156,157,158,159,160,161,163,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,209,229,231,232,239,240,246,259,308,309,310,312,313,314,315,316,317,332,333,334,336,337,338,339,340,341,370,371,372,374,375,376,377,378,379,410,411,412,413,414,415,416,417,419,443,444,445,446,447,448,449,450,452,471,472,473,475,476,477,478,479,480,511,512,513,514,515,516,517,518,520,523,524,525,527,528,529,530,531,532,537,538,539,541,542,543,544,545,546,555,556,557,559,560,561,562,563,564,568,569,570,571,572,573,574,575,576,577,578,579,580,581,590,594,595,596,597,598,599,600,601,602,603,604,605,606,607,635,636,637,638,639,640,641,642,644,651,655,656,657,658,659,660,661,662,663,664,665,666,667,668,690,691,692,693,694,695,696,697,699,720,721,722,723,724,725,726,727,729,751,752,753,771,794,800,804,805,806,807,808,809,810,811,812,813,814,815,816,817,841,842,844,845,846,847,848,849,850,851,852,853,854,855,856,857,863,864,865,867,868,869,870,871,872,874,876,877,878,879,880,881,882,883,884,885,886,887,888,889,894,896,897,898,899,900,901,902,903,904,905,906,907,908,909,911,912,914,915,937,940,941,957,976,977,978,979,980,981,982,983,985,1004,1028,1029,1033,1034,1035,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049,1050,1051,1057,1058,1060,1061,1072,1073,1074,1076,1077,1078,1079,1080,1081,1084,1105,1131,1132,1133,1134,1135,1136,1137,1138,1140,1144,1146,1150,1151,1152,1156,1160,1161,1162,1163,1164,1165,1166,1167,1168,1169,1170,1171,1172,1173,1201,1206,1212,1213,1223,],[73,-568,-35,-93,-94,-568,-95,-96,-97,-34,-492,-493,-411,-412,-36,-37,143,-568,-41,-71,-72,-568,-73,-74,-75,-485,-487,73,73,73,73,73,73,73,73,73,73,73,73,73,73,-38,-40,-48,-49,-46,-47,-42,-43,-45,-51,-44,143,143,143,143,143,143,143,143,143,143,143,143,143,143,-568,-568,-486,-489,-50,-53,-488,-52,399,-568,-198,-228,-229,-568,-230,-231,-232,432,-568,-126,-156,-157,-568,-158,-159,-160,500,-568,-427,-457,-458,-568,-459,-460,-461,-197,-205,-206,-203,-204,-199,-200,-202,-208,-125,-133,-134,-131,-132,-127,-128,-130,-136,624,-568,-499,-529,-530,-568,-531,-532,-533,-426,-434,-435,-432,-433,-428,-429,-431,-437,679,-568,-242,-272,-273,-568,-274,-275,-276,709,-568,-369,-399,-400,-568,-401,-402,-403,740,-568,-543,-562,-563,-564,-565,-566,-201,399,399,399,399,399,399,399,399,399,399,399,399,399,399,-129,432,432,432,432,432,432,432,432,432,432,432,432,432,432,-498,-506,-507,-504,-505,-500,-501,-503,-509,-430,500,500,500,500,500,500,500,500,500,500,500,500,500,500,-241,-249,-250,-247,-248,-243,-244,-246,-252,-368,-376,-377,-374,-375,-370,-371,-373,-379,-542,-544,-545,-568,-568,-502,624,624,624,624,624,624,624,624,624,624,624,624,624,624,-568,-245,679,679,679,679,679,679,679,679,679,679,679,679,679,679,965,-568,-331,-361,-362,-568,-363,-364,-365,-372,709,709,709,709,709,709,709,709,709,709,709,709,709,709,-546,740,740,740,740,740,740,740,740,740,740,740,740,740,740,-207,-210,-135,-138,-568,-436,-439,-568,-330,-338,-339,-336,-337,-332,-333,-335,-341,-568,-508,-511,-251,-254,-334,965,965,965,965,965,965,965,965,965,965,965,965,965,965,-378,-381,-209,-137,1120,-568,-284,-314,-315,-568,-316,-317,-318,-438,-568,-283,-291,-292,-289,-290,-285,-286,-288,-294,-510,-253,-340,-343,-380,-287,1120,1120,1120,1120,1120,1120,1120,1120,1120,1120,1120,1120,1120,1120,-568,-342,-293,-296,-295,]),'EXPONENT':([47,49,50,52,53,55,56,57,58,90,91,92,93,94,95,96,99,100,101,103,104,105,106,107,108,109,111,117,118,119,120,121,122,123,124,125,126,127,128,129,130,137,154,155,156,157,158,159,160,161,163,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,209,229,231,232,239,240,246,259,308,309,310,312,313,314,315,316,317,332,333,334,336,337,338,339,340,341,370,371,372,374,375,376,377,378,379,410,411,412,413,414,415,416,417,419,443,444,445,446,447,448,449,450,452,471,472,473,475,476,477,478,479,480,511,512,513,514,515,516,517,518,520,523,524,525,527,528,529,530,531,532,537,538,539,541,542,543,544,545,546,555,556,557,559,560,561,562,563,564,568,569,570,571,572,573,574,575,576,577,578,579,580,581,590,594,595,596,597,598,599,600,601,602,603,604,605,606,607,635,636,637,638,639,640,641,642,644,651,655,656,657,658,659,660,661,662,663,664,665,666,667,668,690,691,692,693,694,695,696,697,699,720,721,722,723,724,725,726,727,729,751,752,753,771,794,800,804,805,806,807,808,809,810,811,812,813,814,815,816,817,841,842,844,845,846,847,848,849,850,851,852,853,854,855,856,857,863,864,865,867,868,869,870,871,872,874,876,877,878,879,880,881,882,883,884,885,886,887,888,889,894,896,897,898,899,900,901,902,903,904,905,906,907,908,909,911,912,914,915,937,940,941,957,976,977,978,979,980,981,982,983,985,1004,1028,1029,1033,1034,1035,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049,1050,1051,1057,1058,1060,1061,1072,1073,1074,1076,1077,1078,1079,1080,1081,1084,1105,1131,1132,1133,1134,1135,1136,1137,1138,1140,1144,1146,1150,1151,1152,1156,1160,1161,1162,1163,1164,1165,1166,1167,1168,1169,1170,1171,1172,1173,1201,1206,1212,1213,1223,],[74,-568,-35,-93,-94,-568,-95,-96,-97,-34,-492,-493,-411,-412,-36,-37,144,-568,-41,-71,-72,-568,-73,-74,-75,-485,-487,74,74,74,74,74,74,74,74,74,74,74,74,74,74,-38,-40,-48,-49,-46,-47,-42,-43,-45,-51,-44,144,144,144,144,144,144,144,144,144,144,144,144,144,144,-568,-568,-486,-489,-50,-53,-488,-52,400,-568,-198,-228,-229,-568,-230,-231,-232,433,-568,-126,-156,-157,-568,-158,-159,-160,501,-568,-427,-457,-458,-568,-459,-460,-461,-197,-205,-206,-203,-204,-199,-200,-202,-208,-125,-133,-134,-131,-132,-127,-128,-130,-136,625,-568,-499,-529,-530,-568,-531,-532,-533,-426,-434,-435,-432,-433,-428,-429,-431,-437,680,-568,-242,-272,-273,-568,-274,-275,-276,710,-568,-369,-399,-400,-568,-401,-402,-403,741,-568,-543,-562,-563,-564,-565,-566,-201,400,400,400,400,400,400,400,400,400,400,400,400,400,400,-129,433,433,433,433,433,433,433,433,433,433,433,433,433,433,-498,-506,-507,-504,-505,-500,-501,-503,-509,-430,501,501,501,501,501,501,501,501,501,501,501,501,501,501,-241,-249,-250,-247,-248,-243,-244,-246,-252,-368,-376,-377,-374,-375,-370,-371,-373,-379,-542,-544,-545,-568,-568,-502,625,625,625,625,625,625,625,625,625,625,625,625,625,625,-568,-245,680,680,680,680,680,680,680,680,680,680,680,680,680,680,966,-568,-331,-361,-362,-568,-363,-364,-365,-372,710,710,710,710,710,710,710,710,710,710,710,710,710,710,-546,741,741,741,741,741,741,741,741,741,741,741,741,741,741,-207,-210,-135,-138,-568,-436,-439,-568,-330,-338,-339,-336,-337,-332,-333,-335,-341,-568,-508,-511,-251,-254,-334,966,966,966,966,966,966,966,966,966,966,966,966,966,966,-378,-381,-209,-137,1121,-568,-284,-314,-315,-568,-316,-317,-318,-438,-568,-283,-291,-292,-289,-290,-285,-286,-288,-294,-510,-253,-340,-343,-380,-287,1121,1121,1121,1121,1121,1121,1121,1121,1121,1121,1121,1121,1121,1121,-568,-342,-293,-296,-295,]),'GT':([47,49,50,52,53,55,56,57,58,90,91,92,93,94,95,96,99,100,101,103,104,105,106,107,108,109,111,117,118,119,120,121,122,123,124,125,126,127,128,129,130,137,154,155,156,157,158,159,160,161,163,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,209,229,231,232,239,240,246,259,308,309,310,312,313,314,315,316,317,332,333,334,336,337,338,339,340,341,370,371,372,374,375,376,377,378,379,410,411,412,413,414,415,416,417,419,443,444,445,446,447,448,449,450,452,471,472,473,475,476,477,478,479,480,511,512,513,514,515,516,517,518,520,523,524,525,527,528,529,530,531,532,537,538,539,541,542,543,544,545,546,555,556,557,559,560,561,562,563,564,568,569,570,571,572,573,574,575,576,577,578,579,580,581,590,594,595,596,597,598,599,600,601,602,603,604,605,606,607,635,636,637,638,639,640,641,642,644,651,655,656,657,658,659,660,661,662,663,664,665,666,667,668,690,691,692,693,694,695,696,697,699,720,721,722,723,724,725,726,727,729,751,752,753,771,794,800,804,805,806,807,808,809,810,811,812,813,814,815,816,817,841,842,844,845,846,847,848,849,850,851,852,853,854,855,856,857,863,864,865,867,868,869,870,871,872,874,876,877,878,879,880,881,882,883,884,885,886,887,888,889,894,896,897,898,899,900,901,902,903,904,905,906,907,908,909,911,912,914,915,937,940,941,957,976,977,978,979,980,981,982,983,985,1004,1028,1029,1033,1034,1035,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049,1050,1051,1057,1058,1060,1061,1072,1073,1074,1076,1077,1078,1079,1080,1081,1084,1105,1131,1132,1133,1134,1135,1136,1137,1138,1140,1144,1146,1150,1151,1152,1156,1160,1161,1162,1163,1164,1165,1166,1167,1168,1169,1170,1171,1172,1173,1201,1206,1212,1213,1223,],[75,-568,-35,-93,-94,-568,-95,-96,-97,-34,-492,-493,-411,-412,-36,-37,145,-568,-41,-71,-72,-568,-73,-74,-75,-485,-487,75,75,75,75,75,75,75,75,75,75,75,75,75,75,-38,-40,-48,-49,-46,-47,-42,-43,-45,-51,-44,145,145,145,145,145,145,145,145,145,145,145,145,145,145,-568,-568,-486,-489,-50,-53,-488,-52,401,-568,-198,-228,-229,-568,-230,-231,-232,434,-568,-126,-156,-157,-568,-158,-159,-160,502,-568,-427,-457,-458,-568,-459,-460,-461,-197,-205,-206,-203,-204,-199,-200,-202,-208,-125,-133,-134,-131,-132,-127,-128,-130,-136,626,-568,-499,-529,-530,-568,-531,-532,-533,-426,-434,-435,-432,-433,-428,-429,-431,-437,681,-568,-242,-272,-273,-568,-274,-275,-276,711,-568,-369,-399,-400,-568,-401,-402,-403,742,-568,-543,-562,-563,-564,-565,-566,-201,401,401,401,401,401,401,401,401,401,401,401,401,401,401,-129,434,434,434,434,434,434,434,434,434,434,434,434,434,434,-498,-506,-507,-504,-505,-500,-501,-503,-509,-430,502,502,502,502,502,502,502,502,502,502,502,502,502,502,-241,-249,-250,-247,-248,-243,-244,-246,-252,-368,-376,-377,-374,-375,-370,-371,-373,-379,-542,-544,-545,-568,-568,-502,626,626,626,626,626,626,626,626,626,626,626,626,626,626,-568,-245,681,681,681,681,681,681,681,681,681,681,681,681,681,681,967,-568,-331,-361,-362,-568,-363,-364,-365,-372,711,711,711,711,711,711,711,711,711,711,711,711,711,711,-546,742,742,742,742,742,742,742,742,742,742,742,742,742,742,-207,-210,-135,-138,-568,-436,-439,-568,-330,-338,-339,-336,-337,-332,-333,-335,-341,-568,-508,-511,-251,-254,-334,967,967,967,967,967,967,967,967,967,967,967,967,967,967,-378,-381,-209,-137,1122,-568,-284,-314,-315,-568,-316,-317,-318,-438,-568,-283,-291,-292,-289,-290,-285,-286,-288,-294,-510,-253,-340,-343,-380,-287,1122,1122,1122,1122,1122,1122,1122,1122,1122,1122,1122,1122,1122,1122,-568,-342,-293,-296,-295,]),'LT':([47,49,50,52,53,55,56,57,58,90,91,92,93,94,95,96,99,100,101,103,104,105,106,107,108,109,111,117,118,119,120,121,122,123,124,125,126,127,128,129,130,137,154,155,156,157,158,159,160,161,163,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,209,229,231,232,239,240,246,259,308,309,310,312,313,314,315,316,317,332,333,334,336,337,338,339,340,341,370,371,372,374,375,376,377,378,379,410,411,412,413,414,415,416,417,419,443,444,445,446,447,448,449,450,452,471,472,473,475,476,477,478,479,480,511,512,513,514,515,516,517,518,520,523,524,525,527,528,529,530,531,532,537,538,539,541,542,543,544,545,546,555,556,557,559,560,561,562,563,564,568,569,570,571,572,573,574,575,576,577,578,579,580,581,590,594,595,596,597,598,599,600,601,602,603,604,605,606,607,635,636,637,638,639,640,641,642,644,651,655,656,657,658,659,660,661,662,663,664,665,666,667,668,690,691,692,693,694,695,696,697,699,720,721,722,723,724,725,726,727,729,751,752,753,771,794,800,804,805,806,807,808,809,810,811,812,813,814,815,816,817,841,842,844,845,846,847,848,849,850,851,852,853,854,855,856,857,863,864,865,867,868,869,870,871,872,874,876,877,878,879,880,881,882,883,884,885,886,887,888,889,894,896,897,898,899,900,901,902,903,904,905,906,907,908,909,911,912,914,915,937,940,941,957,976,977,978,979,980,981,982,983,985,1004,1028,1029,1033,1034,1035,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049,1050,1051,1057,1058,1060,1061,1072,1073,1074,1076,1077,1078,1079,1080,1081,1084,1105,1131,1132,1133,1134,1135,1136,1137,1138,1140,1144,1146,1150,1151,1152,1156,1160,1161,1162,1163,1164,1165,1166,1167,1168,1169,1170,1171,1172,1173,1201,1206,1212,1213,1223,],[76,-568,-35,-93,-94,-568,-95,-96,-97,-34,-492,-493,-411,-412,-36,-37,146,-568,-41,-71,-72,-568,-73,-74,-75,-485,-487,76,76,76,76,76,76,76,76,76,76,76,76,76,76,-38,-40,-48,-49,-46,-47,-42,-43,-45,-51,-44,146,146,146,146,146,146,146,146,146,146,146,146,146,146,-568,-568,-486,-489,-50,-53,-488,-52,402,-568,-198,-228,-229,-568,-230,-231,-232,435,-568,-126,-156,-157,-568,-158,-159,-160,503,-568,-427,-457,-458,-568,-459,-460,-461,-197,-205,-206,-203,-204,-199,-200,-202,-208,-125,-133,-134,-131,-132,-127,-128,-130,-136,627,-568,-499,-529,-530,-568,-531,-532,-533,-426,-434,-435,-432,-433,-428,-429,-431,-437,682,-568,-242,-272,-273,-568,-274,-275,-276,712,-568,-369,-399,-400,-568,-401,-402,-403,743,-568,-543,-562,-563,-564,-565,-566,-201,402,402,402,402,402,402,402,402,402,402,402,402,402,402,-129,435,435,435,435,435,435,435,435,435,435,435,435,435,435,-498,-506,-507,-504,-505,-500,-501,-503,-509,-430,503,503,503,503,503,503,503,503,503,503,503,503,503,503,-241,-249,-250,-247,-248,-243,-244,-246,-252,-368,-376,-377,-374,-375,-370,-371,-373,-379,-542,-544,-545,-568,-568,-502,627,627,627,627,627,627,627,627,627,627,627,627,627,627,-568,-245,682,682,682,682,682,682,682,682,682,682,682,682,682,682,968,-568,-331,-361,-362,-568,-363,-364,-365,-372,712,712,712,712,712,712,712,712,712,712,712,712,712,712,-546,743,743,743,743,743,743,743,743,743,743,743,743,743,743,-207,-210,-135,-138,-568,-436,-439,-568,-330,-338,-339,-336,-337,-332,-333,-335,-341,-568,-508,-511,-251,-254,-334,968,968,968,968,968,968,968,968,968,968,968,968,968,968,-378,-381,-209,-137,1123,-568,-284,-314,-315,-568,-316,-317,-318,-438,-568,-283,-291,-292,-289,-290,-285,-286,-288,-294,-510,-253,-340,-343,-380,-287,1123,1123,1123,1123,1123,1123,1123,1123,1123,1123,1123,1123,1123,1123,-568,-342,-293,-296,-295,]),'EQ_EQ':([47,49,50,52,53,55,56,57,58,90,91,92,93,94,95,96,99,100,101,103,104,105,106,107,108,109,111,117,118,119,120,121,122,123,124,125,126,127,128,129,130,137,154,155,156,157,158,159,160,161,163,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,209,229,231,232,239,240,246,259,308,309,310,312,313,314,315,316,317,332,333,334,336,337,338,339,340,341,370,371,372,374,375,376,377,378,379,410,411,412,413,414,415,416,417,419,443,444,445,446,447,448,449,450,452,471,472,473,475,476,477,478,479,480,511,512,513,514,515,516,517,518,520,523,524,525,527,528,529,530,531,532,537,538,539,541,542,543,544,545,546,555,556,557,559,560,561,562,563,564,568,569,570,571,572,573,574,575,576,577,578,579,580,581,590,594,595,596,597,598,599,600,601,602,603,604,605,606,607,635,636,637,638,639,640,641,642,644,651,655,656,657,658,659,660,661,662,663,664,665,666,667,668,690,691,692,693,694,695,696,697,699,720,721,722,723,724,725,726,727,729,751,752,753,771,794,800,804,805,806,807,808,809,810,811,812,813,814,815,816,817,841,842,844,845,846,847,848,849,850,851,852,853,854,855,856,857,863,864,865,867,868,869,870,871,872,874,876,877,878,879,880,881,882,883,884,885,886,887,888,889,894,896,897,898,899,900,901,902,903,904,905,906,907,908,909,911,912,914,915,937,940,941,957,976,977,978,979,980,981,982,983,985,1004,1028,1029,1033,1034,1035,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049,1050,1051,1057,1058,1060,1061,1072,1073,1074,1076,1077,1078,1079,1080,1081,1084,1105,1131,1132,1133,1134,1135,1136,1137,1138,1140,1144,1146,1150,1151,1152,1156,1160,1161,1162,1163,1164,1165,1166,1167,1168,1169,1170,1171,1172,1173,1201,1206,1212,1213,1223,],[77,-568,-35,-93,-94,-568,-95,-96,-97,-34,-492,-493,-411,-412,-36,-37,147,-568,-41,-71,-72,-568,-73,-74,-75,-485,-487,77,77,77,77,77,77,77,77,77,77,77,77,77,77,-38,-40,-48,-49,-46,-47,-42,-43,-45,-51,-44,147,147,147,147,147,147,147,147,147,147,147,147,147,147,-568,-568,-486,-489,-50,-53,-488,-52,403,-568,-198,-228,-229,-568,-230,-231,-232,436,-568,-126,-156,-157,-568,-158,-159,-160,504,-568,-427,-457,-458,-568,-459,-460,-461,-197,-205,-206,-203,-204,-199,-200,-202,-208,-125,-133,-134,-131,-132,-127,-128,-130,-136,628,-568,-499,-529,-530,-568,-531,-532,-533,-426,-434,-435,-432,-433,-428,-429,-431,-437,683,-568,-242,-272,-273,-568,-274,-275,-276,713,-568,-369,-399,-400,-568,-401,-402,-403,744,-568,-543,-562,-563,-564,-565,-566,-201,403,403,403,403,403,403,403,403,403,403,403,403,403,403,-129,436,436,436,436,436,436,436,436,436,436,436,436,436,436,-498,-506,-507,-504,-505,-500,-501,-503,-509,-430,504,504,504,504,504,504,504,504,504,504,504,504,504,504,-241,-249,-250,-247,-248,-243,-244,-246,-252,-368,-376,-377,-374,-375,-370,-371,-373,-379,-542,-544,-545,-568,-568,-502,628,628,628,628,628,628,628,628,628,628,628,628,628,628,-568,-245,683,683,683,683,683,683,683,683,683,683,683,683,683,683,969,-568,-331,-361,-362,-568,-363,-364,-365,-372,713,713,713,713,713,713,713,713,713,713,713,713,713,713,-546,744,744,744,744,744,744,744,744,744,744,744,744,744,744,-207,-210,-135,-138,-568,-436,-439,-568,-330,-338,-339,-336,-337,-332,-333,-335,-341,-568,-508,-511,-251,-254,-334,969,969,969,969,969,969,969,969,969,969,969,969,969,969,-378,-381,-209,-137,1124,-568,-284,-314,-315,-568,-316,-317,-318,-438,-568,-283,-291,-292,-289,-290,-285,-286,-288,-294,-510,-253,-340,-343,-380,-287,1124,1124,1124,1124,1124,1124,1124,1124,1124,1124,1124,1124,1124,1124,-568,-342,-293,-296,-295,]),'GT_EQ':([47,49,50,52,53,55,56,57,58,90,91,92,93,94,95,96,99,100,101,103,104,105,106,107,108,109,111,117,118,119,120,121,122,123,124,125,126,127,128,129,130,137,154,155,156,157,158,159,160,161,163,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,209,229,231,232,239,240,246,259,308,309,310,312,313,314,315,316,317,332,333,334,336,337,338,339,340,341,370,371,372,374,375,376,377,378,379,410,411,412,413,414,415,416,417,419,443,444,445,446,447,448,449,450,452,471,472,473,475,476,477,478,479,480,511,512,513,514,515,516,517,518,520,523,524,525,527,528,529,530,531,532,537,538,539,541,542,543,544,545,546,555,556,557,559,560,561,562,563,564,568,569,570,571,572,573,574,575,576,577,578,579,580,581,590,594,595,596,597,598,599,600,601,602,603,604,605,606,607,635,636,637,638,639,640,641,642,644,651,655,656,657,658,659,660,661,662,663,664,665,666,667,668,690,691,692,693,694,695,696,697,699,720,721,722,723,724,725,726,727,729,751,752,753,771,794,800,804,805,806,807,808,809,810,811,812,813,814,815,816,817,841,842,844,845,846,847,848,849,850,851,852,853,854,855,856,857,863,864,865,867,868,869,870,871,872,874,876,877,878,879,880,881,882,883,884,885,886,887,888,889,894,896,897,898,899,900,901,902,903,904,905,906,907,908,909,911,912,914,915,937,940,941,957,976,977,978,979,980,981,982,983,985,1004,1028,1029,1033,1034,1035,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049,1050,1051,1057,1058,1060,1061,1072,1073,1074,1076,1077,1078,1079,1080,1081,1084,1105,1131,1132,1133,1134,1135,1136,1137,1138,1140,1144,1146,1150,1151,1152,1156,1160,1161,1162,1163,1164,1165,1166,1167,1168,1169,1170,1171,1172,1173,1201,1206,1212,1213,1223,],[78,-568,-35,-93,-94,-568,-95,-96,-97,-34,-492,-493,-411,-412,-36,-37,148,-568,-41,-71,-72,-568,-73,-74,-75,-485,-487,78,78,78,78,78,78,78,78,78,78,78,78,78,78,-38,-40,-48,-49,-46,-47,-42,-43,-45,-51,-44,148,148,148,148,148,148,148,148,148,148,148,148,148,148,-568,-568,-486,-489,-50,-53,-488,-52,404,-568,-198,-228,-229,-568,-230,-231,-232,437,-568,-126,-156,-157,-568,-158,-159,-160,505,-568,-427,-457,-458,-568,-459,-460,-461,-197,-205,-206,-203,-204,-199,-200,-202,-208,-125,-133,-134,-131,-132,-127,-128,-130,-136,629,-568,-499,-529,-530,-568,-531,-532,-533,-426,-434,-435,-432,-433,-428,-429,-431,-437,684,-568,-242,-272,-273,-568,-274,-275,-276,714,-568,-369,-399,-400,-568,-401,-402,-403,745,-568,-543,-562,-563,-564,-565,-566,-201,404,404,404,404,404,404,404,404,404,404,404,404,404,404,-129,437,437,437,437,437,437,437,437,437,437,437,437,437,437,-498,-506,-507,-504,-505,-500,-501,-503,-509,-430,505,505,505,505,505,505,505,505,505,505,505,505,505,505,-241,-249,-250,-247,-248,-243,-244,-246,-252,-368,-376,-377,-374,-375,-370,-371,-373,-379,-542,-544,-545,-568,-568,-502,629,629,629,629,629,629,629,629,629,629,629,629,629,629,-568,-245,684,684,684,684,684,684,684,684,684,684,684,684,684,684,970,-568,-331,-361,-362,-568,-363,-364,-365,-372,714,714,714,714,714,714,714,714,714,714,714,714,714,714,-546,745,745,745,745,745,745,745,745,745,745,745,745,745,745,-207,-210,-135,-138,-568,-436,-439,-568,-330,-338,-339,-336,-337,-332,-333,-335,-341,-568,-508,-511,-251,-254,-334,970,970,970,970,970,970,970,970,970,970,970,970,970,970,-378,-381,-209,-137,1125,-568,-284,-314,-315,-568,-316,-317,-318,-438,-568,-283,-291,-292,-289,-290,-285,-286,-288,-294,-510,-253,-340,-343,-380,-287,1125,1125,1125,1125,1125,1125,1125,1125,1125,1125,1125,1125,1125,1125,-568,-342,-293,-296,-295,]),'LT_EQ':([47,49,50,52,53,55,56,57,58,90,91,92,93,94,95,96,99,100,101,103,104,105,106,107,108,109,111,117,118,119,120,121,122,123,124,125,126,127,128,129,130,137,154,155,156,157,158,159,160,161,163,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,209,229,231,232,239,240,246,259,308,309,310,312,313,314,315,316,317,332,333,334,336,337,338,339,340,341,370,371,372,374,375,376,377,378,379,410,411,412,413,414,415,416,417,419,443,444,445,446,447,448,449,450,452,471,472,473,475,476,477,478,479,480,511,512,513,514,515,516,517,518,520,523,524,525,527,528,529,530,531,532,537,538,539,541,542,543,544,545,546,555,556,557,559,560,561,562,563,564,568,569,570,571,572,573,574,575,576,577,578,579,580,581,590,594,595,596,597,598,599,600,601,602,603,604,605,606,607,635,636,637,638,639,640,641,642,644,651,655,656,657,658,659,660,661,662,663,664,665,666,667,668,690,691,692,693,694,695,696,697,699,720,721,722,723,724,725,726,727,729,751,752,753,771,794,800,804,805,806,807,808,809,810,811,812,813,814,815,816,817,841,842,844,845,846,847,848,849,850,851,852,853,854,855,856,857,863,864,865,867,868,869,870,871,872,874,876,877,878,879,880,881,882,883,884,885,886,887,888,889,894,896,897,898,899,900,901,902,903,904,905,906,907,908,909,911,912,914,915,937,940,941,957,976,977,978,979,980,981,982,983,985,1004,1028,1029,1033,1034,1035,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049,1050,1051,1057,1058,1060,1061,1072,1073,1074,1076,1077,1078,1079,1080,1081,1084,1105,1131,1132,1133,1134,1135,1136,1137,1138,1140,1144,1146,1150,1151,1152,1156,1160,1161,1162,1163,1164,1165,1166,1167,1168,1169,1170,1171,1172,1173,1201,1206,1212,1213,1223,],[79,-568,-35,-93,-94,-568,-95,-96,-97,-34,-492,-493,-411,-412,-36,-37,149,-568,-41,-71,-72,-568,-73,-74,-75,-485,-487,79,79,79,79,79,79,79,79,79,79,79,79,79,79,-38,-40,-48,-49,-46,-47,-42,-43,-45,-51,-44,149,149,149,149,149,149,149,149,149,149,149,149,149,149,-568,-568,-486,-489,-50,-53,-488,-52,405,-568,-198,-228,-229,-568,-230,-231,-232,438,-568,-126,-156,-157,-568,-158,-159,-160,506,-568,-427,-457,-458,-568,-459,-460,-461,-197,-205,-206,-203,-204,-199,-200,-202,-208,-125,-133,-134,-131,-132,-127,-128,-130,-136,630,-568,-499,-529,-530,-568,-531,-532,-533,-426,-434,-435,-432,-433,-428,-429,-431,-437,685,-568,-242,-272,-273,-568,-274,-275,-276,715,-568,-369,-399,-400,-568,-401,-402,-403,746,-568,-543,-562,-563,-564,-565,-566,-201,405,405,405,405,405,405,405,405,405,405,405,405,405,405,-129,438,438,438,438,438,438,438,438,438,438,438,438,438,438,-498,-506,-507,-504,-505,-500,-501,-503,-509,-430,506,506,506,506,506,506,506,506,506,506,506,506,506,506,-241,-249,-250,-247,-248,-243,-244,-246,-252,-368,-376,-377,-374,-375,-370,-371,-373,-379,-542,-544,-545,-568,-568,-502,630,630,630,630,630,630,630,630,630,630,630,630,630,630,-568,-245,685,685,685,685,685,685,685,685,685,685,685,685,685,685,971,-568,-331,-361,-362,-568,-363,-364,-365,-372,715,715,715,715,715,715,715,715,715,715,715,715,715,715,-546,746,746,746,746,746,746,746,746,746,746,746,746,746,746,-207,-210,-135,-138,-568,-436,-439,-568,-330,-338,-339,-336,-337,-332,-333,-335,-341,-568,-508,-511,-251,-254,-334,971,971,971,971,971,971,971,971,971,971,971,971,971,971,-378,-381,-209,-137,1126,-568,-284,-314,-315,-568,-316,-317,-318,-438,-568,-283,-291,-292,-289,-290,-285,-286,-288,-294,-510,-253,-340,-343,-380,-287,1126,1126,1126,1126,1126,1126,1126,1126,1126,1126,1126,1126,1126,1126,-568,-342,-293,-296,-295,]),'NOT_EQ':([47,49,50,52,53,55,56,57,58,90,91,92,93,94,95,96,99,100,101,103,104,105,106,107,108,109,111,117,118,119,120,121,122,123,124,125,126,127,128,129,130,137,154,155,156,157,158,159,160,161,163,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,209,229,231,232,239,240,246,259,308,309,310,312,313,314,315,316,317,332,333,334,336,337,338,339,340,341,370,371,372,374,375,376,377,378,379,410,411,412,413,414,415,416,417,419,443,444,445,446,447,448,449,450,452,471,472,473,475,476,477,478,479,480,511,512,513,514,515,516,517,518,520,523,524,525,527,528,529,530,531,532,537,538,539,541,542,543,544,545,546,555,556,557,559,560,561,562,563,564,568,569,570,571,572,573,574,575,576,577,578,579,580,581,590,594,595,596,597,598,599,600,601,602,603,604,605,606,607,635,636,637,638,639,640,641,642,644,651,655,656,657,658,659,660,661,662,663,664,665,666,667,668,690,691,692,693,694,695,696,697,699,720,721,722,723,724,725,726,727,729,751,752,753,771,794,800,804,805,806,807,808,809,810,811,812,813,814,815,816,817,841,842,844,845,846,847,848,849,850,851,852,853,854,855,856,857,863,864,865,867,868,869,870,871,872,874,876,877,878,879,880,881,882,883,884,885,886,887,888,889,894,896,897,898,899,900,901,902,903,904,905,906,907,908,909,911,912,914,915,937,940,941,957,976,977,978,979,980,981,982,983,985,1004,1028,1029,1033,1034,1035,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049,1050,1051,1057,1058,1060,1061,1072,1073,1074,1076,1077,1078,1079,1080,1081,1084,1105,1131,1132,1133,1134,1135,1136,1137,1138,1140,1144,1146,1150,1151,1152,1156,1160,1161,1162,1163,1164,1165,1166,1167,1168,1169,1170,1171,1172,1173,1201,1206,1212,1213,1223,],[80,-568,-35,-93,-94,-568,-95,-96,-97,-34,-492,-493,-411,-412,-36,-37,150,-568,-41,-71,-72,-568,-73,-74,-75,-485,-487,80,80,80,80,80,80,80,80,80,80,80,80,80,80,-38,-40,-48,-49,-46,-47,-42,-43,-45,-51,-44,150,150,150,150,150,150,150,150,150,150,150,150,150,150,-568,-568,-486,-489,-50,-53,-488,-52,406,-568,-198,-228,-229,-568,-230,-231,-232,439,-568,-126,-156,-157,-568,-158,-159,-160,507,-568,-427,-457,-458,-568,-459,-460,-461,-197,-205,-206,-203,-204,-199,-200,-202,-208,-125,-133,-134,-131,-132,-127,-128,-130,-136,631,-568,-499,-529,-530,-568,-531,-532,-533,-426,-434,-435,-432,-433,-428,-429,-431,-437,686,-568,-242,-272,-273,-568,-274,-275,-276,716,-568,-369,-399,-400,-568,-401,-402,-403,747,-568,-543,-562,-563,-564,-565,-566,-201,406,406,406,406,406,406,406,406,406,406,406,406,406,406,-129,439,439,439,439,439,439,439,439,439,439,439,439,439,439,-498,-506,-507,-504,-505,-500,-501,-503,-509,-430,507,507,507,507,507,507,507,507,507,507,507,507,507,507,-241,-249,-250,-247,-248,-243,-244,-246,-252,-368,-376,-377,-374,-375,-370,-371,-373,-379,-542,-544,-545,-568,-568,-502,631,631,631,631,631,631,631,631,631,631,631,631,631,631,-568,-245,686,686,686,686,686,686,686,686,686,686,686,686,686,686,972,-568,-331,-361,-362,-568,-363,-364,-365,-372,716,716,716,716,716,716,716,716,716,716,716,716,716,716,-546,747,747,747,747,747,747,747,747,747,747,747,747,747,747,-207,-210,-135,-138,-568,-436,-439,-568,-330,-338,-339,-336,-337,-332,-333,-335,-341,-568,-508,-511,-251,-254,-334,972,972,972,972,972,972,972,972,972,972,972,972,972,972,-378,-381,-209,-137,1127,-568,-284,-314,-315,-568,-316,-317,-318,-438,-568,-283,-291,-292,-289,-290,-285,-286,-288,-294,-510,-253,-340,-343,-380,-287,1127,1127,1127,1127,1127,1127,1127,1127,1127,1127,1127,1127,1127,1127,-568,-342,-293,-296,-295,]),'AND':([47,49,50,52,53,55,56,57,58,90,91,92,93,94,95,96,99,100,101,103,104,105,106,107,108,109,111,117,118,119,120,121,122,123,124,125,126,127,128,129,130,137,154,155,156,157,158,159,160,161,163,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,209,229,231,232,239,240,246,259,308,309,310,312,313,314,315,316,317,332,333,334,336,337,338,339,340,341,370,371,372,374,375,376,377,378,379,410,411,412,413,414,415,416,417,419,443,444,445,446,447,448,449,450,452,471,472,473,475,476,477,478,479,480,511,512,513,514,515,516,517,518,520,523,524,525,527,528,529,530,531,532,537,538,539,541,542,543,544,545,546,555,556,557,559,560,561,562,563,564,568,569,570,571,572,573,574,575,576,577,578,579,580,581,590,594,595,596,597,598,599,600,601,602,603,604,605,606,607,635,636,637,638,639,640,641,642,644,651,655,656,657,658,659,660,661,662,663,664,665,666,667,668,690,691,692,693,694,695,696,697,699,720,721,722,723,724,725,726,727,729,751,752,753,771,794,800,804,805,806,807,808,809,810,811,812,813,814,815,816,817,841,842,844,845,846,847,848,849,850,851,852,853,854,855,856,857,863,864,865,867,868,869,870,871,872,874,876,877,878,879,880,881,882,883,884,885,886,887,888,889,894,896,897,898,899,900,901,902,903,904,905,906,907,908,909,911,912,914,915,937,940,941,957,976,977,978,979,980,981,982,983,985,1004,1028,1029,1033,1034,1035,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049,1050,1051,1057,1058,1060,1061,1072,1073,1074,1076,1077,1078,1079,1080,1081,1084,1105,1131,1132,1133,1134,1135,1136,1137,1138,1140,1144,1146,1150,1151,1152,1156,1160,1161,1162,1163,1164,1165,1166,1167,1168,1169,1170,1171,1172,1173,1201,1206,1212,1213,1223,],[81,-568,-35,-93,-94,-568,-95,-96,-97,-34,-492,-493,-411,-412,-36,-37,151,-568,-41,-71,-72,-568,-73,-74,-75,-485,-487,81,81,81,81,81,81,81,81,81,81,81,81,81,81,-38,-40,-48,-49,-46,-47,-42,-43,-45,-51,-44,151,151,151,151,151,151,151,151,151,151,151,151,151,151,-568,-568,-486,-489,-50,-53,-488,-52,407,-568,-198,-228,-229,-568,-230,-231,-232,440,-568,-126,-156,-157,-568,-158,-159,-160,508,-568,-427,-457,-458,-568,-459,-460,-461,-197,-205,-206,-203,-204,-199,-200,-202,-208,-125,-133,-134,-131,-132,-127,-128,-130,-136,632,-568,-499,-529,-530,-568,-531,-532,-533,-426,-434,-435,-432,-433,-428,-429,-431,-437,687,-568,-242,-272,-273,-568,-274,-275,-276,717,-568,-369,-399,-400,-568,-401,-402,-403,748,-568,-543,-562,-563,-564,-565,-566,-201,407,407,407,407,407,407,407,407,407,407,407,407,407,407,-129,440,440,440,440,440,440,440,440,440,440,440,440,440,440,-498,-506,-507,-504,-505,-500,-501,-503,-509,-430,508,508,508,508,508,508,508,508,508,508,508,508,508,508,-241,-249,-250,-247,-248,-243,-244,-246,-252,-368,-376,-377,-374,-375,-370,-371,-373,-379,-542,-544,-545,-568,-568,-502,632,632,632,632,632,632,632,632,632,632,632,632,632,632,-568,-245,687,687,687,687,687,687,687,687,687,687,687,687,687,687,973,-568,-331,-361,-362,-568,-363,-364,-365,-372,717,717,717,717,717,717,717,717,717,717,717,717,717,717,-546,748,748,748,748,748,748,748,748,748,748,748,748,748,748,-207,-210,-135,-138,-568,-436,-439,-568,-330,-338,-339,-336,-337,-332,-333,-335,-341,-568,-508,-511,-251,-254,-334,973,973,973,973,973,973,973,973,973,973,973,973,973,973,-378,-381,-209,-137,1128,-568,-284,-314,-315,-568,-316,-317,-318,-438,-568,-283,-291,-292,-289,-290,-285,-286,-288,-294,-510,-253,-340,-343,-380,-287,1128,1128,1128,1128,1128,1128,1128,1128,1128,1128,1128,1128,1128,1128,-568,-342,-293,-296,-295,]),'OR':([47,49,50,52,53,55,56,57,58,90,91,92,93,94,95,96,99,100,101,103,104,105,106,107,108,109,111,117,118,119,120,121,122,123,124,125,126,127,128,129,130,137,154,155,156,157,158,159,160,161,163,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,209,229,231,232,239,240,246,259,308,309,310,312,313,314,315,316,317,332,333,334,336,337,338,339,340,341,370,371,372,374,375,376,377,378,379,410,411,412,413,414,415,416,417,419,443,444,445,446,447,448,449,450,452,471,472,473,475,476,477,478,479,480,511,512,513,514,515,516,517,518,520,523,524,525,527,528,529,530,531,532,537,538,539,541,542,543,544,545,546,555,556,557,559,560,561,562,563,564,568,569,570,571,572,573,574,575,576,577,578,579,580,581,590,594,595,596,597,598,599,600,601,602,603,604,605,606,607,635,636,637,638,639,640,641,642,644,651,655,656,657,658,659,660,661,662,663,664,665,666,667,668,690,691,692,693,694,695,696,697,699,720,721,722,723,724,725,726,727,729,751,752,753,771,794,800,804,805,806,807,808,809,810,811,812,813,814,815,816,817,841,842,844,845,846,847,848,849,850,851,852,853,854,855,856,857,863,864,865,867,868,869,870,871,872,874,876,877,878,879,880,881,882,883,884,885,886,887,888,889,894,896,897,898,899,900,901,902,903,904,905,906,907,908,909,911,912,914,915,937,940,941,957,976,977,978,979,980,981,982,983,985,1004,1028,1029,1033,1034,1035,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049,1050,1051,1057,1058,1060,1061,1072,1073,1074,1076,1077,1078,1079,1080,1081,1084,1105,1131,1132,1133,1134,1135,1136,1137,1138,1140,1144,1146,1150,1151,1152,1156,1160,1161,1162,1163,1164,1165,1166,1167,1168,1169,1170,1171,1172,1173,1201,1206,1212,1213,1223,],[82,-568,-35,-93,-94,-568,-95,-96,-97,-34,-492,-493,-411,-412,-36,-37,152,-568,-41,-71,-72,-568,-73,-74,-75,-485,-487,82,82,82,82,82,82,82,82,82,82,82,82,82,82,-38,-40,-48,-49,-46,-47,-42,-43,-45,-51,-44,152,152,152,152,152,152,152,152,152,152,152,152,152,152,-568,-568,-486,-489,-50,-53,-488,-52,408,-568,-198,-228,-229,-568,-230,-231,-232,441,-568,-126,-156,-157,-568,-158,-159,-160,509,-568,-427,-457,-458,-568,-459,-460,-461,-197,-205,-206,-203,-204,-199,-200,-202,-208,-125,-133,-134,-131,-132,-127,-128,-130,-136,633,-568,-499,-529,-530,-568,-531,-532,-533,-426,-434,-435,-432,-433,-428,-429,-431,-437,688,-568,-242,-272,-273,-568,-274,-275,-276,718,-568,-369,-399,-400,-568,-401,-402,-403,749,-568,-543,-562,-563,-564,-565,-566,-201,408,408,408,408,408,408,408,408,408,408,408,408,408,408,-129,441,441,441,441,441,441,441,441,441,441,441,441,441,441,-498,-506,-507,-504,-505,-500,-501,-503,-509,-430,509,509,509,509,509,509,509,509,509,509,509,509,509,509,-241,-249,-250,-247,-248,-243,-244,-246,-252,-368,-376,-377,-374,-375,-370,-371,-373,-379,-542,-544,-545,-568,-568,-502,633,633,633,633,633,633,633,633,633,633,633,633,633,633,-568,-245,688,688,688,688,688,688,688,688,688,688,688,688,688,688,974,-568,-331,-361,-362,-568,-363,-364,-365,-372,718,718,718,718,718,718,718,718,718,718,718,718,718,718,-546,749,749,749,749,749,749,749,749,749,749,749,749,749,749,-207,-210,-135,-138,-568,-436,-439,-568,-330,-338,-339,-336,-337,-332,-333,-335,-341,-568,-508,-511,-251,-254,-334,974,974,974,974,974,974,974,974,974,974,974,974,974,974,-378,-381,-209,-137,1129,-568,-284,-314,-315,-568,-316,-317,-318,-438,-568,-283,-291,-292,-289,-290,-285,-286,-288,-294,-510,-253,-340,-343,-380,-287,1129,1129,1129,1129,1129,1129,1129,1129,1129,1129,1129,1129,1129,1129,-568,-342,-293,-296,-295,]),'CHR_LIT':([48,133,359,613,647,1082,],[89,89,89,89,89,89,]),'PLUS_PLUS':([49,55,100,105,109,111,161,163,209,229,231,232,239,240,246,259,309,314,333,338,371,376,417,419,450,452,472,477,518,520,524,529,538,543,556,642,644,697,699,727,729,771,794,841,864,869,911,912,914,915,937,940,941,957,983,985,1004,1028,1029,1033,1034,1037,1057,1058,1060,1061,1073,1078,1084,1105,1138,1140,1144,1146,1150,1151,1152,1201,1206,1212,1213,1223,],[93,-568,157,-568,-485,-487,-45,-51,-568,-568,-486,-489,-50,-53,-488,-52,413,-568,446,-568,514,-568,-202,-208,-130,-136,638,-568,-431,-437,693,-568,723,-568,93,-503,-509,-246,-252,-373,-379,-568,-568,-568,979,-568,-207,-210,-135,-138,-568,-436,-439,-568,-335,-341,-568,-508,-511,-251,-254,93,-378,-381,-209,-137,1134,-568,-438,-568,-288,-294,-510,-253,-340,-343,-380,-568,-342,-293,-296,-295,]),'MINUS_MINUS':([49,55,100,105,109,111,161,163,209,229,231,232,239,240,246,259,309,314,333,338,371,376,417,419,450,452,472,477,518,520,524,529,538,543,556,642,644,697,699,727,729,771,794,841,864,869,911,912,914,915,937,940,941,957,983,985,1004,1028,1029,1033,1034,1037,1057,1058,1060,1061,1073,1078,1084,1105,1138,1140,1144,1146,1150,1151,1152,1201,1206,1212,1213,1223,],[94,-568,158,-568,-485,-487,-45,-51,-568,-568,-486,-489,-50,-53,-488,-52,414,-568,447,-568,515,-568,-202,-208,-130,-136,639,-568,-431,-437,694,-568,724,-568,94,-503,-509,-246,-252,-373,-379,-568,-568,-568,980,-568,-207,-210,-135,-138,-568,-436,-439,-568,-335,-341,-568,-508,-511,-251,-254,94,-378,-381,-209,-137,1135,-568,-438,-568,-288,-294,-510,-253,-340,-343,-380,-568,-342,-293,-296,-295,]),'RBRACKET':([52,53,56,57,58,61,84,85,86,87,88,89,131,132,134,135,164,165,166,167,190,206,207,208,241,245,320,582,583,584,585,608,609,610,669,670,671,818,819,820,858,859,860,890,891,892,1020,1021,1030,1052,1053,1054,1083,1086,1106,1174,1175,1176,1180,1218,],[-93,-94,-95,-96,-97,112,131,-568,-568,-91,-92,-98,-23,-24,-27,-25,209,-490,-491,210,-26,229,-54,-55,246,259,420,771,-211,-212,772,794,-139,-140,841,-440,-441,937,-512,-513,957,-255,-256,1004,-382,-383,1060,1061,1084,1105,-344,-345,1144,1146,1152,1201,-297,-298,1206,1223,]),'RPAREN':([52,53,55,56,57,58,85,86,87,88,89,91,92,93,94,98,99,100,101,103,104,105,106,107,108,109,111,115,131,132,134,135,136,138,153,154,155,156,157,158,159,160,161,163,171,172,174,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,209,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,231,232,235,237,239,240,246,258,259,268,287,309,310,312,313,314,315,316,317,333,334,336,337,338,339,340,341,359,371,372,374,375,376,377,378,379,384,390,410,411,412,413,414,415,416,417,419,423,443,444,445,446,447,448,449,450,452,459,463,464,465,471,472,473,475,476,477,478,479,480,481,482,483,484,485,491,511,512,513,514,515,516,517,518,520,522,523,524,525,527,528,529,530,531,532,536,537,538,539,541,542,543,544,545,546,548,551,552,554,555,556,557,559,560,561,562,563,564,565,566,567,589,590,591,592,593,615,619,634,635,636,637,638,639,640,641,642,644,645,646,648,650,651,652,653,654,672,674,689,690,691,692,693,694,695,696,697,699,702,704,719,720,721,722,723,724,725,726,727,729,732,734,735,750,751,752,753,771,794,798,799,800,801,802,803,804,805,806,807,808,809,810,811,812,813,814,815,816,817,821,841,842,844,845,846,847,848,849,850,851,852,853,854,855,856,857,864,865,867,868,869,870,871,872,874,876,877,878,879,880,881,882,883,884,885,886,887,888,889,894,895,896,897,898,899,900,901,902,903,904,905,906,907,908,909,911,912,914,915,919,920,921,922,923,924,925,926,927,928,929,930,931,932,933,934,935,936,937,938,940,941,943,944,945,946,947,948,949,950,951,952,953,954,955,956,957,958,976,977,978,979,980,981,982,983,985,990,991,992,993,994,995,996,997,998,999,1000,1001,1002,1003,1004,1006,1007,1008,1009,1010,1011,1012,1013,1014,1015,1016,1017,1018,1019,1028,1029,1033,1034,1035,1036,1057,1058,1059,1060,1061,1073,1074,1076,1077,1078,1079,1080,1081,1082,1084,1088,1089,1105,1111,1131,1132,1133,1134,1135,1136,1137,1138,1140,1141,1142,1143,1144,1146,1148,1150,1151,1152,1155,1156,1157,1158,1159,1201,1206,1212,1213,1220,1223,],[-93,-94,-568,-95,-96,-97,-568,-568,-91,-92,-98,-492,-493,-411,-412,137,-568,-568,-41,-71,-72,-568,-73,-74,-75,-485,-487,-568,-23,-24,-27,-25,191,-39,-70,-40,-48,-49,-46,-47,-42,-43,-45,-51,212,213,-116,-26,-44,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-568,-486,-489,-115,-118,-50,-53,-488,-568,-52,-117,-414,-568,-198,-228,-229,-568,-230,-231,-232,-568,-126,-156,-157,-568,-158,-159,-160,-568,-568,-427,-457,-458,-568,-459,-460,-461,548,564,-197,-205,-206,-203,-204,-199,-200,-202,-208,590,-125,-133,-134,-131,-132,-127,-128,-130,-136,611,-494,-495,-496,-568,-568,-499,-529,-530,-568,-531,-532,-533,645,-415,-568,-419,-420,651,-426,-434,-435,-432,-433,-428,-429,-431,-437,673,-568,-568,-242,-272,-273,-568,-274,-275,-276,703,-568,-568,-369,-399,-400,-568,-401,-402,-403,-567,733,-538,-540,-568,-568,-543,-562,-563,-564,-565,-566,-201,754,755,756,776,-129,777,778,779,800,-497,-528,-498,-506,-507,-504,-505,-500,-501,-503,-509,-413,-416,-418,823,-430,824,825,826,842,-240,-271,-241,-249,-250,-247,-248,-243,-244,-246,-252,874,-367,-398,-368,-376,-377,-374,-375,-370,-371,-373,-379,894,895,-541,-561,-542,-544,-545,-568,-568,918,919,-502,920,921,922,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-245,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-331,-361,-362,-568,-363,-364,-365,-372,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-546,-539,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-207,-210,-135,-138,-534,-535,-536,-537,-514,-515,-516,-517,-518,-519,-520,-521,-522,-523,-524,-525,-526,-527,-568,-417,-436,-439,-257,-258,-259,-260,-261,-262,-263,-264,-265,-266,-267,-268,-269,-270,-568,1035,-330,-338,-339,-336,-337,-332,-333,-335,-341,-384,-385,-386,-387,-388,-389,-390,-391,-392,-393,-394,-395,-396,-397,-568,-547,-548,-549,-550,-551,-552,-553,-554,-555,-556,-557,-558,-559,-560,-508,-511,-251,-254,-334,1087,-378,-381,1107,-209,-137,-568,-284,-314,-315,-568,-316,-317,-318,-568,-438,-408,-409,-568,1156,-283,-291,-292,-289,-290,-285,-286,-288,-294,1177,-483,-484,-510,-253,-410,-340,-343,-380,1183,-287,1184,1185,1186,-568,-342,-293,-296,1225,-295,]),'SEMICOLON':([55,109,111,209,231,232,246,533,862,863,864,865,867,868,869,870,871,872,960,975,976,977,978,979,980,981,982,983,985,986,987,988,1035,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049,1050,1051,1091,1092,1093,1094,1095,1096,1097,1098,1099,1100,1101,1102,1103,1104,1105,1150,1151,1206,],[-568,-485,-487,-568,-486,-489,-488,700,959,-568,-568,-331,-361,-362,-568,-363,-364,-365,-329,-360,-330,-338,-339,-336,-337,-332,-333,-335,-341,-405,-406,-407,-334,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-346,-347,-348,-349,-350,-351,-352,-353,-354,-355,-356,-357,-358,-359,-568,-340,-343,-342,]),'PLUS_EQ':([55,109,111,209,231,232,246,282,1037,],[-568,-485,-487,-568,-486,-489,-488,354,354,]),'MINUS_EQ':([55,109,111,209,231,232,246,282,1037,],[-568,-485,-487,-568,-486,-489,-488,355,355,]),'MUL_EQ':([55,109,111,209,231,232,246,282,1037,],[-568,-485,-487,-568,-486,-489,-488,356,356,]),'DIV_EQ':([55,109,111,209,231,232,246,282,1037,],[-568,-485,-487,-568,-486,-489,-488,357,357,]),'MOD_EQ':([55,109,111,209,231,232,246,282,1037,],[-568,-485,-487,-568,-486,-489,-488,358,358,]),'CONVERT_TO_INT':([266,271,289,351,352,353,354,355,356,357,358,360,488,1023,1090,],[303,327,365,466,-473,-474,-475,-476,-477,-478,-479,466,466,1067,466,]),'CONVERT_TO_FLT':([266,271,289,351,352,353,354,355,356,357,358,360,488,1023,1090,],[305,329,367,468,-473,-474,-475,-476,-477,-478,-479,468,468,1069,468,]),'CONVERT_TO_BLN':([266,271,289,351,352,353,354,355,356,357,358,360,488,1023,1090,],[306,330,368,469,-473,-474,-475,-476,-477,-478,-479,469,469,1070,469,]),'CONVERT_TO_STR':([266,271,289,351,352,353,354,355,356,357,358,360,488,1023,1090,],[307,331,369,470,-473,-474,-475,-476,-477,-478,-479,470,470,1071,470,]),'DOT':([282,],[350,]),'COLON':([287,548,645,1063,1064,1065,1066,1072,1073,1074,1076,1077,1078,1079,1080,1081,1115,1130,1131,1132,1133,1134,1135,1136,1137,1138,1140,1156,1160,1161,1162,1163,1164,1165,1166,1167,1168,1169,1170,1171,1172,1173,1183,1184,1185,1186,1187,1188,1189,1190,1191,1192,1193,1194,1195,1196,1197,1198,1199,1200,1201,1212,1213,1223,],[-414,-567,-413,1109,-279,-280,-281,-568,-568,-284,-314,-315,-568,-316,-317,-318,-282,-313,-283,-291,-292,-289,-290,-285,-286,-288,-294,-287,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-568,-319,-320,-321,-322,-299,-300,-301,-302,-303,-304,-305,-306,-307,-308,-309,-310,-311,-312,-568,-293,-296,-295,]),'SPLICE':([350,],[460,]),'PUSH':([350,],[461,]),}
+_lr_action_items = {'BIRTH':([0,],[2,]),'$end':([1,133,],[0,-1,]),'NEWLINE':([2,3,4,5,6,7,8,9,16,17,18,19,20,21,22,23,24,25,26,28,41,42,45,46,50,51,52,53,54,56,57,59,60,62,63,64,65,66,67,90,91,92,93,94,95,96,98,100,102,103,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,128,132,134,138,140,145,146,147,148,151,153,154,155,156,157,158,159,160,161,162,163,164,168,169,170,171,185,186,188,189,190,191,192,193,194,197,198,210,211,212,213,231,233,234,235,236,237,238,239,240,241,242,243,244,245,249,250,251,252,254,255,257,268,269,270,273,274,275,276,277,278,280,281,285,299,300,302,303,307,308,309,311,312,313,314,319,320,321,323,326,333,334,335,339,341,344,357,361,362,363,364,366,368,369,370,371,372,373,374,375,376,377,378,379,383,384,386,390,391,394,395,396,397,398,400,401,403,404,],[4,-195,4,19,-7,-8,4,-195,-5,-195,-2,19,4,-10,-11,-17,-20,-195,19,-62,-3,-9,-12,-13,-19,-18,-21,-22,-47,-195,-49,-55,-56,-195,-57,-58,-59,-195,4,-48,-182,-183,-142,-143,-50,-51,-175,-177,-14,-15,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-23,-52,-16,19,-195,19,-176,-179,19,-195,-195,19,-86,-87,19,4,-195,-92,-93,-94,-95,-96,-97,-130,-131,-132,-145,-178,19,-195,19,4,-90,-91,4,-109,-195,-159,-195,-153,-154,-155,19,-82,-88,-89,-98,-195,-195,-114,-115,-116,-117,-118,-99,-105,-162,-184,-185,-186,-158,-152,-157,-194,-6,-144,-81,-83,-84,-85,-110,-111,-113,-195,-195,4,-195,-106,-107,19,-156,-187,-188,-189,-190,19,-195,-112,-108,-161,-195,-61,-63,-62,19,19,-134,-135,19,19,19,19,-160,-195,-195,-195,19,-195,19,-121,19,-195,-124,-128,-129,19,19,-133,19,19,-195,19,-123,19,-195,19,-119,19,-120,]),'FUNCTION':([3,4,5,6,7,16,17,18,19,21,41,42,319,],[-195,-4,-195,-7,-8,-5,29,-2,-195,-10,-3,-9,29,]),'FUNCTION_INT':([3,4,5,6,7,16,17,18,19,21,41,42,319,],[-195,-4,-195,-7,-8,-5,31,-2,-195,-10,-3,-9,31,]),'FUNCTION_FLT':([3,4,5,6,7,16,17,18,19,21,41,42,319,],[-195,-4,-195,-7,-8,-5,32,-2,-195,-10,-3,-9,32,]),'FUNCTION_CHR':([3,4,5,6,7,16,17,18,19,21,41,42,319,],[-195,-4,-195,-7,-8,-5,33,-2,-195,-10,-3,-9,33,]),'FUNCTION_BLN':([3,4,5,6,7,16,17,18,19,21,41,42,319,],[-195,-4,-195,-7,-8,-5,34,-2,-195,-10,-3,-9,34,]),'FUNCTION_STR':([3,4,5,6,7,16,17,18,19,21,41,42,319,],[-195,-4,-195,-7,-8,-5,35,-2,-195,-10,-3,-9,35,]),'FUNCTION_LIST_INT':([3,4,5,6,7,16,17,18,19,21,41,42,319,],[-195,-4,-195,-7,-8,-5,36,-2,-195,-10,-3,-9,36,]),'FUNCTION_LIST_FLT':([3,4,5,6,7,16,17,18,19,21,41,42,319,],[-195,-4,-195,-7,-8,-5,37,-2,-195,-10,-3,-9,37,]),'FUNCTION_LIST_CHR':([3,4,5,6,7,16,17,18,19,21,41,42,319,],[-195,-4,-195,-7,-8,-5,38,-2,-195,-10,-3,-9,38,]),'FUNCTION_LIST_STR':([3,4,5,6,7,16,17,18,19,21,41,42,319,],[-195,-4,-195,-7,-8,-5,39,-2,-195,-10,-3,-9,39,]),'FUNCTION_LIST_BLN':([3,4,5,6,7,16,17,18,19,21,41,42,319,],[-195,-4,-195,-7,-8,-5,40,-2,-195,-10,-3,-9,40,]),'MAIN_CASPER':([3,4,5,6,7,16,17,18,19,21,26,28,41,42,48,319,333,334,335,],[-195,-4,-195,-7,-8,-5,-195,-2,-195,-10,-195,-62,-3,-9,68,-195,-61,-63,-62,]),'INT':([3,4,6,16,18,19,21,41,42,69,140,142,147,148,151,155,156,189,191,192,219,221,234,235,236,314,317,326,362,364,368,370,371,376,391,394,395,398,],[11,-4,11,-5,-2,-195,-10,-3,-9,11,-195,11,-195,175,175,175,-195,-195,-90,-91,265,175,-88,-89,-98,-195,175,175,-195,-195,175,175,-195,175,-195,175,-195,175,]),'FLT':([3,4,6,16,18,19,21,41,42,69,140,142,147,148,151,155,156,189,191,192,221,234,235,236,314,317,326,362,364,368,370,371,376,391,394,395,398,],[12,-4,12,-5,-2,-195,-10,-3,-9,12,-195,12,-195,176,176,176,-195,-195,-90,-91,176,-88,-89,-98,-195,176,176,-195,-195,176,176,-195,176,-195,176,-195,176,]),'BLN':([3,4,6,16,18,19,21,41,42,69,140,142,147,148,151,155,156,189,191,192,221,234,235,236,314,317,326,362,364,368,370,371,376,391,394,395,398,],[13,-4,13,-5,-2,-195,-10,-3,-9,13,-195,13,-195,177,177,177,-195,-195,-90,-91,177,-88,-89,-98,-195,177,177,-195,-195,177,177,-195,177,-195,177,-195,177,]),'CHR':([3,4,6,16,18,19,21,41,42,69,140,142,147,148,151,155,156,189,191,192,221,234,235,236,314,317,326,362,364,368,370,371,376,391,394,395,398,],[14,-4,14,-5,-2,-195,-10,-3,-9,14,-195,14,-195,178,178,178,-195,-195,-90,-91,178,-88,-89,-98,-195,178,178,-195,-195,178,178,-195,178,-195,178,-195,178,]),'STR':([3,4,6,16,18,19,21,41,42,69,140,142,147,148,151,155,156,189,191,192,221,234,235,236,314,317,326,362,364,368,370,371,376,391,394,395,398,],[15,-4,15,-5,-2,-195,-10,-3,-9,15,-195,15,-195,179,179,179,-195,-195,-90,-91,179,-88,-89,-98,-195,179,179,-195,-195,179,179,-195,179,-195,179,-195,179,]),'GHOST':([4,16,104,],[-4,-5,133,]),'SWAP':([4,16,18,19,41,140,147,148,151,155,156,189,191,192,221,234,235,236,314,317,326,362,364,368,370,371,376,391,394,395,398,],[-4,-5,-2,-195,-3,-195,-195,167,167,167,-195,-195,-90,-91,167,-88,-89,-98,-195,167,167,-195,-195,167,167,-195,167,-195,167,-195,167,]),'FUNCTION_NAME':([4,16,18,19,27,29,30,31,32,33,34,35,36,37,38,39,40,41,140,147,148,151,155,156,173,189,191,192,196,200,201,202,203,204,205,206,207,209,221,232,234,235,236,256,258,259,260,261,314,317,326,340,356,362,364,368,370,371,376,391,394,395,398,],[-4,-5,-2,-195,49,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-3,-195,-195,152,152,152,-195,152,-195,-90,-91,152,152,-163,-164,-165,-166,-167,-168,-169,152,152,152,-88,-89,-98,152,288,288,288,288,-195,152,152,152,152,-195,-195,152,152,-195,152,-195,152,-195,152,]),'IDENT':([4,10,11,12,13,14,15,16,18,19,41,43,44,61,70,71,72,73,74,75,76,77,78,79,80,81,82,83,99,107,140,144,147,148,149,151,155,156,165,173,175,176,177,178,179,187,189,191,192,195,196,200,201,202,203,204,205,206,207,208,209,218,220,221,232,234,235,236,256,258,259,260,261,265,271,279,294,314,316,317,326,327,332,340,356,362,364,368,370,371,376,385,391,394,395,398,],[-4,25,-28,-29,-30,-31,-32,-5,-2,-195,-3,50,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,131,136,-195,131,-195,166,184,166,166,-195,197,62,-100,-101,-102,-103,-104,62,-195,-90,-91,237,62,62,-163,-164,-165,-166,-167,-168,-169,253,62,62,62,166,62,-88,-89,-98,62,62,62,62,62,295,62,300,62,-195,62,166,166,62,62,62,62,-195,-195,166,166,-195,166,62,-195,166,-195,166,]),'DISPLAY':([4,16,18,19,41,140,147,148,151,155,156,189,191,192,221,234,235,236,314,317,326,362,364,368,370,371,376,391,394,395,398,],[-4,-5,-2,-195,-3,-195,-195,173,173,173,-195,-195,-90,-91,173,-88,-89,-98,-195,173,173,-195,-195,173,173,-195,173,-195,173,-195,173,]),'CHECK':([4,16,18,19,41,140,147,148,151,155,156,189,191,192,221,234,235,236,314,317,326,362,364,368,370,371,376,391,394,395,398,],[-4,-5,-2,-195,-3,-195,-195,174,174,174,-195,-195,-90,-91,174,-88,-89,-98,-195,174,174,-195,-195,174,174,-195,174,-195,174,-195,174,]),'FOR':([4,16,18,19,41,140,147,148,151,155,156,189,191,192,221,234,235,236,314,317,326,362,364,368,370,371,376,391,394,395,398,],[-4,-5,-2,-195,-3,-195,-195,180,180,180,-195,-195,-90,-91,180,-88,-89,-98,-195,180,180,-195,-195,180,180,-195,180,-195,180,-195,180,]),'UNTIL':([4,16,18,19,41,140,147,148,151,155,156,189,191,192,221,234,235,236,297,314,317,326,362,364,368,370,371,376,391,394,395,398,],[-4,-5,-2,-195,-3,-195,-195,181,181,181,-195,-195,-90,-91,181,-88,-89,-98,318,-195,181,181,-195,-195,181,181,-195,181,-195,181,-195,181,]),'REPEAT':([4,16,18,19,41,140,147,148,151,155,156,189,191,192,221,234,235,236,314,317,326,362,364,368,370,371,376,391,394,395,398,],[-4,-5,-2,-195,-3,-195,-195,182,182,182,-195,-195,-90,-91,182,-88,-89,-98,-195,182,182,-195,-195,182,182,-195,182,-195,182,-195,182,]),'INPUT':([4,16,18,19,41,140,147,148,151,155,156,173,189,191,192,196,200,201,202,203,204,205,206,207,209,221,232,234,235,236,256,258,259,260,261,314,317,326,340,356,362,364,368,370,371,376,391,394,395,398,],[-4,-5,-2,-195,-3,-195,-195,183,183,183,-195,183,-195,-90,-91,183,183,-163,-164,-165,-166,-167,-168,-169,183,183,183,-88,-89,-98,183,183,183,183,183,-195,183,183,183,183,-195,-195,183,183,-195,183,-195,183,-195,183,]),'REVIVE':([4,16,18,19,41,140,148,153,154,155,156,188,189,191,192,234,235,236,],[-4,-5,-2,-195,-3,-195,-195,-195,-86,-87,-195,232,-195,-90,-91,-88,-89,-98,]),'RBRACE':([4,16,18,19,41,54,56,57,59,60,62,63,64,65,90,91,92,93,94,95,96,98,100,109,110,111,112,113,114,115,116,117,118,119,120,121,122,128,138,140,145,146,147,148,151,153,154,155,156,171,185,186,188,189,191,192,221,224,231,233,234,235,236,267,268,270,272,273,274,275,276,309,311,312,313,314,317,326,331,341,352,364,370,371,375,376,382,383,387,390,391,393,394,395,397,398,399,400,402,],[-4,-5,-2,-195,-3,-47,-195,-49,-55,-56,-195,-57,-58,-59,-48,-182,-183,-142,-143,-50,-51,-175,-177,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-52,-195,-195,-176,-179,-195,-195,-195,-195,-86,-87,-195,-145,-178,-195,-195,-195,-90,-91,-195,269,-195,-82,-88,-89,-98,297,-194,-144,299,-81,-83,-84,-85,-187,-188,-189,-190,-195,-195,-195,344,-195,363,-195,-195,-195,-195,-195,386,-195,390,-195,-195,396,-195,-195,-195,-195,401,-195,403,]),'SHIFT':([4,16,18,19,41,154,155,156,189,191,192,234,235,236,307,324,362,368,372,],[-4,-5,-2,-195,-3,-86,-87,-195,-195,-90,-91,-88,-89,-98,-195,340,-195,-195,340,]),'OTHERWISE':([4,16,18,19,41,154,155,156,189,191,192,234,235,236,339,347,362,363,368,369,372,373,374,377,378,379,380,403,404,],[-4,-5,-2,-195,-3,-86,-87,-195,-195,-90,-91,-88,-89,-98,-195,361,-195,-195,-195,-195,-195,-195,-121,-124,-128,-129,384,-195,-120,]),'EQ':([9,23,24,25,45,46,50,66,98,100,102,103,132,138,145,146,158,166,172,185,197,237,244,245,281,295,300,302,303,321,],[-195,44,-20,-195,-12,-13,-19,-195,-175,-177,-14,-15,-16,-195,-176,-179,196,202,209,-178,-195,196,-99,-105,-195,316,196,-106,-107,-108,]),'COMMA':([9,22,23,24,25,45,46,50,51,52,53,54,56,57,59,60,62,63,64,65,66,85,86,87,88,89,90,91,92,93,94,95,96,98,100,102,103,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,128,132,136,138,145,146,158,171,184,185,197,210,211,212,213,227,228,229,230,237,238,239,240,241,242,243,244,245,250,251,252,268,270,281,285,298,300,302,303,304,305,309,311,312,313,321,322,336,337,338,],[-195,43,-17,-20,-195,-12,-13,-19,-18,-21,-22,-47,-195,-49,-55,-56,-195,-57,-58,-59,-195,125,125,-53,-54,-60,-48,-182,-183,-142,-143,-50,-51,-175,-177,-14,-15,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-23,-52,-16,142,-195,-176,-179,195,-145,142,-178,-195,256,-153,-154,-155,271,-149,-150,-151,195,279,-114,-115,-116,-117,-118,-99,-105,-184,-185,-186,-194,-144,-195,256,-148,195,-106,-107,322,-170,-187,-188,-189,-190,-108,-195,346,-171,-172,]),'LBRACE':([18,19,41,134,135,139,182,284,293,296,353,361,367,384,388,392,],[-2,-195,-3,-195,140,147,221,307,314,317,364,-195,371,-195,391,395,]),'OTHERWISE_CHECK':([18,19,41,363,369,373,374,403,404,],[-2,-195,-3,-195,-195,381,-121,-195,-120,]),'LBRACKET':([25,44,55,62,66,125,138,166,196,197,281,283,346,],[47,55,55,99,101,55,144,99,55,246,301,55,55,]),'TILDE':([44,61,70,71,72,73,74,75,76,77,78,79,80,81,82,83,173,196,200,201,202,203,204,205,206,207,209,218,220,232,256,258,259,260,261,294,332,340,356,385,],[58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,-163,-164,-165,-166,-167,-168,-169,58,58,58,58,58,58,58,58,58,58,58,58,58,58,]),'LPAREN':([44,49,61,68,70,71,72,73,74,75,76,77,78,79,80,81,82,83,152,167,173,174,180,181,183,196,200,201,202,203,204,205,206,207,209,214,215,216,217,218,220,232,247,248,256,258,259,260,261,288,294,318,332,340,356,381,385,],[61,69,61,105,61,61,61,61,61,61,61,61,61,61,61,61,61,61,187,208,61,218,219,220,222,61,61,-163,-164,-165,-166,-167,-168,-169,61,258,259,260,261,61,61,61,282,283,61,61,61,61,61,310,61,332,61,61,61,385,61,]),'INT_LIT':([44,55,58,61,70,71,72,73,74,75,76,77,78,79,80,81,82,83,99,125,144,173,187,196,200,201,202,203,204,205,206,207,209,218,220,232,256,258,259,260,261,271,282,283,294,316,322,332,340,346,356,385,],[59,59,95,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,130,59,130,59,59,59,59,-163,-164,-165,-166,-167,-168,-169,59,59,59,59,59,59,59,59,59,59,305,59,59,329,338,59,59,59,59,59,]),'FLT_LIT':([44,55,58,61,70,71,72,73,74,75,76,77,78,79,80,81,82,83,125,173,187,196,200,201,202,203,204,205,206,207,209,218,220,232,256,258,259,260,261,271,283,294,332,340,346,356,385,],[60,60,96,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,-163,-164,-165,-166,-167,-168,-169,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,]),'DAY':([44,55,61,70,71,72,73,74,75,76,77,78,79,80,81,82,83,125,173,187,196,200,201,202,203,204,205,206,207,209,218,220,232,256,258,259,260,261,271,283,294,332,340,346,356,385,],[63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,-163,-164,-165,-166,-167,-168,-169,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,]),'NIGHT':([44,55,61,70,71,72,73,74,75,76,77,78,79,80,81,82,83,125,173,187,196,200,201,202,203,204,205,206,207,209,218,220,232,256,258,259,260,261,271,283,294,332,340,346,356,385,],[64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,-163,-164,-165,-166,-167,-168,-169,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,]),'STR_LIT':([44,55,61,70,71,72,73,74,75,76,77,78,79,80,81,82,83,125,173,187,196,200,201,202,203,204,205,206,207,209,218,220,232,256,258,259,260,261,271,283,294,332,340,346,356,385,],[65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,-163,-164,-165,-166,-167,-168,-169,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,]),'RBRACKET':([47,59,60,63,64,65,84,85,86,87,88,89,101,123,124,126,127,129,130,131,137,150,246,301,],[66,-55,-56,-57,-58,-59,123,-195,-195,-53,-54,-60,132,-23,-24,-27,-25,138,-180,-181,-26,185,281,321,]),'PLUS':([52,54,56,57,59,60,62,63,64,65,90,91,92,93,94,95,96,97,98,100,109,110,111,112,113,114,115,116,117,118,119,120,121,122,128,138,145,146,185,212,242,251,263,266,275,287,315,345,350,],[70,-47,-195,-49,-55,-56,-195,-57,-58,-59,-48,-182,-183,-142,-143,-50,-51,70,-175,-177,-33,-34,-35,-36,-37,-38,70,70,70,70,70,70,70,70,-52,-195,-176,-179,-178,70,70,70,70,70,70,70,70,70,70,]),'MINUS':([52,54,56,57,59,60,62,63,64,65,90,91,92,93,94,95,96,97,98,100,109,110,111,112,113,114,115,116,117,118,119,120,121,122,128,138,145,146,185,212,242,251,263,266,275,287,315,345,350,],[71,-47,-195,-49,-55,-56,-195,-57,-58,-59,-48,-182,-183,-142,-143,-50,-51,71,-175,-177,-33,-34,-35,-36,-37,-38,71,71,71,71,71,71,71,71,-52,-195,-176,-179,-178,71,71,71,71,71,71,71,71,71,71,]),'MULTIPLY':([52,54,56,57,59,60,62,63,64,65,90,91,92,93,94,95,96,97,98,100,109,110,111,112,113,114,115,116,117,118,119,120,121,122,128,138,145,146,185,212,242,251,263,266,275,287,315,345,350,],[72,-47,-195,-49,-55,-56,-195,-57,-58,-59,-48,-182,-183,-142,-143,-50,-51,72,-175,-177,72,72,-35,-36,-37,-38,72,72,72,72,72,72,72,72,-52,-195,-176,-179,-178,72,72,72,72,72,72,72,72,72,72,]),'DIVISION':([52,54,56,57,59,60,62,63,64,65,90,91,92,93,94,95,96,97,98,100,109,110,111,112,113,114,115,116,117,118,119,120,121,122,128,138,145,146,185,212,242,251,263,266,275,287,315,345,350,],[73,-47,-195,-49,-55,-56,-195,-57,-58,-59,-48,-182,-183,-142,-143,-50,-51,73,-175,-177,73,73,-35,-36,-37,-38,73,73,73,73,73,73,73,73,-52,-195,-176,-179,-178,73,73,73,73,73,73,73,73,73,73,]),'MODULO':([52,54,56,57,59,60,62,63,64,65,90,91,92,93,94,95,96,97,98,100,109,110,111,112,113,114,115,116,117,118,119,120,121,122,128,138,145,146,185,212,242,251,263,266,275,287,315,345,350,],[74,-47,-195,-49,-55,-56,-195,-57,-58,-59,-48,-182,-183,-142,-143,-50,-51,74,-175,-177,74,74,-35,-36,-37,-38,74,74,74,74,74,74,74,74,-52,-195,-176,-179,-178,74,74,74,74,74,74,74,74,74,74,]),'EXPONENT':([52,54,56,57,59,60,62,63,64,65,90,91,92,93,94,95,96,97,98,100,109,110,111,112,113,114,115,116,117,118,119,120,121,122,128,138,145,146,185,212,242,251,263,266,275,287,315,345,350,],[75,-47,-195,-49,-55,-56,-195,-57,-58,-59,-48,-182,-183,-142,-143,-50,-51,75,-175,-177,75,75,75,75,75,75,75,75,75,75,75,75,75,75,-52,-195,-176,-179,-178,75,75,75,75,75,75,75,75,75,75,]),'GT':([52,54,56,57,59,60,62,63,64,65,90,91,92,93,94,95,96,97,98,100,109,110,111,112,113,114,115,116,117,118,119,120,121,122,128,138,145,146,185,212,242,251,263,266,275,287,315,345,350,],[76,-47,-195,-49,-55,-56,-195,-57,-58,-59,-48,-182,-183,-142,-143,-50,-51,76,-175,-177,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,76,76,-52,-195,-176,-179,-178,76,76,76,76,76,76,76,76,76,76,]),'LT':([52,54,56,57,59,60,62,63,64,65,90,91,92,93,94,95,96,97,98,100,109,110,111,112,113,114,115,116,117,118,119,120,121,122,128,138,145,146,185,212,242,251,263,266,275,287,315,345,350,],[77,-47,-195,-49,-55,-56,-195,-57,-58,-59,-48,-182,-183,-142,-143,-50,-51,77,-175,-177,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,77,77,-52,-195,-176,-179,-178,77,77,77,77,77,77,77,77,77,77,]),'EQ_EQ':([52,54,56,57,59,60,62,63,64,65,90,91,92,93,94,95,96,97,98,100,109,110,111,112,113,114,115,116,117,118,119,120,121,122,128,138,145,146,185,212,242,251,263,266,275,287,315,345,350,],[78,-47,-195,-49,-55,-56,-195,-57,-58,-59,-48,-182,-183,-142,-143,-50,-51,78,-175,-177,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,78,78,-52,-195,-176,-179,-178,78,78,78,78,78,78,78,78,78,78,]),'GT_EQ':([52,54,56,57,59,60,62,63,64,65,90,91,92,93,94,95,96,97,98,100,109,110,111,112,113,114,115,116,117,118,119,120,121,122,128,138,145,146,185,212,242,251,263,266,275,287,315,345,350,],[79,-47,-195,-49,-55,-56,-195,-57,-58,-59,-48,-182,-183,-142,-143,-50,-51,79,-175,-177,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,79,79,-52,-195,-176,-179,-178,79,79,79,79,79,79,79,79,79,79,]),'LT_EQ':([52,54,56,57,59,60,62,63,64,65,90,91,92,93,94,95,96,97,98,100,109,110,111,112,113,114,115,116,117,118,119,120,121,122,128,138,145,146,185,212,242,251,263,266,275,287,315,345,350,],[80,-47,-195,-49,-55,-56,-195,-57,-58,-59,-48,-182,-183,-142,-143,-50,-51,80,-175,-177,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,80,80,-52,-195,-176,-179,-178,80,80,80,80,80,80,80,80,80,80,]),'NOT_EQ':([52,54,56,57,59,60,62,63,64,65,90,91,92,93,94,95,96,97,98,100,109,110,111,112,113,114,115,116,117,118,119,120,121,122,128,138,145,146,185,212,242,251,263,266,275,287,315,345,350,],[81,-47,-195,-49,-55,-56,-195,-57,-58,-59,-48,-182,-183,-142,-143,-50,-51,81,-175,-177,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,81,81,-52,-195,-176,-179,-178,81,81,81,81,81,81,81,81,81,81,]),'AND':([52,54,56,57,59,60,62,63,64,65,90,91,92,93,94,95,96,97,98,100,109,110,111,112,113,114,115,116,117,118,119,120,121,122,128,138,145,146,185,212,242,251,263,266,275,287,315,345,350,],[82,-47,-195,-49,-55,-56,-195,-57,-58,-59,-48,-182,-183,-142,-143,-50,-51,82,-175,-177,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,82,-52,-195,-176,-179,-178,82,82,82,82,82,82,82,82,82,82,]),'OR':([52,54,56,57,59,60,62,63,64,65,90,91,92,93,94,95,96,97,98,100,109,110,111,112,113,114,115,116,117,118,119,120,121,122,128,138,145,146,185,212,242,251,263,266,275,287,315,345,350,],[83,-47,-195,-49,-55,-56,-195,-57,-58,-59,-48,-182,-183,-142,-143,-50,-51,83,-175,-177,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-52,-195,-176,-179,-178,83,83,83,83,83,83,83,83,83,83,]),'RPAREN':([54,56,57,59,60,62,63,64,65,69,85,86,87,88,89,90,91,92,93,94,95,96,97,98,100,105,106,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,126,127,128,136,137,138,141,143,145,146,171,184,185,187,222,223,225,226,227,228,229,230,250,251,252,253,262,263,266,268,270,286,287,289,290,291,292,298,306,309,310,311,312,313,325,342,345,346,354,355,358,359,360,365,389,],[-47,-195,-49,-55,-56,-195,-57,-58,-59,-195,-195,-195,-53,-54,-60,-48,-182,-183,-142,-143,-50,-51,128,-175,-177,134,135,-78,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-23,-24,-27,-25,-52,-195,-26,-195,-77,-80,-176,-179,-145,-195,-178,-195,268,-79,270,-146,-147,-149,-150,-151,-184,-185,-186,284,293,-122,296,-194,-144,309,-191,-193,311,312,313,-148,323,-187,325,-188,-189,-190,-192,353,357,-195,-139,-140,366,-173,-174,-141,392,]),'SEMICOLON':([54,56,57,59,60,62,63,64,65,90,91,92,93,94,95,96,98,100,109,110,111,112,113,114,115,116,117,118,119,120,121,122,128,138,145,146,185,264,315,328,329,330,],[-47,-195,-49,-55,-56,-195,-57,-58,-59,-48,-182,-183,-142,-143,-50,-51,-175,-177,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-52,-195,-176,-179,-178,294,327,-136,-137,-138,]),'COLON':([54,56,57,59,60,62,63,64,65,90,91,92,93,94,95,96,98,100,109,110,111,112,113,114,115,116,117,118,119,120,121,122,128,138,145,146,171,185,268,270,309,311,312,313,348,349,350,351,],[-47,-195,-49,-55,-56,-195,-57,-58,-59,-48,-182,-183,-142,-143,-50,-51,-175,-177,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-52,-195,-176,-179,-145,-178,-194,-144,-187,-188,-189,-190,362,-125,-126,-127,]),'CHR_LIT':([55,125,187,271,283,346,],[89,89,89,89,89,89,]),'PLUS_PLUS':([56,62,98,100,138,145,146,185,343,],[93,-195,-175,-177,-195,-176,-179,-178,93,]),'MINUS_MINUS':([56,62,98,100,138,145,146,185,343,],[94,-195,-175,-177,-195,-176,-179,-178,94,]),'PLUS_EQ':([62,98,100,138,145,146,166,185,343,],[-195,-175,-177,-195,-176,-179,203,-178,203,]),'MINUS_EQ':([62,98,100,138,145,146,166,185,343,],[-195,-175,-177,-195,-176,-179,204,-178,204,]),'MUL_EQ':([62,98,100,138,145,146,166,185,343,],[-195,-175,-177,-195,-176,-179,205,-178,205,]),'DIV_EQ':([62,98,100,138,145,146,166,185,343,],[-195,-175,-177,-195,-176,-179,206,-178,206,]),'MOD_EQ':([62,98,100,138,145,146,166,185,343,],[-195,-175,-177,-195,-176,-179,207,-178,207,]),'DOT':([166,],[199,]),'CONVERT_TO_INT':([173,196,200,201,202,203,204,205,206,207,209,232,256,340,356,],[214,214,214,-163,-164,-165,-166,-167,-168,-169,214,214,214,214,214,]),'CONVERT_TO_FLT':([173,196,200,201,202,203,204,205,206,207,209,232,256,340,356,],[215,215,215,-163,-164,-165,-166,-167,-168,-169,215,215,215,215,215,]),'CONVERT_TO_BLN':([173,196,200,201,202,203,204,205,206,207,209,232,256,340,356,],[216,216,216,-163,-164,-165,-166,-167,-168,-169,216,216,216,216,216,]),'CONVERT_TO_STR':([173,196,200,201,202,203,204,205,206,207,209,232,256,340,356,],[217,217,217,-163,-164,-165,-166,-167,-168,-169,217,217,217,217,217,]),'SPLICE':([199,],[247,]),'PUSH':([199,],[248,]),}
 
 _lr_action = {}
 for _k, _v in _lr_action_items.items():
@@ -17,7 +17,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'program':([0,],[1,]),'unli_newline':([2,4,6,113,263,274,276,277,278,279,280,421,],[3,15,19,170,295,342,343,344,345,346,347,588,]),'global_dec':([3,19,],[5,42,]),'global_statement':([3,19,],[6,6,]),'empty':([3,5,8,16,18,19,24,25,43,44,47,49,55,85,86,99,100,105,112,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,192,193,194,195,196,197,198,199,200,201,202,203,204,205,209,212,214,229,234,242,243,247,248,250,251,258,260,261,262,267,270,282,296,297,308,309,314,332,333,338,342,343,344,345,346,347,359,361,370,371,376,383,420,471,472,477,483,523,524,529,537,538,543,549,555,556,568,569,570,571,572,573,574,575,576,577,578,579,580,581,588,594,595,596,597,598,599,600,601,602,603,604,605,606,607,649,655,656,657,658,659,660,661,662,663,664,665,666,667,668,771,794,795,804,805,806,807,808,809,810,811,812,813,814,815,816,817,821,841,843,844,845,846,847,848,849,850,851,852,853,854,855,856,857,863,864,869,875,876,877,878,879,880,881,882,883,884,885,886,887,888,889,896,897,898,899,900,901,902,903,904,905,906,907,908,909,917,937,942,957,1004,1022,1031,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049,1050,1051,1072,1073,1078,1082,1105,1108,1109,1145,1147,1154,1160,1161,1162,1163,1164,1165,1166,1167,1168,1169,1170,1171,1172,1173,1178,1179,1181,1182,1201,1202,1205,1207,1217,1219,1226,1227,1228,1230,1231,1233,1234,1238,1239,],[7,17,21,27,17,7,60,17,21,67,83,91,111,134,134,153,155,163,169,174,21,83,83,83,83,83,83,83,83,83,83,83,83,83,83,153,153,153,153,153,153,153,153,153,153,153,153,153,153,232,17,237,240,17,17,249,249,17,17,264,237,17,272,249,319,17,111,264,388,409,411,419,442,444,452,249,249,249,249,249,249,482,489,510,512,520,249,587,634,636,644,648,689,691,699,719,721,729,264,750,91,409,409,409,409,409,409,409,409,409,409,409,409,409,409,775,442,442,442,442,442,442,442,442,442,442,442,442,442,442,489,510,510,510,510,510,510,510,510,510,510,510,510,510,510,912,915,17,634,634,634,634,634,634,634,634,634,634,634,634,634,634,648,941,17,689,689,689,689,689,689,689,689,689,689,689,689,689,689,975,977,985,249,719,719,719,719,719,719,719,719,719,719,719,719,719,719,750,750,750,750,750,750,750,750,750,750,750,750,750,750,1025,1029,249,1034,1058,17,17,975,975,975,975,975,975,975,975,975,975,975,975,975,975,1130,1132,1140,1142,1151,17,17,17,17,249,1130,1130,1130,1130,1130,1130,1130,1130,1130,1130,1130,1130,1130,1130,1204,249,17,1210,1213,17,17,249,17,17,17,17,17,249,249,17,17,17,1204,]),'var_statement':([3,19,],[8,8,]),'data_type':([3,19,115,236,],[9,9,173,244,]),'maybe_newline':([5,18,25,212,234,242,248,250,260,270,795,843,1022,1031,1108,1109,1145,1147,1181,1202,1205,1217,1219,1226,1227,1228,1233,1234,1238,],[16,40,62,233,243,247,261,262,269,322,916,942,1062,1085,1153,1154,1178,1179,1207,1214,1216,1222,1224,1229,1230,1231,1235,1236,1239,]),'global_statement_tail':([8,43,116,],[20,64,175,]),'function_statements':([16,588,],[25,774,]),'ret_type':([16,588,],[26,26,]),'function_dtype':([16,588,],[29,29,]),'global_tail':([19,],[41,]),'global_value':([23,],[44,]),'expression':([23,],[45,]),'list_value':([23,48,133,266,613,1082,],[46,86,86,299,86,86,]),'factor':([23,69,70,71,72,73,74,75,76,77,78,79,80,81,82,],[47,117,118,119,120,121,122,123,124,125,126,127,128,129,130,]),'var_call':([23,69,70,71,72,73,74,75,76,77,78,79,80,81,82,262,359,389,391,392,393,422,424,425,426,490,492,493,494,550,614,616,617,618,647,736,737,738,739,740,741,742,743,744,745,746,747,748,749,873,959,1110,1112,1113,1114,],[49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,288,485,556,556,556,556,556,556,556,556,556,556,556,556,556,556,556,556,556,485,556,556,556,556,556,556,556,556,556,556,556,556,556,556,988,1037,556,556,556,556,]),'literal1':([23,48,69,70,71,72,73,74,75,76,77,78,79,80,81,82,133,359,613,647,1082,],[50,87,50,50,50,50,50,50,50,50,50,50,50,50,50,50,87,87,87,87,87,]),'list_dec':([24,],[59,]),'global_statement_tail2':([44,],[65,]),'factor_tail':([47,117,118,119,120,121,122,123,124,125,126,127,128,129,130,],[68,176,177,178,179,180,181,182,183,184,185,186,187,188,189,]),'list_element':([48,133,613,1082,],[84,190,798,1143,]),'literal':([48,133,359,613,647,1082,],[85,85,484,85,484,85,]),'literal2':([48,133,359,613,647,1082,],[88,88,88,88,88,88,]),'postfix':([49,556,],[90,751,]),'postfix_op':([49,556,1037,],[92,92,1089,]),'factor_expression':([54,97,],[98,136,]),'factor_expression_factor':([54,97,139,140,141,142,143,144,145,146,147,148,149,150,151,152,],[99,99,192,193,194,195,196,197,198,199,200,201,202,203,204,205,]),'factor_var_call':([54,97,139,140,141,142,143,144,145,146,147,148,149,150,151,152,],[100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,]),'factor_expression1':([54,97,139,140,141,142,143,144,145,146,147,148,149,150,151,152,],[101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,]),'list_index':([55,282,],[109,109,]),'main_function':([62,],[113,]),'element_tail':([85,86,],[132,135,]),'factor_expression_tail':([99,192,193,194,195,196,197,198,199,200,201,202,203,204,205,],[138,215,216,217,218,219,220,221,222,223,224,225,226,227,228,]),'factor_postfix':([100,],[154,]),'factor_postfix_op':([100,],[156,]),'factor_list_index':([105,],[161,]),'index':([110,230,],[164,241,]),'_2d_list':([112,],[168,]),'parameters':([115,],[172,]),'factor_index':([162,238,],[206,245,]),'list_index2':([209,],[231,]),'parameters_tail':([214,258,],[235,268,]),'factor_list_index2':([229,],[239,]),'statements':([243,247,262,342,343,344,345,346,347,383,875,942,1154,1179,1207,1230,1231,],[248,260,275,453,454,455,456,457,458,547,989,1031,1182,1205,1217,1233,1234,]),'local_dec':([243,247,262,342,343,344,345,346,347,383,875,942,1154,1179,1207,1230,1231,],[250,250,250,250,250,250,250,250,250,250,250,250,250,250,250,250,250,]),'local_var_statement':([243,247,262,342,343,344,345,346,347,383,875,942,1154,1179,1207,1230,1231,],[251,251,251,251,251,251,251,251,251,251,251,251,251,251,251,251,251,]),'local_data_type':([243,247,262,342,343,344,345,346,347,383,875,942,1154,1179,1207,1230,1231,],[252,252,252,252,252,252,252,252,252,252,252,252,252,252,252,252,252,]),'local_dec_tail':([251,296,549,],[263,385,731,]),'revive':([261,],[270,]),'statements_tail':([262,],[273,]),'switch_statement':([262,],[274,]),'loop_statement':([262,],[276,]),'function_call':([262,266,271,289,351,360,488,1023,1090,],[277,302,326,364,465,465,465,1066,465,]),'assignment_statement':([262,],[278,]),'output_statement':([262,],[279,]),'conditional_statement':([262,],[280,]),'for_loop':([262,],[283,]),'until_loop':([262,],[284,]),'repeat_until':([262,],[285,]),'input_statement':([262,266,271,289,351,360,389,391,392,393,422,424,425,426,488,490,492,493,494,614,616,617,618,1023,1090,1110,1112,1113,1114,],[287,287,287,287,287,287,554,554,554,554,554,554,554,554,287,554,554,554,554,554,554,554,554,287,287,554,554,554,554,]),'local_value':([266,],[297,]),'local_value_value':([266,],[298,]),'local_type_cast':([266,],[300,]),'local_expression':([266,],[301,]),'local_factor':([266,304,395,396,397,398,399,400,401,402,403,404,405,406,407,408,],[308,390,568,569,570,571,572,573,574,575,576,577,578,579,580,581,]),'local_var_call':([266,304,395,396,397,398,399,400,401,402,403,404,405,406,407,408,],[309,309,309,309,309,309,309,309,309,309,309,309,309,309,309,309,]),'local_factor1':([266,304,395,396,397,398,399,400,401,402,403,404,405,406,407,408,],[310,310,310,310,310,310,310,310,310,310,310,310,310,310,310,310,]),'local_list_dec':([267,],[318,]),'revive_value':([271,],[323,]),'revive_type_cast':([271,],[324,]),'revive_expression':([271,],[325,]),'revive_factor':([271,328,428,429,430,431,432,433,434,435,436,437,438,439,440,441,],[332,423,594,595,596,597,598,599,600,601,602,603,604,605,606,607,]),'revive_var_call':([271,328,428,429,430,431,432,433,434,435,436,437,438,439,440,441,],[333,333,333,333,333,333,333,333,333,333,333,333,333,333,333,333,]),'revive_factor1':([271,328,428,429,430,431,432,433,434,435,436,437,438,439,440,441,],[334,334,334,334,334,334,334,334,334,334,334,334,334,334,334,334,]),'assign_tail':([282,],[349,]),'assign_op':([282,],[351,]),'compound_op':([282,1037,],[352,1090,]),'output_value':([289,],[361,]),'output_type_cast':([289,],[362,]),'output_expression':([289,],[363,]),'output_factor':([289,366,496,497,498,499,500,501,502,503,504,505,506,507,508,509,],[370,491,655,656,657,658,659,660,661,662,663,664,665,666,667,668,]),'output_var_call':([289,366,496,497,498,499,500,501,502,503,504,505,506,507,508,509,],[371,371,371,371,371,371,371,371,371,371,371,371,371,371,371,371,]),'output_factor1':([289,366,496,497,498,499,500,501,502,503,504,505,506,507,508,509,],[372,372,372,372,372,372,372,372,372,372,372,372,372,372,372,372,]),'local_dec_tail2':([297,],[386,]),'local_factor_tail':([308,568,569,570,571,572,573,574,575,576,577,578,579,580,581,],[394,757,758,759,760,761,762,763,764,765,766,767,768,769,770,]),'local_postfix':([309,],[410,]),'local_postfix_op':([309,],[412,]),'local_list_index':([314,],[417,]),'revive_factor_tail':([332,594,595,596,597,598,599,600,601,602,603,604,605,606,607,],[427,780,781,782,783,784,785,786,787,788,789,790,791,792,793,]),'revive_postfix':([333,],[443,]),'revive_postfix_op':([333,],[445,]),'revive_list_index':([338,],[450,]),'value':([351,360,488,1090,],[462,486,649,1148,]),'type_cast':([351,360,488,1090,],[463,463,463,463,]),'value_expression':([351,360,488,1090,],[464,464,464,464,]),'value_factor':([351,360,467,488,620,621,622,623,624,625,626,627,628,629,630,631,632,633,1090,],[471,471,615,471,804,805,806,807,808,809,810,811,812,813,814,815,816,817,471,]),'value_var_call':([351,360,467,488,620,621,622,623,624,625,626,627,628,629,630,631,632,633,1090,],[472,472,472,472,472,472,472,472,472,472,472,472,472,472,472,472,472,472,472,]),'value_factor1':([351,360,467,488,620,621,622,623,624,625,626,627,628,629,630,631,632,633,1090,],[473,473,473,473,473,473,473,473,473,473,473,473,473,473,473,473,473,473,473,]),'arguments':([359,],[481,]),'arg_value':([359,647,],[483,821,]),'next_val':([361,649,],[487,822,]),'output_factor_tail':([370,655,656,657,658,659,660,661,662,663,664,665,666,667,668,],[495,827,828,829,830,831,832,833,834,835,836,837,838,839,840,]),'output_postfix':([371,],[511,]),'output_postfix_op':([371,],[513,]),'output_list_index':([376,],[518,]),'condition':([380,521,1215,],[522,672,1220,]),'condition_factor':([380,521,675,676,677,678,679,680,681,682,683,684,685,686,687,688,1215,],[523,523,844,845,846,847,848,849,850,851,852,853,854,855,856,857,523,]),'condition_var_call':([380,521,675,676,677,678,679,680,681,682,683,684,685,686,687,688,1215,],[524,524,524,524,524,524,524,524,524,524,524,524,524,524,524,524,524,]),'condition1':([380,521,675,676,677,678,679,680,681,682,683,684,685,686,687,688,1215,],[525,525,525,525,525,525,525,525,525,525,525,525,525,525,525,525,525,]),'control_variable':([381,],[533,]),'until_expression':([382,1005,],[536,1059,]),'until_factor':([382,535,705,706,707,708,709,710,711,712,713,714,715,716,717,718,1005,],[537,702,876,877,878,879,880,881,882,883,884,885,886,887,888,889,537,]),'until_var_call':([382,535,705,706,707,708,709,710,711,712,713,714,715,716,717,718,1005,],[538,538,538,538,538,538,538,538,538,538,538,538,538,538,538,538,538,]),'until_factor1':([382,535,705,706,707,708,709,710,711,712,713,714,715,716,717,718,1005,],[539,539,539,539,539,539,539,539,539,539,539,539,539,539,539,539,539,]),'typecast_value':([389,391,392,393,422,424,425,426,490,492,493,494,614,616,617,618,1110,1112,1113,1114,],[551,565,566,567,589,591,592,593,650,652,653,654,799,801,802,803,1155,1157,1158,1159,]),'typecast_expression':([389,391,392,393,422,424,425,426,490,492,493,494,614,616,617,618,1110,1112,1113,1114,],[552,552,552,552,552,552,552,552,552,552,552,552,552,552,552,552,552,552,552,552,]),'typecast_factor':([389,391,392,393,422,424,425,426,490,492,493,494,550,614,616,617,618,736,737,738,739,740,741,742,743,744,745,746,747,748,749,1110,1112,1113,1114,],[555,555,555,555,555,555,555,555,555,555,555,555,732,555,555,555,555,896,897,898,899,900,901,902,903,904,905,906,907,908,909,555,555,555,555,]),'typecast_factor1':([389,391,392,393,422,424,425,426,490,492,493,494,550,614,616,617,618,736,737,738,739,740,741,742,743,744,745,746,747,748,749,1110,1112,1113,1114,],[557,557,557,557,557,557,557,557,557,557,557,557,557,557,557,557,557,557,557,557,557,557,557,557,557,557,557,557,557,557,557,557,557,557,557,]),'local_index':([418,910,],[582,1020,]),'local_2d_list':([420,],[586,]),'revive_index':([451,913,],[608,1021,]),'value_factor_tail':([471,804,805,806,807,808,809,810,811,812,813,814,815,816,817,],[619,923,924,925,926,927,928,929,930,931,932,933,934,935,936,]),'value_postfix':([472,],[635,]),'value_postfix_op':([472,],[637,]),'value_list_index':([477,],[642,]),'arg_tail':([483,821,],[646,938,]),'output_index':([519,939,],[669,1030,]),'condition_tail':([523,844,845,846,847,848,849,850,851,852,853,854,855,856,857,],[674,943,944,945,946,947,948,949,950,951,952,953,954,955,956,]),'condition_postfix':([524,],[690,]),'condition_postfix_op':([524,],[692,]),'condition_list_index':([529,],[697,]),'until_factor_tail':([537,876,877,878,879,880,881,882,883,884,885,886,887,888,889,],[704,990,991,992,993,994,995,996,997,998,999,1000,1001,1002,1003,]),'until_postfix':([538,],[720,]),'until_postfix_op':([538,],[722,]),'until_list_index':([543,],[727,]),'typecast_factor_tail':([555,896,897,898,899,900,901,902,903,904,905,906,907,908,909,],[735,1006,1007,1008,1009,1010,1011,1012,1013,1014,1015,1016,1017,1018,1019,]),'function_statements_tail':([588,],[773,]),'start':([612,],[796,]),'value_index':([643,1027,],[818,1083,]),'condition_index':([698,1032,],[858,1086,]),'for_expression':([700,],[862,]),'for_factor':([700,861,961,962,963,964,965,966,967,968,969,970,971,972,973,974,],[863,958,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049,1050,1051,]),'for_var_call':([700,861,961,962,963,964,965,966,967,968,969,970,971,972,973,974,],[864,864,864,864,864,864,864,864,864,864,864,864,864,864,864,864,]),'for_factor1':([700,861,961,962,963,964,965,966,967,968,969,970,971,972,973,974,],[865,865,865,865,865,865,865,865,865,865,865,865,865,865,865,865,]),'until_index':([728,1056,],[890,1106,]),'local_list_index2':([771,],[911,]),'revive_list_index2':([794,],[914,]),'output_list_index2':([841,],[940,]),'for_factor_tail':([863,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049,1050,1051,],[960,1091,1092,1093,1094,1095,1096,1097,1098,1099,1100,1101,1102,1103,1104,]),'for_postfix':([864,],[976,]),'for_postfix_op':([864,],[978,]),'for_list_index':([869,],[983,]),'control_var_tail':([873,],[986,]),'switch_condition':([916,1182,],[1022,1209,]),'deleteCount':([917,],[1024,]),'value_list_index2':([937,],[1028,]),'condition_list_index2':([957,],[1033,]),'update':([959,],[1036,]),'for_index':([984,1149,],[1052,1180,]),'until_list_index2':([1004,],[1057,]),'switch_value':([1023,],[1063,]),'switch_type_cast':([1023,],[1064,]),'switch_expression':([1023,],[1065,]),'switch_factor':([1023,1068,1116,1117,1118,1119,1120,1121,1122,1123,1124,1125,1126,1127,1128,1129,],[1072,1111,1160,1161,1162,1163,1164,1165,1166,1167,1168,1169,1170,1171,1172,1173,]),'switch_var_call':([1023,1068,1116,1117,1118,1119,1120,1121,1122,1123,1124,1125,1126,1127,1128,1129,],[1073,1073,1073,1073,1073,1073,1073,1073,1073,1073,1073,1073,1073,1073,1073,1073,]),'switch_factor1':([1023,1068,1116,1117,1118,1119,1120,1121,1122,1123,1124,1125,1126,1127,1128,1129,],[1074,1074,1074,1074,1074,1074,1074,1074,1074,1074,1074,1074,1074,1074,1074,1074,]),'update_tail':([1037,],[1088,]),'switch_factor_tail':([1072,1160,1161,1162,1163,1164,1165,1166,1167,1168,1169,1170,1171,1172,1173,],[1115,1187,1188,1189,1190,1191,1192,1193,1194,1195,1196,1197,1198,1199,1200,]),'switch_postfix':([1073,],[1131,]),'switch_postfix_op':([1073,],[1133,]),'switch_list_index':([1078,],[1138,]),'splice_items':([1082,],[1141,]),'for_list_index2':([1105,],[1150,]),'switch_index':([1139,1211,],[1174,1218,]),'conditional_tail':([1178,1239,],[1202,1240,]),'switchcond_tail':([1182,],[1208,]),'switch_list_index2':([1201,],[1212,]),}
+_lr_goto_items = {'program':([0,],[1,]),'unli_newline':([2,4,8,20,67,157,190,193,299,],[3,16,21,42,104,192,235,236,319,]),'global_dec':([3,],[5,]),'global_list':([3,],[6,]),'empty':([3,5,9,17,19,25,26,56,62,66,69,85,86,134,136,138,140,147,148,151,153,156,158,166,184,186,187,188,189,197,210,221,231,237,238,281,285,300,307,314,317,319,322,326,339,341,346,361,362,363,364,368,369,370,371,372,373,375,376,383,384,390,391,394,395,397,398,400,403,],[7,18,24,28,18,46,18,91,100,103,108,126,126,18,143,146,18,18,154,154,18,18,194,100,143,18,226,233,18,245,257,154,18,194,280,303,257,194,18,18,154,335,337,154,18,18,359,18,18,18,18,154,374,154,18,379,18,18,154,18,18,18,18,154,18,18,154,18,18,]),'global_statement':([3,6,],[8,20,]),'var_statement':([3,6,],[9,9,]),'data_type':([3,6,69,142,],[10,10,107,149,]),'maybe_newline':([5,19,26,134,140,147,153,156,186,189,231,307,314,339,341,361,362,363,364,371,373,375,383,384,390,391,395,397,400,403,],[17,41,48,139,148,151,188,191,224,234,272,324,326,347,352,367,368,369,370,376,380,382,387,388,393,394,398,399,402,404,]),'global_statement_tail':([9,],[22,]),'global_statement_tail2':([9,],[23,]),'function_statements':([17,319,],[26,334,]),'ret_type':([17,319,],[27,27,]),'function_dtype':([17,319,],[30,30,]),'list_dec':([25,],[45,]),'global_value':([44,],[51,]),'expression':([44,61,70,71,72,73,74,75,76,77,78,79,80,81,82,83,173,196,200,209,218,220,232,256,258,259,260,261,294,332,340,356,385,],[52,97,109,110,111,112,113,114,115,116,117,118,119,120,121,122,212,242,251,251,263,266,275,251,287,287,287,287,315,345,350,251,263,]),'list_value':([44,55,125,196,283,346,],[53,86,86,240,86,86,]),'factor':([44,61,70,71,72,73,74,75,76,77,78,79,80,81,82,83,173,196,200,209,218,220,232,256,258,259,260,261,294,332,340,356,385,],[54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,]),'var_call':([44,61,70,71,72,73,74,75,76,77,78,79,80,81,82,83,148,151,155,173,187,196,200,209,218,220,221,232,256,258,259,260,261,271,294,316,317,326,327,332,340,356,368,370,376,385,394,398,],[56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,172,172,172,56,230,56,56,56,56,56,172,56,56,56,56,56,56,230,56,330,172,172,343,56,56,56,172,172,172,56,172,172,]),'literal1':([44,55,61,70,71,72,73,74,75,76,77,78,79,80,81,82,83,125,173,187,196,200,209,218,220,232,256,258,259,260,261,271,283,294,332,340,346,356,385,],[57,87,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,87,57,87,57,57,57,57,57,57,57,57,57,57,57,87,87,57,57,57,87,57,57,]),'main_function':([48,],[67,]),'list_element':([55,125,283,346,],[84,137,306,360,]),'literal':([55,125,187,271,283,346,],[85,85,229,229,85,85,]),'literal2':([55,125,187,271,283,346,],[88,88,88,88,88,88,]),'postfix':([56,],[90,]),'postfix_op':([56,343,],[92,355,]),'list_index':([62,166,],[98,98,]),'_2d_list':([66,],[102,]),'parameters':([69,],[106,]),'element_tail':([85,86,],[124,127,]),'index':([99,144,],[129,150,]),'parameters_tail':([136,184,],[141,223,]),'list_index2':([138,],[145,]),'statements':([148,151,221,317,326,368,370,376,394,398,],[153,186,267,331,341,372,375,383,397,400,]),'statement_list':([148,151,221,317,326,368,370,376,394,398,],[155,155,155,155,155,155,155,155,155,155,]),'local_dec':([148,151,155,221,317,326,368,370,376,394,398,],[156,156,189,156,156,156,156,156,156,156,156,]),'statements_tail':([148,151,155,221,317,326,368,370,376,394,398,],[157,157,190,157,157,157,157,157,157,157,157,]),'local_var_statement':([148,151,155,221,317,326,368,370,376,394,398,],[158,158,158,158,158,158,158,158,158,158,158,]),'switch_statement':([148,151,155,221,317,326,368,370,376,394,398,],[159,159,159,159,159,159,159,159,159,159,159,]),'loop_statement':([148,151,155,221,317,326,368,370,376,394,398,],[160,160,160,160,160,160,160,160,160,160,160,]),'function_call':([148,151,155,173,196,200,209,221,232,256,317,326,340,356,368,370,376,394,398,],[161,161,161,213,243,252,252,161,276,252,161,161,351,252,161,161,161,161,161,]),'assignment_statement':([148,151,155,221,317,326,368,370,376,394,398,],[162,162,162,162,162,162,162,162,162,162,162,]),'output_statement':([148,151,155,221,317,326,368,370,376,394,398,],[163,163,163,163,163,163,163,163,163,163,163,]),'conditional_statement':([148,151,155,221,317,326,368,370,376,394,398,],[164,164,164,164,164,164,164,164,164,164,164,]),'local_data_type':([148,151,155,221,317,326,368,370,376,394,398,],[165,165,165,165,165,165,165,165,165,165,165,]),'for_loop':([148,151,155,221,317,326,368,370,376,394,398,],[168,168,168,168,168,168,168,168,168,168,168,]),'until_loop':([148,151,155,221,317,326,368,370,376,394,398,],[169,169,169,169,169,169,169,169,169,169,169,]),'repeat_until':([148,151,155,221,317,326,368,370,376,394,398,],[170,170,170,170,170,170,170,170,170,170,170,]),'input_statement':([148,151,155,173,196,200,209,221,232,256,258,259,260,261,317,326,340,356,368,370,376,394,398,],[171,171,171,171,171,171,171,171,171,171,289,289,289,289,171,171,171,171,171,171,171,171,171,]),'local_dec_tail':([158,237,300,],[193,277,320,]),'assign_tail':([166,],[198,]),'assign_op':([166,],[200,]),'compound_op':([166,343,],[201,356,]),'output_value':([173,],[210,]),'type_cast':([173,196,200,209,232,256,340,356,],[211,241,250,250,274,250,349,250,]),'arguments':([187,],[225,]),'arg_list':([187,],[227,]),'arg_value':([187,271,],[228,298,]),'revive':([188,],[231,]),'local_value':([196,],[238,]),'local_value_value':([196,],[239,]),'local_list_dec':([197,],[244,]),'value':([200,209,256,356,],[249,254,285,365,]),'next_val':([210,285,],[255,308,]),'condition':([218,385,],[262,389,]),'control_variable':([219,],[264,]),'revive_value':([232,],[273,]),'local_dec_tail2':([238,],[278,]),'typecast_value':([258,259,260,261,],[286,290,291,292,]),'local_2d_list':([281,],[302,]),'start':([282,],[304,]),'control_var_tail':([316,],[328,]),'function_statements_tail':([319,],[333,]),'deleteCount':([322,],[336,]),'switch_condition':([324,372,],[339,378,]),'update':([327,],[342,]),'switch_value':([340,],[348,]),'update_tail':([343,],[354,]),'splice_items':([346,],[358,]),'conditional_tail':([369,],[373,]),'switchcond_tail':([372,],[377,]),}
 
 _lr_goto = {}
 for _k, _v in _lr_goto_items.items():
@@ -27,572 +27,199 @@ for _k, _v in _lr_goto_items.items():
 del _lr_goto_items
 _lr_productions = [
   ("S' -> program","S'",1,None,None,None),
-  ('program -> BIRTH unli_newline global_dec maybe_newline function_statements maybe_newline main_function unli_newline GHOST','program',9,'p_program','Parser.py',41),
-  ('maybe_newline -> empty','maybe_newline',1,'p_maybe_newline','Parser.py',49),
-  ('maybe_newline -> NEWLINE maybe_newline','maybe_newline',2,'p_maybe_newline','Parser.py',50),
-  ('unli_newline -> NEWLINE','unli_newline',1,'p_unli_newline','Parser.py',58),
-  ('unli_newline -> NEWLINE unli_newline','unli_newline',2,'p_unli_newline','Parser.py',59),
-  ('main_function -> MAIN_CASPER LPAREN RPAREN maybe_newline LBRACE maybe_newline statements maybe_newline RBRACE','main_function',9,'p_main_function','Parser.py',66),
-  ('global_dec -> global_statement unli_newline global_tail','global_dec',3,'p_global_dec','Parser.py',78),
-  ('global_dec -> empty','global_dec',1,'p_global_dec','Parser.py',79),
-  ('global_tail -> global_dec','global_tail',1,'p_global_tail','Parser.py',93),
-  ('global_statement -> var_statement global_statement_tail','global_statement',2,'p_global_statement','Parser.py',103),
-  ('var_statement -> data_type IDENT list_dec','var_statement',3,'p_var_statement','Parser.py',136),
-  ('list_dec -> empty','list_dec',1,'p_list_dec','Parser.py',151),
-  ('list_dec -> LBRACKET RBRACKET _2d_list','list_dec',3,'p_list_dec','Parser.py',152),
-  ('_2d_list -> empty','_2d_list',1,'p_2d_list','Parser.py',167),
-  ('_2d_list -> LBRACKET RBRACKET','_2d_list',2,'p_2d_list','Parser.py',168),
-  ('global_statement_tail -> empty','global_statement_tail',1,'p_global_statement_tail','Parser.py',183),
-  ('global_statement_tail -> COMMA IDENT global_statement_tail','global_statement_tail',3,'p_global_statement_tail','Parser.py',184),
-  ('global_statement_tail -> EQ global_value global_statement_tail2','global_statement_tail',3,'p_global_statement_tail','Parser.py',185),
-  ('global_statement_tail2 -> COMMA IDENT global_statement_tail','global_statement_tail2',3,'p_global_statement_tail2','Parser.py',202),
-  ('global_statement_tail2 -> empty','global_statement_tail2',1,'p_global_statement_tail2','Parser.py',203),
-  ('global_value -> expression','global_value',1,'p_global_value','Parser.py',218),
-  ('global_value -> list_value','global_value',1,'p_global_value','Parser.py',219),
-  ('list_value -> LBRACKET list_element RBRACKET','list_value',3,'p_list_value','Parser.py',229),
-  ('list_element -> literal element_tail','list_element',2,'p_list_element','Parser.py',241),
-  ('list_element -> list_value element_tail','list_element',2,'p_list_element','Parser.py',242),
-  ('element_tail -> COMMA list_element','element_tail',2,'p_element_tail','Parser.py',258),
-  ('element_tail -> empty','element_tail',1,'p_element_tail','Parser.py',259),
-  ('data_type -> INT','data_type',1,'p_data_type','Parser.py',276),
-  ('data_type -> FLT','data_type',1,'p_data_type','Parser.py',277),
-  ('data_type -> BLN','data_type',1,'p_data_type','Parser.py',278),
-  ('data_type -> CHR','data_type',1,'p_data_type','Parser.py',279),
-  ('data_type -> STR','data_type',1,'p_data_type','Parser.py',280),
-  ('expression -> factor factor_tail','expression',2,'p_expression','Parser.py',290),
-  ('factor -> var_call postfix','factor',2,'p_factor','Parser.py',307),
-  ('factor -> literal1','factor',1,'p_factor','Parser.py',308),
-  ('factor -> TILDE INT_LIT','factor',2,'p_factor','Parser.py',309),
-  ('factor -> TILDE FLT_LIT','factor',2,'p_factor','Parser.py',310),
-  ('factor -> LPAREN factor_expression RPAREN','factor',3,'p_factor','Parser.py',311),
-  ('factor_expression -> factor_expression_factor factor_expression_tail','factor_expression',2,'p_factor_expression','Parser.py',333),
-  ('factor_expression_factor -> factor_var_call factor_postfix','factor_expression_factor',2,'p_factor_expression_factor','Parser.py',343),
-  ('factor_expression_factor -> factor_expression1','factor_expression_factor',1,'p_factor_expression_factor','Parser.py',344),
-  ('factor_expression_factor -> TILDE INT_LIT','factor_expression_factor',2,'p_factor_expression_factor','Parser.py',345),
-  ('factor_expression_factor -> TILDE FLT_LIT','factor_expression_factor',2,'p_factor_expression_factor','Parser.py',346),
-  ('factor_expression_factor -> LPAREN factor_expression RPAREN','factor_expression_factor',3,'p_factor_expression_factor','Parser.py',347),
-  ('factor_var_call -> IDENT factor_list_index','factor_var_call',2,'p_factor_var_call','Parser.py',368),
-  ('factor_postfix_op -> PLUS_PLUS','factor_postfix_op',1,'p_factor_postfix_op','Parser.py',374),
-  ('factor_postfix_op -> MINUS_MINUS','factor_postfix_op',1,'p_factor_postfix_op','Parser.py',375),
-  ('factor_postfix -> empty','factor_postfix',1,'p_factor_postfix','Parser.py',380),
-  ('factor_postfix -> factor_postfix_op','factor_postfix',1,'p_factor_postfix','Parser.py',381),
-  ('factor_list_index -> LBRACKET factor_index RBRACKET factor_list_index2','factor_list_index',4,'p_factor_list_index','Parser.py',387),
-  ('factor_list_index -> empty','factor_list_index',1,'p_factor_list_index','Parser.py',388),
-  ('factor_list_index2 -> LBRACKET factor_index RBRACKET','factor_list_index2',3,'p_factor_list_index2','Parser.py',398),
-  ('factor_list_index2 -> empty','factor_list_index2',1,'p_factor_list_index2','Parser.py',399),
-  ('factor_index -> INT_LIT','factor_index',1,'p_factor__int_lit','Parser.py',409),
-  ('factor_index -> IDENT','factor_index',1,'p_factor_index_ident','Parser.py',414),
-  ('factor_expression_tail -> PLUS factor_expression_factor factor_expression_tail','factor_expression_tail',3,'p_factor_expression_tail','Parser.py',420),
-  ('factor_expression_tail -> MINUS factor_expression_factor factor_expression_tail','factor_expression_tail',3,'p_factor_expression_tail','Parser.py',421),
-  ('factor_expression_tail -> MULTIPLY factor_expression_factor factor_expression_tail','factor_expression_tail',3,'p_factor_expression_tail','Parser.py',422),
-  ('factor_expression_tail -> DIVISION factor_expression_factor factor_expression_tail','factor_expression_tail',3,'p_factor_expression_tail','Parser.py',423),
-  ('factor_expression_tail -> MODULO factor_expression_factor factor_expression_tail','factor_expression_tail',3,'p_factor_expression_tail','Parser.py',424),
-  ('factor_expression_tail -> EXPONENT factor_expression_factor factor_expression_tail','factor_expression_tail',3,'p_factor_expression_tail','Parser.py',425),
-  ('factor_expression_tail -> GT factor_expression_factor factor_expression_tail','factor_expression_tail',3,'p_factor_expression_tail','Parser.py',426),
-  ('factor_expression_tail -> LT factor_expression_factor factor_expression_tail','factor_expression_tail',3,'p_factor_expression_tail','Parser.py',427),
-  ('factor_expression_tail -> EQ_EQ factor_expression_factor factor_expression_tail','factor_expression_tail',3,'p_factor_expression_tail','Parser.py',428),
-  ('factor_expression_tail -> GT_EQ factor_expression_factor factor_expression_tail','factor_expression_tail',3,'p_factor_expression_tail','Parser.py',429),
-  ('factor_expression_tail -> LT_EQ factor_expression_factor factor_expression_tail','factor_expression_tail',3,'p_factor_expression_tail','Parser.py',430),
-  ('factor_expression_tail -> NOT_EQ factor_expression_factor factor_expression_tail','factor_expression_tail',3,'p_factor_expression_tail','Parser.py',431),
-  ('factor_expression_tail -> AND factor_expression_factor factor_expression_tail','factor_expression_tail',3,'p_factor_expression_tail','Parser.py',432),
-  ('factor_expression_tail -> OR factor_expression_factor factor_expression_tail','factor_expression_tail',3,'p_factor_expression_tail','Parser.py',433),
-  ('factor_expression_tail -> empty','factor_expression_tail',1,'p_factor_expression_tail','Parser.py',434),
-  ('factor_expression1 -> INT_LIT','factor_expression1',1,'p_factor_expression1','Parser.py',448),
-  ('factor_expression1 -> FLT_LIT','factor_expression1',1,'p_factor_expression1','Parser.py',449),
-  ('factor_expression1 -> DAY','factor_expression1',1,'p_factor_expression1','Parser.py',450),
-  ('factor_expression1 -> NIGHT','factor_expression1',1,'p_factor_expression1','Parser.py',451),
-  ('factor_expression1 -> STR_LIT','factor_expression1',1,'p_factor_expression1','Parser.py',452),
-  ('factor_tail -> PLUS factor factor_tail','factor_tail',3,'p_factor_tail','Parser.py',476),
-  ('factor_tail -> MINUS factor factor_tail','factor_tail',3,'p_factor_tail','Parser.py',477),
-  ('factor_tail -> MULTIPLY factor factor_tail','factor_tail',3,'p_factor_tail','Parser.py',478),
-  ('factor_tail -> DIVISION factor factor_tail','factor_tail',3,'p_factor_tail','Parser.py',479),
-  ('factor_tail -> MODULO factor factor_tail','factor_tail',3,'p_factor_tail','Parser.py',480),
-  ('factor_tail -> EXPONENT factor factor_tail','factor_tail',3,'p_factor_tail','Parser.py',481),
-  ('factor_tail -> GT factor factor_tail','factor_tail',3,'p_factor_tail','Parser.py',482),
-  ('factor_tail -> LT factor factor_tail','factor_tail',3,'p_factor_tail','Parser.py',483),
-  ('factor_tail -> EQ_EQ factor factor_tail','factor_tail',3,'p_factor_tail','Parser.py',484),
-  ('factor_tail -> GT_EQ factor factor_tail','factor_tail',3,'p_factor_tail','Parser.py',485),
-  ('factor_tail -> LT_EQ factor factor_tail','factor_tail',3,'p_factor_tail','Parser.py',486),
-  ('factor_tail -> NOT_EQ factor factor_tail','factor_tail',3,'p_factor_tail','Parser.py',487),
-  ('factor_tail -> AND factor factor_tail','factor_tail',3,'p_factor_tail','Parser.py',488),
-  ('factor_tail -> OR factor factor_tail','factor_tail',3,'p_factor_tail','Parser.py',489),
-  ('factor_tail -> empty','factor_tail',1,'p_factor_tail','Parser.py',490),
-  ('literal -> literal1','literal',1,'p_literal','Parser.py',508),
-  ('literal -> literal2','literal',1,'p_literal','Parser.py',509),
-  ('literal1 -> INT_LIT','literal1',1,'p_literal1','Parser.py',530),
-  ('literal1 -> FLT_LIT','literal1',1,'p_literal1','Parser.py',531),
-  ('literal1 -> DAY','literal1',1,'p_literal1','Parser.py',532),
-  ('literal1 -> NIGHT','literal1',1,'p_literal1','Parser.py',533),
-  ('literal1 -> STR_LIT','literal1',1,'p_literal1','Parser.py',534),
-  ('literal2 -> CHR_LIT','literal2',1,'p_literal2','Parser.py',539),
-  ('function_statements -> ret_type FUNCTION_NAME LPAREN parameters RPAREN LBRACE maybe_newline statements maybe_newline revive maybe_newline RBRACE unli_newline function_statements_tail','function_statements',14,'p_function_statements','Parser.py',550),
-  ('function_statements -> empty','function_statements',1,'p_function_statements','Parser.py',551),
-  ('function_statements_tail -> function_statements','function_statements_tail',1,'p_function_statements_tail','Parser.py',602),
-  ('function_statements_tail -> empty','function_statements_tail',1,'p_function_statements_tail','Parser.py',603),
-  ('ret_type -> FUNCTION','ret_type',1,'p_ret_type','Parser.py',616),
-  ('ret_type -> function_dtype','ret_type',1,'p_ret_type','Parser.py',617),
-  ('function_dtype -> FUNCTION_INT','function_dtype',1,'p_function_dtype','Parser.py',638),
-  ('function_dtype -> FUNCTION_FLT','function_dtype',1,'p_function_dtype','Parser.py',639),
-  ('function_dtype -> FUNCTION_CHR','function_dtype',1,'p_function_dtype','Parser.py',640),
-  ('function_dtype -> FUNCTION_BLN','function_dtype',1,'p_function_dtype','Parser.py',641),
-  ('function_dtype -> FUNCTION_STR','function_dtype',1,'p_function_dtype','Parser.py',642),
-  ('function_dtype -> FUNCTION_LIST_INT','function_dtype',1,'p_function_dtype','Parser.py',643),
-  ('function_dtype -> FUNCTION_LIST_FLT','function_dtype',1,'p_function_dtype','Parser.py',644),
-  ('function_dtype -> FUNCTION_LIST_CHR','function_dtype',1,'p_function_dtype','Parser.py',645),
-  ('function_dtype -> FUNCTION_LIST_STR','function_dtype',1,'p_function_dtype','Parser.py',646),
-  ('function_dtype -> FUNCTION_LIST_BLN','function_dtype',1,'p_function_dtype','Parser.py',647),
-  ('parameters -> data_type IDENT parameters_tail','parameters',3,'p_parameters','Parser.py',657),
-  ('parameters -> empty','parameters',1,'p_parameters','Parser.py',658),
-  ('parameters_tail -> COMMA data_type IDENT parameters_tail','parameters_tail',4,'p_parameters_tail','Parser.py',672),
-  ('parameters_tail -> empty','parameters_tail',1,'p_parameters_tail','Parser.py',673),
-  ('revive -> REVIVE revive_value','revive',2,'p_revive','Parser.py',685),
-  ('revive -> empty','revive',1,'p_revive','Parser.py',686),
-  ('revive_value -> revive_type_cast','revive_value',1,'p_revive_value','Parser.py',696),
-  ('revive_value -> revive_expression','revive_value',1,'p_revive_value','Parser.py',697),
-  ('revive_value -> function_call','revive_value',1,'p_revive_value','Parser.py',698),
-  ('revive_expression -> revive_factor revive_factor_tail','revive_expression',2,'p_revive_expression','Parser.py',704),
-  ('revive_factor -> revive_var_call revive_postfix','revive_factor',2,'p_revive_factor','Parser.py',714),
-  ('revive_factor -> revive_factor1','revive_factor',1,'p_revive_factor','Parser.py',715),
-  ('revive_factor -> TILDE INT_LIT','revive_factor',2,'p_revive_factor','Parser.py',716),
-  ('revive_factor -> TILDE FLT_LIT','revive_factor',2,'p_revive_factor','Parser.py',717),
-  ('revive_factor -> LPAREN revive_factor RPAREN','revive_factor',3,'p_revive_factor','Parser.py',718),
-  ('revive_var_call -> IDENT revive_list_index','revive_var_call',2,'p_revive_var_call','Parser.py',738),
-  ('revive_postfix_op -> PLUS_PLUS','revive_postfix_op',1,'p_revive_postfix_op','Parser.py',744),
-  ('revive_postfix_op -> MINUS_MINUS','revive_postfix_op',1,'p_revive_postfix_op','Parser.py',745),
-  ('revive_postfix -> empty','revive_postfix',1,'p_revive_postfix','Parser.py',750),
-  ('revive_postfix -> revive_postfix_op','revive_postfix',1,'p_revive_postfix','Parser.py',751),
-  ('revive_list_index -> LBRACKET revive_index RBRACKET revive_list_index2','revive_list_index',4,'p_revive_list_index','Parser.py',757),
-  ('revive_list_index -> empty','revive_list_index',1,'p_revive_list_index','Parser.py',758),
-  ('revive_list_index2 -> LBRACKET revive_index RBRACKET','revive_list_index2',3,'p_revive_list_index2','Parser.py',768),
-  ('revive_list_index2 -> empty','revive_list_index2',1,'p_revive_list_index2','Parser.py',769),
-  ('revive_index -> INT_LIT','revive_index',1,'p_revive_int_lit','Parser.py',778),
-  ('revive_index -> IDENT','revive_index',1,'p_revive_index_ident','Parser.py',783),
-  ('revive_factor_tail -> PLUS revive_factor revive_factor_tail','revive_factor_tail',3,'p_revive_factor_tail','Parser.py',787),
-  ('revive_factor_tail -> MINUS revive_factor revive_factor_tail','revive_factor_tail',3,'p_revive_factor_tail','Parser.py',788),
-  ('revive_factor_tail -> MULTIPLY revive_factor revive_factor_tail','revive_factor_tail',3,'p_revive_factor_tail','Parser.py',789),
-  ('revive_factor_tail -> DIVISION revive_factor revive_factor_tail','revive_factor_tail',3,'p_revive_factor_tail','Parser.py',790),
-  ('revive_factor_tail -> MODULO revive_factor revive_factor_tail','revive_factor_tail',3,'p_revive_factor_tail','Parser.py',791),
-  ('revive_factor_tail -> EXPONENT revive_factor revive_factor_tail','revive_factor_tail',3,'p_revive_factor_tail','Parser.py',792),
-  ('revive_factor_tail -> GT revive_factor revive_factor_tail','revive_factor_tail',3,'p_revive_factor_tail','Parser.py',793),
-  ('revive_factor_tail -> LT revive_factor revive_factor_tail','revive_factor_tail',3,'p_revive_factor_tail','Parser.py',794),
-  ('revive_factor_tail -> EQ_EQ revive_factor revive_factor_tail','revive_factor_tail',3,'p_revive_factor_tail','Parser.py',795),
-  ('revive_factor_tail -> GT_EQ revive_factor revive_factor_tail','revive_factor_tail',3,'p_revive_factor_tail','Parser.py',796),
-  ('revive_factor_tail -> LT_EQ revive_factor revive_factor_tail','revive_factor_tail',3,'p_revive_factor_tail','Parser.py',797),
-  ('revive_factor_tail -> NOT_EQ revive_factor revive_factor_tail','revive_factor_tail',3,'p_revive_factor_tail','Parser.py',798),
-  ('revive_factor_tail -> AND revive_factor revive_factor_tail','revive_factor_tail',3,'p_revive_factor_tail','Parser.py',799),
-  ('revive_factor_tail -> OR revive_factor revive_factor_tail','revive_factor_tail',3,'p_revive_factor_tail','Parser.py',800),
-  ('revive_factor_tail -> empty','revive_factor_tail',1,'p_revive_factor_tail','Parser.py',801),
-  ('revive_factor1 -> INT_LIT','revive_factor1',1,'p_revive_factor1','Parser.py',815),
-  ('revive_factor1 -> FLT_LIT','revive_factor1',1,'p_revive_factor1','Parser.py',816),
-  ('revive_factor1 -> DAY','revive_factor1',1,'p_revive_factor1','Parser.py',817),
-  ('revive_factor1 -> NIGHT','revive_factor1',1,'p_revive_factor1','Parser.py',818),
-  ('revive_factor1 -> STR_LIT','revive_factor1',1,'p_revive_factor1','Parser.py',819),
-  ('revive_type_cast -> CONVERT_TO_INT LPAREN typecast_value RPAREN','revive_type_cast',4,'p_revive_type_cast','Parser.py',824),
-  ('revive_type_cast -> CONVERT_TO_FLT LPAREN typecast_value RPAREN','revive_type_cast',4,'p_revive_type_cast','Parser.py',825),
-  ('revive_type_cast -> CONVERT_TO_BLN LPAREN typecast_value RPAREN','revive_type_cast',4,'p_revive_type_cast','Parser.py',826),
-  ('revive_type_cast -> CONVERT_TO_STR LPAREN typecast_value RPAREN','revive_type_cast',4,'p_revive_type_cast','Parser.py',827),
-  ('statements -> empty','statements',1,'p_statements','Parser.py',834),
-  ('statements -> local_dec maybe_newline statements_tail','statements',3,'p_statements','Parser.py',835),
-  ('statements_tail -> switch_statement unli_newline statements','statements_tail',3,'p_statements_tail','Parser.py',849),
-  ('statements_tail -> loop_statement unli_newline statements','statements_tail',3,'p_statements_tail','Parser.py',850),
-  ('statements_tail -> function_call unli_newline statements','statements_tail',3,'p_statements_tail','Parser.py',851),
-  ('statements_tail -> assignment_statement unli_newline statements','statements_tail',3,'p_statements_tail','Parser.py',852),
-  ('statements_tail -> output_statement unli_newline statements','statements_tail',3,'p_statements_tail','Parser.py',853),
-  ('statements_tail -> conditional_statement unli_newline statements','statements_tail',3,'p_statements_tail','Parser.py',854),
-  ('statements_tail -> statements','statements_tail',1,'p_statements_tail','Parser.py',855),
-  ('local_dec -> local_var_statement local_dec_tail unli_newline','local_dec',3,'p_local_dec','Parser.py',913),
-  ('local_dec -> empty','local_dec',1,'p_local_dec','Parser.py',914),
-  ('local_var_statement -> local_data_type IDENT local_list_dec','local_var_statement',3,'p_local_var_statement','Parser.py',928),
-  ('local_data_type -> INT','local_data_type',1,'p_local_data_type','Parser.py',938),
-  ('local_data_type -> FLT','local_data_type',1,'p_local_data_type','Parser.py',939),
-  ('local_data_type -> BLN','local_data_type',1,'p_local_data_type','Parser.py',940),
-  ('local_data_type -> CHR','local_data_type',1,'p_local_data_type','Parser.py',941),
-  ('local_data_type -> STR','local_data_type',1,'p_local_data_type','Parser.py',942),
-  ('local_list_dec -> empty','local_list_dec',1,'p_local_list_dec','Parser.py',948),
-  ('local_list_dec -> LBRACKET RBRACKET local_2d_list','local_list_dec',3,'p_local_list_dec','Parser.py',949),
-  ('local_2d_list -> empty','local_2d_list',1,'p_local_2d_list','Parser.py',960),
-  ('local_2d_list -> LBRACKET RBRACKET','local_2d_list',2,'p_local_2d_list','Parser.py',961),
-  ('local_dec_tail -> empty','local_dec_tail',1,'p_local_dec_tail','Parser.py',976),
-  ('local_dec_tail -> COMMA IDENT local_dec_tail','local_dec_tail',3,'p_local_dec_tail','Parser.py',977),
-  ('local_dec_tail -> EQ local_value local_dec_tail2','local_dec_tail',3,'p_local_dec_tail','Parser.py',978),
-  ('local_dec_tail2 -> COMMA IDENT local_dec_tail','local_dec_tail2',3,'p_local_dec_tail2','Parser.py',993),
-  ('local_dec_tail2 -> empty','local_dec_tail2',1,'p_local_dec_tail2','Parser.py',994),
-  ('local_value -> local_value_value','local_value',1,'p_local_value','Parser.py',1008),
-  ('local_value -> list_value','local_value',1,'p_local_value','Parser.py',1009),
-  ('local_value_value -> local_type_cast','local_value_value',1,'p_local_value_value','Parser.py',1014),
-  ('local_value_value -> local_expression','local_value_value',1,'p_local_value_value','Parser.py',1015),
-  ('local_value_value -> function_call','local_value_value',1,'p_local_value_value','Parser.py',1016),
-  ('local_expression -> local_factor local_factor_tail','local_expression',2,'p_local_expression','Parser.py',1021),
-  ('local_factor -> local_var_call local_postfix','local_factor',2,'p_local_factor','Parser.py',1031),
-  ('local_factor -> local_factor1','local_factor',1,'p_local_factor','Parser.py',1032),
-  ('local_factor -> TILDE INT_LIT','local_factor',2,'p_local_factor','Parser.py',1033),
-  ('local_factor -> TILDE FLT_LIT','local_factor',2,'p_local_factor','Parser.py',1034),
-  ('local_factor -> LPAREN local_factor RPAREN','local_factor',3,'p_local_factor','Parser.py',1035),
-  ('local_var_call -> IDENT local_list_index','local_var_call',2,'p_local_var_call','Parser.py',1056),
-  ('local_postfix_op -> PLUS_PLUS','local_postfix_op',1,'p_local_postfix_op','Parser.py',1062),
-  ('local_postfix_op -> MINUS_MINUS','local_postfix_op',1,'p_local_postfix_op','Parser.py',1063),
-  ('local_postfix -> empty','local_postfix',1,'p_local_postfix','Parser.py',1068),
-  ('local_postfix -> local_postfix_op','local_postfix',1,'p_local_postfix','Parser.py',1069),
-  ('local_list_index -> LBRACKET local_index RBRACKET local_list_index2','local_list_index',4,'p_local_list_index','Parser.py',1075),
-  ('local_list_index -> empty','local_list_index',1,'p_local_list_index','Parser.py',1076),
-  ('local_list_index2 -> LBRACKET local_index RBRACKET','local_list_index2',3,'p_local_list_index2','Parser.py',1086),
-  ('local_list_index2 -> empty','local_list_index2',1,'p_local_list_index2','Parser.py',1087),
-  ('local_index -> INT_LIT','local_index',1,'p_local_int_lit','Parser.py',1096),
-  ('local_index -> IDENT','local_index',1,'p_local_index_ident','Parser.py',1101),
-  ('local_factor_tail -> PLUS local_factor local_factor_tail','local_factor_tail',3,'p_local_factor_tail','Parser.py',1105),
-  ('local_factor_tail -> MINUS local_factor local_factor_tail','local_factor_tail',3,'p_local_factor_tail','Parser.py',1106),
-  ('local_factor_tail -> MULTIPLY local_factor local_factor_tail','local_factor_tail',3,'p_local_factor_tail','Parser.py',1107),
-  ('local_factor_tail -> DIVISION local_factor local_factor_tail','local_factor_tail',3,'p_local_factor_tail','Parser.py',1108),
-  ('local_factor_tail -> MODULO local_factor local_factor_tail','local_factor_tail',3,'p_local_factor_tail','Parser.py',1109),
-  ('local_factor_tail -> EXPONENT local_factor local_factor_tail','local_factor_tail',3,'p_local_factor_tail','Parser.py',1110),
-  ('local_factor_tail -> GT local_factor local_factor_tail','local_factor_tail',3,'p_local_factor_tail','Parser.py',1111),
-  ('local_factor_tail -> LT local_factor local_factor_tail','local_factor_tail',3,'p_local_factor_tail','Parser.py',1112),
-  ('local_factor_tail -> EQ_EQ local_factor local_factor_tail','local_factor_tail',3,'p_local_factor_tail','Parser.py',1113),
-  ('local_factor_tail -> GT_EQ local_factor local_factor_tail','local_factor_tail',3,'p_local_factor_tail','Parser.py',1114),
-  ('local_factor_tail -> LT_EQ local_factor local_factor_tail','local_factor_tail',3,'p_local_factor_tail','Parser.py',1115),
-  ('local_factor_tail -> NOT_EQ local_factor local_factor_tail','local_factor_tail',3,'p_local_factor_tail','Parser.py',1116),
-  ('local_factor_tail -> AND local_factor local_factor_tail','local_factor_tail',3,'p_local_factor_tail','Parser.py',1117),
-  ('local_factor_tail -> OR local_factor local_factor_tail','local_factor_tail',3,'p_local_factor_tail','Parser.py',1118),
-  ('local_factor_tail -> empty','local_factor_tail',1,'p_local_factor_tail','Parser.py',1119),
-  ('local_factor1 -> INT_LIT','local_factor1',1,'p_local_factor1','Parser.py',1133),
-  ('local_factor1 -> FLT_LIT','local_factor1',1,'p_local_factor1','Parser.py',1134),
-  ('local_factor1 -> DAY','local_factor1',1,'p_local_factor1','Parser.py',1135),
-  ('local_factor1 -> NIGHT','local_factor1',1,'p_local_factor1','Parser.py',1136),
-  ('local_factor1 -> STR_LIT','local_factor1',1,'p_local_factor1','Parser.py',1137),
-  ('local_type_cast -> CONVERT_TO_INT LPAREN typecast_value RPAREN','local_type_cast',4,'p_local_type_cast','Parser.py',1142),
-  ('local_type_cast -> CONVERT_TO_FLT LPAREN typecast_value RPAREN','local_type_cast',4,'p_local_type_cast','Parser.py',1143),
-  ('local_type_cast -> CONVERT_TO_BLN LPAREN typecast_value RPAREN','local_type_cast',4,'p_local_type_cast','Parser.py',1144),
-  ('local_type_cast -> CONVERT_TO_STR LPAREN typecast_value RPAREN','local_type_cast',4,'p_local_type_cast','Parser.py',1145),
-  ('conditional_statement -> CHECK LPAREN condition RPAREN LBRACE maybe_newline statements maybe_newline RBRACE maybe_newline conditional_tail maybe_newline OTHERWISE maybe_newline LBRACE maybe_newline statements maybe_newline RBRACE','conditional_statement',19,'p_conditional_statement','Parser.py',1152),
-  ('conditional_tail -> OTHERWISE_CHECK LPAREN condition RPAREN LBRACE maybe_newline statements maybe_newline RBRACE maybe_newline conditional_tail','conditional_tail',11,'p_conditional_tail','Parser.py',1163),
-  ('conditional_tail -> empty','conditional_tail',1,'p_conditional_tail','Parser.py',1164),
-  ('condition -> condition_factor condition_tail','condition',2,'p_condition','Parser.py',1174),
-  ('condition_factor -> condition_var_call condition_postfix','condition_factor',2,'p_condition_factor','Parser.py',1184),
-  ('condition_factor -> condition1','condition_factor',1,'p_condition_factor','Parser.py',1185),
-  ('condition_factor -> TILDE INT_LIT','condition_factor',2,'p_condition_factor','Parser.py',1186),
-  ('condition_factor -> TILDE FLT_LIT','condition_factor',2,'p_condition_factor','Parser.py',1187),
-  ('condition_factor -> LPAREN condition RPAREN','condition_factor',3,'p_condition_factor','Parser.py',1188),
-  ('condition_var_call -> IDENT condition_list_index','condition_var_call',2,'p_condition_var_call','Parser.py',1208),
-  ('condition_postfix_op -> PLUS_PLUS','condition_postfix_op',1,'p_condition_postfix_op','Parser.py',1214),
-  ('condition_postfix_op -> MINUS_MINUS','condition_postfix_op',1,'p_condition_postfix_op','Parser.py',1215),
-  ('condition_postfix -> empty','condition_postfix',1,'p_condition_postfix','Parser.py',1220),
-  ('condition_postfix -> condition_postfix_op','condition_postfix',1,'p_condition_postfix','Parser.py',1221),
-  ('condition_list_index -> LBRACKET condition_index RBRACKET condition_list_index2','condition_list_index',4,'p_condition_list_index','Parser.py',1227),
-  ('condition_list_index -> empty','condition_list_index',1,'p_condition_list_index','Parser.py',1228),
-  ('condition_list_index2 -> LBRACKET condition_index RBRACKET','condition_list_index2',3,'p_condition_list_index2','Parser.py',1238),
-  ('condition_list_index2 -> empty','condition_list_index2',1,'p_condition_list_index2','Parser.py',1239),
-  ('condition_index -> INT_LIT','condition_index',1,'p_condition_int_lit','Parser.py',1248),
-  ('condition_index -> IDENT','condition_index',1,'p_condition_index_ident','Parser.py',1253),
-  ('condition_tail -> PLUS condition_factor condition_tail','condition_tail',3,'p_condition_tail','Parser.py',1257),
-  ('condition_tail -> MINUS condition_factor condition_tail','condition_tail',3,'p_condition_tail','Parser.py',1258),
-  ('condition_tail -> MULTIPLY condition_factor condition_tail','condition_tail',3,'p_condition_tail','Parser.py',1259),
-  ('condition_tail -> DIVISION condition_factor condition_tail','condition_tail',3,'p_condition_tail','Parser.py',1260),
-  ('condition_tail -> MODULO condition_factor condition_tail','condition_tail',3,'p_condition_tail','Parser.py',1261),
-  ('condition_tail -> EXPONENT condition_factor condition_tail','condition_tail',3,'p_condition_tail','Parser.py',1262),
-  ('condition_tail -> GT condition_factor condition_tail','condition_tail',3,'p_condition_tail','Parser.py',1263),
-  ('condition_tail -> LT condition_factor condition_tail','condition_tail',3,'p_condition_tail','Parser.py',1264),
-  ('condition_tail -> EQ_EQ condition_factor condition_tail','condition_tail',3,'p_condition_tail','Parser.py',1265),
-  ('condition_tail -> GT_EQ condition_factor condition_tail','condition_tail',3,'p_condition_tail','Parser.py',1266),
-  ('condition_tail -> LT_EQ condition_factor condition_tail','condition_tail',3,'p_condition_tail','Parser.py',1267),
-  ('condition_tail -> NOT_EQ condition_factor condition_tail','condition_tail',3,'p_condition_tail','Parser.py',1268),
-  ('condition_tail -> AND condition_factor condition_tail','condition_tail',3,'p_condition_tail','Parser.py',1269),
-  ('condition_tail -> OR condition_factor condition_tail','condition_tail',3,'p_condition_tail','Parser.py',1270),
-  ('condition_tail -> empty','condition_tail',1,'p_condition_tail','Parser.py',1271),
-  ('condition1 -> INT_LIT','condition1',1,'p_condition1','Parser.py',1285),
-  ('condition1 -> FLT_LIT','condition1',1,'p_condition1','Parser.py',1286),
-  ('condition1 -> DAY','condition1',1,'p_condition1','Parser.py',1287),
-  ('condition1 -> NIGHT','condition1',1,'p_condition1','Parser.py',1288),
-  ('condition1 -> STR_LIT','condition1',1,'p_condition1','Parser.py',1289),
-  ('switch_statement -> SWAP LPAREN IDENT RPAREN LBRACE maybe_newline switch_condition maybe_newline OTHERWISE maybe_newline LBRACE maybe_newline statements maybe_newline RBRACE maybe_newline RBRACE','switch_statement',17,'p_switch_statement','Parser.py',1301),
-  ('switch_condition -> SHIFT switch_value COLON maybe_newline statements switchcond_tail','switch_condition',6,'p_switch_condition','Parser.py',1315),
-  ('switch_value -> switch_type_cast','switch_value',1,'p_switch_value','Parser.py',1321),
-  ('switch_value -> switch_expression','switch_value',1,'p_switch_value','Parser.py',1322),
-  ('switch_value -> function_call','switch_value',1,'p_switch_value','Parser.py',1323),
-  ('switch_expression -> switch_factor switch_factor_tail','switch_expression',2,'p_switch_expression','Parser.py',1328),
-  ('switch_factor -> switch_var_call switch_postfix','switch_factor',2,'p_switch_factor','Parser.py',1338),
-  ('switch_factor -> switch_factor1','switch_factor',1,'p_switch_factor','Parser.py',1339),
-  ('switch_factor -> TILDE INT_LIT','switch_factor',2,'p_switch_factor','Parser.py',1340),
-  ('switch_factor -> TILDE FLT_LIT','switch_factor',2,'p_switch_factor','Parser.py',1341),
-  ('switch_factor -> LPAREN switch_factor RPAREN','switch_factor',3,'p_switch_factor','Parser.py',1342),
-  ('switch_var_call -> IDENT switch_list_index','switch_var_call',2,'p_switch_var_call','Parser.py',1362),
-  ('switch_postfix_op -> PLUS_PLUS','switch_postfix_op',1,'p_switch_postfix_op','Parser.py',1368),
-  ('switch_postfix_op -> MINUS_MINUS','switch_postfix_op',1,'p_switch_postfix_op','Parser.py',1369),
-  ('switch_postfix -> empty','switch_postfix',1,'p_switch_postfix','Parser.py',1374),
-  ('switch_postfix -> switch_postfix_op','switch_postfix',1,'p_switch_postfix','Parser.py',1375),
-  ('switch_list_index -> LBRACKET switch_index RBRACKET switch_list_index2','switch_list_index',4,'p_switch_list_index','Parser.py',1381),
-  ('switch_list_index -> empty','switch_list_index',1,'p_switch_list_index','Parser.py',1382),
-  ('switch_list_index2 -> LBRACKET switch_index RBRACKET','switch_list_index2',3,'p_switch_list_index2','Parser.py',1392),
-  ('switch_list_index2 -> empty','switch_list_index2',1,'p_switch_list_index2','Parser.py',1393),
-  ('switch_index -> INT_LIT','switch_index',1,'p_switch_int_lit','Parser.py',1401),
-  ('switch_index -> IDENT','switch_index',1,'p_switch_index_ident','Parser.py',1406),
-  ('switch_factor_tail -> PLUS switch_factor switch_factor_tail','switch_factor_tail',3,'p_switch_factor_tail','Parser.py',1411),
-  ('switch_factor_tail -> MINUS switch_factor switch_factor_tail','switch_factor_tail',3,'p_switch_factor_tail','Parser.py',1412),
-  ('switch_factor_tail -> MULTIPLY switch_factor switch_factor_tail','switch_factor_tail',3,'p_switch_factor_tail','Parser.py',1413),
-  ('switch_factor_tail -> DIVISION switch_factor switch_factor_tail','switch_factor_tail',3,'p_switch_factor_tail','Parser.py',1414),
-  ('switch_factor_tail -> MODULO switch_factor switch_factor_tail','switch_factor_tail',3,'p_switch_factor_tail','Parser.py',1415),
-  ('switch_factor_tail -> EXPONENT switch_factor switch_factor_tail','switch_factor_tail',3,'p_switch_factor_tail','Parser.py',1416),
-  ('switch_factor_tail -> GT switch_factor switch_factor_tail','switch_factor_tail',3,'p_switch_factor_tail','Parser.py',1417),
-  ('switch_factor_tail -> LT switch_factor switch_factor_tail','switch_factor_tail',3,'p_switch_factor_tail','Parser.py',1418),
-  ('switch_factor_tail -> EQ_EQ switch_factor switch_factor_tail','switch_factor_tail',3,'p_switch_factor_tail','Parser.py',1419),
-  ('switch_factor_tail -> GT_EQ switch_factor switch_factor_tail','switch_factor_tail',3,'p_switch_factor_tail','Parser.py',1420),
-  ('switch_factor_tail -> LT_EQ switch_factor switch_factor_tail','switch_factor_tail',3,'p_switch_factor_tail','Parser.py',1421),
-  ('switch_factor_tail -> NOT_EQ switch_factor switch_factor_tail','switch_factor_tail',3,'p_switch_factor_tail','Parser.py',1422),
-  ('switch_factor_tail -> AND switch_factor switch_factor_tail','switch_factor_tail',3,'p_switch_factor_tail','Parser.py',1423),
-  ('switch_factor_tail -> OR switch_factor switch_factor_tail','switch_factor_tail',3,'p_switch_factor_tail','Parser.py',1424),
-  ('switch_factor_tail -> empty','switch_factor_tail',1,'p_switch_factor_tail','Parser.py',1425),
-  ('switch_factor1 -> INT_LIT','switch_factor1',1,'p_switch_factor1','Parser.py',1439),
-  ('switch_factor1 -> FLT_LIT','switch_factor1',1,'p_switch_factor1','Parser.py',1440),
-  ('switch_factor1 -> DAY','switch_factor1',1,'p_switch_factor1','Parser.py',1441),
-  ('switch_factor1 -> NIGHT','switch_factor1',1,'p_switch_factor1','Parser.py',1442),
-  ('switch_factor1 -> STR_LIT','switch_factor1',1,'p_switch_factor1','Parser.py',1443),
-  ('switch_type_cast -> CONVERT_TO_INT LPAREN typecast_value RPAREN','switch_type_cast',4,'p_switch_type_cast','Parser.py',1448),
-  ('switch_type_cast -> CONVERT_TO_FLT LPAREN typecast_value RPAREN','switch_type_cast',4,'p_switch_type_cast','Parser.py',1449),
-  ('switch_type_cast -> CONVERT_TO_BLN LPAREN typecast_value RPAREN','switch_type_cast',4,'p_switch_type_cast','Parser.py',1450),
-  ('switch_type_cast -> CONVERT_TO_STR LPAREN typecast_value RPAREN','switch_type_cast',4,'p_switch_type_cast','Parser.py',1451),
-  ('switchcond_tail -> switch_condition','switchcond_tail',1,'p_switchcond_tail','Parser.py',1459),
-  ('switchcond_tail -> empty','switchcond_tail',1,'p_switchcond_tail','Parser.py',1460),
-  ('loop_statement -> for_loop','loop_statement',1,'p_loop_statement','Parser.py',1475),
-  ('loop_statement -> until_loop','loop_statement',1,'p_loop_statement','Parser.py',1476),
-  ('loop_statement -> repeat_until','loop_statement',1,'p_loop_statement','Parser.py',1477),
-  ('for_loop -> FOR LPAREN control_variable SEMICOLON for_expression SEMICOLON update RPAREN LBRACE maybe_newline statements maybe_newline RBRACE','for_loop',13,'p_for_loop','Parser.py',1485),
-  ('for_expression -> for_factor for_factor_tail','for_expression',2,'p_for_expression','Parser.py',1490),
-  ('for_factor -> for_var_call for_postfix','for_factor',2,'p_for_factor','Parser.py',1500),
-  ('for_factor -> for_factor1','for_factor',1,'p_for_factor','Parser.py',1501),
-  ('for_factor -> TILDE INT_LIT','for_factor',2,'p_for_factor','Parser.py',1502),
-  ('for_factor -> TILDE FLT_LIT','for_factor',2,'p_for_factor','Parser.py',1503),
-  ('for_factor -> LPAREN for_factor RPAREN','for_factor',3,'p_for_factor','Parser.py',1504),
-  ('for_var_call -> IDENT for_list_index','for_var_call',2,'p_for_var_call','Parser.py',1524),
-  ('for_postfix_op -> PLUS_PLUS','for_postfix_op',1,'p_for_postfix_op','Parser.py',1530),
-  ('for_postfix_op -> MINUS_MINUS','for_postfix_op',1,'p_for_postfix_op','Parser.py',1531),
-  ('for_postfix -> empty','for_postfix',1,'p_for_postfix','Parser.py',1536),
-  ('for_postfix -> for_postfix_op','for_postfix',1,'p_for_postfix','Parser.py',1537),
-  ('for_list_index -> LBRACKET for_index RBRACKET for_list_index2','for_list_index',4,'p_for_list_index','Parser.py',1543),
-  ('for_list_index -> empty','for_list_index',1,'p_for_list_index','Parser.py',1544),
-  ('for_list_index2 -> LBRACKET for_index RBRACKET','for_list_index2',3,'p_for_list_index2','Parser.py',1554),
-  ('for_list_index2 -> empty','for_list_index2',1,'p_for_list_index2','Parser.py',1555),
-  ('for_index -> INT_LIT','for_index',1,'p_for_int_lit','Parser.py',1564),
-  ('for_index -> IDENT','for_index',1,'p_for_index_ident','Parser.py',1569),
-  ('for_factor_tail -> PLUS for_factor for_factor_tail','for_factor_tail',3,'p_for_factor_tail','Parser.py',1576),
-  ('for_factor_tail -> MINUS for_factor for_factor_tail','for_factor_tail',3,'p_for_factor_tail','Parser.py',1577),
-  ('for_factor_tail -> MULTIPLY for_factor for_factor_tail','for_factor_tail',3,'p_for_factor_tail','Parser.py',1578),
-  ('for_factor_tail -> DIVISION for_factor for_factor_tail','for_factor_tail',3,'p_for_factor_tail','Parser.py',1579),
-  ('for_factor_tail -> MODULO for_factor for_factor_tail','for_factor_tail',3,'p_for_factor_tail','Parser.py',1580),
-  ('for_factor_tail -> EXPONENT for_factor for_factor_tail','for_factor_tail',3,'p_for_factor_tail','Parser.py',1581),
-  ('for_factor_tail -> GT for_factor for_factor_tail','for_factor_tail',3,'p_for_factor_tail','Parser.py',1582),
-  ('for_factor_tail -> LT for_factor for_factor_tail','for_factor_tail',3,'p_for_factor_tail','Parser.py',1583),
-  ('for_factor_tail -> EQ_EQ for_factor for_factor_tail','for_factor_tail',3,'p_for_factor_tail','Parser.py',1584),
-  ('for_factor_tail -> GT_EQ for_factor for_factor_tail','for_factor_tail',3,'p_for_factor_tail','Parser.py',1585),
-  ('for_factor_tail -> LT_EQ for_factor for_factor_tail','for_factor_tail',3,'p_for_factor_tail','Parser.py',1586),
-  ('for_factor_tail -> NOT_EQ for_factor for_factor_tail','for_factor_tail',3,'p_for_factor_tail','Parser.py',1587),
-  ('for_factor_tail -> AND for_factor for_factor_tail','for_factor_tail',3,'p_for_factor_tail','Parser.py',1588),
-  ('for_factor_tail -> OR for_factor for_factor_tail','for_factor_tail',3,'p_for_factor_tail','Parser.py',1589),
-  ('for_factor_tail -> empty','for_factor_tail',1,'p_for_factor_tail','Parser.py',1590),
-  ('for_factor1 -> INT_LIT','for_factor1',1,'p_for_factor1','Parser.py',1604),
-  ('for_factor1 -> FLT_LIT','for_factor1',1,'p_for_factor1','Parser.py',1605),
-  ('for_factor1 -> DAY','for_factor1',1,'p_for_factor1','Parser.py',1606),
-  ('for_factor1 -> NIGHT','for_factor1',1,'p_for_factor1','Parser.py',1607),
-  ('for_factor1 -> STR_LIT','for_factor1',1,'p_for_factor1','Parser.py',1608),
-  ('until_loop -> UNTIL LPAREN until_expression RPAREN LBRACE statements RBRACE','until_loop',7,'p_until_loop','Parser.py',1616),
-  ('until_expression -> until_factor until_factor_tail','until_expression',2,'p_until_expression','Parser.py',1623),
-  ('until_factor -> until_var_call until_postfix','until_factor',2,'p_until_factor','Parser.py',1633),
-  ('until_factor -> until_factor1','until_factor',1,'p_until_factor','Parser.py',1634),
-  ('until_factor -> TILDE INT_LIT','until_factor',2,'p_until_factor','Parser.py',1635),
-  ('until_factor -> TILDE FLT_LIT','until_factor',2,'p_until_factor','Parser.py',1636),
-  ('until_factor -> LPAREN until_factor RPAREN','until_factor',3,'p_until_factor','Parser.py',1637),
-  ('until_var_call -> IDENT until_list_index','until_var_call',2,'p_until_var_call','Parser.py',1657),
-  ('until_postfix_op -> PLUS_PLUS','until_postfix_op',1,'p_until_postfix_op','Parser.py',1663),
-  ('until_postfix_op -> MINUS_MINUS','until_postfix_op',1,'p_until_postfix_op','Parser.py',1664),
-  ('until_postfix -> empty','until_postfix',1,'p_until_postfix','Parser.py',1669),
-  ('until_postfix -> until_postfix_op','until_postfix',1,'p_until_postfix','Parser.py',1670),
-  ('until_list_index -> LBRACKET until_index RBRACKET until_list_index2','until_list_index',4,'p_until_list_index','Parser.py',1676),
-  ('until_list_index -> empty','until_list_index',1,'p_until_list_index','Parser.py',1677),
-  ('until_list_index2 -> LBRACKET until_index RBRACKET','until_list_index2',3,'p_until_list_index2','Parser.py',1687),
-  ('until_list_index2 -> empty','until_list_index2',1,'p_until_list_index2','Parser.py',1688),
-  ('until_index -> INT_LIT','until_index',1,'p_until_int_lit','Parser.py',1698),
-  ('until_index -> IDENT','until_index',1,'p_until_index_ident','Parser.py',1703),
-  ('until_factor_tail -> PLUS until_factor until_factor_tail','until_factor_tail',3,'p_until_factor_tail','Parser.py',1708),
-  ('until_factor_tail -> MINUS until_factor until_factor_tail','until_factor_tail',3,'p_until_factor_tail','Parser.py',1709),
-  ('until_factor_tail -> MULTIPLY until_factor until_factor_tail','until_factor_tail',3,'p_until_factor_tail','Parser.py',1710),
-  ('until_factor_tail -> DIVISION until_factor until_factor_tail','until_factor_tail',3,'p_until_factor_tail','Parser.py',1711),
-  ('until_factor_tail -> MODULO until_factor until_factor_tail','until_factor_tail',3,'p_until_factor_tail','Parser.py',1712),
-  ('until_factor_tail -> EXPONENT until_factor until_factor_tail','until_factor_tail',3,'p_until_factor_tail','Parser.py',1713),
-  ('until_factor_tail -> GT until_factor until_factor_tail','until_factor_tail',3,'p_until_factor_tail','Parser.py',1714),
-  ('until_factor_tail -> LT until_factor until_factor_tail','until_factor_tail',3,'p_until_factor_tail','Parser.py',1715),
-  ('until_factor_tail -> EQ_EQ until_factor until_factor_tail','until_factor_tail',3,'p_until_factor_tail','Parser.py',1716),
-  ('until_factor_tail -> GT_EQ until_factor until_factor_tail','until_factor_tail',3,'p_until_factor_tail','Parser.py',1717),
-  ('until_factor_tail -> LT_EQ until_factor until_factor_tail','until_factor_tail',3,'p_until_factor_tail','Parser.py',1718),
-  ('until_factor_tail -> NOT_EQ until_factor until_factor_tail','until_factor_tail',3,'p_until_factor_tail','Parser.py',1719),
-  ('until_factor_tail -> AND until_factor until_factor_tail','until_factor_tail',3,'p_until_factor_tail','Parser.py',1720),
-  ('until_factor_tail -> OR until_factor until_factor_tail','until_factor_tail',3,'p_until_factor_tail','Parser.py',1721),
-  ('until_factor_tail -> empty','until_factor_tail',1,'p_until_factor_tail','Parser.py',1722),
-  ('until_factor1 -> INT_LIT','until_factor1',1,'p_until_factor1','Parser.py',1736),
-  ('until_factor1 -> FLT_LIT','until_factor1',1,'p_until_factor1','Parser.py',1737),
-  ('until_factor1 -> DAY','until_factor1',1,'p_until_factor1','Parser.py',1738),
-  ('until_factor1 -> NIGHT','until_factor1',1,'p_until_factor1','Parser.py',1739),
-  ('until_factor1 -> STR_LIT','until_factor1',1,'p_until_factor1','Parser.py',1740),
-  ('repeat_until -> REPEAT LBRACE statements RBRACE UNTIL LPAREN until_expression RPAREN','repeat_until',8,'p_repeat_until','Parser.py',1748),
-  ('control_variable -> INT IDENT EQ control_var_tail','control_variable',4,'p_control_variable','Parser.py',1756),
-  ('control_var_tail -> INT_LIT','control_var_tail',1,'p_control_var_tail','Parser.py',1770),
-  ('control_var_tail -> var_call','control_var_tail',1,'p_control_var_tail','Parser.py',1771),
-  ('update -> var_call update_tail','update',2,'p_update','Parser.py',1784),
-  ('update_tail -> postfix_op','update_tail',1,'p_update_tail','Parser.py',1794),
-  ('update_tail -> compound_op value','update_tail',2,'p_update_tail','Parser.py',1795),
-  ('postfix_op -> PLUS_PLUS','postfix_op',1,'p_postfix_op','Parser.py',1808),
-  ('postfix_op -> MINUS_MINUS','postfix_op',1,'p_postfix_op','Parser.py',1809),
-  ('function_call -> FUNCTION_NAME LPAREN arguments RPAREN','function_call',4,'p_function_call','Parser.py',1819),
-  ('function_call -> input_statement','function_call',1,'p_function_call','Parser.py',1820),
-  ('arguments -> empty','arguments',1,'p_arguments','Parser.py',1832),
-  ('arguments -> arg_value arg_tail','arguments',2,'p_arguments','Parser.py',1833),
-  ('arg_tail -> COMMA arg_value arg_tail','arg_tail',3,'p_arg_tail','Parser.py',1846),
-  ('arg_tail -> empty','arg_tail',1,'p_arg_tail','Parser.py',1847),
-  ('arg_value -> literal','arg_value',1,'p_arg_value','Parser.py',1860),
-  ('arg_value -> var_call','arg_value',1,'p_arg_value','Parser.py',1861),
-  ('output_statement -> DISPLAY output_value next_val','output_statement',3,'p_output_statement','Parser.py',1870),
-  ('output_value -> output_type_cast','output_value',1,'p_output_value','Parser.py',1877),
-  ('output_value -> output_expression','output_value',1,'p_output_value','Parser.py',1878),
-  ('output_value -> function_call','output_value',1,'p_output_value','Parser.py',1879),
-  ('output_expression -> output_factor output_factor_tail','output_expression',2,'p_output_expression','Parser.py',1885),
-  ('output_factor -> output_var_call output_postfix','output_factor',2,'p_output_factor','Parser.py',1895),
-  ('output_factor -> output_factor1','output_factor',1,'p_output_factor','Parser.py',1896),
-  ('output_factor -> TILDE INT_LIT','output_factor',2,'p_output_factor','Parser.py',1897),
-  ('output_factor -> TILDE FLT_LIT','output_factor',2,'p_output_factor','Parser.py',1898),
-  ('output_factor -> LPAREN output_factor RPAREN','output_factor',3,'p_output_factor','Parser.py',1899),
-  ('output_var_call -> IDENT output_list_index','output_var_call',2,'p_output_var_call','Parser.py',1919),
-  ('output_postfix_op -> PLUS_PLUS','output_postfix_op',1,'p_output_postfix_op','Parser.py',1925),
-  ('output_postfix_op -> MINUS_MINUS','output_postfix_op',1,'p_output_postfix_op','Parser.py',1926),
-  ('output_postfix -> empty','output_postfix',1,'p_output_postfix','Parser.py',1931),
-  ('output_postfix -> output_postfix_op','output_postfix',1,'p_output_postfix','Parser.py',1932),
-  ('output_list_index -> LBRACKET output_index RBRACKET output_list_index2','output_list_index',4,'p_output_list_index','Parser.py',1938),
-  ('output_list_index -> empty','output_list_index',1,'p_output_list_index','Parser.py',1939),
-  ('output_list_index2 -> LBRACKET output_index RBRACKET','output_list_index2',3,'p_output_list_index2','Parser.py',1949),
-  ('output_list_index2 -> empty','output_list_index2',1,'p_output_list_index2','Parser.py',1950),
-  ('output_index -> INT_LIT','output_index',1,'p_output_int_lit','Parser.py',1959),
-  ('output_index -> IDENT','output_index',1,'p_output_index_ident','Parser.py',1964),
-  ('output_factor_tail -> PLUS output_factor output_factor_tail','output_factor_tail',3,'p_output_factor_tail','Parser.py',1969),
-  ('output_factor_tail -> MINUS output_factor output_factor_tail','output_factor_tail',3,'p_output_factor_tail','Parser.py',1970),
-  ('output_factor_tail -> MULTIPLY output_factor output_factor_tail','output_factor_tail',3,'p_output_factor_tail','Parser.py',1971),
-  ('output_factor_tail -> DIVISION output_factor output_factor_tail','output_factor_tail',3,'p_output_factor_tail','Parser.py',1972),
-  ('output_factor_tail -> MODULO output_factor output_factor_tail','output_factor_tail',3,'p_output_factor_tail','Parser.py',1973),
-  ('output_factor_tail -> EXPONENT output_factor output_factor_tail','output_factor_tail',3,'p_output_factor_tail','Parser.py',1974),
-  ('output_factor_tail -> GT output_factor output_factor_tail','output_factor_tail',3,'p_output_factor_tail','Parser.py',1975),
-  ('output_factor_tail -> LT output_factor output_factor_tail','output_factor_tail',3,'p_output_factor_tail','Parser.py',1976),
-  ('output_factor_tail -> EQ_EQ output_factor output_factor_tail','output_factor_tail',3,'p_output_factor_tail','Parser.py',1977),
-  ('output_factor_tail -> GT_EQ output_factor output_factor_tail','output_factor_tail',3,'p_output_factor_tail','Parser.py',1978),
-  ('output_factor_tail -> LT_EQ output_factor output_factor_tail','output_factor_tail',3,'p_output_factor_tail','Parser.py',1979),
-  ('output_factor_tail -> NOT_EQ output_factor output_factor_tail','output_factor_tail',3,'p_output_factor_tail','Parser.py',1980),
-  ('output_factor_tail -> AND output_factor output_factor_tail','output_factor_tail',3,'p_output_factor_tail','Parser.py',1981),
-  ('output_factor_tail -> OR output_factor output_factor_tail','output_factor_tail',3,'p_output_factor_tail','Parser.py',1982),
-  ('output_factor_tail -> empty','output_factor_tail',1,'p_output_factor_tail','Parser.py',1983),
-  ('output_factor1 -> INT_LIT','output_factor1',1,'p_output_factor1','Parser.py',1997),
-  ('output_factor1 -> FLT_LIT','output_factor1',1,'p_output_factor1','Parser.py',1998),
-  ('output_factor1 -> DAY','output_factor1',1,'p_output_factor1','Parser.py',1999),
-  ('output_factor1 -> NIGHT','output_factor1',1,'p_output_factor1','Parser.py',2000),
-  ('output_factor1 -> STR_LIT','output_factor1',1,'p_output_factor1','Parser.py',2001),
-  ('output_type_cast -> CONVERT_TO_INT LPAREN typecast_value RPAREN','output_type_cast',4,'p_output_type_cast','Parser.py',2006),
-  ('output_type_cast -> CONVERT_TO_FLT LPAREN typecast_value RPAREN','output_type_cast',4,'p_output_type_cast','Parser.py',2007),
-  ('output_type_cast -> CONVERT_TO_BLN LPAREN typecast_value RPAREN','output_type_cast',4,'p_output_type_cast','Parser.py',2008),
-  ('output_type_cast -> CONVERT_TO_STR LPAREN typecast_value RPAREN','output_type_cast',4,'p_output_type_cast','Parser.py',2009),
-  ('next_val -> COMMA value next_val','next_val',3,'p_next_val','Parser.py',2017),
-  ('next_val -> empty','next_val',1,'p_next_val','Parser.py',2018),
-  ('assignment_statement -> var_call EQ value','assignment_statement',3,'p_assignment_statement_indexed','Parser.py',2031),
-  ('assignment_statement -> IDENT assign_tail','assignment_statement',2,'p_assignment_statement','Parser.py',2045),
-  ('assign_tail -> DOT SPLICE LPAREN start COMMA deleteCount COMMA splice_items RPAREN','assign_tail',9,'p_assign_tail','Parser.py',2063),
-  ('assign_tail -> DOT PUSH LPAREN list_element RPAREN','assign_tail',5,'p_assign_tail','Parser.py',2064),
-  ('assign_tail -> assign_op value','assign_tail',2,'p_assign_tail','Parser.py',2065),
-  ('assign_op -> compound_op','assign_op',1,'p_assign_op','Parser.py',2081),
-  ('assign_op -> EQ','assign_op',1,'p_assign_op','Parser.py',2082),
-  ('compound_op -> PLUS_EQ','compound_op',1,'p_compound_op','Parser.py',2095),
-  ('compound_op -> MINUS_EQ','compound_op',1,'p_compound_op','Parser.py',2096),
-  ('compound_op -> MUL_EQ','compound_op',1,'p_compound_op','Parser.py',2097),
-  ('compound_op -> DIV_EQ','compound_op',1,'p_compound_op','Parser.py',2098),
-  ('compound_op -> MOD_EQ','compound_op',1,'p_compound_op','Parser.py',2099),
-  ('start -> INT_LIT','start',1,'p_start','Parser.py',2108),
-  ('deleteCount -> empty','deleteCount',1,'p_deleteCount','Parser.py',2118),
-  ('deleteCount -> INT_LIT','deleteCount',1,'p_deleteCount','Parser.py',2119),
-  ('splice_items -> empty','splice_items',1,'p_splice_items','Parser.py',2132),
-  ('splice_items -> list_element','splice_items',1,'p_splice_items','Parser.py',2133),
-  ('var_call -> IDENT list_index','var_call',2,'p_var_call','Parser.py',2145),
-  ('list_index -> LBRACKET index RBRACKET list_index2','list_index',4,'p_list_index','Parser.py',2156),
-  ('list_index -> empty','list_index',1,'p_list_index','Parser.py',2157),
-  ('list_index2 -> LBRACKET index RBRACKET','list_index2',3,'p_list_index2','Parser.py',2170),
-  ('list_index2 -> empty','list_index2',1,'p_list_index2','Parser.py',2171),
-  ('index -> INT_LIT','index',1,'p_index_int_lit','Parser.py',2184),
-  ('index -> IDENT','index',1,'p_index_ident','Parser.py',2188),
-  ('postfix -> empty','postfix',1,'p_postfix','Parser.py',2197),
-  ('postfix -> postfix_op','postfix',1,'p_postfix','Parser.py',2198),
-  ('value -> type_cast','value',1,'p_value','Parser.py',2209),
-  ('value -> value_expression','value',1,'p_value','Parser.py',2210),
-  ('value -> function_call','value',1,'p_value','Parser.py',2211),
-  ('value_expression -> value_factor value_factor_tail','value_expression',2,'p_value_expression','Parser.py',2218),
-  ('value_factor -> value_var_call value_postfix','value_factor',2,'p_value_factor','Parser.py',2228),
-  ('value_factor -> value_factor1','value_factor',1,'p_value_factor','Parser.py',2229),
-  ('value_factor -> TILDE INT_LIT','value_factor',2,'p_value_factor','Parser.py',2230),
-  ('value_factor -> TILDE FLT_LIT','value_factor',2,'p_value_factor','Parser.py',2231),
-  ('value_factor -> LPAREN value_factor RPAREN','value_factor',3,'p_value_factor','Parser.py',2232),
-  ('value_var_call -> IDENT value_list_index','value_var_call',2,'p_value_var_call','Parser.py',2253),
-  ('value_postfix_op -> PLUS_PLUS','value_postfix_op',1,'p_value_postfix_op','Parser.py',2259),
-  ('value_postfix_op -> MINUS_MINUS','value_postfix_op',1,'p_value_postfix_op','Parser.py',2260),
-  ('value_postfix -> empty','value_postfix',1,'p_value_postfix','Parser.py',2265),
-  ('value_postfix -> value_postfix_op','value_postfix',1,'p_value_postfix','Parser.py',2266),
-  ('value_list_index -> LBRACKET value_index RBRACKET value_list_index2','value_list_index',4,'p_value_list_index','Parser.py',2272),
-  ('value_list_index -> empty','value_list_index',1,'p_value_list_index','Parser.py',2273),
-  ('value_list_index2 -> LBRACKET value_index RBRACKET','value_list_index2',3,'p_value_list_index2','Parser.py',2283),
-  ('value_list_index2 -> empty','value_list_index2',1,'p_value_list_index2','Parser.py',2284),
-  ('value_index -> INT_LIT','value_index',1,'p_value_int_lit','Parser.py',2293),
-  ('value_index -> IDENT','value_index',1,'p_value_index_ident','Parser.py',2298),
-  ('value_factor_tail -> PLUS value_factor value_factor_tail','value_factor_tail',3,'p_value_factor_tail','Parser.py',2303),
-  ('value_factor_tail -> MINUS value_factor value_factor_tail','value_factor_tail',3,'p_value_factor_tail','Parser.py',2304),
-  ('value_factor_tail -> MULTIPLY value_factor value_factor_tail','value_factor_tail',3,'p_value_factor_tail','Parser.py',2305),
-  ('value_factor_tail -> DIVISION value_factor value_factor_tail','value_factor_tail',3,'p_value_factor_tail','Parser.py',2306),
-  ('value_factor_tail -> MODULO value_factor value_factor_tail','value_factor_tail',3,'p_value_factor_tail','Parser.py',2307),
-  ('value_factor_tail -> EXPONENT value_factor value_factor_tail','value_factor_tail',3,'p_value_factor_tail','Parser.py',2308),
-  ('value_factor_tail -> GT value_factor value_factor_tail','value_factor_tail',3,'p_value_factor_tail','Parser.py',2309),
-  ('value_factor_tail -> LT value_factor value_factor_tail','value_factor_tail',3,'p_value_factor_tail','Parser.py',2310),
-  ('value_factor_tail -> EQ_EQ value_factor value_factor_tail','value_factor_tail',3,'p_value_factor_tail','Parser.py',2311),
-  ('value_factor_tail -> GT_EQ value_factor value_factor_tail','value_factor_tail',3,'p_value_factor_tail','Parser.py',2312),
-  ('value_factor_tail -> LT_EQ value_factor value_factor_tail','value_factor_tail',3,'p_value_factor_tail','Parser.py',2313),
-  ('value_factor_tail -> NOT_EQ value_factor value_factor_tail','value_factor_tail',3,'p_value_factor_tail','Parser.py',2314),
-  ('value_factor_tail -> AND value_factor value_factor_tail','value_factor_tail',3,'p_value_factor_tail','Parser.py',2315),
-  ('value_factor_tail -> OR value_factor value_factor_tail','value_factor_tail',3,'p_value_factor_tail','Parser.py',2316),
-  ('value_factor_tail -> empty','value_factor_tail',1,'p_value_factor_tail','Parser.py',2317),
-  ('value_factor1 -> INT_LIT','value_factor1',1,'p_value_factor1','Parser.py',2331),
-  ('value_factor1 -> FLT_LIT','value_factor1',1,'p_value_factor1','Parser.py',2332),
-  ('value_factor1 -> DAY','value_factor1',1,'p_value_factor1','Parser.py',2333),
-  ('value_factor1 -> NIGHT','value_factor1',1,'p_value_factor1','Parser.py',2334),
-  ('value_factor1 -> STR_LIT','value_factor1',1,'p_value_factor1','Parser.py',2335),
-  ('type_cast -> CONVERT_TO_INT LPAREN typecast_value RPAREN','type_cast',4,'p_type_cast','Parser.py',2346),
-  ('type_cast -> CONVERT_TO_FLT LPAREN typecast_value RPAREN','type_cast',4,'p_type_cast','Parser.py',2347),
-  ('type_cast -> CONVERT_TO_BLN LPAREN typecast_value RPAREN','type_cast',4,'p_type_cast','Parser.py',2348),
-  ('type_cast -> CONVERT_TO_STR LPAREN typecast_value RPAREN','type_cast',4,'p_type_cast','Parser.py',2349),
-  ('typecast_value -> typecast_expression','typecast_value',1,'p_typecast_value','Parser.py',2361),
-  ('typecast_value -> FUNCTION_NAME LPAREN RPAREN','typecast_value',3,'p_typecast_value','Parser.py',2362),
-  ('typecast_value -> input_statement','typecast_value',1,'p_typecast_value','Parser.py',2363),
-  ('typecast_expression -> typecast_factor typecast_factor_tail','typecast_expression',2,'p_typecast_expression','Parser.py',2373),
-  ('typecast_factor -> var_call postfix','typecast_factor',2,'p_typecast_factor','Parser.py',2383),
-  ('typecast_factor -> typecast_factor1','typecast_factor',1,'p_typecast_factor','Parser.py',2384),
-  ('typecast_factor -> TILDE INT_LIT','typecast_factor',2,'p_typecast_factor','Parser.py',2385),
-  ('typecast_factor -> TILDE FLT_LIT','typecast_factor',2,'p_typecast_factor','Parser.py',2386),
-  ('typecast_factor -> LPAREN typecast_factor RPAREN','typecast_factor',3,'p_typecast_factor','Parser.py',2387),
-  ('typecast_factor_tail -> PLUS typecast_factor typecast_factor_tail','typecast_factor_tail',3,'p_typecast_factor_tail','Parser.py',2408),
-  ('typecast_factor_tail -> MINUS typecast_factor typecast_factor_tail','typecast_factor_tail',3,'p_typecast_factor_tail','Parser.py',2409),
-  ('typecast_factor_tail -> MULTIPLY typecast_factor typecast_factor_tail','typecast_factor_tail',3,'p_typecast_factor_tail','Parser.py',2410),
-  ('typecast_factor_tail -> DIVISION typecast_factor typecast_factor_tail','typecast_factor_tail',3,'p_typecast_factor_tail','Parser.py',2411),
-  ('typecast_factor_tail -> MODULO typecast_factor typecast_factor_tail','typecast_factor_tail',3,'p_typecast_factor_tail','Parser.py',2412),
-  ('typecast_factor_tail -> EXPONENT typecast_factor typecast_factor_tail','typecast_factor_tail',3,'p_typecast_factor_tail','Parser.py',2413),
-  ('typecast_factor_tail -> GT typecast_factor typecast_factor_tail','typecast_factor_tail',3,'p_typecast_factor_tail','Parser.py',2414),
-  ('typecast_factor_tail -> LT typecast_factor typecast_factor_tail','typecast_factor_tail',3,'p_typecast_factor_tail','Parser.py',2415),
-  ('typecast_factor_tail -> EQ_EQ typecast_factor typecast_factor_tail','typecast_factor_tail',3,'p_typecast_factor_tail','Parser.py',2416),
-  ('typecast_factor_tail -> GT_EQ typecast_factor typecast_factor_tail','typecast_factor_tail',3,'p_typecast_factor_tail','Parser.py',2417),
-  ('typecast_factor_tail -> LT_EQ typecast_factor typecast_factor_tail','typecast_factor_tail',3,'p_typecast_factor_tail','Parser.py',2418),
-  ('typecast_factor_tail -> NOT_EQ typecast_factor typecast_factor_tail','typecast_factor_tail',3,'p_typecast_factor_tail','Parser.py',2419),
-  ('typecast_factor_tail -> AND typecast_factor typecast_factor_tail','typecast_factor_tail',3,'p_typecast_factor_tail','Parser.py',2420),
-  ('typecast_factor_tail -> OR typecast_factor typecast_factor_tail','typecast_factor_tail',3,'p_typecast_factor_tail','Parser.py',2421),
-  ('typecast_factor_tail -> empty','typecast_factor_tail',1,'p_typecast_factor_tail','Parser.py',2422),
-  ('typecast_factor1 -> INT_LIT','typecast_factor1',1,'p_typecast_factor1','Parser.py',2436),
-  ('typecast_factor1 -> FLT_LIT','typecast_factor1',1,'p_typecast_factor1','Parser.py',2437),
-  ('typecast_factor1 -> DAY','typecast_factor1',1,'p_typecast_factor1','Parser.py',2438),
-  ('typecast_factor1 -> NIGHT','typecast_factor1',1,'p_typecast_factor1','Parser.py',2439),
-  ('typecast_factor1 -> STR_LIT','typecast_factor1',1,'p_typecast_factor1','Parser.py',2440),
-  ('input_statement -> INPUT LPAREN RPAREN','input_statement',3,'p_input_statement','Parser.py',2448),
-  ('empty -> <empty>','empty',0,'p_empty','Parser.py',2453),
+  ('program -> BIRTH unli_newline global_dec maybe_newline function_statements maybe_newline main_function unli_newline GHOST','program',9,'p_program','Parser.py',47),
+  ('maybe_newline -> empty','maybe_newline',1,'p_maybe_newline','Parser.py',55),
+  ('maybe_newline -> NEWLINE maybe_newline','maybe_newline',2,'p_maybe_newline','Parser.py',56),
+  ('unli_newline -> NEWLINE','unli_newline',1,'p_unli_newline','Parser.py',64),
+  ('unli_newline -> NEWLINE unli_newline','unli_newline',2,'p_unli_newline','Parser.py',65),
+  ('main_function -> MAIN_CASPER LPAREN RPAREN maybe_newline LBRACE maybe_newline statements maybe_newline RBRACE','main_function',9,'p_main_function','Parser.py',72),
+  ('global_dec -> global_list','global_dec',1,'p_global_dec','Parser.py',88),
+  ('global_dec -> empty','global_dec',1,'p_global_dec','Parser.py',89),
+  ('global_list -> global_list global_statement unli_newline','global_list',3,'p_global_list','Parser.py',99),
+  ('global_list -> global_statement unli_newline','global_list',2,'p_global_list','Parser.py',100),
+  ('global_statement -> var_statement global_statement_tail','global_statement',2,'p_global_statement','Parser.py',114),
+  ('var_statement -> data_type IDENT list_dec','var_statement',3,'p_var_statement','Parser.py',147),
+  ('list_dec -> empty','list_dec',1,'p_list_dec','Parser.py',162),
+  ('list_dec -> LBRACKET RBRACKET _2d_list','list_dec',3,'p_list_dec','Parser.py',163),
+  ('_2d_list -> empty','_2d_list',1,'p_2d_list','Parser.py',178),
+  ('_2d_list -> LBRACKET RBRACKET','_2d_list',2,'p_2d_list','Parser.py',179),
+  ('global_statement_tail -> global_statement_tail2','global_statement_tail',1,'p_global_statement_tail','Parser.py',195),
+  ('global_statement_tail -> global_statement_tail2 EQ global_value','global_statement_tail',3,'p_global_statement_tail','Parser.py',196),
+  ('global_statement_tail2 -> global_statement_tail COMMA IDENT','global_statement_tail2',3,'p_global_statement_tail2','Parser.py',209),
+  ('global_statement_tail2 -> empty','global_statement_tail2',1,'p_global_statement_tail2','Parser.py',210),
+  ('global_value -> expression','global_value',1,'p_global_value','Parser.py',226),
+  ('global_value -> list_value','global_value',1,'p_global_value','Parser.py',227),
+  ('list_value -> LBRACKET list_element RBRACKET','list_value',3,'p_list_value','Parser.py',237),
+  ('list_element -> literal element_tail','list_element',2,'p_list_element','Parser.py',249),
+  ('list_element -> list_value element_tail','list_element',2,'p_list_element','Parser.py',250),
+  ('element_tail -> COMMA list_element','element_tail',2,'p_element_tail','Parser.py',266),
+  ('element_tail -> empty','element_tail',1,'p_element_tail','Parser.py',267),
+  ('data_type -> INT','data_type',1,'p_data_type','Parser.py',284),
+  ('data_type -> FLT','data_type',1,'p_data_type','Parser.py',285),
+  ('data_type -> BLN','data_type',1,'p_data_type','Parser.py',286),
+  ('data_type -> CHR','data_type',1,'p_data_type','Parser.py',287),
+  ('data_type -> STR','data_type',1,'p_data_type','Parser.py',288),
+  ('expression -> expression PLUS expression','expression',3,'p_expression','Parser.py',306),
+  ('expression -> expression MINUS expression','expression',3,'p_expression','Parser.py',307),
+  ('expression -> expression MULTIPLY expression','expression',3,'p_expression','Parser.py',308),
+  ('expression -> expression DIVISION expression','expression',3,'p_expression','Parser.py',309),
+  ('expression -> expression MODULO expression','expression',3,'p_expression','Parser.py',310),
+  ('expression -> expression EXPONENT expression','expression',3,'p_expression','Parser.py',311),
+  ('expression -> expression GT expression','expression',3,'p_expression','Parser.py',312),
+  ('expression -> expression LT expression','expression',3,'p_expression','Parser.py',313),
+  ('expression -> expression EQ_EQ expression','expression',3,'p_expression','Parser.py',314),
+  ('expression -> expression GT_EQ expression','expression',3,'p_expression','Parser.py',315),
+  ('expression -> expression LT_EQ expression','expression',3,'p_expression','Parser.py',316),
+  ('expression -> expression NOT_EQ expression','expression',3,'p_expression','Parser.py',317),
+  ('expression -> expression AND expression','expression',3,'p_expression','Parser.py',318),
+  ('expression -> expression OR expression','expression',3,'p_expression','Parser.py',319),
+  ('expression -> factor','expression',1,'p_expression','Parser.py',320),
+  ('factor -> var_call postfix','factor',2,'p_factor','Parser.py',347),
+  ('factor -> literal1','factor',1,'p_factor','Parser.py',348),
+  ('factor -> TILDE INT_LIT','factor',2,'p_factor','Parser.py',349),
+  ('factor -> TILDE FLT_LIT','factor',2,'p_factor','Parser.py',350),
+  ('factor -> LPAREN expression RPAREN','factor',3,'p_factor','Parser.py',351),
+  ('literal -> literal1','literal',1,'p_literal','Parser.py',376),
+  ('literal -> literal2','literal',1,'p_literal','Parser.py',377),
+  ('literal1 -> INT_LIT','literal1',1,'p_literal1','Parser.py',398),
+  ('literal1 -> FLT_LIT','literal1',1,'p_literal1','Parser.py',399),
+  ('literal1 -> DAY','literal1',1,'p_literal1','Parser.py',400),
+  ('literal1 -> NIGHT','literal1',1,'p_literal1','Parser.py',401),
+  ('literal1 -> STR_LIT','literal1',1,'p_literal1','Parser.py',402),
+  ('literal2 -> CHR_LIT','literal2',1,'p_literal2','Parser.py',407),
+  ('function_statements -> ret_type FUNCTION_NAME LPAREN parameters RPAREN LBRACE maybe_newline statements maybe_newline revive maybe_newline RBRACE unli_newline function_statements_tail','function_statements',14,'p_function_statements','Parser.py',418),
+  ('function_statements -> empty','function_statements',1,'p_function_statements','Parser.py',419),
+  ('function_statements_tail -> function_statements','function_statements_tail',1,'p_function_statements_tail','Parser.py',470),
+  ('function_statements_tail -> empty','function_statements_tail',1,'p_function_statements_tail','Parser.py',471),
+  ('ret_type -> FUNCTION','ret_type',1,'p_ret_type','Parser.py',484),
+  ('ret_type -> function_dtype','ret_type',1,'p_ret_type','Parser.py',485),
+  ('function_dtype -> FUNCTION_INT','function_dtype',1,'p_function_dtype','Parser.py',506),
+  ('function_dtype -> FUNCTION_FLT','function_dtype',1,'p_function_dtype','Parser.py',507),
+  ('function_dtype -> FUNCTION_CHR','function_dtype',1,'p_function_dtype','Parser.py',508),
+  ('function_dtype -> FUNCTION_BLN','function_dtype',1,'p_function_dtype','Parser.py',509),
+  ('function_dtype -> FUNCTION_STR','function_dtype',1,'p_function_dtype','Parser.py',510),
+  ('function_dtype -> FUNCTION_LIST_INT','function_dtype',1,'p_function_dtype','Parser.py',511),
+  ('function_dtype -> FUNCTION_LIST_FLT','function_dtype',1,'p_function_dtype','Parser.py',512),
+  ('function_dtype -> FUNCTION_LIST_CHR','function_dtype',1,'p_function_dtype','Parser.py',513),
+  ('function_dtype -> FUNCTION_LIST_STR','function_dtype',1,'p_function_dtype','Parser.py',514),
+  ('function_dtype -> FUNCTION_LIST_BLN','function_dtype',1,'p_function_dtype','Parser.py',515),
+  ('parameters -> data_type IDENT parameters_tail','parameters',3,'p_parameters','Parser.py',525),
+  ('parameters -> empty','parameters',1,'p_parameters','Parser.py',526),
+  ('parameters_tail -> COMMA data_type IDENT parameters_tail','parameters_tail',4,'p_parameters_tail','Parser.py',540),
+  ('parameters_tail -> empty','parameters_tail',1,'p_parameters_tail','Parser.py',541),
+  ('revive -> REVIVE revive_value','revive',2,'p_revive','Parser.py',553),
+  ('revive -> empty','revive',1,'p_revive','Parser.py',554),
+  ('revive_value -> type_cast','revive_value',1,'p_revive_value','Parser.py',564),
+  ('revive_value -> expression','revive_value',1,'p_revive_value','Parser.py',565),
+  ('revive_value -> function_call','revive_value',1,'p_revive_value','Parser.py',566),
+  ('statements -> empty','statements',1,'p_statements','Parser.py',576),
+  ('statements -> statement_list','statements',1,'p_statements','Parser.py',577),
+  ('statement_list -> statement_list local_dec maybe_newline','statement_list',3,'p_statement_list','Parser.py',590),
+  ('statement_list -> statement_list statements_tail unli_newline','statement_list',3,'p_statement_list','Parser.py',591),
+  ('statement_list -> local_dec maybe_newline','statement_list',2,'p_statement_list','Parser.py',592),
+  ('statement_list -> statements_tail unli_newline','statement_list',2,'p_statement_list','Parser.py',593),
+  ('statements_tail -> switch_statement','statements_tail',1,'p_statements_tail','Parser.py',609),
+  ('statements_tail -> loop_statement','statements_tail',1,'p_statements_tail','Parser.py',610),
+  ('statements_tail -> function_call','statements_tail',1,'p_statements_tail','Parser.py',611),
+  ('statements_tail -> assignment_statement','statements_tail',1,'p_statements_tail','Parser.py',612),
+  ('statements_tail -> output_statement','statements_tail',1,'p_statements_tail','Parser.py',613),
+  ('statements_tail -> conditional_statement','statements_tail',1,'p_statements_tail','Parser.py',614),
+  ('local_dec -> local_var_statement local_dec_tail unli_newline','local_dec',3,'p_local_dec','Parser.py',669),
+  ('local_var_statement -> local_data_type IDENT local_list_dec','local_var_statement',3,'p_local_var_statement','Parser.py',679),
+  ('local_data_type -> INT','local_data_type',1,'p_local_data_type','Parser.py',689),
+  ('local_data_type -> FLT','local_data_type',1,'p_local_data_type','Parser.py',690),
+  ('local_data_type -> BLN','local_data_type',1,'p_local_data_type','Parser.py',691),
+  ('local_data_type -> CHR','local_data_type',1,'p_local_data_type','Parser.py',692),
+  ('local_data_type -> STR','local_data_type',1,'p_local_data_type','Parser.py',693),
+  ('local_list_dec -> empty','local_list_dec',1,'p_local_list_dec','Parser.py',699),
+  ('local_list_dec -> LBRACKET RBRACKET local_2d_list','local_list_dec',3,'p_local_list_dec','Parser.py',700),
+  ('local_2d_list -> empty','local_2d_list',1,'p_local_2d_list','Parser.py',711),
+  ('local_2d_list -> LBRACKET RBRACKET','local_2d_list',2,'p_local_2d_list','Parser.py',712),
+  ('local_dec_tail -> empty','local_dec_tail',1,'p_local_dec_tail','Parser.py',727),
+  ('local_dec_tail -> COMMA IDENT local_dec_tail','local_dec_tail',3,'p_local_dec_tail','Parser.py',728),
+  ('local_dec_tail -> EQ local_value local_dec_tail2','local_dec_tail',3,'p_local_dec_tail','Parser.py',729),
+  ('local_dec_tail2 -> COMMA IDENT local_dec_tail','local_dec_tail2',3,'p_local_dec_tail2','Parser.py',744),
+  ('local_dec_tail2 -> empty','local_dec_tail2',1,'p_local_dec_tail2','Parser.py',745),
+  ('local_value -> local_value_value','local_value',1,'p_local_value','Parser.py',759),
+  ('local_value -> list_value','local_value',1,'p_local_value','Parser.py',760),
+  ('local_value_value -> type_cast','local_value_value',1,'p_local_value_value','Parser.py',765),
+  ('local_value_value -> expression','local_value_value',1,'p_local_value_value','Parser.py',766),
+  ('local_value_value -> function_call','local_value_value',1,'p_local_value_value','Parser.py',767),
+  ('conditional_statement -> CHECK LPAREN condition RPAREN LBRACE maybe_newline statements maybe_newline RBRACE maybe_newline conditional_tail maybe_newline OTHERWISE maybe_newline LBRACE maybe_newline statements maybe_newline RBRACE','conditional_statement',19,'p_conditional_statement','Parser.py',775),
+  ('conditional_tail -> conditional_tail OTHERWISE_CHECK LPAREN condition RPAREN LBRACE maybe_newline statements maybe_newline RBRACE maybe_newline','conditional_tail',11,'p_conditional_tail','Parser.py',786),
+  ('conditional_tail -> empty','conditional_tail',1,'p_conditional_tail','Parser.py',787),
+  ('condition -> expression','condition',1,'p_condition','Parser.py',798),
+  ('switch_statement -> SWAP LPAREN IDENT RPAREN LBRACE maybe_newline switch_condition maybe_newline OTHERWISE maybe_newline LBRACE maybe_newline statements maybe_newline RBRACE maybe_newline RBRACE','switch_statement',17,'p_switch_statement','Parser.py',808),
+  ('switch_condition -> SHIFT switch_value COLON maybe_newline statements switchcond_tail','switch_condition',6,'p_switch_condition','Parser.py',822),
+  ('switch_value -> type_cast','switch_value',1,'p_switch_value','Parser.py',828),
+  ('switch_value -> expression','switch_value',1,'p_switch_value','Parser.py',829),
+  ('switch_value -> function_call','switch_value',1,'p_switch_value','Parser.py',830),
+  ('switchcond_tail -> switch_condition','switchcond_tail',1,'p_switchcond_tail','Parser.py',839),
+  ('switchcond_tail -> empty','switchcond_tail',1,'p_switchcond_tail','Parser.py',840),
+  ('loop_statement -> for_loop','loop_statement',1,'p_loop_statement','Parser.py',855),
+  ('loop_statement -> until_loop','loop_statement',1,'p_loop_statement','Parser.py',856),
+  ('loop_statement -> repeat_until','loop_statement',1,'p_loop_statement','Parser.py',857),
+  ('for_loop -> FOR LPAREN control_variable SEMICOLON expression SEMICOLON update RPAREN LBRACE maybe_newline statements maybe_newline RBRACE','for_loop',13,'p_for_loop','Parser.py',865),
+  ('until_loop -> UNTIL LPAREN expression RPAREN LBRACE statements RBRACE','until_loop',7,'p_until_loop','Parser.py',873),
+  ('repeat_until -> REPEAT LBRACE statements RBRACE UNTIL LPAREN expression RPAREN','repeat_until',8,'p_repeat_until','Parser.py',883),
+  ('control_variable -> INT IDENT EQ control_var_tail','control_variable',4,'p_control_variable','Parser.py',891),
+  ('control_var_tail -> INT_LIT','control_var_tail',1,'p_control_var_tail','Parser.py',905),
+  ('control_var_tail -> var_call','control_var_tail',1,'p_control_var_tail','Parser.py',906),
+  ('update -> var_call update_tail','update',2,'p_update','Parser.py',919),
+  ('update_tail -> postfix_op','update_tail',1,'p_update_tail','Parser.py',929),
+  ('update_tail -> compound_op value','update_tail',2,'p_update_tail','Parser.py',930),
+  ('postfix_op -> PLUS_PLUS','postfix_op',1,'p_postfix_op','Parser.py',943),
+  ('postfix_op -> MINUS_MINUS','postfix_op',1,'p_postfix_op','Parser.py',944),
+  ('function_call -> FUNCTION_NAME LPAREN arguments RPAREN','function_call',4,'p_function_call','Parser.py',954),
+  ('function_call -> input_statement','function_call',1,'p_function_call','Parser.py',955),
+  ('arguments -> empty','arguments',1,'p_arguments','Parser.py',967),
+  ('arguments -> arg_list','arguments',1,'p_arguments','Parser.py',968),
+  ('arg_list -> arg_list COMMA arg_value','arg_list',3,'p_arg_list','Parser.py',978),
+  ('arg_list -> arg_value','arg_list',1,'p_arg_list','Parser.py',979),
+  ('arg_value -> literal','arg_value',1,'p_arg_value','Parser.py',993),
+  ('arg_value -> var_call','arg_value',1,'p_arg_value','Parser.py',994),
+  ('output_statement -> DISPLAY output_value next_val','output_statement',3,'p_output_statement','Parser.py',1003),
+  ('output_value -> type_cast','output_value',1,'p_output_value','Parser.py',1010),
+  ('output_value -> expression','output_value',1,'p_output_value','Parser.py',1011),
+  ('output_value -> function_call','output_value',1,'p_output_value','Parser.py',1012),
+  ('next_val -> COMMA value next_val','next_val',3,'p_next_val','Parser.py',1022),
+  ('next_val -> empty','next_val',1,'p_next_val','Parser.py',1023),
+  ('assignment_statement -> var_call EQ value','assignment_statement',3,'p_assignment_statement_indexed','Parser.py',1036),
+  ('assignment_statement -> IDENT assign_tail','assignment_statement',2,'p_assignment_statement','Parser.py',1050),
+  ('assign_tail -> DOT SPLICE LPAREN start COMMA deleteCount COMMA splice_items RPAREN','assign_tail',9,'p_assign_tail','Parser.py',1068),
+  ('assign_tail -> DOT PUSH LPAREN list_element RPAREN','assign_tail',5,'p_assign_tail','Parser.py',1069),
+  ('assign_tail -> assign_op value','assign_tail',2,'p_assign_tail','Parser.py',1070),
+  ('assign_op -> compound_op','assign_op',1,'p_assign_op','Parser.py',1086),
+  ('assign_op -> EQ','assign_op',1,'p_assign_op','Parser.py',1087),
+  ('compound_op -> PLUS_EQ','compound_op',1,'p_compound_op','Parser.py',1100),
+  ('compound_op -> MINUS_EQ','compound_op',1,'p_compound_op','Parser.py',1101),
+  ('compound_op -> MUL_EQ','compound_op',1,'p_compound_op','Parser.py',1102),
+  ('compound_op -> DIV_EQ','compound_op',1,'p_compound_op','Parser.py',1103),
+  ('compound_op -> MOD_EQ','compound_op',1,'p_compound_op','Parser.py',1104),
+  ('start -> INT_LIT','start',1,'p_start','Parser.py',1113),
+  ('deleteCount -> empty','deleteCount',1,'p_deleteCount','Parser.py',1123),
+  ('deleteCount -> INT_LIT','deleteCount',1,'p_deleteCount','Parser.py',1124),
+  ('splice_items -> empty','splice_items',1,'p_splice_items','Parser.py',1137),
+  ('splice_items -> list_element','splice_items',1,'p_splice_items','Parser.py',1138),
+  ('var_call -> IDENT list_index','var_call',2,'p_var_call','Parser.py',1150),
+  ('list_index -> LBRACKET index RBRACKET list_index2','list_index',4,'p_list_index','Parser.py',1161),
+  ('list_index -> empty','list_index',1,'p_list_index','Parser.py',1162),
+  ('list_index2 -> LBRACKET index RBRACKET','list_index2',3,'p_list_index2','Parser.py',1175),
+  ('list_index2 -> empty','list_index2',1,'p_list_index2','Parser.py',1176),
+  ('index -> INT_LIT','index',1,'p_index_int_lit','Parser.py',1189),
+  ('index -> IDENT','index',1,'p_index_ident','Parser.py',1193),
+  ('postfix -> empty','postfix',1,'p_postfix','Parser.py',1202),
+  ('postfix -> postfix_op','postfix',1,'p_postfix','Parser.py',1203),
+  ('value -> type_cast','value',1,'p_value','Parser.py',1214),
+  ('value -> expression','value',1,'p_value','Parser.py',1215),
+  ('value -> function_call','value',1,'p_value','Parser.py',1216),
+  ('type_cast -> CONVERT_TO_INT LPAREN typecast_value RPAREN','type_cast',4,'p_type_cast','Parser.py',1229),
+  ('type_cast -> CONVERT_TO_FLT LPAREN typecast_value RPAREN','type_cast',4,'p_type_cast','Parser.py',1230),
+  ('type_cast -> CONVERT_TO_BLN LPAREN typecast_value RPAREN','type_cast',4,'p_type_cast','Parser.py',1231),
+  ('type_cast -> CONVERT_TO_STR LPAREN typecast_value RPAREN','type_cast',4,'p_type_cast','Parser.py',1232),
+  ('typecast_value -> expression','typecast_value',1,'p_typecast_value','Parser.py',1244),
+  ('typecast_value -> FUNCTION_NAME LPAREN RPAREN','typecast_value',3,'p_typecast_value','Parser.py',1245),
+  ('typecast_value -> input_statement','typecast_value',1,'p_typecast_value','Parser.py',1246),
+  ('input_statement -> INPUT LPAREN RPAREN','input_statement',3,'p_input_statement','Parser.py',1259),
+  ('empty -> <empty>','empty',0,'p_empty','Parser.py',1264),
 ]
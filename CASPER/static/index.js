@@ -21,32 +21,115 @@ require(["vs/editor/editor.main"], function () {
     }
   );
 
-  monacoEditorInstance.onDidChangeModelContent(
-    debounce(() => {
-      const code = monacoEditorInstance.getValue();
-      console.log("Editor content changed:", code);
-      checkErrors(code);
-    }, 500)
-  );
+  monacoEditorInstance.onDidChangeModelContent((event) => {
+    pendingChanges.push(...event.changes.map(({ range, text }) => ({ range, text })));
+    scheduleErrorCheck();
+  });
 });
 
-async function checkErrors(code) {
+// The server keeps a copy of the document for this editor session (see
+// DocumentSync.py). After the first check only Monaco's edits are sent, and
+// checks run one at a time so the edits arrive in order.
+const editorSession = Math.random().toString(36).slice(2) + Date.now().toString(36);
+let syncedVersion = null;
+let pendingChanges = [];
+let errorChecks = Promise.resolve();
+
+const scheduleErrorCheck = debounce(() => {
+  errorChecks = errorChecks.then(checkErrors);
+}, 500);
+
+function fullDocument() {
+  const model = monacoEditorInstance.getModel();
+  pendingChanges = [];
+  return { session: editorSession, version: model.getVersionId(), code: model.getValue() };
+}
+
+function postCheck(body) {
+  return fetch("/check_errors", {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify(body),
+  });
+}
+
+async function checkErrors() {
   console.log("Requesting errors check...");
+  let body;
+  if (syncedVersion === null) {
+    body = fullDocument();
+  } else {
+    body = {
+      session: editorSession,
+      base: syncedVersion,
+      version: monacoEditorInstance.getModel().getVersionId(),
+      changes: pendingChanges,
+    };
+    pendingChanges = [];
+  }
   try {
-    const response = await fetch("/check_errors", {
-      method: "POST",
-      headers: { "Content-Type": "application/json" },
-      body: JSON.stringify({ code }),
-    });
+    let response = await postCheck(body);
+    if (response.status === 409) {
+      // The server dropped the session or lost track of it: send the whole text.
+      response = await postCheck(fullDocument());
+    }
 
     const data = await response.json();
     console.log("Backend response:", data);
+    syncedVersion = data.version ?? null;
     updateMonacoDiagnostics(data.errors || []);
   } catch (error) {
+    syncedVersion = null;
     console.error("Fetch error:", error);
   }
 }
 
+// A live run streams what the program displays as Server-Sent Events (see
+// Streaming.py). Pressing the button again while it runs cancels it.
+let liveRun = null;
+
+async function runLive() {
+  if (liveRun) {
+    await fetch(`/runs/${liveRun}/cancel`, { method: "POST" });
+    return;
+  }
+  const output = document.getElementById("output");
+  const button = document.getElementById("liveRunButton");
+  const response = await fetch("/runs", {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify({ code: monacoEditorInstance.getValue() }),
+  });
+  const data = await response.json();
+  if (!response.ok) {
+    output.textContent = (data.errors || []).join("\n");
+    return;
+  }
+
+  liveRun = data.id;
+  output.textContent = "";
+  button.textContent = "Stop";
+  const events = new EventSource(`/runs/${data.id}/events`);
+  const finish = () => {
+    events.close();
+    liveRun = null;
+    button.textContent = "Run Live";
+  };
+  events.addEventListener("output", (event) => {
+    output.textContent += event.data;
+  });
+  events.addEventListener("end", (event) => {
+    const end = JSON.parse(event.data);
+    if (end.message) {
+      output.textContent += `\n${end.message}`;
+    } else if (end.status === "cancelled") {
+      output.textContent += "\n[Run cancelled]";
+    }
+    finish();
+  });
+  events.onerror = finish;
+}
+
 function updateMonacoDiagnostics(errors) {
   const markers = errors.map((err) => ({
     severity: monaco.MarkerSeverity.Error,
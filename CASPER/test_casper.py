@@ -0,0 +1,1305 @@
+# test_casper.py
+#
+# Correctness tests for the CASPER pipeline: every engine (lexers, parsers,
+# execution engines, caches, servers) is run over the same cases and held
+# to what the reference engine does. Run from the CASPER directory:
+#   python -m unittest test_casper
+#
+# The cases are the programs in tests/*.lime plus randomly generated ones.
+# The environment sets how many and from which seed:
+#
+#   CASPER_TEST_CORPUS   generated programs per run
+#   CASPER_TEST_SEED     seed for the generator and the random edits
+#
+# benchmark.py times the same programs; it imports them from here.
+
+import concurrent.futures
+import contextlib
+import functools
+import glob
+import io
+import json
+import os
+import queue
+import random
+import re
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+from Lexer import IDENTIFIER_DELIMS, LEXER_ENGINES, LITERAL_DELIMS, NUMBER_DELIMS, TokenReplay, TokenStream, make_lexer
+from Token import TokenType
+import Bytecode
+import CBackend
+from Budget import Budget, BudgetExceeded
+import CodeGen
+import CompileCache
+import DelimiterTable
+from Delimiters import Delimiters
+import DocumentSync
+from KeywordDelimiters import KEYWORD_DELIMITERS
+import ExecutionPool
+import LanguageServer
+import LLVMBackend
+import Optimizer
+import Parser
+from Output import BufferSink, OutputLimitExceeded
+import Streaming
+import Transpiler
+from Semantics import SemanticAnalyzer
+
+TEST_CORPUS = int(os.environ.get("CASPER_TEST_CORPUS", "60"))
+TEST_SEED = int(os.environ.get("CASPER_TEST_SEED", "0"))
+
+# Generated loops may never end, so engines are compared on runs held to
+# this many steps, with no clock: a program over it stops at the same
+# point, with the same error, on every engine.
+TEST_STEPS = 10000
+
+TEST_PROGRAMS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tests")
+
+
+# -- programs -----------------------------------------------------------------
+
+def load_programs(path):
+    """Splits a .lime file into its birth ... ghost programs with editor (CRLF) line endings."""
+    with open(path) as f:
+        text = f.read()
+    programs = [chunk.strip() for chunk in re.split(r"(?<=ghost)", text) if chunk.strip()]
+    return [program.replace("\n", "\r\n") for program in programs]
+
+
+def generate_program(statement_count):
+    """Builds a syntactically valid program whose main body has roughly `statement_count` statements."""
+    lines = ["birth", "", "int $g = 5", "@main_casper() {", "    int $x = 1", "    flt $f = 2.5"]
+    for i in range(statement_count):
+        kind = i % 5
+        if kind == 0:
+            lines.append(f"    $x = $x + {i}")
+        elif kind == 1:
+            lines.append(f"    display \"line {i}\", $x")
+        elif kind == 2:
+            lines += [f"    check ($x > {i}) {{", "        display $x", "    } otherwise {", "        $x = $x - 1", "    }"]
+        elif kind == 3:
+            lines += [f"    for (int $i{i} = 0; $i{i} < 3; $i{i}++) {{", "        $x = $x * 2", "    }"]
+        else:
+            lines.append(f"    << comment {i}")
+    lines += ["}", "ghost"]
+    return "\r\n".join(lines)
+
+
+def display_heavy(lines):
+    """A main body of `lines` display statements."""
+    body = [f"    display {i}" for i in range(lines)]
+    return "\r\n".join(["birth", "@main_casper() {", *body, "}", "ghost"])
+
+
+def straight_line(lines):
+    """A main body of `lines` arithmetic display statements, with no branches or loops."""
+    body = [f"    display {i} + {i + 1} * 2 - {i % 7}" for i in range(lines)]
+    return "\r\n".join(["birth", "@main_casper() {", *body, "}", "ghost"])
+
+
+def crlf(template, *values):
+    """A program template below with editor line endings, filled in."""
+    return template.replace("\n", "\r\n") % values
+
+
+BINARY_OPERATORS = ["+", "-", "*", "/", "%", "**", ">", "<", "==", ">=", "<=", "!=", "&&", "||"]
+
+
+def parenthesize(text):
+    """Wraps text in parentheses; the lexer does not accept '~' right after '('."""
+    return f"( {text})" if text.startswith("~") else f"({text})"
+
+
+class ProgramGenerator:
+    """Random, syntactically valid programs covering every statement kind and operator."""
+
+    def __init__(self, seed):
+        self.rng = random.Random(seed)
+        self.names = ["$a", "$b", "$count", "$total"]
+
+    def expression(self, depth=0):
+        rng = self.rng
+        if depth < 3 and rng.random() < 0.45:
+            left, right = self.expression(depth + 1), self.expression(depth + 1)
+            return f"{left} {rng.choice(BINARY_OPERATORS)} {right}"
+        if depth < 3 and rng.random() < 0.15:
+            return parenthesize(self.expression(depth + 1))
+        return rng.choice([
+            lambda: rng.choice(self.names),
+            lambda: f"{rng.choice(self.names)}[{rng.randint(0, 3)}]",
+            lambda: f"{rng.choice(self.names)}++ ",  # '++' must be followed by a space
+            lambda: str(rng.randint(0, 99)),
+            lambda: f"{rng.randint(0, 99)}.{rng.randint(1, 9)}",
+            lambda: f"~{rng.randint(1, 9)}",
+            lambda: f"~{rng.randint(1, 9)}.5",
+            lambda: rng.choice(["Day", "Night"]),
+            lambda: f'"s{rng.randint(0, 9)}"',
+        ])()
+
+    def value(self):
+        rng = self.rng
+        roll = rng.random()
+        if roll < 0.1:
+            return rng.choice(["to_int", "to_flt", "to_str", "to_bln"]) + parenthesize(self.expression(1))
+        if roll < 0.15:
+            return f"@f{rng.randint(0, 2)}({rng.choice(self.names)}, {rng.randint(0, 9)})"
+        if roll < 0.18:
+            return "input()"
+        return self.expression()
+
+    def list_value(self, depth=0):
+        rng = self.rng
+        items = [self.list_value(depth + 1) if depth == 0 and rng.random() < 0.3
+                 else rng.choice([str(rng.randint(0, 9)), "'c'", '"x"', "Day"])
+                 for _ in range(rng.randint(1, 3))]
+        return "[" + ", ".join(items) + "]"
+
+    def block(self, indent, depth):
+        return [line for _ in range(self.rng.randint(0, 3)) for line in self.statement(indent, depth + 1)]
+
+    def statement(self, indent, depth=0):
+        rng = self.rng
+        pad = "    " * indent
+        name = rng.choice(self.names)
+        kinds = ["declare", "assign", "display", "call"]
+        if depth < 2:
+            kinds += ["check", "swap", "for", "until", "repeat"]
+        kind = rng.choice(kinds)
+        if kind == "declare":
+            dtype = rng.choice(["int", "flt", "str", "chr", "bln"])
+            if rng.random() < 0.2:
+                return [f"{pad}{dtype} {name}[] = {self.list_value()}"]
+            tail = rng.choice(["", f" = {self.value()}", f", {rng.choice(self.names)}", f" = {self.value()}, $z"])
+            return [f"{pad}{dtype} {name}{tail}"]
+        if kind == "assign":
+            return [f"{pad}" + rng.choice([
+                f"{name} = {self.value()}",
+                f"{name} {rng.choice(['+=', '-=', '*=', '/=', '%='])} {self.value()}",
+                f"{name}[{rng.randint(0, 3)}] = {self.value()}",
+                f"{name}.push({self.list_value()[1:-1]})",
+                f"{name}.splice(0, 1, {rng.randint(0, 9)})",
+            ])]
+        if kind == "display":
+            values = ", ".join(self.value() for _ in range(rng.randint(1, 3)))
+            return [f"{pad}display {values}"]
+        if kind == "call":
+            return [f"{pad}@f{rng.randint(0, 2)}({name})" if rng.random() < 0.7 else f"{pad}input()"]
+        inner = "    " * (indent + 1)
+        if kind == "check":
+            lines = [f"{pad}check {parenthesize(self.expression())} {{"] + self.block(indent + 1, depth)
+            for _ in range(rng.randint(0, 2)):
+                lines += [f"{pad}}} otherwise_check {parenthesize(self.expression())} {{"] + self.block(indent + 1, depth)
+            return lines + [f"{pad}}} otherwise {{"] + self.block(indent + 1, depth) + [f"{pad}}}"]
+        if kind == "swap":
+            lines = [f"{pad}swap({name}) {{"]
+            for case in range(rng.randint(1, 3)):
+                lines += [f"{inner}shift {case}:"] + self.block(indent + 2, depth)
+            return lines + [f"{inner}otherwise {{"] + self.block(indent + 2, depth) + [f"{inner}}}", f"{pad}}}"]
+        if kind == "for":
+            step = rng.choice(["$i++", "$i--", f"$i += {rng.randint(1, 3)}"])
+            return ([f"{pad}for (int $i = 0; $i < {rng.randint(1, 9)}; {step}) {{"]
+                    + self.block(indent + 1, depth) + [f"{pad}}}"])
+        # until/repeat bodies start right after the brace, and the lexer only
+        # accepts '$' or '@' there, so the first statement is an assignment.
+        body = [f"{name} += 1"] + [line.strip() for line in self.block(indent + 1, depth)]
+        if kind == "until":
+            return [f"{pad}until {parenthesize(self.expression())} {{{body[0]}"] + body[1:] + [f"{pad}}}"]
+        return [f"{pad}repeat {{{body[0]}"] + body[1:] + [f"{pad}}} until {parenthesize(self.expression())}"]
+
+    def program(self, statement_count):
+        rng = self.rng
+        lines = ["birth"]
+        for name in self.names[:rng.randint(0, 3)]:
+            lines.append(f"{rng.choice(['int', 'flt'])} {name} = {self.expression()}")
+        for index in range(rng.randint(0, 2)):
+            ret = rng.choice(["function", "function_int", "function_str", "function_list_int"])
+            lines.append(f"{ret} @f{index}(int $p, flt $q) {{")
+            while len(lines) < statement_count // 3:
+                lines += self.statement(1)
+            if rng.random() < 0.8:
+                lines.append(f"    revive {self.value()}")
+            lines += ["}", ""]
+        lines.append("@main_casper() {")
+        target = len(lines) + statement_count
+        while len(lines) < target:
+            lines += self.statement(1)
+        lines += ["}", "ghost"]
+        return "\r\n".join(lines)
+
+
+def mutate_tokens(rng, tokens):
+    """Deletes, duplicates or swaps a few tokens to provoke syntax errors."""
+    tokens = list(tokens)
+    for _ in range(rng.randint(1, 3)):
+        if not tokens:
+            break
+        index = rng.randrange(len(tokens))
+        action = rng.randrange(3)
+        if action == 0:
+            del tokens[index]
+        elif action == 1:
+            tokens.insert(index, tokens[rng.randrange(len(tokens))])
+        else:
+            other = rng.randrange(len(tokens))
+            tokens[index], tokens[other] = tokens[other], tokens[index]
+    return tokens
+
+
+@functools.lru_cache(maxsize=None)
+def lime_programs():
+    """The programs in tests/*.lime."""
+    return tuple(source for path in sorted(glob.glob(os.path.join(TEST_PROGRAMS, "*.lime")))
+                 for source in load_programs(path))
+
+
+@functools.lru_cache(maxsize=None)
+def corpus(count=TEST_CORPUS):
+    """The shared cases: the test programs, then `count` generated ones."""
+    rng = random.Random(TEST_SEED)
+    generator = ProgramGenerator(TEST_SEED)
+    return lime_programs() + tuple(generator.program(rng.randint(5, 60)) for _ in range(count))
+
+
+def parse(source):
+    """A fresh tree for source (engines may rewrite the trees they run), or None on a syntax error."""
+    try:
+        return Parser.build_parser().parse(lexer=TokenStream(source))
+    except SyntaxError:
+        return None
+
+
+def ast_signature(node):
+    """Flattens an AST into comparable tuples without recursing (trees can be deep)."""
+    flat = []
+    stack = [node]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, list):
+            flat.append(("list", len(item)))
+            stack.extend(reversed(item))
+        elif isinstance(item, Parser.ASTNode):
+            flat.append((item.type, repr(item.value), len(item.children)))
+            stack.extend(reversed(item.children))
+        else:
+            flat.append(("leaf", repr(item)))
+    return flat
+
+
+def analyze_quietly(ast):
+    """Runs the SemanticAnalyzer for its annotations; returns its errors."""
+    return SemanticAnalyzer().analyze(ast)
+
+
+# -- outcomes -------------------------------------------------------------------
+
+def step_budget():
+    return Budget(TEST_STEPS, 0)
+
+
+def codegen_outcome(ast, engine):
+    """Everything a program shows the user: its printed output, and the error that stopped it."""
+    output = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(output):
+            CodeGen.run_code_generation(ast, engine, budget=step_budget())
+    except Exception as error:
+        return output.getvalue(), f"{type(error).__name__}: {error}"
+    return output.getvalue(), None
+
+
+def sink_outcome(source, engine, limit=0, budget=None):
+    """codegen_outcome, but collected in the program's own sink rather than through sys.stdout."""
+    sink = BufferSink(limit)
+    try:
+        CodeGen.run_code_generation(parse(source), engine, output=sink, budget=budget or step_budget())
+    except Exception as error:
+        return sink.getvalue(), f"{type(error).__name__}: {error}"
+    return sink.getvalue(), None
+
+
+def walker_outcome(ast):
+    """codegen_outcome of the tree walker, with the error reduced to the message other engines report."""
+    output, error = codegen_outcome(ast, "walk")
+    return output, error and error.split(": ", 1)[1]
+
+
+def engine_outcome(run, ast, failure):
+    """walker_outcome for an engine that displays through a callback and raises failure for runtime errors."""
+    displayed = []
+    try:
+        run(ast, display=displayed.append, budget=step_budget())
+    except failure as error:
+        return "".join(line + "\n" for line in displayed), str(error).removeprefix("Runtime Error: ")
+    return "".join(line + "\n" for line in displayed), None
+
+
+def native_outcome(ast):
+    """engine_outcome for the C backend; None when it rejects the program."""
+    try:
+        binary = CBackend.build_program(ast, step_budget())
+    except CBackend.NativeError:
+        return None
+    return engine_outcome(lambda _, display, budget: CBackend.execute(binary, display), ast, CBackend.NativeError)
+
+
+def jit_outcome(ast):
+    """engine_outcome for the LLVM JIT; None when it rejects the program."""
+    try:
+        main = LLVMBackend.jit_compile(LLVMBackend.generate_ir(ast, step_budget()))
+    except LLVMBackend.LLVMError:
+        return None
+    return engine_outcome(lambda _, display, budget: LLVMBackend.execute(main, display), ast, LLVMBackend.LLVMError)
+
+
+FIBONACCI = """birth
+function_int @fib(int $n) {
+    int $r = $n
+    check ($n > 1) {
+        int $a = $n - 1
+        int $b = $n - 2
+        int $x = @fib($a)
+        int $y = @fib($b)
+        $r = $x + $y
+    } otherwise {
+        $r = $n
+    }
+    revive $r
+}
+
+@main_casper() {
+    display @fib(%d)
+}
+ghost"""
+
+
+MIXED_ARITHMETIC = """birth
+function_int @fib(int $n) {
+    int $r = $n
+    flt $w = 0.5
+    str $s = "x"
+    check ($n > 1) {
+        int $a = $n - 1
+        int $b = $n - 2
+        int $x = @fib($a)
+        int $y = @fib($b)
+        $w = $w * 1.5 + $w * 2.5 - $w / 4.0
+        $s = $s + "y" + "z"
+        $r = $x + $y
+    } otherwise {
+        $r = $n
+    }
+    revive $r
+}
+
+@main_casper() {
+    display @fib(%d)
+}
+ghost"""
+
+
+CONSTANT_HEAVY = """birth
+function_int @fib(int $n) {
+    int $r = $n
+    check ($n > 1) {
+        int $a = $n - (3 - 2)
+        int $b = $n - (4 - 2)
+        int $x = @fib($a)
+        int $y = @fib($b)
+        $r = $x + $y + (2 * 3 - 6) * (100 + 24) + 60 * 60 * 24 - 86400
+        check (Night) {
+            display "tracing", $r
+        } otherwise_check (Day) {
+            $r += 2 * 0
+        } otherwise {
+        }
+    } otherwise {
+        $r = $n * (1 + 0)
+    }
+    revive $r
+}
+
+@main_casper() {
+    display @fib(%d)
+}
+ghost"""
+
+
+LOOP_INVARIANT = """birth
+@main_casper() {
+    int $a = 3
+    int $b = 4
+    int $total = 0
+    for (int $i = 0; $i < %d; $i++) {
+        for (int $j = 0; $j < 10; $j++) {
+            $total += $a * $b + $a * 7 - $b
+        }
+    }
+    display $total
+}
+ghost"""
+
+
+CUBE_ITERATION = """birth
+int $total = 0
+
+function_int @cubeIteration(int $num) {
+    int $result = 1
+    for (int $i = 1; $i <= 3; $i++) {
+        $result *= $num
+    }
+    revive $result
+}
+
+@main_casper() {
+    for (int $n = 0; $n < %d; $n++) {
+        $total += @cubeIteration($n)
+    }
+    display $total
+}
+ghost"""
+
+
+# The tree walker's semantics, which every engine follows: `/` is true
+# division, loops run until their condition ends them and only taken
+# branches run.
+REFERENCE_SEMANTICS = """birth
+int $g = 10
+function_int @fact(int $n) {
+    int $r = 1
+    check ($n > 1) {
+        int $m = $n - 1
+        int $t = @fact($m)
+        $r = $n * $t
+    } otherwise {
+        $r = 1
+    }
+    revive $r
+}
+@main_casper() {
+    int $sum = 0
+    for (int $i = 0; $i < 5; $i++) {
+        $sum += $i
+    }
+    display $sum
+    int $five = 5
+    int $ff = @fact($five)
+    display $ff
+    flt $f = 7 / 2
+    display $f
+    int $k = 7 %% 3
+    display $k
+    str $s = "ab" + "cd"
+    display $s
+    check ($g == 10 && $sum > 3) {
+        display "yes"
+    } otherwise {
+        display "no"
+    }
+    display 2 + 3 * 4
+    display 10 - 2 - 3
+}
+ghost"""
+
+
+def reference_programs():
+    """corpus() and the programs above: what every engine must run as the tree walker does."""
+    return corpus() + (
+        crlf(REFERENCE_SEMANTICS), crlf(FIBONACCI, 12), crlf(MIXED_ARITHMETIC, 10), crlf(CONSTANT_HEAVY, 8),
+        crlf(LOOP_INVARIANT, 5), crlf(CUBE_ITERATION, 50), crlf(LOOPS, 9), crlf(RUNAWAY_RECURSION),
+        crlf(RUNAWAY_LOOP),
+    )
+
+
+# Every kind of loop, nested and around calls, counting up and down.
+LOOPS = """birth
+int $total = 0
+
+function_int @triangle(int $n) {
+    int $sum = 0
+    for (int $i = 1; $i <= $n; $i++) {
+        $sum += $i
+    }
+    revive $sum
+}
+
+@main_casper() {
+    str $s = "a"
+    int $k = 0
+    for (int $i = %d; $i > 0; $i -= 2) {
+        for (int $j = 0; $j < 4; $j++) {
+            int $t = @triangle($j)
+            $total += $t * $i
+        }
+        $s += "b"
+    }
+    display $total
+    display $s
+    until ($k >= 10) {$k += 3
+        display $k
+    }
+    repeat {$k -= 4
+    } until ($k < 0)
+    display $k
+    until (Day) {$k = 100
+    }
+    repeat {$k *= 2
+    } until (Day)
+    display $k
+}
+ghost"""
+
+
+# Doubles a string on every call until the string cap stops it.
+RUNAWAY_RECURSION = """birth
+function_str @grow(str $s) {
+    str $t = $s + $s
+    str $u = @grow($t)
+    revive $u
+}
+
+@main_casper() {
+    display @grow("ab")
+}
+ghost"""
+
+
+# Never ends, so only the step limit stops it.
+RUNAWAY_LOOP = """birth
+@main_casper() {
+    int $n = 0
+    until (Night) {$n += 1
+    }
+    display $n
+}
+ghost"""
+
+
+# The dead branches declare $x, which makes it main's local (None) rather than the global.
+DEAD_DECLARATIONS = """birth
+int $x = 5
+@main_casper() {
+    check (Night) {
+        int $x = 1
+    } otherwise {
+    }
+    display $x
+    check (Day) {
+        display $x
+    } otherwise_check (Day) {
+        int $x = 2
+    } otherwise {
+    }
+}
+ghost"""
+
+
+# An int variable may hold Day, which is a string at run time.
+NUMBER_HOLDING_DAY = """birth
+@main_casper() {
+    int $x = Day
+    int $n = 3
+    $x *= $n
+    display $x * $n
+}
+ghost"""
+
+
+DIVISION_BY_ZERO = """birth
+@main_casper() {
+    int $zero = 0
+    display 7
+    display 1 / $zero
+}
+ghost"""
+
+
+# Each would build a string of two trillion characters.
+HUGE_REPEATS = ["""birth
+@main_casper() {
+    int $n = 1000000
+    display "ab" * ($n * $n)
+}
+ghost""", """birth
+@main_casper() {
+    int $n = 1000000
+    str $s = "ab"
+    $s *= $n * $n
+    display $s
+}
+ghost"""]
+
+
+# -- lexing and parsing -----------------------------------------------------
+
+def lexed(source, engine):
+    """Every token a fresh lexer reads from source, EOF excepted, as tuples."""
+    lexer = make_lexer(source, engine)
+    read = []
+    while lexer.current_char is not None:
+        tok = lexer.next_token()
+        if tok.type != TokenType.EOF:
+            read.append((tok.type, tok.literal, tok.line_no, tok.position, tok.valid_delims))
+    return read
+
+
+def vars_of(tok):
+    return (tok.type, tok.value, tok.lineno, tok.lexpos)
+
+
+def parse_outcome(parser, tokens):
+    try:
+        return ast_signature(parser.parse(lexer=TokenReplay(tokens)))
+    except SyntaxError as error:
+        return str(error)
+
+
+class LexerTests(unittest.TestCase):
+
+    def test_engines_read_the_same_tokens(self):
+        for source in corpus() + (generate_program(200),):
+            reference = lexed(source, "char")
+            stream = TokenStream(source, "char")
+            for engine in LEXER_ENGINES:
+                self.assertEqual(lexed(source, engine), reference, f"{engine} lexer:\n{source}")
+                self.assertEqual(list(make_lexer(source, engine).scan())[:-1], reference, f"{engine} scan:\n{source}")
+                buffered = TokenStream(source, engine)
+                self.assertEqual([vars_of(tok) for tok in buffered.tokens], [vars_of(tok) for tok in stream.tokens], source)
+                self.assertEqual(list(map(str, buffered.illegal_tokens + buffered.comments)),
+                                 list(map(str, stream.illegal_tokens + stream.comments)), source)
+
+
+class DelimiterTableTests(unittest.TestCase):
+
+    def test_compiled_tables_match_the_delimiter_sets(self):
+        self.assertEqual(DelimiterTable.check_delimiter_table(), [])
+        # The tables the Lexer tests characters against directly.
+        self.assertIs(IDENTIFIER_DELIMS.source, Delimiters.identifier_del)
+        self.assertIs(NUMBER_DELIMS.source, Delimiters.DEL10)
+        self.assertIs(LITERAL_DELIMS.source, KEYWORD_DELIMITERS["STR_LIT"])
+
+
+class ParserTests(unittest.TestCase):
+
+    def test_engines_build_the_same_tree_or_error(self):
+        rng = random.Random(TEST_SEED)
+        # Without diagnostics the descent engine cannot fall back to the LALR
+        # parser, so a program it wrongly rejects shows up as a mismatch.
+        parsers = {engine: Parser.build_parser(engine) for engine in Parser.PARSER_ENGINES}
+        parsers["descent (no fallback)"] = Parser.DescentParser(diagnostics=False)
+        for source in corpus():
+            tokens = list(TokenStream(source).tokens)
+            for variant in [tokens] + [mutate_tokens(rng, tokens) for _ in range(3)]:
+                reference = parse_outcome(parsers["lalr"], variant)
+                for name, parser in parsers.items():
+                    outcome = parse_outcome(parser, variant)
+                    if isinstance(reference, str) and name == "descent (no fallback)":
+                        self.assertIsInstance(outcome, str, f"{name} parser accepted:\n{source}")
+                    else:
+                        self.assertEqual(outcome, reference, f"{name} parser:\n{source}")
+
+
+# -- execution --------------------------------------------------------------
+
+class CodeGenTests(unittest.TestCase):
+
+    def test_engines_agree_with_the_tree_walker(self):
+        for source in corpus() + (generate_program(200),):
+            if parse(source) is None:
+                continue
+            # The tree walker flattens children in place, so each engine gets its own tree.
+            reference = codegen_outcome(parse(source), "walk")
+            for engine in CodeGen.CODEGEN_ENGINES:
+                self.assertEqual(codegen_outcome(parse(source), engine), reference, f"{engine} engine:\n{source}")
+
+    def test_type_annotations_do_not_change_behaviour(self):
+        for source in corpus():
+            plain = parse(source)
+            if plain is None:
+                continue
+            reference = codegen_outcome(plain, "walk")
+            for engine in CodeGen.CODEGEN_ENGINES:
+                analyzed = parse(source)
+                analyze_quietly(analyzed)
+                self.assertEqual(codegen_outcome(analyzed, engine), reference, f"{engine} engine, annotated:\n{source}")
+
+    def test_reference_semantics(self):
+        self.assertEqual(walker_outcome(parse(crlf(REFERENCE_SEMANTICS))), ("10\n120\n3.5\n1\nabcd\nyes\n14\n5\n", None))
+
+    def test_calls_get_their_own_frames(self):
+        source = crlf(FIBONACCI, 18)
+        for engine in CodeGen.CODEGEN_ENGINES:
+            self.assertEqual(codegen_outcome(parse(source), engine), ("2584\n", None), engine)
+
+
+    def test_typed_numeric_operations_skip_the_size_checks(self):
+        class CountingBudget(Budget):
+            checks = 0
+
+            def add(self, left, right):
+                self.checks += 1
+                return super().add(left, right)
+
+            def multiply(self, left, right):
+                self.checks += 1
+                return super().multiply(left, right)
+
+        for source, checked in ((crlf(FIBONACCI, 10), False), (crlf(MIXED_ARITHMETIC, 10), True),
+                                (crlf(NUMBER_HOLDING_DAY), True)):
+            for engine in CodeGen.CODEGEN_ENGINES:
+                ast, budget = parse(source), CountingBudget(TEST_STEPS, 0)
+                self.assertEqual(analyze_quietly(ast), [])
+                with contextlib.redirect_stdout(io.StringIO()):
+                    CodeGen.run_code_generation(ast, engine, budget=budget)
+                # FIBONACCI only adds ints; the others also build strings, which stay checked.
+                self.assertEqual(budget.checks > 0, checked, f"{engine} engine:\n{source}")
+
+
+class BytecodeTests(unittest.TestCase):
+
+    def test_vm_programs_match_the_tree_walker(self):
+        for source in reference_programs() + (straight_line(200),):
+            if parse(source) is None:
+                continue
+            actual = engine_outcome(Bytecode.run_program, parse(source), Bytecode.VMError)
+            self.assertEqual(actual, walker_outcome(parse(source)), source)
+
+    def test_transpiled_programs_match_the_tree_walker(self):
+        for source in reference_programs():
+            if parse(source) is None:
+                continue
+            actual = engine_outcome(Transpiler.run_program, parse(source), Transpiler.TranspileError)
+            self.assertEqual(actual, walker_outcome(parse(source)), source)
+
+    @unittest.skipUnless(shutil.which(CBackend.CC), "no C compiler")
+    def test_native_programs_match_the_tree_walker(self):
+        for source in reference_programs():
+            if parse(source) is None:
+                continue
+            actual = native_outcome(parse(source))
+            if actual is not None:
+                self.assertEqual(actual, walker_outcome(parse(source)), source)
+
+    @unittest.skipUnless(shutil.which(CBackend.CC), "no C compiler")
+    def test_native_loops_go_round(self):
+        for source in (crlf(LOOPS, 9), crlf(CUBE_ITERATION, 50), crlf(RUNAWAY_LOOP)):
+            self.assertEqual(native_outcome(parse(source)), walker_outcome(parse(source)), source)
+
+    def test_native_backends_refuse_untyped_constructs(self):
+        for statement, message in (('int $a = to_int("4")', "Type casts"), ("str $a = input()", "input"),
+                                   ("int $a[] = [1, 2]", "List literals")):
+            source = crlf(f"birth\n@main_casper() {{\n    {statement}\n    display $a\n}}\nghost")
+            with self.assertRaisesRegex(CBackend.NativeError, message):
+                CBackend.translate_program(parse(source))
+
+    @unittest.skipIf(LLVMBackend.llvm is None, "llvmlite is not installed")
+    def test_jit_programs_match_the_tree_walker(self):
+        for source in reference_programs():
+            if parse(source) is None:
+                continue
+            actual = jit_outcome(parse(source))
+            if actual is not None:
+                self.assertEqual(actual, walker_outcome(parse(source)), source)
+
+    @unittest.skipIf(LLVMBackend.llvm is None, "llvmlite is not installed")
+    def test_jit_runs_loops_and_strings(self):
+        for source in (crlf(LOOPS, 9), crlf(RUNAWAY_LOOP), crlf(RUNAWAY_RECURSION), crlf(REFERENCE_SEMANTICS)):
+            self.assertEqual(jit_outcome(parse(source)), walker_outcome(parse(source)), source)
+
+
+class OptimizerTests(unittest.TestCase):
+
+    def test_optimized_programs_behave_as_before(self):
+        for source in corpus() + (crlf(CONSTANT_HEAVY, 8), crlf(LOOP_INVARIANT, 5), crlf(DEAD_DECLARATIONS)):
+            if parse(source) is None:
+                continue
+            reference = walker_outcome(parse(source))
+
+            def optimized():
+                ast = parse(source)
+                # As in main.py, hoisting relies on a program the analyzer accepted.
+                clean = analyze_quietly(ast) == []
+                return ast, Optimizer.optimize(ast, None if clean else "fold,branches")
+
+            ast, report = optimized()
+            self.assertEqual(walker_outcome(ast), reference, f"{report}\n{source}")
+            ast, report = optimized()
+            self.assertEqual(engine_outcome(Bytecode.run_program, ast, Bytecode.VMError), reference, f"{report}\n{source}")
+            outcomes = {engine: codegen_outcome(optimized()[0], engine) for engine in CodeGen.CODEGEN_ENGINES}
+            self.assertEqual(len(set(outcomes.values())), 1, f"CodeGen engines disagree once optimized:\n{source}")
+
+
+    def test_dead_branches_that_declare_stay(self):
+        ast = parse(crlf(DEAD_DECLARATIONS))
+        Optimizer.optimize(ast, "fold,branches")
+        self.assertEqual(walker_outcome(ast), ("None\nNone\n", None))
+
+
+# -- running programs for the web app ---------------------------------------
+
+def budget_outcome(run, ast, budget):
+    """The error that stopped a budgeted run (None if it finished) and how long it took."""
+    start = time.perf_counter()
+    try:
+        with open(os.devnull, "w") as sink, contextlib.redirect_stdout(sink):
+            run(ast, budget)
+    except (BudgetExceeded, Bytecode.VMError, Transpiler.TranspileError) as error:
+        return str(error), time.perf_counter() - start
+    return None, time.perf_counter() - start
+
+
+class OutputTests(unittest.TestCase):
+
+    def test_concurrent_runs_see_only_their_own_output(self):
+        jobs = [(source, engine) for source in corpus() if parse(source) for engine in ("walk", "closure")]
+        expected = [codegen_outcome(parse(source), engine) for source, engine in jobs]
+        with concurrent.futures.ThreadPoolExecutor(8) as pool:
+            outcomes = list(pool.map(lambda job: sink_outcome(*job), jobs))
+        for (source, engine), outcome, reference in zip(jobs, outcomes, expected):
+            self.assertEqual(outcome, reference, f"{engine} engine, run concurrently:\n{source}")
+
+    def test_the_cap_stops_a_program_at_the_limit(self):
+        output, error = sink_outcome(display_heavy(1000), "closure", limit=100)
+        self.assertEqual(len(output), 100)
+        self.assertTrue(output.startswith("0\n1\n2\n"), output)
+        self.assertEqual(error, f"{OutputLimitExceeded.__name__}: Output limit of 100 characters exceeded.")
+
+
+class BudgetTests(unittest.TestCase):
+
+    def test_runaway_programs_stop_at_the_limit_they_hit(self):
+        vm = lambda ast, budget: Bytecode.run_program(ast, display=len, budget=budget)
+        runs = [("vm", vm, "Runtime Error: ")] + [
+            (engine, lambda ast, budget, engine=engine: CodeGen.run_code_generation(ast, engine, budget=budget), "")
+            for engine in CodeGen.CODEGEN_ENGINES]
+        for name, run, prefix in runs:
+            error, _ = budget_outcome(run, parse(crlf(RUNAWAY_RECURSION)), Budget(0, 0, 0, 1000))
+            self.assertEqual(error, prefix + "String of 1024 characters exceeds the limit of 1000.", name)
+            error, _ = budget_outcome(run, parse(crlf(FIBONACCI, 40)), Budget(100000, 0, 0, 0))
+            self.assertEqual(error, prefix + "Step limit of 100000 exceeded.", name)
+            error, _ = budget_outcome(run, parse(crlf(FIBONACCI, 40)), Budget(0, 0.2, 0, 0))
+            self.assertEqual(error, prefix + "Time limit of 0.2 seconds exceeded.", name)
+
+    def test_oversized_strings_are_refused_before_they_are_built(self):
+        runs = [
+            ("vm", lambda ast, budget: Bytecode.run_program(ast, display=len, budget=budget), "Runtime Error: "),
+            ("transpiled", lambda ast, budget: Transpiler.run_program(ast, display=len, budget=budget),
+             "Runtime Error: "),
+        ] + [(engine, lambda ast, budget, engine=engine: CodeGen.run_code_generation(ast, engine, budget=budget), "")
+             for engine in CodeGen.CODEGEN_ENGINES]
+        for source in HUGE_REPEATS:
+            for name, run, prefix in runs:
+                error, _ = budget_outcome(run, parse(crlf(source)), Budget(0, 0, 0, 1000))
+                self.assertEqual(error, prefix + "String of 2000000000000 characters exceeds the limit of 1000.",
+                                 f"{name}:\n{source}")
+
+    def test_numbers_holding_strings_stay_checked(self):
+        runs = [
+            ("vm", lambda ast, budget: Bytecode.run_program(ast, display=len, budget=budget), "Runtime Error: "),
+            ("transpiled", lambda ast, budget: Transpiler.run_program(ast, display=len, budget=budget),
+             "Runtime Error: "),
+        ] + [(engine, lambda ast, budget, engine=engine: CodeGen.run_code_generation(ast, engine, budget=budget), "")
+             for engine in CodeGen.CODEGEN_ENGINES]
+        for name, run, prefix in runs:
+            ast = parse(crlf(NUMBER_HOLDING_DAY))
+            self.assertEqual(analyze_quietly(ast), [])
+            error, _ = budget_outcome(run, ast, Budget(0, 0, 0, 5))
+            self.assertEqual(error, prefix + "String of 9 characters exceeds the limit of 5.", name)
+
+    def test_step_limits_are_exact(self):
+        # @fib(18) makes 8361 calls, so 8361 steps but not 8360.
+        vm = lambda ast, budget: Bytecode.run_program(ast, display=len, budget=budget)
+        ast = parse(crlf(FIBONACCI, 18))
+        self.assertIsNone(budget_outcome(vm, ast, Budget(8361, 0, 0, 0))[0])
+        self.assertEqual(budget_outcome(vm, ast, Budget(8360, 0, 0, 0))[0], "Runtime Error: Step limit of 8360 exceeded.")
+        for engine in CodeGen.CODEGEN_ENGINES:
+            run = lambda ast, budget: CodeGen.run_code_generation(ast, engine, budget=budget)
+            ast = parse(crlf(FIBONACCI, 18))
+            self.assertIsNone(budget_outcome(run, ast, Budget(8361, 0, 0, 0))[0], engine)
+            self.assertEqual(budget_outcome(run, ast, Budget(8360, 0, 0, 0))[0], "Step limit of 8360 exceeded.", engine)
+
+
+class CompileCacheTests(unittest.TestCase):
+
+    def test_cached_results_match_a_fresh_compile(self):
+        sources = corpus()
+        with tempfile.TemporaryDirectory() as directory:
+            cache = CompileCache.CompileCache(max_entries=len(sources), directory=directory)
+            for source in sources:
+                fresh = CompileCache.compile_source(source)
+                expected = (fresh.illegal_tokens, fresh.syntax_error, fresh.semantic_errors)
+                fresh_ast = fresh.ast()
+                outcome = codegen_outcome(fresh.ast(), "closure") if fresh_ast is not None else None
+                cache.compile(source)
+                for result in (cache.compile(source), CompileCache.CompileCache(directory=directory).compile(source)):
+                    self.assertEqual((result.illegal_tokens, result.syntax_error, result.semantic_errors), expected, source)
+                    ast = result.ast()
+                    self.assertEqual(ast is None, fresh_ast is None, source)
+                    if ast is not None:
+                        self.assertEqual(ast_signature(ast), ast_signature(fresh_ast), source)
+                        self.assertEqual(codegen_outcome(ast, "closure"), outcome, source)
+            stats = cache.stats()
+            self.assertEqual((stats["hits"], stats["misses"], stats["evictions"]), (len(sources), len(sources), 0))
+
+    def test_checks_are_cached_and_bad_files_are_misses(self):
+        sources = corpus()[:20]
+        with tempfile.TemporaryDirectory() as directory:
+            cache = CompileCache.CompileCache(directory=directory)
+            for source in sources:
+                fresh = CompileCache.check_source(source)
+                for result in (cache.check(source), cache.check(source), CompileCache.CompileCache(directory=directory).check(source)):
+                    self.assertEqual((result.illegal_tokens, result.syntax_error), (fresh.illegal_tokens, fresh.syntax_error), source)
+            self.assertEqual((cache.stats()["hits"], cache.stats()["misses"]), (len(sources), len(sources)))
+            source = sources[0]
+            path = cache._path(cache.key(source))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as file:
+                file.write(b"cno_such_module\nResult\n.")  # unpickling raises ModuleNotFoundError
+            self.assertIsNone(cache._read(cache.key(source)))
+            self.assertIsNotNone(CompileCache.CompileCache(directory=directory).compile(source))
+
+    def test_least_recently_used_entries_go_first(self):
+        sources = corpus()
+        cache = CompileCache.CompileCache(max_entries=2, directory="")
+        for source in sources[:3] + sources[:1]:
+            cache.compile(source)
+        self.assertEqual((cache.stats()["evictions"], cache.stats()["entries"]), (2, 2))
+        ast_bytes = max(cache._entries.values(), key=CompileCache.CompileResult.size).size()
+        cache = CompileCache.CompileCache(max_entries=100, max_bytes=ast_bytes, directory="")
+        for source in sources[:20]:
+            cache.compile(source)
+        self.assertLessEqual(cache.bytes, ast_bytes)
+
+
+def job_outcome(diagnostics, output):
+    return (diagnostics.illegal_tokens, diagnostics.syntax_error, diagnostics.semantic_errors, output)
+
+
+class ExecutionPoolTests(unittest.TestCase):
+
+    def test_pool_results_match_inline_runs(self):
+        sources = corpus()
+        with ExecutionPool.ExecutionPool(workers=2, jobs_per_worker=25) as pool:
+            futures = [(source, pool.submit(source)) for source in sources]
+            for source, future in futures:
+                job = future.result()
+                try:
+                    expected = job_outcome(*ExecutionPool.run_source(source))
+                except Exception as error:
+                    self.assertEqual((job.status, job.error), ("error", str(error)), source)
+                    continue
+                self.assertEqual(job.status, "ok", source)
+                self.assertEqual(job_outcome(job.diagnostics, job.output), expected, source)
+            metrics = pool.metrics()
+        self.assertEqual(metrics["completed"], len(sources))
+        self.assertGreater(metrics["recycled"], 0)
+
+    def test_timeouts_and_a_full_queue(self):
+        endless = crlf(FIBONACCI, 40)
+        quick = crlf(FIBONACCI, 5)
+        with ExecutionPool.ExecutionPool(workers=1, queue_size=1, timeout=0.5) as pool:
+            first = pool.run(quick).pid
+            slow = pool.submit(endless)
+            time.sleep(0.1)  # let the worker take it, so the next job waits in the queue
+            waiting = pool.submit(quick)
+            with self.assertRaises(ExecutionPool.ExecutionPoolError):
+                pool.submit(quick)
+            timed_out, after = slow.result(), waiting.result()
+            self.assertEqual((timed_out.status, timed_out.pid), ("timeout", first))
+            self.assertEqual((after.status, after.output), ("ok", "5\n"))
+            self.assertNotEqual(after.pid, first)
+            metrics = pool.metrics()
+        self.assertEqual((metrics["timeouts"], metrics["rejected"]), (1, 1))
+
+    def test_workers_that_fail_to_start(self):
+        quick = crlf(FIBONACCI, 5)
+        with ExecutionPool.ExecutionPool(workers=1, jobs_per_worker=1) as pool:
+            context, pool._context = pool._context, None  # every replacement fails to start
+            recycled, stranded = pool.run(quick), pool.run(quick)
+            pool._context = context
+            after = pool.run(quick)
+            metrics = pool.metrics()
+        self.assertEqual((recycled.status, recycled.output), ("ok", "5\n"))
+        self.assertEqual(stranded.status, "crashed")
+        self.assertEqual((after.status, after.output), ("ok", "5\n"))
+        self.assertEqual((metrics["spawn_failures"], metrics["crashes"], metrics["completed"]), (2, 1, 3))
+
+    def test_runtime_errors_end_the_output(self):
+        source = crlf(DIVISION_BY_ZERO)
+        self.assertEqual(ExecutionPool.run_source(source)[1], "7\n\nRuntime Error: division by zero")
+        with ExecutionPool.ExecutionPool(workers=1) as pool:
+            job = pool.run(source)
+            metrics = pool.metrics()
+        self.assertEqual((job.status, job.output), ("ok", "7\n\nRuntime Error: division by zero"))
+        self.assertEqual(metrics["errors"], 0)
+
+
+# -- editor support ---------------------------------------------------------
+
+def random_change(rng, text):
+    """A Monaco-style change somewhere in text: (start line, start column, end line, end column, new text)."""
+    lines = text.split("\n")
+    start_line = rng.randrange(len(lines))
+    end_line = min(len(lines) - 1, start_line + rng.choice([0, 0, 0, 1, 2]))
+    start_column = rng.randint(1, len(lines[start_line]) + 1)
+    low = start_column if end_line == start_line else 1
+    end_column = rng.randint(low, len(lines[end_line]) + 1)
+    pieces = ['"', "'", "---", "\r\n", " ", "x", "$a", "++", "[", "]", "birth", "123", "<< c", '"abc"\r\n']
+    text = "".join(rng.choice(pieces) for _ in range(rng.choice([0, 1, 1, 2, 3])))
+    return start_line + 1, start_column, end_line + 1, end_column, text
+
+
+class DocumentSyncTests(unittest.TestCase):
+
+    def test_incremental_tokens_match_a_fresh_lex(self):
+        rng = random.Random(TEST_SEED)
+        for engine in LEXER_ENGINES:
+            for source in corpus():
+                document = DocumentSync.Document(source, engine=engine)
+                for _ in range(20):
+                    document.apply_change(*random_change(rng, document.text))
+                    expected = [token[:4] for token in lexed(document.text, engine)]
+                    tokens = [(tok.type, tok.literal, tok.line_no, tok.position) for tok in document.tokens()]
+                    self.assertEqual(tokens, expected, f"{engine} lexer:\n{document.text}")
+                    self.assertEqual(document.token_count, len(expected))
+
+    def test_diagnostics_match_a_full_compile(self):
+        for source in corpus():
+            fresh = CompileCache.compile_source(source)
+            expected = (fresh.illegal_tokens, fresh.syntax_error)
+            for result in (DocumentSync.Document(source).check(), CompileCache.check_source(source)):
+                self.assertEqual((result.illegal_tokens, result.syntax_error), expected, source)
+
+    def test_store_limits(self):
+        source = corpus()[0]
+        store = DocumentSync.DocumentStore(max_sessions=2, idle_seconds=0, max_bytes=1 << 30)
+        for session in "abc":
+            store.open(session, source, 1)
+        store.change("c", 1, 2, [])
+        for session, base in (("a", 1), ("c", 1), ("missing", 0)):
+            with self.assertRaises(DocumentSync.DocumentSyncError, msg=f"session {session} at {base}"):
+                store.change(session, base, 2, [])
+        size = DocumentSync.Document(source).size()
+        store = DocumentSync.DocumentStore(max_sessions=10, idle_seconds=0, max_bytes=2 * size)
+        for session in "abcd":
+            store.open(session, source)
+        stats = store.stats()
+        self.assertEqual((stats["sessions"], stats["evictions"]), (2, 2))
+        self.assertLessEqual(stats["bytes"], 2 * size)
+        store = DocumentSync.DocumentStore(idle_seconds=0.05)
+        store.open("a", source)
+        time.sleep(0.1)
+        store.open("b", source)
+        self.assertEqual(store.stats()["sessions"], 1)
+
+
+def lsp_client(server):
+    """Runs server.serve() on pipes in a thread; returns send(message) and receive(predicate), and the thread."""
+    client_read, server_write = os.pipe()
+    server_read, client_write = os.pipe()
+    server.reader, server.writer = os.fdopen(server_read, "rb"), os.fdopen(server_write, "wb")
+    to_server, from_server = os.fdopen(client_write, "wb"), os.fdopen(client_read, "rb")
+    received = queue.Queue()
+    exit_code = []
+
+    def serve():
+        exit_code.append(server.serve())
+        server.writer.close()
+
+    def listen():
+        while (message := LanguageServer.read_message(from_server)) is not None:
+            received.put(message)
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    threading.Thread(target=listen, daemon=True).start()
+
+    def send(message):
+        LanguageServer.write_message(to_server, {"jsonrpc": "2.0", **message})
+
+    def receive(predicate, skipped=None):
+        while True:
+            message = received.get(timeout=60)
+            if predicate(message):
+                return message
+            if skipped is not None:
+                skipped.append(message)
+
+    return send, receive, thread, exit_code
+
+
+def expected_diagnostics(source):
+    """The messages the language server should publish for source, from a full compile."""
+    result = CompileCache.compile_source(source)
+    if result.illegal_tokens:
+        return [f"Illegal Token: {literal}" for _, _, _, literal in result.illegal_tokens]
+    if result.syntax_error is not None:
+        return [result.syntax_error]
+    return result.semantic_errors
+
+
+def decode_semantic_tokens(data):
+    line = column = 0
+    for index in range(0, len(data), 5):
+        line_delta, start_delta, length, code, _ = data[index:index + 5]
+        line += line_delta
+        column = column + start_delta if not line_delta else start_delta
+        yield line, column, length, LanguageServer.SEMANTIC_TOKEN_TYPES[code]
+
+
+def is_response(request_id):
+    return lambda message: message.get("id") == request_id
+
+
+class LanguageServerTests(unittest.TestCase):
+
+    def setUp(self):
+        self.server = LanguageServer.LanguageServer(None, None, debounce=0.2)
+        self.send, self.receive, self.thread, self.exit_code = lsp_client(self.server)
+        self.send({"id": 1, "method": "initialize", "params": {}})
+        capabilities = self.receive(is_response(1))["result"]["capabilities"]
+        self.assertEqual(capabilities["textDocumentSync"]["change"], 2)
+        self.send({"method": "initialized", "params": {}})
+
+    def tearDown(self):
+        self.send({"id": 99, "method": "shutdown"})
+        self.assertIsNone(self.receive(is_response(99))["result"])
+        self.send({"method": "exit"})
+        self.thread.join()
+        self.assertEqual(self.exit_code, [0])
+
+    def test_diagnostics_after_incremental_edits_match_a_full_compile(self):
+        rng = random.Random(TEST_SEED)
+        for number, source in enumerate(corpus(TEST_CORPUS // 4)):
+            uri = f"file:///program{number}.lime"
+            self.send({"method": "textDocument/didOpen",
+                       "params": {"textDocument": {"uri": uri, "languageId": "casper", "version": 1, "text": source}}})
+            text = source
+            edits = rng.randint(1, 8)
+            for version in range(2, edits + 2):
+                start_line, start_column, end_line, end_column, new_text = random_change(rng, text)
+                lines = text.split("\n")
+                start = sum(len(line) + 1 for line in lines[:start_line - 1]) + start_column - 1
+                end = sum(len(line) + 1 for line in lines[:end_line - 1]) + end_column - 1
+                text = text[:start] + new_text + text[end:]
+                change = {"range": {"start": {"line": start_line - 1, "character": start_column - 1},
+                                    "end": {"line": end_line - 1, "character": end_column - 1}}, "text": new_text}
+                self.send({"method": "textDocument/didChange",
+                           "params": {"textDocument": {"uri": uri, "version": version}, "contentChanges": [change]}})
+            last = edits + 1
+            message = self.receive(lambda message: message.get("method") == "textDocument/publishDiagnostics"
+                                   and message["params"]["uri"] == uri and message["params"].get("version") == last)
+            self.assertEqual([diagnostic["message"] for diagnostic in message["params"]["diagnostics"]],
+                             expected_diagnostics(text), text)
+
+            self.send({"id": 2, "method": "textDocument/semanticTokens/full", "params": {"textDocument": {"uri": uri}}})
+            data = self.receive(is_response(2))["result"]["data"]
+            lines = text.split("\n")
+            for line, column, length, kind in decode_semantic_tokens(data):
+                word = lines[line][column:column + length]
+                if kind in ("variable", "function"):
+                    self.assertRegex(word, r"^[$@]?[A-Za-z_]\w*$", kind)
+                elif kind == "number":
+                    self.assertRegex(word, r"^[0-9.]+$", kind)
+            self.send({"id": 3, "method": "textDocument/semanticTokens/full", "params": {"textDocument": {"uri": uri}}})
+            self.assertEqual(self.receive(is_response(3))["result"]["data"], data)
+            self.send({"method": "textDocument/didClose", "params": {"textDocument": {"uri": uri}}})
+
+    def test_document_symbols_and_cancelled_requests(self):
+        uri = "file:///generated.lime"
+        self.send({"method": "textDocument/didOpen",
+                   "params": {"textDocument": {"uri": uri, "version": 1, "text": generate_program(20)}}})
+        self.send({"id": 4, "method": "textDocument/documentSymbol", "params": {"textDocument": {"uri": uri}}})
+        symbols = self.receive(is_response(4))["result"]
+        self.assertEqual([(symbol["name"], symbol["kind"]) for symbol in symbols], [("$g", 13), ("@main_casper", 12)])
+        self.assertEqual([child["name"] for child in symbols[1]["children"]][:3], ["$x", "$f", "$i3"])
+        self.send({"method": "$/cancelRequest", "params": {"id": 5}})
+        self.send({"id": 5, "method": "textDocument/documentSymbol", "params": {"textDocument": {"uri": uri}}})
+        self.assertEqual(self.receive(is_response(5))["error"]["code"], LanguageServer.REQUEST_CANCELLED)
+
+
+def server_sent_events(stream):
+    """(event, data) pairs from a Server-Sent Events byte stream."""
+    buffer = ""
+    for chunk in stream:
+        buffer += chunk.decode()
+        while "\n\n" in buffer:
+            block, buffer = buffer.split("\n\n", 1)
+            event, data = "message", []
+            for line in block.split("\n"):
+                field, _, value = line.partition(": ")
+                if field == "event":
+                    event = value
+                elif field == "data":
+                    data.append(value)
+            yield event, "\n".join(data)
+
+
+class StreamingTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        import main
+        cls.client = main.app.test_client()
+
+    def test_streamed_output_matches_a_buffered_run(self):
+        for source in corpus(TEST_CORPUS // 4) + (display_heavy(300),):
+            response = self.client.post("/runs", json={"code": source})
+            if response.status_code != 201:
+                continue
+            events = list(server_sent_events(
+                self.client.get(f"/runs/{response.json['id']}/events", buffered=False).response))
+            output = "".join(data for event, data in events if event == "output")
+            # Streamed runs get the server's budget.
+            expected, error = sink_outcome(source, None, budget=Budget())
+            end = json.loads(events[-1][1])
+            self.assertEqual(events[-1][0], "end", source)
+            self.assertEqual(output, expected.replace("\r", ""), source)
+            self.assertEqual(end["status"] == "finished", error is None, (end, error))
+        self.assertEqual(self.client.get("/runs/nonsense/events").status_code, 404)
+
+    def test_plain_runs_go_through_the_registry(self):
+        import main
+        started = main.runs.stats()["started"]
+        response = self.client.post("/run", json={"code": crlf(FIBONACCI, 5)})
+        self.assertEqual((response.status_code, response.get_data(as_text=True)), (200, "5\n"))
+        self.assertEqual(main.runs.stats()["started"], started + 1)
+        self.assertEqual(self.client.post("/run", json={"code": "$"}).status_code, 400)
+
+    def test_cancelling_a_busy_run(self):
+        response = self.client.post("/runs", json={"code": crlf(FIBONACCI, 40)})
+        run_id = response.json["id"]
+        stream = self.client.get(f"/runs/{run_id}/events", buffered=False).response
+        self.assertEqual(self.client.get(f"/runs/{run_id}/events").status_code, 409)
+        time.sleep(0.2)
+        self.assertEqual(self.client.post(f"/runs/{run_id}/cancel").json, {"cancelled": True})
+        events = list(server_sent_events(stream))
+        self.assertEqual(events[-1], ("end", json.dumps({"status": "cancelled", "message": None})))
+
+    def test_rate_limit(self):
+        rate, burst = 40000, 1000
+        registry = Streaming.RunRegistry(rate=rate, burst=burst)
+        run = registry.start(parse(display_heavy(20000)))
+        started = time.perf_counter()
+        sent = sum(len(data) for event, data in server_sent_events(
+            chunk.encode() for chunk in registry.stream(run.id)) if event == "output")
+        elapsed = time.perf_counter() - started
+        self.assertEqual(sent, run.sent)
+        self.assertGreaterEqual(elapsed, (sent - burst) / rate * 0.95)
+
+    def test_runs_nobody_streams_are_cancelled(self):
+        registry = Streaming.RunRegistry(max_runs=1, attach_seconds=0.1)
+        run = registry.start(parse(crlf(FIBONACCI, 40)))
+        with self.assertRaises(Streaming.StreamError):
+            registry.start(parse(display_heavy(1)))
+        run._thread.join(5)
+        self.assertFalse(run._thread.is_alive())
+        self.assertEqual((run.status, registry.stats()["abandoned"]), ("cancelled", 1))
+
+
+if __name__ == "__main__":
+    unittest.main()